@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Pemeriksaan Anggaran Waktu Import
+=================================
+
+Menjalankan `python -X importtime -c "import <modul>"` pada proses baru
+untuk setiap modul, lalu memeriksa:
+- waktu import kumulatif modul tidak melebihi anggarannya (ms)
+- modul terlarang (misalnya matplotlib) tidak ikut terimpor
+
+Kernel geometri (shapes, transformations, scene) dan titik masuk CLI
+(main) tidak boleh memuat Matplotlib; pyplot dan backend baru dimuat
+saat benar-benar merender.
+
+Setiap modul diukur beberapa kali pada proses terpisah. Median yang
+dibandingkan dengan anggaran, sehingga satu pengukuran lambat (cache
+disk, kompilasi .pyc pertama) maupun satu pengukuran yang kebetulan
+cepat tidak menentukan hasil. Waktu terkecil ikut ditampilkan.
+
+Penggunaan:
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --repeat 5 --budget-scale 2
+    python benchmarks/check_import_time.py --module transformations.scaling
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+# Anggaran waktu import kumulatif (ms). Sebagian besar adalah import numpy.
+IMPORT_BUDGETS_MS = {
+    'shapes': 300,
+    'transformations': 300,
+    'transformations.scaling': 300,
+    'scene': 300,
+    'utils.batch': 300,
+    'main': 400,
+}
+
+# Modul yang tidak boleh ikut terimpor oleh modul di atas
+FORBIDDEN_MODULES = ('matplotlib',)
+
+
+def parse_importtime(stderr):
+    """
+    Membaca keluaran -X importtime.
+
+    Parameters:
+    -----------
+    stderr : str
+        Keluaran stderr proses Python
+
+    Returns:
+    --------
+    dict : {nama_modul: waktu_kumulatif_us}
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue  # Baris header
+        timings[fields[2].strip()] = cumulative
+    return timings
+
+
+def measure_import(module):
+    """
+    Mengimpor modul pada proses Python baru.
+
+    Returns:
+    --------
+    dict : {nama_modul: waktu_kumulatif_us} untuk semua modul yang terimpor
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=SRC_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Gagal mengimpor {module}:\n{result.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(result.stderr)
+
+
+def check_module(module, budget_ms, repeat):
+    """
+    Mengukur satu modul dan memeriksa anggaran serta modul terlarang.
+
+    Returns:
+    --------
+    tuple : (median_ms, min_ms, list pesan pelanggaran)
+    """
+    samples_ms = []
+    forbidden = set()
+    for _ in range(repeat):
+        timings = measure_import(module)
+        if module not in timings:
+            raise RuntimeError(f"Waktu import {module} tidak ada pada keluaran -X importtime.")
+        samples_ms.append(timings[module] / 1000)
+        forbidden.update(name for name in timings
+                         if name.split('.')[0] in FORBIDDEN_MODULES)
+
+    median_ms = statistics.median(samples_ms)
+    problems = []
+    if median_ms > budget_ms:
+        problems.append(f"median {median_ms:.1f} ms melebihi anggaran {budget_ms:.0f} ms")
+    if forbidden:
+        roots = sorted({name.split('.')[0] for name in forbidden})
+        problems.append(f"mengimpor {', '.join(roots)} ({len(forbidden)} modul)")
+    return median_ms, min(samples_ms), problems
+
+
+def parse_args(argv=None):
+    """Membaca argumen command line."""
+    parser = argparse.ArgumentParser(description='Memeriksa anggaran waktu import modul.')
+    parser.add_argument('--module', nargs='+', choices=sorted(IMPORT_BUDGETS_MS),
+                        help='Periksa hanya modul tertentu')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Jumlah pengukuran per modul; median dibandingkan dengan '
+                             'anggaran (default: 5)')
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help='Pengali anggaran untuk mesin yang lebih lambat (default: 1.0)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Memeriksa semua modul dan mengembalikan 1 jika ada pelanggaran."""
+    args = parse_args(argv)
+    if args.repeat < 1:
+        print("--repeat minimal 1.")
+        return 2
+    modules = args.module or list(IMPORT_BUDGETS_MS)
+
+    print(f"{'Modul':<26} {'Median (ms)':>12} {'Min (ms)':>9} {'Anggaran (ms)':>14}  Status")
+    print("-" * 80)
+
+    failed = 0
+    for module in modules:
+        budget_ms = IMPORT_BUDGETS_MS[module] * args.budget_scale
+        median_ms, min_ms, problems = check_module(module, budget_ms, args.repeat)
+        status = 'OK' if not problems else 'GAGAL: ' + '; '.join(problems)
+        print(f"{module:<26} {median_ms:>12.1f} {min_ms:>9.1f} {budget_ms:>14.0f}  {status}")
+        failed += bool(problems)
+
+    if failed:
+        print(f"\n{failed} modul melanggar anggaran import.")
+        return 1
+    print("\nSemua modul memenuhi anggaran import.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
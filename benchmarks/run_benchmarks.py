@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+Benchmark Grafika Komputer 2D
+=============================
+
+Mengukur waktu (wall time), puncak memori (tracemalloc), dan throughput untuk:
+- Transformasi   : scale_vertices, rotate_vertices, reflect_vertices
+                   (API list of tuples dan API array NumPy)
+- Konstruksi     : create_* untuk setiap bentuk dan ShapeArray.from_shapes
+- Rendering      : plot_shape_on_ax + canvas.draw() pada backend Agg, dan
+                   CollectionRenderer untuk scene dengan banyak bentuk
+- Raster         : Rasterizer NumPy (scanline + midpoint circle) ke PNG
+                   dibandingkan dengan plot_shape_on_ax + fig.savefig, serta
+                   verifikasi bit per bit isian polygon terhadap uji per piksel
+- Tiled          : TiledRenderer untuk kanvas besar (PNG per band) dengan
+                   1 sampai N worker, dibandingkan dengan satu Rasterizer utuh
+- Paralel        : ParallelTransformer dengan 1 sampai N worker, untuk data
+                   di SharedVertexBuffer (tanpa salinan) dan array biasa
+- Boolean        : union, intersection, dan difference dua lingkaran
+                   ter-tessellate yang bertumpuk (total edge 10^2 sampai N),
+                   serta union dua sisir yang saling menyisip (edge panjang)
+- Collision      : CollisionDetector untuk scene tersebar (kepadatan tetap),
+                   pemeriksaan penuh dan pemeriksaan ulang satu bentuk
+
+Hasil disimpan sebagai JSON agar dapat dibandingkan sebelum dan sesudah
+perubahan.
+
+Penggunaan:
+    python benchmarks/run_benchmarks.py --output hasil.json
+    python benchmarks/run_benchmarks.py --quick --compare hasil.json
+    python benchmarks/run_benchmarks.py --only transforms --max-vertices 10000000
+    python benchmarks/run_benchmarks.py --only parallel --max-workers 16 --chunk-size 500000
+    python benchmarks/run_benchmarks.py --only tiled --canvas-size 16384 --max-workers 16
+    python benchmarks/run_benchmarks.py --only boolean --max-boolean-edges 1000000
+    python benchmarks/run_benchmarks.py --only collision --max-collision-shapes 1000000
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Tambahkan path untuk import modul lokal
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+
+from shapes import (create_square, create_triangle, create_rectangle,
+                    create_circle, create_trapezoid, Shape, ShapeArray)
+from transformations.scaling import scale_vertices, scale_vertices_array
+from transformations.rotation import rotate_vertices, rotate_vertices_array
+from transformations.reflection import reflect_vertices, reflect_vertices_array
+from transformations.pipeline import apply_affine
+from transformations.parallel import DEFAULT_CHUNK_SIZE, ParallelTransformer, SharedVertexBuffer
+from shapes.boolean import boolean_operation
+from scene.collision import CollisionDetector
+
+
+BENCHMARK_GROUPS = ('transforms', 'construction', 'rendering', 'raster', 'tiled', 'parallel', 'boolean',
+                    'collision')
+
+
+def powers_of_ten(start, stop):
+    """Daftar 10^k dari start sampai stop (inklusif), misalnya 10, 100, ..., 10^7."""
+    values = []
+    value = start
+    while value <= stop:
+        values.append(value)
+        value *= 10
+    return values
+
+
+def measure(func, repeat=3):
+    """
+    Mengukur satu fungsi tanpa argumen.
+
+    Waktu diukur tanpa tracemalloc (karena tracemalloc memperlambat alokasi),
+    lalu puncak memori diukur pada satu eksekusi terpisah.
+
+    Returns:
+    --------
+    dict : {'best_s', 'mean_s', 'peak_bytes'}
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'best_s': min(times),
+        'mean_s': sum(times) / len(times),
+        'peak_bytes': peak,
+    }
+
+
+def record(results, benchmark, n, unit, stats):
+    """Menambahkan satu hasil dan mencetaknya ke layar."""
+    throughput = n / stats['best_s'] if stats['best_s'] > 0 else float('inf')
+    entry = {
+        'benchmark': benchmark,
+        'n': n,
+        'unit': unit,
+        'best_s': stats['best_s'],
+        'mean_s': stats['mean_s'],
+        'peak_bytes': stats['peak_bytes'],
+        'throughput': throughput,
+    }
+    results.append(entry)
+    print(f"{benchmark:<32} n={n:<10} {stats['best_s'] * 1000:>12.3f} ms "
+          f"{stats['peak_bytes'] / 1e6:>10.2f} MB {throughput:>14.0f} {unit}/s")
+
+
+def bench_transforms(results, max_vertices, max_list_vertices, repeat):
+    """Benchmark kernel transformasi untuk jumlah vertices 10 sampai max_vertices."""
+    rng = np.random.default_rng(0)
+
+    for n in powers_of_ten(10, max_vertices):
+        points = rng.uniform(-10, 10, size=(n, 2))
+
+        cases = [
+            ('scale_vertices_array', lambda: scale_vertices_array(points, 2.0, 0.5)),
+            ('rotate_vertices_array', lambda: rotate_vertices_array(points, 30.0)),
+            ('reflect_vertices_array', lambda: reflect_vertices_array(points, 'y=x')),
+        ]
+        if n <= max_list_vertices:
+            vertices = [tuple(p) for p in points.tolist()]
+            cases += [
+                ('scale_vertices', lambda: scale_vertices(vertices, 2.0, 0.5)),
+                ('rotate_vertices', lambda: rotate_vertices(vertices, 30.0)),
+                ('reflect_vertices', lambda: reflect_vertices(vertices, 'y=x')),
+            ]
+
+        for name, func in cases:
+            record(results, name, n, 'vertices', measure(func, repeat))
+
+
+def random_shape_builders(rng):
+    """Pasangan (nama, fungsi pembuat tanpa argumen) untuk setiap jenis bentuk."""
+    def square():
+        return create_square(rng.uniform(0.5, 2), *rng.uniform(-8, 8, 2))
+
+    def triangle():
+        return create_triangle(rng.uniform(-8, 8, size=(3, 2)))
+
+    def rectangle():
+        return create_rectangle(*rng.uniform(0.5, 2, 2), *rng.uniform(-8, 8, 2))
+
+    def circle():
+        return create_circle(*rng.uniform(-8, 8, 2), rng.uniform(0.5, 2))
+
+    def trapezoid():
+        return create_trapezoid(2.0, 1.0, rng.uniform(0.5, 2), *rng.uniform(-8, 8, 2))
+
+    return [('square', square), ('triangle', triangle), ('rectangle', rectangle),
+            ('circle', circle), ('trapezoid', trapezoid)]
+
+
+def make_scene(count, seed=0):
+    """Membuat `count` bentuk acak dengan jenis bergantian."""
+    builders = random_shape_builders(np.random.default_rng(seed))
+    return [builders[i % len(builders)][1]() for i in range(count)]
+
+
+def bench_construction(results, max_shapes, repeat):
+    """Benchmark pembuatan bentuk untuk jumlah bentuk 1 sampai max_shapes."""
+    rng = np.random.default_rng(1)
+
+    for count in powers_of_ten(1, max_shapes):
+        for name, builder in random_shape_builders(rng):
+            stats = measure(lambda: [builder() for _ in range(count)], repeat)
+            record(results, f'create_{name}', count, 'shapes', stats)
+
+        shapes = make_scene(count)
+        stats = measure(lambda: ShapeArray.from_shapes(shapes), repeat)
+        record(results, 'ShapeArray.from_shapes', count, 'shapes', stats)
+
+        array = ShapeArray.from_shapes(shapes)
+        record(results, 'ShapeArray.metrics', count, 'shapes', measure(array.metrics, repeat))
+
+
+def bench_rendering(results, max_shapes, max_vertices, repeat):
+    """
+    Benchmark plot_shape_on_ax + canvas.draw() pada backend Agg.
+
+    - Berdasarkan jumlah bentuk (1 sampai max_shapes)
+    - Berdasarkan jumlah vertices satu polygon (10 sampai max_vertices),
+      dengan level-of-detail dan tanpa penyederhanaan
+    - CollectionRenderer untuk jumlah bentuk yang sama (satu artist per kelompok)
+    - Polygon raksasa (radius 1000) yang dilihat dari dekat, dengan dan
+      tanpa clipping viewport
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Polygon
+    from utils.plotting import POLYGON_STYLE, init_cartesian_plot, plot_shape_on_ax
+    from utils.collection_renderer import CollectionRenderer
+
+    fig, ax = init_cartesian_plot()
+
+    def render(shapes):
+        plot_shape_on_ax(ax, None, clear_previous=True)
+        for shape in shapes:
+            plot_shape_on_ax(ax, shape, clear_previous=False)
+        fig.canvas.draw()
+
+    for count in powers_of_ten(1, max_shapes):
+        shapes = make_scene(count)
+        record(results, 'render_shapes', count, 'shapes', measure(lambda: render(shapes), repeat))
+
+    plot_shape_on_ax(ax, None, clear_previous=True)
+    collection = CollectionRenderer(ax)
+
+    def render_collection(shapes):
+        collection.set_shapes(shapes)
+        fig.canvas.draw()
+
+    for count in powers_of_ten(1, max_shapes):
+        shapes = ShapeArray.from_shapes(make_scene(count))
+        record(results, 'render_collection', count, 'shapes',
+               measure(lambda: render_collection(shapes), repeat))
+    collection.remove()
+
+    def render_unclipped(shape):
+        plot_shape_on_ax(ax, None, clear_previous=True)
+        ax.add_patch(Polygon(shape.vertices, closed=True, **POLYGON_STYLE))
+        fig.canvas.draw()
+
+    rng = np.random.default_rng(2)
+    for n in powers_of_ten(10, max_vertices):
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        polygon = Shape('polygon', np.column_stack((8 * np.cos(angles), 8 * np.sin(angles))))
+        record(results, 'render_vertices', n, 'vertices', measure(lambda: render([polygon]), repeat))
+        record(results, 'render_vertices_full', n, 'vertices',
+               measure(lambda: render_unclipped(polygon), repeat))
+
+    for n in powers_of_ten(10, max_vertices):
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        giant = Shape('polygon', np.column_stack((1000 * np.cos(angles), 995 + 1000 * np.sin(angles))))
+        record(results, 'render_zoomed', n, 'vertices', measure(lambda: render([giant]), repeat))
+        record(results, 'render_zoomed_unclipped', n, 'vertices',
+               measure(lambda: render_unclipped(giant), repeat))
+
+    plt.close(fig)
+
+
+def reference_fill_mask(points, width, height):
+    """
+    Isian polygon referensi: uji even-odd di pusat setiap piksel.
+
+    Lambat (satu pass per edge atas seluruh gambar), tetapi memakai aturan
+    sampel yang sama dengan scanline_spans sehingga hasilnya harus identik.
+    """
+    cols, rows = np.meshgrid(np.arange(width), np.arange(height))
+    center_y = rows + 0.5
+    inside = np.zeros((height, width), dtype=bool)
+    for k in range(len(points)):
+        (x0, y0), (x1, y1) = points[k], points[(k + 1) % len(points)]
+        if y0 == y1:
+            continue
+        crosses = (min(y0, y1) <= center_y) & (center_y < max(y0, y1))
+        x_at_y = x0 + (center_y - y0) * (x1 - x0) / (y1 - y0)
+        inside ^= crosses & (np.ceil(x_at_y - 0.5) <= cols)
+    return inside
+
+
+def verify_raster(shapes, size=400):
+    """Jumlah piksel isian polygon yang berbeda antara Rasterizer dan referensi."""
+    from utils.raster import Rasterizer
+
+    raster = Rasterizer(size, size)
+    mismatched = 0
+    for shape in shapes:
+        if shape.type == 'circle':
+            continue
+        raster.clear()
+        raster.fill_polygon(shape.vertices, (0, 0, 0, 255))
+        mask = raster.buffer[..., 0] == 0
+        reference = reference_fill_mask(raster.to_pixels(shape.vertices), size, size)
+        mismatched += int(np.count_nonzero(mask != reference))
+    return mismatched
+
+
+def bench_raster(results, max_shapes, repeat):
+    """
+    Rasterizer NumPy vs jalur savefig Matplotlib untuk gambar PNG 800x800.
+
+    Keduanya menulis PNG ke memori dengan kompresi level 1; Rasterizer
+    memakai salinan latar grid yang digambar sekali.
+    """
+    import io
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from utils.plotting import init_cartesian_plot, plot_shape_on_ax
+    from utils.raster import Rasterizer
+
+    mismatched = verify_raster(make_scene(50, seed=5))
+    print(f"{'verifikasi raster':<32} {mismatched} piksel isian berbeda dari referensi per piksel")
+
+    fig, ax = init_cartesian_plot()
+    raster = Rasterizer(800, 800)
+    raster.draw_grid()
+    background = raster.buffer.copy()
+
+    def savefig_png(shapes):
+        plot_shape_on_ax(ax, None, clear_previous=True)
+        for shape in shapes:
+            plot_shape_on_ax(ax, shape, clear_previous=False)
+        fig.savefig(io.BytesIO(), format='png', pil_kwargs={'compress_level': 1})
+
+    def raster_png(shapes):
+        raster.buffer[:] = background
+        raster.draw_shapes(shapes)
+        raster.save_png(io.BytesIO())
+
+    for count in powers_of_ten(1, max_shapes):
+        shapes = make_scene(count)
+        record(results, 'savefig_png', count, 'shapes', measure(lambda: savefig_png(shapes), repeat))
+        record(results, 'raster_png', count, 'shapes', measure(lambda: raster_png(shapes), repeat))
+
+    plt.close(fig)
+
+
+def make_poster_scene(count, seed=0):
+    """Scene padat: `count` bentuk kecil (skala 0.1) tersebar di -10..10."""
+    rng = np.random.default_rng(seed)
+    matrices = np.zeros((count, 3, 3))
+    matrices[:, 0, 0] = matrices[:, 1, 1] = 0.1
+    matrices[:, :2, 2] = rng.uniform(-10, 10, size=(count, 2))
+    matrices[:, 2, 2] = 1.0
+    return [shape.transformed(matrix) for shape, matrix in zip(make_scene(count, seed), matrices)]
+
+
+def bench_tiled(results, canvas_size, tile_size, shape_count, max_workers, repeat):
+    """
+    TiledRenderer vs satu Rasterizer utuh untuk poster canvas_size x canvas_size.
+
+    Keduanya menulis PNG ke memori. Puncak memori hanya mencakup proses
+    utama; untuk pool proses, memori tile ada di worker, sehingga pool
+    thread juga diukur.
+    """
+    import io
+    from utils.raster import Rasterizer
+    from utils.tiled import TiledRenderer
+
+    shapes = make_poster_scene(shape_count)
+    pixels = canvas_size * canvas_size
+
+    def render_full():
+        raster = Rasterizer(canvas_size, canvas_size)
+        raster.draw_grid()
+        raster.draw_shapes(shapes)
+        raster.save_png(io.BytesIO())
+
+    record(results, 'raster_full', pixels, 'pixels', measure(render_full, repeat))
+
+    for pool in ('thread', 'process'):
+        for workers in worker_counts(max_workers):
+            with TiledRenderer(canvas_size, canvas_size, tile_size=tile_size,
+                               workers=workers, pool=pool) as renderer:
+                renderer.executor.submit(int).result()
+                record(results, f'tiled_{pool}[w={workers}]', pixels, 'pixels',
+                       measure(lambda: renderer.render(shapes, io.BytesIO(), grid=True), repeat))
+
+
+def worker_counts(max_workers):
+    """Jumlah worker 1, 2, 4, ... sampai max_workers (inklusif)."""
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def bench_parallel(results, max_vertices, max_workers, chunk_size, repeat):
+    """
+    Skalabilitas ParallelTransformer dari 1 sampai max_workers proses.
+
+    Pool dibuat dan dipanaskan sebelum pengukuran, sehingga yang diukur
+    hanya pembagian tugas dan transformasi. Puncak memori hanya mencakup
+    proses utama (tracemalloc tidak melihat worker maupun shared memory).
+    """
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-10, 10, size=(max_vertices, 2))
+    matrix = np.array([[0.8, -0.6, 1.0], [0.6, 0.8, -2.0], [0.0, 0.0, 1.0]])
+
+    record(results, 'apply_affine', max_vertices, 'vertices',
+           measure(lambda: apply_affine(points, matrix), repeat))
+
+    with SharedVertexBuffer.from_array(points) as buffer:
+        for workers in worker_counts(max_workers):
+            with ParallelTransformer(workers, chunk_size) as transformer:
+                transformer.apply(buffer, matrix)
+                record(results, f'parallel_shared[w={workers}]', max_vertices, 'vertices',
+                       measure(lambda: transformer.apply(buffer, matrix), repeat))
+                record(results, f'parallel_array[w={workers}]', max_vertices, 'vertices',
+                       measure(lambda: transformer.apply(points, matrix), repeat))
+
+
+def make_comb(teeth, shift=0.0, mirror=False):
+    """
+    Polygon sisir: teeth gigi horizontal selebar 100 satuan pada punggung vertikal.
+
+    Dua sisir berhadapan (mirror=True, digeser setengah jarak gigi) saling
+    menyisip tanpa bersentuhan, sehingga hampir setiap edge membentang di
+    seluruh rentang X kedua bentuk (kasus terburuk sweep sumbu X).
+    """
+    width, pitch, thick = 100.0, 1.0, 0.4
+    ys = shift + np.arange(teeth) * pitch
+    xs = np.array([0.0, width, width, 0.0])
+    teeth_vertices = np.column_stack((np.tile(xs, teeth),
+                                      np.repeat(ys, 4) + np.tile([0.0, 0.0, thick, thick], teeth)))
+    vertices = np.vstack(([(-1.0, shift)], teeth_vertices, [(-1.0, ys[-1] + thick)]))
+    if mirror:
+        vertices[:, 0] = width + 0.5 - vertices[:, 0]
+        vertices = vertices[::-1].copy()
+    return Shape('polygon', vertices)
+
+
+def bench_boolean(results, max_edges, repeat):
+    """
+    Operasi boolean dengan total edge 10^2 sampai max_edges: dua lingkaran
+    bertumpuk (edge pendek) dan dua sisir yang saling menyisip (edge panjang).
+    """
+    a, b = create_circle(0, 0, 10), create_circle(5, 1, 10)
+    for n in powers_of_ten(100, max_edges):
+        for operation in ('union', 'intersection', 'difference'):
+            stats = measure(lambda: boolean_operation(a, b, operation, segments=n // 2), repeat)
+            record(results, f'boolean_{operation}', n, 'edges', stats)
+
+    for n in powers_of_ten(100, max_edges):
+        teeth = n // 8
+        a, b = make_comb(teeth), make_comb(teeth, shift=0.5, mirror=True)
+        record(results, 'boolean_comb_union', n, 'edges',
+               measure(lambda: boolean_operation(a, b, 'union'), repeat))
+
+
+def make_spread_scene(count, seed=0):
+    """make_scene yang digeser acak ke area seluas ~64 satuan^2 per bentuk (kepadatan tetap)."""
+    shapes = ShapeArray.from_shapes(make_scene(count, seed))
+    rng = np.random.default_rng(seed + 1)
+    offsets = rng.uniform(0, 8 * np.sqrt(count), size=(count, 2))
+    shapes.vertices += np.repeat(offsets, shapes.vertex_counts, axis=0)
+    shapes.anchors += offsets
+    return shapes
+
+
+def bench_collision(results, max_shapes, repeat):
+    """CollisionDetector: pemeriksaan penuh dan update setelah satu bentuk dipindah."""
+    rng = np.random.default_rng(0)
+    for count in powers_of_ten(1000, max_shapes):
+        shapes = make_spread_scene(count)
+        record(results, 'collision_build', count, 'shapes',
+               measure(lambda: CollisionDetector(shapes), repeat))
+
+        detector = CollisionDetector(shapes)
+        moves = rng.integers(0, count, size=100)
+        translation = np.eye(3)
+
+        def move_one():
+            index = moves[rng.integers(len(moves))]
+            translation[:2, 2] = rng.uniform(-2, 2, 2)
+            detector.transform([index], translation)
+
+        record(results, 'collision_move_one', count, 'shapes', measure(move_one, repeat))
+
+
+def collect_metadata():
+    """Informasi lingkungan agar hasil antar-run dapat dibandingkan dengan adil."""
+    import matplotlib
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SRC_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results, baseline_path):
+    """Mencetak perbandingan waktu terhadap file hasil sebelumnya."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    previous = {(r['benchmark'], r['n']): r for r in baseline.get('results', [])}
+    print(f"\nPerbandingan terhadap {baseline_path}:")
+    print(f"{'Benchmark':<32} {'n':>10} {'Sebelum (ms)':>14} {'Sesudah (ms)':>14} {'Speedup':>9}")
+    print("-" * 83)
+    for r in results:
+        old = previous.get((r['benchmark'], r['n']))
+        if old is None:
+            continue
+        speedup = old['best_s'] / r['best_s'] if r['best_s'] > 0 else float('inf')
+        print(f"{r['benchmark']:<32} {r['n']:>10} {old['best_s'] * 1000:>14.3f} "
+              f"{r['best_s'] * 1000:>14.3f} {speedup:>8.2f}x")
+
+
+def parse_args(argv=None):
+    """Membaca argumen command line."""
+    parser = argparse.ArgumentParser(description='Benchmark transformasi, konstruksi bentuk, dan rendering.')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='File JSON hasil benchmark (default: benchmark_results.json)')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='File JSON hasil sebelumnya untuk dibandingkan')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARK_GROUPS,
+                        help='Jalankan hanya kelompok benchmark tertentu')
+    parser.add_argument('--quick', action='store_true',
+                        help='Ukuran kecil untuk pengecekan cepat (10^5 vertices, 10^3 bentuk)')
+    parser.add_argument('--max-vertices', type=int, default=10 ** 7,
+                        help='Jumlah vertices maksimum untuk kernel array (default: 10^7)')
+    parser.add_argument('--max-list-vertices', type=int, default=10 ** 6,
+                        help='Jumlah vertices maksimum untuk API list of tuples (default: 10^6)')
+    parser.add_argument('--max-shapes', type=int, default=10 ** 5,
+                        help='Jumlah bentuk maksimum untuk konstruksi (default: 10^5)')
+    parser.add_argument('--max-render-shapes', type=int, default=10 ** 4,
+                        help='Jumlah bentuk maksimum untuk rendering (default: 10^4)')
+    parser.add_argument('--max-render-vertices', type=int, default=10 ** 6,
+                        help='Jumlah vertices maksimum untuk rendering (default: 10^6)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1,
+                        help='Jumlah worker maksimum untuk benchmark paralel (default: jumlah CPU)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Vertices per tugas worker (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--canvas-size', type=int, default=8192,
+                        help='Sisi kanvas poster untuk benchmark tiled (default: 8192)')
+    parser.add_argument('--tile-size', type=int, default=1024,
+                        help='Sisi tile untuk benchmark tiled (default: 1024)')
+    parser.add_argument('--poster-shapes', type=int, default=10 ** 4,
+                        help='Jumlah bentuk poster untuk benchmark tiled (default: 10^4)')
+    parser.add_argument('--max-boolean-edges', type=int, default=10 ** 6,
+                        help='Jumlah edge maksimum untuk operasi boolean (default: 10^6)')
+    parser.add_argument('--max-collision-shapes', type=int, default=10 ** 5,
+                        help='Jumlah bentuk maksimum untuk deteksi tumpang tindih (default: 10^5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Jumlah pengulangan pengukuran waktu (default: 3)')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.max_vertices = min(args.max_vertices, 10 ** 5)
+        args.max_list_vertices = min(args.max_list_vertices, 10 ** 5)
+        args.max_shapes = min(args.max_shapes, 10 ** 3)
+        args.max_render_shapes = min(args.max_render_shapes, 10 ** 2)
+        args.max_render_vertices = min(args.max_render_vertices, 10 ** 4)
+        args.canvas_size = min(args.canvas_size, 2048)
+        args.poster_shapes = min(args.poster_shapes, 10 ** 3)
+        args.max_boolean_edges = min(args.max_boolean_edges, 10 ** 4)
+        args.max_collision_shapes = min(args.max_collision_shapes, 10 ** 3)
+    return args
+
+
+def main(argv=None):
+    """Menjalankan benchmark yang dipilih dan menyimpan hasilnya."""
+    args = parse_args(argv)
+    groups = args.only or BENCHMARK_GROUPS
+    results = []
+
+    print(f"{'Benchmark':<32} {'n':<12} {'Waktu terbaik':>15} {'Puncak memori':>13} {'Throughput':>16}")
+    print("-" * 92)
+
+    if 'transforms' in groups:
+        bench_transforms(results, args.max_vertices, args.max_list_vertices, args.repeat)
+    if 'construction' in groups:
+        bench_construction(results, args.max_shapes, args.repeat)
+    if 'rendering' in groups:
+        bench_rendering(results, args.max_render_shapes, args.max_render_vertices, args.repeat)
+    if 'raster' in groups:
+        bench_raster(results, args.max_render_shapes, args.repeat)
+    if 'tiled' in groups:
+        bench_tiled(results, args.canvas_size, args.tile_size, args.poster_shapes,
+                    args.max_workers, args.repeat)
+    if 'parallel' in groups:
+        bench_parallel(results, args.max_vertices, args.max_workers, args.chunk_size, args.repeat)
+    if 'boolean' in groups:
+        bench_boolean(results, args.max_boolean_edges, args.repeat)
+    if 'collision' in groups:
+        bench_collision(results, args.max_collision_shapes, args.repeat)
+
+    report = {'metadata': collect_metadata(), 'config': vars(args), 'results': results}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan ke {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
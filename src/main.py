@@ -9,18 +9,30 @@ transformasi menggunakan Matplotlib.
 Fitur:
 - Menggambar: Bujursangkar, Segitiga, Persegi Panjang, Lingkaran, Trapesium
 - Transformasi: Penskalaan, Pencerminan, Rotasi
+- Scene: banyak bentuk sekaligus, transformasi diterapkan ke bentuk terpilih
+- Animasi transisi transformasi (dapat diekspor ke GIF/PNG pada mode batch)
+- Menggambar dengan mouse (drag/klik) dengan pratinjau rubber-band
 
 Penggunaan:
     python main.py
+    python main.py --script ops.json --out frame.png     (mode batch/headless)
+    python main.py --script a.json b.json --out hasil/   (banyak skrip)
+    python main.py --script ops.json --animate ops.gif   (ekspor animasi)
+    python main.py --frames 0                            (tanpa animasi)
+    python main.py --script ops.json --stream titik.csv hasil.bin   (file vertices besar)
+    python main.py --profile laporan.json --cprofile sesi.prof      (profiling per aksi)
+    python main.py --blocking-input                      (input() biasa, tanpa event loop)
+    python main.py --renderer collection                 (PolyCollection untuk scene besar)
 
 Author: Rio Priantama
 Created: 2026-01-13
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+import argparse
+import json
 import sys
 import os
+import time
 
 # Tambahkan path untuk import modul lokal
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -33,12 +45,57 @@ from shapes.circle import draw_circle
 from shapes.trapezoid import draw_trapezoid
 
 # Import modul transformations
-from transformations.scaling import apply_scaling, scale_vertices
-from transformations.reflection import apply_reflection, reflect_vertices
-from transformations.rotation import apply_rotation, rotate_vertices
+from transformations.scaling import get_scaling_matrix, read_scaling_factors
+from transformations.reflection import get_reflection_matrix, read_reflection_axis
+from transformations.rotation import get_rotation_matrix, read_rotation_angle
+from transformations.pipeline import to_homogeneous
 
-# Import utilities
-from utils.plotting import init_cartesian_plot, plot_shape_on_ax
+# Import scene
+from scene import Scene
+
+# Import utilities (Matplotlib baru dimuat saat plot dibuat, lihat main)
+from utils.plotting import init_cartesian_plot
+from utils.batch import run_batch, format_timing_report, load_script, streaming_pipeline
+from utils.animation import DEFAULT_FRAMES, DEFAULT_FPS
+from utils.profiling import PROFILE_ENV, PROFILER, format_profile_report
+from utils.event_loop import EventLoop
+
+
+# Fungsi menggambar untuk pilihan menu 1-5
+DRAW_FUNCTIONS = {
+    '1': draw_square,
+    '2': draw_triangle,
+    '3': draw_rectangle,
+    '4': draw_circle,
+    '5': draw_trapezoid,
+}
+
+# Nama aksi profiler untuk setiap pilihan menu
+MENU_ACTIONS = {
+    '1': 'draw_square',
+    '2': 'draw_triangle',
+    '3': 'draw_rectangle',
+    '4': 'draw_circle',
+    '5': 'draw_trapezoid',
+    '6': 'scale',
+    '7': 'reflect',
+    '8': 'rotate',
+    '9': 'clear',
+    '10': 'exit',
+    '11': 'select',
+    '12': 'undo',
+    '13': 'redo',
+    '14': 'mouse_mode',
+}
+
+# Jenis bentuk untuk pilihan menu 1-5 (juga dipakai pada mode mouse)
+MENU_SHAPES = {
+    '1': 'square',
+    '2': 'triangle',
+    '3': 'rectangle',
+    '4': 'circle',
+    '5': 'trapezoid',
+}
 
 
 def show_menu():
@@ -59,6 +116,10 @@ def show_menu():
     print("\n--- Lainnya ---")
     print("9. Hapus Semua Bentuk (Clear All)")
     print("10. Keluar (Exit)")
+    print("11. Pilih Bentuk (Select)")
+    print("12. Undo Transformasi")
+    print("13. Redo Transformasi")
+    print("14. Gambar dengan Mouse")
     print("-"*50)
 
 
@@ -72,12 +133,344 @@ def clear_all_shapes(ax):
     ax.set_ylim(-10, 10)
     ax.set_aspect('equal')
     ax.grid(True)
-    plt.title('Interactive Drawing and Transformation Application')
+    ax.set_title('Interactive Drawing and Transformation Application')
     print("Semua bentuk telah dihapus.")
 
 
-def main():
+def select_shapes(scene):
+    """
+    Meminta cara seleksi dari pengguna dan memperbarui seleksi scene.
+    
+    Parameters:
+    -----------
+    scene : Scene
+        Scene yang berisi bentuk
+    """
+    if len(scene) == 0:
+        print("Tidak ada bentuk yang tersedia. Gambar bentuk terlebih dahulu.")
+        return
+    
+    print("\nPilih bentuk berdasarkan:")
+    print("1. Titik (bentuk paling atas di titik tersebut)")
+    print("2. Area persegi panjang")
+    print("3. Semua bentuk")
+    print("4. ID bentuk")
+    option = input("Pilihan (1-4): ").strip()
+    
+    try:
+        if option == '1':
+            x = float(input("Masukkan koordinat X: "))
+            y = float(input("Masukkan koordinat Y: "))
+            scene.select_point(x, y)
+        elif option == '2':
+            x1 = float(input("X pojok pertama: "))
+            y1 = float(input("Y pojok pertama: "))
+            x2 = float(input("X pojok kedua: "))
+            y2 = float(input("Y pojok kedua: "))
+            scene.select_rect((x1, y1, x2, y2))
+        elif option == '3':
+            scene.select_all()
+        elif option == '4':
+            ids = input(f"Masukkan ID bentuk, pisahkan dengan spasi (1-{max(scene)}): ")
+            scene.select(int(i) for i in ids.split())
+        else:
+            print("Pilihan tidak valid.")
+            return
+    except ValueError:
+        print("Input tidak valid. Harap masukkan angka.")
+        return
+    
+    if scene.selection:
+        print(f"Bentuk terpilih: {', '.join(map(str, scene.selection))}")
+    else:
+        print("Tidak ada bentuk yang terpilih.")
+
+
+def start_mouse_drawing(renderer, scene, tool=None):
+    """
+    Meminta jenis bentuk lalu mengaktifkan mode gambar dengan mouse.
+
+    Setiap bentuk yang selesai digambar langsung ditambahkan ke scene,
+    dipilih, dan dirender.
+
+    Parameters:
+    -----------
+    renderer : ShapeRenderer atau SceneCollectionRenderer
+        Renderer yang menggambar scene
+    scene : Scene
+        Scene tujuan bentuk baru
+    tool : MouseDrawingTool, optional
+        Alat yang sedang aktif; dilepas sebelum alat baru dipasang
+
+    Returns:
+    --------
+    MouseDrawingTool : Alat yang aktif, atau None jika mode dimatikan
+    """
+    from utils.mouse_drawing import CLICK_SHAPES, MouseDrawingTool
+
+    print("\nGambar dengan mouse:")
+    print("1. Bujursangkar  2. Segitiga  3. Persegi Panjang  4. Lingkaran  5. Trapesium")
+    print("0. Matikan mode mouse")
+    option = input("Pilihan (0-5): ").strip()
+
+    if tool is not None:
+        tool.disconnect()
+    if option == '0':
+        print("Mode gambar mouse dimatikan.")
+        return None
+    shape_type = MENU_SHAPES.get(option)
+    if shape_type is None:
+        print("Pilihan tidak valid.")
+        return None
+
+    def add_shape(shape):
+        shape_id = scene.add(shape)
+        scene.select([shape_id])
+        renderer.update(shape_id, scene[shape_id])
+        renderer.highlight(scene.selection)
+        renderer.refresh()
+        print(f"\nBentuk disimpan dengan ID {shape_id}.")
+
+    if shape_type in CLICK_SHAPES:
+        print("Klik tiga titik di jendela untuk setiap segitiga (Esc membatalkan).")
+    else:
+        print("Tekan dan seret di jendela untuk menggambar (Esc membatalkan).")
+    return MouseDrawingTool(renderer.ax, shape_type, add_shape, renderer)
+
+
+def animate_transition(renderer, scene, name, params, center, frames, fps):
+    """
+    Memutar animasi transisi untuk bentuk terpilih sebelum transformasinya diterapkan.
+
+    Bentuk terpilih disembunyikan selama animasi; bentuk lain tetap
+    digambar sebagai artist statis di atas latar blitting.
+
+    Parameters:
+    -----------
+    renderer : ShapeRenderer atau SceneCollectionRenderer
+        Renderer yang menggambar scene
+    scene : Scene
+        Scene yang berisi bentuk terpilih
+    name : str
+        'scale', 'rotate', atau 'reflect'
+    params : dict
+        Parameter transformasi
+    center : tuple or None
+        Pusat transformasi (None = origin)
+    frames : int
+        Jumlah frame animasi
+    fps : float
+        Frame per detik
+    """
+    import matplotlib.pyplot as plt
+    from utils.animation import TransformAnimation, interpolated_matrices
+
+    matrices = interpolated_matrices(name, params, center, frames)
+    animation = TransformAnimation(renderer.ax, [scene[i] for i in scene.selection], matrices)
+    static = renderer.set_hidden(scene.selection)
+
+    player = animation.play(fps, static)
+    # Backend tanpa GUI tidak menjalankan timer: batasi waktu tunggu
+    deadline = time.perf_counter() + 2 * frames / fps + 0.5
+    while not animation.finished and time.perf_counter() < deadline:
+        plt.pause(1 / fps)
+
+    player.event_source.stop()
+    animation.remove()
+    renderer.set_hidden(())
+    renderer.invalidate()
+
+
+def transform_selection(scene, choice, animate=None):
+    """
+    Meminta parameter transformasi dan menerapkannya ke semua bentuk terpilih.
+    
+    Penskalaan dan rotasi memakai pusat seleksi (rata-rata centroid bentuk
+    terpilih); untuk satu bentuk sama dengan centroid bentuk itu sendiri.
+    
+    Parameters:
+    -----------
+    scene : Scene
+        Scene yang berisi bentuk terpilih
+    choice : str
+        Pilihan menu: '6' (skala), '7' (cermin), atau '8' (rotasi)
+    animate : callable, optional
+        Dipanggil sebagai animate(name, params, center) sebelum
+        transformasi diterapkan (lihat animate_transition)
+        
+    Returns:
+    --------
+    dict : {shape_id: Shape baru}, kosong jika dibatalkan
+    """
+    if not scene.selection:
+        print("Tidak ada bentuk yang dipilih. Gambar atau pilih bentuk terlebih dahulu.")
+        return {}
+    
+    center = scene.selection_centroid()
+    
+    if choice == '6':
+        factors = read_scaling_factors()
+        if factors is None:
+            return {}
+        matrix = to_homogeneous(get_scaling_matrix(*factors), center)
+        name, params = 'scale', {'sx': factors[0], 'sy': factors[1]}
+        message = f"Penskalaan berhasil diterapkan dengan faktor {factors}"
+    elif choice == '7':
+        axis = read_reflection_axis()
+        if axis is None:
+            return {}
+        matrix = to_homogeneous(get_reflection_matrix(axis))
+        name, params = 'reflect', {'axis': axis}
+        message = f"Pencerminan berhasil diterapkan terhadap sumbu {axis}"
+    else:
+        angle = read_rotation_angle()
+        if angle is None:
+            return {}
+        matrix = to_homogeneous(get_rotation_matrix(angle), center)
+        name, params = 'rotate', {'angle': angle}
+        message = f"Rotasi berhasil diterapkan dengan sudut {angle} derajat"
+    
+    if animate is not None:
+        # Pencerminan selalu terhadap origin (tanpa pusat seleksi)
+        animate(name, params, None if name == 'reflect' else center)
+    
+    changed = scene.transform_selected(matrix, name, params)
+    print(f"{message} pada {len(changed)} bentuk.")
+    return changed
+
+
+def parse_args(argv=None):
+    """Membaca argumen command line."""
+    parser = argparse.ArgumentParser(
+        description='Aplikasi Grafika Komputer 2D (interaktif atau batch).'
+    )
+    parser.add_argument('--script', nargs='+', metavar='FILE',
+                        help='File skrip JSON berisi operasi draw/scale/reflect/rotate. '
+                             'Jika diberikan, aplikasi berjalan tanpa GUI.')
+    parser.add_argument('--out', default='frame.png',
+                        help="Path gambar output. Untuk banyak skrip: direktori, "
+                             "atau pola dengan '{name}' (default: frame.png)")
+    parser.add_argument('--dpi', type=int, default=100,
+                        help='Resolusi gambar output (default: 100)')
+    parser.add_argument('--report', metavar='FILE',
+                        help='Simpan laporan waktu per operasi ke file JSON')
+    parser.add_argument('--stream', nargs=2, metavar=('INPUT', 'OUTPUT'),
+                        help='Terapkan transformasi skrip ke file vertices (.csv atau biner '
+                             'float64) per chunk, tanpa memuat seluruh file ke RAM')
+    parser.add_argument('--chunk-size', type=int,
+                        help='Jumlah vertices per chunk untuk --stream')
+    parser.add_argument('--animate', metavar='OUT',
+                        help="Mode batch: ekspor animasi transisi ke file .gif atau "
+                             "direktori frame PNG (mendukung '{name}')")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES,
+                        help=f'Jumlah frame per animasi transisi; 0 menonaktifkan '
+                             f'animasi interaktif (default: {DEFAULT_FRAMES})')
+    parser.add_argument('--fps', type=float, default=DEFAULT_FPS,
+                        help=f'Frame per detik animasi (default: {DEFAULT_FPS})')
+    parser.add_argument('--profile', metavar='FILE', default=os.environ.get(PROFILE_ENV),
+                        help=f'Profiling per aksi: simpan waktu tiap tahap, counter, dan '
+                             f'puncak memori ke file .json atau .csv (atau set {PROFILE_ENV})')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='Simpan profil cProfile seluruh sesi ke file .prof')
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help='Profiling tanpa pencatatan puncak memori (lebih ringan)')
+    parser.add_argument('--renderer', choices=('artists', 'collection'), default='artists',
+                        help='Renderer interaktif: satu artist per bentuk (artists, dengan '
+                             'culling dan LOD) atau PolyCollection/EllipseCollection untuk '
+                             'scene dengan ribuan bentuk (collection). Default: artists')
+    parser.add_argument('--blocking-input', action='store_true',
+                        help='Mode interaktif dengan input() biasa; jendela tidak '
+                             'responsif selama prompt menunggu')
+    return parser.parse_args(argv)
+
+
+def finish_profiling(args):
+    """Menghentikan profiler, mencetak ringkasan, dan menyimpan laporannya."""
+    PROFILER.stop()
+    report = PROFILER.report()
+    print("\nLaporan profiling:")
+    print(format_profile_report(report))
+    try:
+        if args.profile:
+            PROFILER.write_report(args.profile)
+            print(f"Laporan profiling disimpan ke {args.profile}.")
+        if args.cprofile and PROFILER.dump_cprofile(args.cprofile):
+            print(f"Profil cProfile disimpan ke {args.cprofile}.")
+    except OSError as e:
+        print(f"Gagal menyimpan laporan profiling: {e}")
+
+
+def run_batch_mode(args):
+    """Menjalankan mode batch dan mencetak laporan waktu per operasi."""
+    timings, failures = run_batch(args.script, out=args.out, dpi=args.dpi,
+                                  animate=args.animate, frames=max(args.frames, 2),
+                                  fps=args.fps)
+
+    for script_path, message in failures:
+        print(f"Gagal menjalankan skrip {script_path}: {message}")
+
+    print(f"\n{len(args.script) - len(failures)} dari {len(args.script)} skrip berhasil dirender.")
+    print(format_timing_report(timings))
+
+    if args.report:
+        report = {name: {'count': count, 'total_s': total, 'mean_ms': total * 1000 / count}
+                  for name, (total, count) in timings.items()}
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    return 1 if failures else 0
+
+
+def run_stream_mode(args):
+    """Menjalankan transformasi skrip pada file vertices secara streaming."""
+    if len(args.script) != 1:
+        print("Mode streaming membutuhkan tepat satu file skrip.")
+        return 1
+    
+    input_path, output_path = args.stream
+    try:
+        pipeline = streaming_pipeline(input_path, load_script(args.script[0]), args.chunk_size)
+        start = time.perf_counter()
+        count = pipeline.run(output_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Gagal menjalankan streaming: {e}")
+        return 1
+    
+    print(f"{count} vertices ditransformasi ({len(pipeline)} langkah) ke {output_path} "
+          f"dalam {time.perf_counter() - start:.2f} detik.")
+    return 0
+
+
+def main(argv=None):
     """Fungsi utama aplikasi."""
+    args = parse_args(argv)
+    if args.profile or args.cprofile:
+        PROFILER.start(memory=not args.no_tracemalloc, cprofile=bool(args.cprofile))
+    try:
+        if args.stream:
+            if not args.script:
+                print("--stream membutuhkan --script berisi operasi transformasi.")
+                return 1
+            with PROFILER.action('stream'):
+                return run_stream_mode(args)
+        if args.script:
+            with PROFILER.action('batch'):
+                return run_batch_mode(args)
+        return run_interactive(args)
+    finally:
+        if PROFILER.enabled:
+            finish_profiling(args)
+
+
+def run_interactive(args):
+    """Menjalankan aplikasi interaktif dengan menu."""
+    # pyplot dan backend GUI hanya dimuat untuk mode interaktif
+    import matplotlib.pyplot as plt
+    if args.renderer == 'collection':
+        from utils.collection_renderer import SceneCollectionRenderer as ShapeRenderer
+    else:
+        from utils.renderer import ShapeRenderer
+    
     print("\n" + "="*50)
     print("   SELAMAT DATANG DI APLIKASI GRAFIKA KOMPUTER")
     print("="*50)
@@ -91,83 +484,125 @@ def main():
         title='Interactive Drawing and Transformation Application'
     )
     
+    # Scene menyimpan semua bentuk; renderer memakai ulang artist bentuk,
+    # hanya mem-blit perubahan, dan melewati bentuk di luar viewport.
+    # --renderer collection menggambar semua bentuk dengan beberapa collection
+    scene = Scene()
+    renderer = ShapeRenderer(ax, scene)
+    
+    animate = None
+    if args.frames >= 2:
+        def animate(name, params, center):
+            with PROFILER.stage('animation'):
+                animate_transition(renderer, scene, name, params, center, args.frames, args.fps)
+    
     # Enable interactive mode
     plt.ion()
     plt.show()
     
-    # Variabel untuk menyimpan data bentuk terakhir
-    current_shape_data = None
+    # Input dibaca di thread terpisah; selama prompt menunggu, event loop
+    # GUI terus dipompa sehingga jendela tetap bisa di-pan/zoom/resize
+    event_loop = None
+    if not args.blocking_input:
+        event_loop = EventLoop(fig.canvas).install()
+    mouse_tool = None
     
     while True:
         show_menu()
-        choice = input("\nPilih opsi (1-10): ").strip()
+        try:
+            choice = input("\nPilih opsi (1-14): ").strip()
+        except EOFError:
+            # stdin habis (misalnya input dari pipe): keluar seperti pilihan 10
+            choice = '10'
         
+        # Profiling: setiap tahap aksi diukur terpisah (input pengguna
+        # dicatat otomatis sebagai tahap 'input')
+        PROFILER.begin_action(MENU_ACTIONS.get(choice, 'invalid'))
         shape_data = None
         
-        if choice == '1':
-            shape_data = draw_square(ax)
-            
-        elif choice == '2':
-            shape_data = draw_triangle(ax)
-            
-        elif choice == '3':
-            shape_data = draw_rectangle(ax)
+        if choice in DRAW_FUNCTIONS:
+            with PROFILER.stage('build'):
+                shape_data = DRAW_FUNCTIONS[choice](ax)
             
-        elif choice == '4':
-            shape_data = draw_circle(ax)
-            
-        elif choice == '5':
-            shape_data = draw_trapezoid(ax)
-            
-        elif choice == '6':
-            if current_shape_data is not None:
-                new_data = apply_scaling(ax, current_shape_data)
-                if new_data is not None:
-                    current_shape_data = new_data
-            else:
-                print("Tidak ada bentuk yang tersedia. Gambar bentuk terlebih dahulu.")
-                
-        elif choice == '7':
-            if current_shape_data is not None:
-                new_data = apply_reflection(ax, current_shape_data)
-                if new_data is not None:
-                    current_shape_data = new_data
-            else:
-                print("Tidak ada bentuk yang tersedia. Gambar bentuk terlebih dahulu.")
-                
-        elif choice == '8':
-            if current_shape_data is not None:
-                new_data = apply_rotation(ax, current_shape_data)
-                if new_data is not None:
-                    current_shape_data = new_data
-            else:
-                print("Tidak ada bentuk yang tersedia. Gambar bentuk terlebih dahulu.")
+        elif choice in ['6', '7', '8']:
+            with PROFILER.stage('transform'):
+                changed = transform_selection(scene, choice, animate)
+            if PROFILER.enabled:
+                PROFILER.count('vertices_transformed',
+                               sum(len(shape.vertices) for shape in changed.values()))
+            with PROFILER.stage('artists'):
+                for shape_id, new_data in changed.items():
+                    renderer.update(shape_id, new_data)
                 
         elif choice == '9':
-            clear_all_shapes(ax)
-            current_shape_data = None
+            with PROFILER.stage('artists'):
+                renderer.clear()
+                clear_all_shapes(ax)
+                renderer.invalidate()
+            scene.clear()
             
         elif choice == '10':
             print("\nKeluar dari aplikasi. Sampai jumpa!")
+            PROFILER.end_action()
             break
             
+        elif choice == '11':
+            with PROFILER.stage('select'):
+                select_shapes(scene)
+            
+        elif choice == '14':
+            if event_loop is None:
+                print("Mode mouse membutuhkan event loop non-blocking (tanpa --blocking-input).")
+            else:
+                mouse_tool = start_mouse_drawing(renderer, scene, mouse_tool)
+            
+        elif choice in ['12', '13']:
+            with PROFILER.stage('transform'):
+                changed = scene.undo() if choice == '12' else scene.redo()
+            if changed:
+                with PROFILER.stage('artists'):
+                    for shape_id, new_data in changed.items():
+                        renderer.update(shape_id, new_data)
+                action = 'Undo' if choice == '12' else 'Redo'
+                print(f"{action} berhasil pada {len(changed)} bentuk.")
+            else:
+                print("Tidak ada transformasi untuk di-" + ('undo.' if choice == '12' else 'redo.'))
+            
         else:
-            print("Pilihan tidak valid. Harap masukkan angka antara 1 dan 10.")
+            print("Pilihan tidak valid. Harap masukkan angka antara 1 dan 14.")
+        
+        # Bentuk baru ditambahkan ke scene (bentuk lama tetap ada) dan langsung dipilih
+        if choice in DRAW_FUNCTIONS and shape_data is not None:
+            PROFILER.count('vertices_created', len(shape_data.vertices))
+            with PROFILER.stage('scene'):
+                shape_id = scene.add(shape_data)
+                scene.select([shape_id])
+            # Buang patch sementara dari draw_*, lalu serahkan ke renderer
+            with PROFILER.stage('artists'):
+                renderer.remove_untracked_artists()
+                renderer.update(shape_id, scene[shape_id])
+            print(f"Bentuk disimpan dengan ID {shape_id}.")
         
-        # Update current_shape_data jika menggambar bentuk baru
-        if choice in ['1', '2', '3', '4', '5'] and shape_data is not None:
-            current_shape_data = shape_data
-            plot_shape_on_ax(ax, current_shape_data, clear_previous=True)
+        with PROFILER.stage('artists'):
+            renderer.highlight(scene.selection)
         
-        # Redraw canvas
-        plt.draw()
-        plt.pause(0.1)
+        # Tampilkan perubahan hanya jika ada yang berubah: blit bila hanya
+        # bentuk yang berubah, full draw bila latar (batas sumbu, grid) ikut berubah
+        if renderer.dirty:
+            with PROFILER.stage('draw'):
+                renderer.refresh()
+                fig.canvas.flush_events()
+        PROFILER.end_action()
     
     # Cleanup
+    if mouse_tool is not None:
+        mouse_tool.disconnect()
+    if event_loop is not None:
+        event_loop.uninstall()
     plt.ioff()
     plt.close(fig)
     print("Aplikasi gambar telah ditutup.")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
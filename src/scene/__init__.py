@@ -0,0 +1,13 @@
+"""
+Modul scene untuk mengelola banyak bentuk sekaligus.
+
+- Scene        : kumpulan bentuk dengan ID, seleksi, dan transformasi seleksi
+- SpatialIndex : grid seragam untuk hit-test, seleksi persegi panjang,
+                 dan culling viewport
+- CollisionDetector / find_overlaps : pasangan bentuk yang bertumpuk
+                 (broad phase grid + narrow phase SAT/lingkaran), inkremental
+"""
+
+from .scene import Scene
+from .spatial_index import SpatialIndex
+from .collision import CollisionDetector, find_overlaps
@@ -0,0 +1,587 @@
+"""
+Modul deteksi tumpang tindih (collision) untuk scene dengan banyak bentuk.
+
+Deteksi dilakukan dua tahap pada ShapeArray:
+
+1. Broad phase: grid seragam atas bounding box (seperti SpatialIndex,
+   tetapi dibangun dan di-query dengan NumPy). Setiap bentuk didaftarkan
+   ke semua sel yang disentuh bounding box-nya; pasangan kandidat adalah
+   pasangan dalam sel yang sama. Pasangan hanya dilaporkan oleh sel yang
+   memuat pojok kiri bawah irisan bounding box keduanya, sehingga tidak
+   ada duplikat. Bentuk yang mencakup lebih dari max_cells_per_item sel
+   diperiksa terpisah terhadap semua bentuk.
+2. Narrow phase, per jenis pasangan dan secara vektor:
+   - polygon konveks vs polygon konveks (square, rectangle, triangle,
+     trapezoid): Separating Axis Theorem dengan normal setiap edge
+   - lingkaran vs polygon konveks: polygon dipindah ke ruang lokal
+     lingkaran (invers matriks affine-nya), lalu diuji tepat: pusat di
+     dalam polygon atau jarak pusat ke edge terdekat < radius. Berlaku
+     juga untuk lingkaran yang sudah menjadi elips
+   - lingkaran vs lingkaran: jarak pusat < jumlah radius. Jika salah satu
+     sudah menjadi elips, elips lain didekati polygon yang melingkupinya
+     (ELLIPSE_SEGMENTS sisi), sehingga tidak ada tumpang tindih yang terlewat
+   - pasangan dengan bentuk 'polygon' (hasil operasi boolean, bisa tidak
+     konveks): luas irisan dari shapes.boolean
+
+Dua bentuk dianggap bertumpuk jika interiornya beririsan; bentuk yang
+hanya bersentuhan di tepi tidak dilaporkan.
+
+CollisionDetector menyimpan hasilnya dan bersifat inkremental: setelah
+beberapa bentuk dipindah, hanya pasangan kandidat bentuk-bentuk tersebut
+yang diperiksa ulang. Grid tidak dibangun ulang setiap kali; bentuk yang
+sudah dipindah diperiksa langsung sampai jumlahnya melewati
+REBUILD_FRACTION dari seluruh bentuk.
+"""
+
+import numpy as np
+
+from shapes.boolean import intersection
+from shapes.shape_array import SHAPE_TYPES, ShapeArray
+
+
+# Bentuk konveks yang diuji dengan Separating Axis Theorem
+CONVEX_TYPES = ('square', 'triangle', 'rectangle', 'trapezoid')
+
+# Jumlah sisi polygon pendekatan elips pada uji lingkaran vs elips
+ELLIPSE_SEGMENTS = 64
+
+# Grid dibangun ulang setelah bagian bentuk ini dipindah sejak pembangunan terakhir
+REBUILD_FRACTION = 1 / 16
+
+# Batas jumlah pasangan yang diproses sekaligus (membatasi memori)
+MAX_PAIRS_PER_CHUNK = 1 << 20
+
+CIRCLE_CODE = SHAPE_TYPES.index('circle')
+CONVEX_CODES = np.array([SHAPE_TYPES.index(name) for name in CONVEX_TYPES])
+
+
+def _range_pairs(lo, hi):
+    """
+    Pasangan (baris, kolom) untuk semua baris i dan kolom lo[i]..hi[i]-1,
+    dipecah menjadi beberapa chunk (generator).
+    """
+    counts = np.maximum(hi - lo, 0)
+    ends = np.cumsum(counts)
+    row = 0
+    while row < len(lo):
+        base = ends[row] - counts[row]
+        stop = max(int(np.searchsorted(ends, base + MAX_PAIRS_PER_CHUNK, 'right')), row + 1)
+        rows = np.repeat(np.arange(row, stop), counts[row:stop])
+        first = ends[row:stop] - counts[row:stop] - base
+        cols = (np.arange(len(rows)) - np.repeat(first, counts[row:stop])
+                + np.repeat(lo[row:stop], counts[row:stop]))
+        if len(rows):
+            yield rows, cols
+        row = stop
+
+
+def _bounds_overlap(a, b):
+    """Uji irisan bounding box per baris, array (n, 4) vs (n, 4)."""
+    return (a[:, 0] <= b[:, 2]) & (b[:, 0] <= a[:, 2]) & (a[:, 1] <= b[:, 3]) & (b[:, 1] <= a[:, 3])
+
+
+def _cell_keys(ix, iy):
+    """Kunci int64 unik untuk sel (ix, iy)."""
+    return ix * (1 << 32) + iy
+
+
+def default_cell_size(bounds):
+    """Ukuran sel default: dua kali median sisi terpanjang bounding box."""
+    if len(bounds) == 0:
+        return 1.0
+    extent = np.maximum(bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1])
+    size = 2 * float(np.median(extent))
+    return size if size > 0 else 1.0
+
+
+class _Grid:
+    """Grid seragam statis atas bounding box: entri (kunci sel, indeks bentuk) terurut."""
+
+    def __init__(self, bounds, cell_size, max_cells_per_item):
+        self.cell_size = cell_size
+        cells = np.floor(bounds / cell_size).astype(np.int64)
+        nx = cells[:, 2] - cells[:, 0] + 1
+        ny = cells[:, 3] - cells[:, 1] + 1
+        spans = nx * ny
+        large = spans > max_cells_per_item
+        self.oversized = np.flatnonzero(large)
+
+        items = np.flatnonzero(~large)
+        spans = spans[items]
+        entry_item = np.repeat(items, spans)
+        local = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        width = nx[entry_item]
+        keys = _cell_keys(cells[entry_item, 0] + local % width, cells[entry_item, 1] + local // width)
+        order = np.argsort(keys, kind='stable')
+        self.keys, self.items = keys[order], entry_item[order]
+
+    def pairs(self, bounds):
+        """Pasangan kandidat (i, j) antar bentuk yang terdaftar, tanpa duplikat (generator)."""
+        keys, items = self.keys, self.items
+        cell_end = np.searchsorted(keys, keys, 'right')
+        for rows, cols in _range_pairs(np.arange(len(keys)) + 1, cell_end):
+            i, j = items[rows], items[cols]
+            box_i, box_j = bounds[i], bounds[j]
+            reference = np.floor(np.maximum(box_i[:, :2], box_j[:, :2]) / self.cell_size).astype(np.int64)
+            keep = _bounds_overlap(box_i, box_j) & (_cell_keys(reference[:, 0], reference[:, 1]) == keys[rows])
+            yield i[keep], j[keep]
+
+    def query(self, query_bounds, max_cells_per_item):
+        """
+        Bentuk terdaftar yang selnya disentuh setiap bounding box query.
+
+        Returns:
+        --------
+        tuple : (indeks query, indeks bentuk); bisa berisi duplikat dan
+                bentuk yang bounding box-nya tidak beririsan
+        """
+        cells = np.floor(query_bounds / self.cell_size).astype(np.int64)
+        nx = cells[:, 2] - cells[:, 0] + 1
+        spans = nx * (cells[:, 3] - cells[:, 1] + 1)
+        # Query yang sangat besar tidak dipecah per sel (lihat CollisionDetector._candidates)
+        spans = np.where(spans > max_cells_per_item, 0, spans)
+        entry_query = np.repeat(np.arange(len(query_bounds)), spans)
+        local = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        width = nx[entry_query]
+        keys = _cell_keys(cells[entry_query, 0] + local % width, cells[entry_query, 1] + local // width)
+        lo = np.searchsorted(self.keys, keys, 'left')
+        hi = np.searchsorted(self.keys, keys, 'right')
+        found_query, found_item = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for rows, cols in _range_pairs(lo, hi):
+            found_query.append(entry_query[rows])
+            found_item.append(self.items[cols])
+        return np.concatenate(found_query), np.concatenate(found_item)
+
+
+def candidate_pairs(bounds, cell_size=None, max_cells_per_item=256):
+    """
+    Broad phase: pasangan bentuk yang bounding box-nya beririsan.
+
+    Parameters:
+    -----------
+    bounds : array_like
+        Bounding box (n, 4), misalnya ShapeArray.bounds()
+    cell_size : float, optional
+        Ukuran sel grid (default: default_cell_size)
+    max_cells_per_item : int
+        Bentuk yang mencakup lebih banyak sel diperiksa terhadap semua bentuk
+
+    Returns:
+    --------
+    numpy.ndarray : Pasangan (P, 2) dengan i < j
+    """
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+    grid = _Grid(bounds, cell_size or default_cell_size(bounds), max_cells_per_item)
+    return _normalized(list(grid.pairs(bounds)) + _oversized_pairs(bounds, grid.oversized))
+
+
+def _oversized_pairs(bounds, oversized):
+    """Pasangan bentuk besar dengan semua bentuk lain (uji bounding box langsung)."""
+    pairs = []
+    is_oversized = np.zeros(len(bounds), dtype=bool)
+    is_oversized[oversized] = True
+    for item in oversized.tolist():
+        hits = np.flatnonzero(_bounds_overlap(bounds, bounds[item][None]))
+        # Pasangan dua bentuk besar hanya dilaporkan sekali
+        hits = hits[~is_oversized[hits] | (hits > item)]
+        pairs.append((np.full(len(hits), item), hits))
+    return pairs
+
+
+def _normalized(pairs):
+    """Menggabungkan potongan pasangan menjadi array (P, 2) unik dengan i < j."""
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    i = np.concatenate([np.asarray(p[0], dtype=np.int64) for p in pairs])
+    j = np.concatenate([np.asarray(p[1], dtype=np.int64) for p in pairs])
+    valid = i != j
+    # Kunci 1D (i << 32) + j: unique 1D jauh lebih cepat dari unique(axis=0)
+    keys = np.unique(_cell_keys(np.minimum(i, j)[valid], np.maximum(i, j)[valid]))
+    return np.column_stack((keys >> 32, keys & 0xFFFFFFFF))
+
+
+def _vertex_counts(shapes, indices):
+    """Jumlah vertices bentuk tertentu (tanpa menghitung untuk seluruh ShapeArray)."""
+    return shapes.offsets[indices + 1] - shapes.offsets[indices]
+
+
+def _gather(shapes, indices, vertex_count):
+    """Vertices (n, vertex_count, 2) bentuk dengan jumlah vertices sama."""
+    rows = shapes.offsets[indices][:, None] + np.arange(vertex_count)
+    return np.asarray(shapes.vertices[rows], dtype=np.float64)
+
+
+def _edge_normals(polygons):
+    """Normal setiap edge polygon (n, k, 2) (tidak dinormalisasi)."""
+    edges = np.roll(polygons, -1, axis=1) - polygons
+    return np.stack((-edges[..., 1], edges[..., 0]), axis=-1)
+
+
+def sat_overlap(polygons_a, polygons_b):
+    """
+    Separating Axis Theorem untuk pasangan polygon konveks.
+
+    Parameters:
+    -----------
+    polygons_a : numpy.ndarray
+        Vertices (n, ka, 2)
+    polygons_b : numpy.ndarray
+        Vertices (n, kb, 2)
+
+    Returns:
+    --------
+    numpy.ndarray : bool (n,), True jika interior kedua polygon beririsan
+    """
+    axes = np.concatenate((_edge_normals(polygons_a), _edge_normals(polygons_b)), axis=1)
+    project_a = np.einsum('pad,pvd->pav', axes, polygons_a)
+    project_b = np.einsum('pad,pvd->pav', axes, polygons_b)
+    separated = ((project_a.max(axis=2) <= project_b.min(axis=2))
+                 | (project_b.max(axis=2) <= project_a.min(axis=2)))
+    # Edge berpanjang nol tidak memberi sumbu
+    separated &= np.any(axes != 0, axis=2)
+    return ~separated.any(axis=1)
+
+
+def disk_polygon_overlap(centers, radii, polygons):
+    """
+    Uji tepat lingkaran vs polygon konveks.
+
+    Parameters:
+    -----------
+    centers : numpy.ndarray
+        Pusat lingkaran (n, 2)
+    radii : numpy.ndarray
+        Radius (n,)
+    polygons : numpy.ndarray
+        Vertices polygon konveks (n, k, 2), orientasi bebas
+
+    Returns:
+    --------
+    numpy.ndarray : bool (n,)
+    """
+    edges = np.roll(polygons, -1, axis=1) - polygons
+    offsets = centers[:, None, :] - polygons
+    cross = edges[..., 0] * offsets[..., 1] - edges[..., 1] * offsets[..., 0]
+    inside = (cross > 0).all(axis=1) | (cross < 0).all(axis=1)
+
+    length2 = np.einsum('pkd,pkd->pk', edges, edges)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.clip(np.einsum('pkd,pkd->pk', offsets, edges) / length2, 0.0, 1.0)
+    t = np.nan_to_num(t)
+    nearest = offsets - t[..., None] * edges
+    distance2 = np.einsum('pkd,pkd->pk', nearest, nearest).min(axis=1)
+    return inside | (distance2 < radii ** 2)
+
+
+def _circle_frames(shapes, circles):
+    """Invers linear, translasi, pusat lokal, dan radius lingkaran; flag matriks singular."""
+    linear, translation = shapes.circle_affines(circles)
+    det = np.linalg.det(linear)
+    regular = np.abs(det) > 0
+    inverse = np.zeros_like(linear)
+    inverse[regular] = np.linalg.inv(linear[regular])
+    return inverse, translation, shapes.anchors[circles], shapes.params[circles, 0], regular
+
+
+def _circle_polygon(shapes, circles, polygons):
+    """Lingkaran/elips vs polygon konveks, diuji di ruang lokal lingkaran."""
+    result = np.zeros(len(circles), dtype=bool)
+    inverse, translation, centers, radii, regular = _circle_frames(shapes, circles)
+    counts = _vertex_counts(shapes, polygons)
+    for vertex_count in np.unique(counts).tolist():
+        select = np.flatnonzero((counts == vertex_count) & regular)
+        vertices = _gather(shapes, polygons[select], vertex_count)
+        local = np.einsum('pij,pkj->pki', inverse[select], vertices - translation[select, None])
+        result[select] = disk_polygon_overlap(centers[select], radii[select], local)
+    return result
+
+
+def _circle_circle(shapes, first, second):
+    """Lingkaran vs lingkaran; pasangan dengan elips memakai polygon yang melingkupi elips."""
+    linear_a, translation_a = shapes.circle_affines(first)
+    linear_b, translation_b = shapes.circle_affines(second)
+    radius_a, radius_b = shapes.params[first, 0], shapes.params[second, 0]
+
+    def similarity(linear):
+        gram = np.einsum('pki,pkj->pij', linear, linear)
+        scale = np.abs(gram).max(axis=(1, 2)) + 1e-300
+        uniform = (np.abs(gram[:, 0, 1]) <= 1e-12 * scale) & (np.abs(gram[:, 0, 0] - gram[:, 1, 1]) <= 1e-12 * scale)
+        return uniform, np.sqrt(np.abs(np.linalg.det(linear)))
+
+    uniform_a, scale_a = similarity(linear_a)
+    uniform_b, scale_b = similarity(linear_b)
+    centers_a = np.einsum('pij,pj->pi', linear_a, shapes.anchors[first]) + translation_a
+    centers_b = np.einsum('pij,pj->pi', linear_b, shapes.anchors[second]) + translation_b
+    gap = centers_a - centers_b
+    result = np.einsum('pd,pd->p', gap, gap) < (radius_a * scale_a + radius_b * scale_b) ** 2
+
+    # Elips: lingkaran kedua -> polygon melingkupi (dalam ruang dunia) -> ruang lokal lingkaran pertama
+    ellipse = np.flatnonzero(~(uniform_a & uniform_b))
+    if len(ellipse):
+        angles = np.linspace(0, 2 * np.pi, ELLIPSE_SEGMENTS, endpoint=False)
+        unit = np.column_stack((np.cos(angles), np.sin(angles))) / np.cos(np.pi / ELLIPSE_SEGMENTS)
+        local_b = shapes.anchors[second[ellipse], None] + radius_b[ellipse, None, None] * unit
+        world_b = np.einsum('pij,pkj->pki', linear_b[ellipse], local_b) + translation_b[ellipse, None]
+        inverse, translation, centers, radii, regular = _circle_frames(shapes, first[ellipse])
+        local = np.einsum('pij,pkj->pki', inverse, world_b - translation[:, None])
+        result[ellipse] = regular & disk_polygon_overlap(centers, radii, local)
+    return result
+
+
+def narrow_phase(shapes, first, second):
+    """
+    Uji tumpang tindih tepat untuk pasangan bentuk (lihat modul).
+
+    Parameters:
+    -----------
+    shapes : ShapeArray
+        Kumpulan bentuk
+    first, second : array of int
+        Indeks pasangan
+
+    Returns:
+    --------
+    numpy.ndarray : bool (P,), True jika pasangan bertumpuk
+    """
+    first = np.asarray(first, dtype=np.int64).reshape(-1)
+    second = np.asarray(second, dtype=np.int64).reshape(-1)
+    # Urutan tetap: pendekatan elips tidak simetris terhadap urutan pasangan
+    first, second = np.minimum(first, second), np.maximum(first, second)
+    result = np.zeros(len(first), dtype=bool)
+    codes_a, codes_b = shapes.type_codes[first], shapes.type_codes[second]
+    convex_a, convex_b = np.isin(codes_a, CONVEX_CODES), np.isin(codes_b, CONVEX_CODES)
+    circle_a, circle_b = codes_a == CIRCLE_CODE, codes_b == CIRCLE_CODE
+
+    # Polygon konveks vs polygon konveks, dikelompokkan per (jumlah vertices A, B)
+    both = np.flatnonzero(convex_a & convex_b)
+    counts = np.column_stack((_vertex_counts(shapes, first[both]), _vertex_counts(shapes, second[both])))
+    for count_a, count_b in (np.unique(counts, axis=0).tolist() if len(both) else []):
+        select = both[(counts[:, 0] == count_a) & (counts[:, 1] == count_b)]
+        result[select] = sat_overlap(_gather(shapes, first[select], count_a),
+                                     _gather(shapes, second[select], count_b))
+
+    select = np.flatnonzero(circle_a & convex_b)
+    result[select] = _circle_polygon(shapes, first[select], second[select])
+    select = np.flatnonzero(convex_a & circle_b)
+    result[select] = _circle_polygon(shapes, second[select], first[select])
+    select = np.flatnonzero(circle_a & circle_b)
+    result[select] = _circle_circle(shapes, first[select], second[select])
+
+    # Bentuk lain (polygon hasil operasi boolean): luas irisan
+    for pair in np.flatnonzero(~(convex_a | circle_a) | ~(convex_b | circle_b)).tolist():
+        result[pair] = bool(intersection(shapes[int(first[pair])], shapes[int(second[pair])]))
+    return result
+
+
+def find_overlaps(shapes, cell_size=None, max_cells_per_item=256):
+    """
+    Semua pasangan bentuk yang bertumpuk (broad phase + narrow phase).
+
+    Parameters:
+    -----------
+    shapes : ShapeArray atau iterable of Shape
+        Kumpulan bentuk
+    cell_size : float, optional
+        Ukuran sel grid broad phase (default: default_cell_size)
+    max_cells_per_item : int
+        Lihat candidate_pairs
+
+    Returns:
+    --------
+    numpy.ndarray : Pasangan indeks (P, 2) dengan i < j, terurut
+
+    Example:
+    --------
+    >>> find_overlaps([create_square(2, 0, 0), create_circle(2, 2, 1), create_square(1, 5, 5)])
+    array([[0, 1]])
+    """
+    return CollisionDetector(shapes, cell_size, max_cells_per_item).pairs()
+
+
+class CollisionDetector:
+    """
+    Daftar pasangan bentuk yang bertumpuk, diperbarui secara inkremental.
+
+    Pasangan disimpan sebagai array dasar terurut (hasil pemeriksaan penuh)
+    ditambah pasangan baru per bentuk yang dipindah sejak itu. Pasangan
+    dasar yang melibatkan bentuk yang sudah dipindah diabaikan; keduanya
+    digabung kembali setiap kali grid dibangun ulang.
+
+    Parameters:
+    -----------
+    shapes : ShapeArray atau iterable of Shape
+        Kumpulan bentuk; dikonversi ke ShapeArray bila perlu
+    cell_size : float, optional
+        Ukuran sel grid broad phase (default: default_cell_size)
+    max_cells_per_item : int
+        Bentuk yang mencakup lebih banyak sel diperiksa terhadap semua bentuk
+
+    Example:
+    --------
+    >>> detector = CollisionDetector(shapes)
+    >>> detector.pairs()                        # Array (P, 2)
+    >>> detector.transform([7], translasi)     # Hanya kandidat bentuk 7 yang diuji ulang
+    >>> detector.partners(7)
+
+    Note:
+    -----
+    Jika vertices, anchors, atau transforms ShapeArray diubah langsung
+    (bukan lewat transform), panggil update(indices) untuk bentuk yang berubah.
+    """
+
+    def __init__(self, shapes, cell_size=None, max_cells_per_item=256):
+        if not isinstance(shapes, ShapeArray):
+            shapes = ShapeArray.from_shapes(shapes)
+        self.shapes = shapes
+        self._cell_size_fixed = cell_size is not None
+        self.cell_size = float(cell_size) if cell_size else None
+        self.max_cells_per_item = max_cells_per_item
+        # Jumlah pasangan yang sudah diuji narrow phase (untuk pengukuran)
+        self.checked_pairs = 0
+        self.rebuild()
+
+    def __len__(self):
+        return len(self.pairs())
+
+    def _check(self, first, second):
+        self.checked_pairs += len(first)
+        return narrow_phase(self.shapes, first, second)
+
+    def _reset(self, pairs):
+        """Menjadikan pairs (terurut, unik) sebagai pasangan dasar dan membangun ulang grid."""
+        self._base = pairs
+        self._base_by_second = np.argsort(pairs[:, 1], kind='stable')
+        # Pasangan baru bentuk yang dipindah: indeks -> set indeks pasangan
+        self._extra = {}
+        self._grid = _Grid(self.bounds, self.cell_size, self.max_cells_per_item)
+        # Bentuk yang dipindah sejak grid dibangun: posisi di grid dan pasangan dasarnya usang
+        self._moved = np.zeros(len(self.shapes), dtype=bool)
+        self._moved_items = []
+
+    def rebuild(self):
+        """Membangun ulang grid dan memeriksa semua pasangan dari awal."""
+        self.bounds = self.shapes.bounds()
+        if not self._cell_size_fixed:
+            self.cell_size = default_cell_size(self.bounds)
+        self._reset(np.empty((0, 2), dtype=np.int64))
+        pairs = []
+        for i, j in list(self._grid.pairs(self.bounds)) + _oversized_pairs(self.bounds, self._grid.oversized):
+            hit = self._check(i, j)
+            pairs.append((i[hit], j[hit]))
+        self._base = _normalized(pairs)
+        self._base_by_second = np.argsort(self._base[:, 1], kind='stable')
+        return self
+
+    def pairs(self):
+        """Pasangan bentuk yang bertumpuk, array (P, 2) dengan i < j, terurut."""
+        base = self._base
+        if self._moved_items:
+            base = base[~(self._moved[base[:, 0]] | self._moved[base[:, 1]])]
+        extra = [(item, partner) for item, partners in self._extra.items()
+                 for partner in partners if item < partner]
+        if not extra:
+            return base.copy()
+        return _normalized([(base[:, 0], base[:, 1]), tuple(np.array(extra, dtype=np.int64).T)])
+
+    def partners(self, index):
+        """Indeks bentuk yang bertumpuk dengan bentuk ke-index, terurut."""
+        found = list(self._extra.get(index, ()))
+        if not self._moved[index]:
+            base = self._base
+            lo, hi = np.searchsorted(base[:, 0], (index, index + 1))
+            by_second = self._base_by_second
+            lo2, hi2 = np.searchsorted(base[by_second, 1], (index, index + 1))
+            others = np.concatenate((base[lo:hi, 1], base[by_second[lo2:hi2], 0]))
+            found.extend(others[~self._moved[others]].tolist())
+        return np.array(sorted(found), dtype=np.int64)
+
+    def colliding(self):
+        """Indeks semua bentuk yang bertumpuk dengan minimal satu bentuk lain."""
+        return np.unique(self.pairs())
+
+    def _candidates(self, indices):
+        """Pasangan kandidat (index, bentuk lain) untuk bentuk-bentuk tertentu."""
+        query = self.bounds[indices]
+        parts = [self._grid.query(query, self.max_cells_per_item)]
+
+        # Posisi bentuk yang sudah dipindah di grid utama tidak berlaku lagi:
+        # bentuk-bentuk ini dicari lewat grid sementara
+        large = self._grid.oversized
+        moved = np.array(self._moved_items, dtype=np.int64)
+        if len(moved):
+            grid = _Grid(self.bounds[moved], self.cell_size, self.max_cells_per_item)
+            rows, found = grid.query(query, self.max_cells_per_item)
+            parts.append((rows, moved[found]))
+            large = np.concatenate((large, moved[grid.oversized]))
+
+        # Bentuk besar dipasangkan dengan semua query, query besar dengan semua bentuk
+        rows = np.arange(len(indices))
+        parts.append((np.repeat(rows, len(large)), np.tile(large, len(rows))))
+        cells = np.floor(query / self.cell_size)
+        spans = (cells[:, 2] - cells[:, 0] + 1) * (cells[:, 3] - cells[:, 1] + 1)
+        for row in np.flatnonzero(spans > self.max_cells_per_item).tolist():
+            parts.append((np.full(len(self.shapes), row), np.arange(len(self.shapes))))
+
+        rows = np.concatenate([part[0] for part in parts])
+        items = np.concatenate([part[1] for part in parts])
+        keep = _bounds_overlap(query[rows], self.bounds[items]) & (items != indices[rows])
+        return indices[rows[keep]], items[keep]
+
+    def update(self, indices):
+        """
+        Memeriksa ulang bentuk-bentuk yang berubah.
+
+        Hanya pasangan kandidat bentuk tersebut (dari grid) yang diuji
+        narrow phase; pasangan lain tidak disentuh.
+
+        Parameters:
+        -----------
+        indices : int atau array of int
+            Indeks bentuk yang sudah berubah di ShapeArray
+
+        Returns:
+        --------
+        CollisionDetector : Objek ini sendiri
+        """
+        indices = np.unique(np.atleast_1d(np.asarray(indices, dtype=np.int64)))
+        if len(indices) == 0:
+            return self
+        self.bounds[indices] = self.shapes.bounds(indices)
+        new = indices[~self._moved[indices]]
+        self._moved[new] = True
+        self._moved_items.extend(new.tolist())
+
+        # Lepas pasangan lama bentuk-bentuk ini, lalu catat hasil pemeriksaan ulang
+        for item in indices.tolist():
+            for partner in self._extra.pop(item, ()):
+                partners = self._extra.get(partner)
+                if partners is not None:
+                    partners.discard(item)
+        first, second = self._candidates(indices)
+        hit = self._check(first, second)
+        for a, b in _normalized([(first[hit], second[hit])]).tolist():
+            self._extra.setdefault(a, set()).add(b)
+            self._extra.setdefault(b, set()).add(a)
+
+        if len(self._moved_items) > len(self.shapes) * REBUILD_FRACTION:
+            self._reset(self.pairs())
+        return self
+
+    def transform(self, indices, matrix):
+        """
+        Mentransformasi bentuk tertentu dengan matriks homogen 3x3, lalu update.
+
+        Parameters:
+        -----------
+        indices : int atau array of int
+            Indeks bentuk
+        matrix : array_like
+            Matriks affine homogen 3x3
+
+        Returns:
+        --------
+        CollisionDetector : Objek ini sendiri
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        self.shapes.transform(matrix, indices=indices)
+        return self.update(indices)
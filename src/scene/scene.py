@@ -0,0 +1,323 @@
+"""
+Modul scene: wadah banyak bentuk dengan ID dan seleksi.
+
+Setiap bentuk yang ditambahkan mendapat ID bilangan bulat yang terus
+bertambah; ID yang lebih besar digambar di atas ID yang lebih kecil.
+Bounding box setiap bentuk didaftarkan ke SpatialIndex sehingga
+hit-test titik, seleksi persegi panjang, dan culling viewport tidak
+perlu memeriksa seluruh bentuk.
+
+Transformasi diterapkan ke seluruh bentuk terpilih sekaligus dengan satu
+matriks affine homogen 3x3. Setiap bentuk memiliki TransformHistory
+(matriks kumulatif + referensi geometri asal), dan setiap transformasi
+seleksi dicatat sebagai satu aksi sehingga undo/redo memulihkan semua
+bentuk yang terkena sekaligus.
+"""
+
+import numpy as np
+
+from transformations.history import TransformHistory
+
+from .spatial_index import SpatialIndex
+
+
+class Scene:
+    """
+    Kumpulan bentuk dengan ID, seleksi, dan spatial index.
+
+    Parameters:
+    -----------
+    cell_size : float
+        Ukuran sel grid SpatialIndex
+
+    Example:
+    --------
+    >>> scene = Scene()
+    >>> a = scene.add(create_square(2, 0, 0))
+    >>> b = scene.add(create_circle(5, 5, 1))
+    >>> scene.shape_at(1, 1)
+    1
+    >>> scene.select_rect((-1, -1, 3, 3))
+    [1]
+    >>> scene.transform_selected(matriks_3x3)
+    >>> scene.undo()
+    """
+
+    def __init__(self, cell_size=2.0):
+        self._shapes = {}
+        self._histories = {}
+        self._selection = {}
+        self._next_id = 1
+        self.index = SpatialIndex(cell_size)
+
+        # Setiap aksi adalah tuple ID bentuk yang terkena satu transformasi
+        self._undo_stack = []
+        self._redo_stack = []
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def __contains__(self, shape_id):
+        return shape_id in self._shapes
+
+    def __getitem__(self, shape_id):
+        return self._shapes[shape_id]
+
+    def __iter__(self):
+        return iter(self._shapes)
+
+    def items(self):
+        """Pasangan (shape_id, Shape) dengan urutan penambahan (bawah ke atas)."""
+        return self._shapes.items()
+
+    def shapes(self):
+        """List Shape dengan urutan penambahan, misalnya untuk CollectionRenderer."""
+        return list(self._shapes.values())
+
+    # --- Menambah, mengganti, dan menghapus bentuk ---
+
+    def add(self, shape_data):
+        """
+        Menambahkan bentuk ke scene.
+
+        Parameters:
+        -----------
+        shape_data : Shape atau dict
+            Bentuk yang ditambahkan
+
+        Returns:
+        --------
+        int : ID bentuk baru
+        """
+        shape_id = self._next_id
+        self._next_id += 1
+        self._histories[shape_id] = TransformHistory(shape_data)
+        self._store(shape_id, self._histories[shape_id].current)
+        return shape_id
+
+    def replace(self, shape_id, shape_data):
+        """
+        Mengganti bentuk dengan ID tertentu dan memperbarui index.
+
+        Bentuk baru menjadi geometri asal riwayatnya; langkah undo
+        sebelumnya untuk bentuk ini dibuang, termasuk ID-nya di aksi
+        undo/redo lama (riwayat baru tidak memiliki langkah aksi tersebut).
+        """
+        if shape_id not in self._shapes:
+            raise KeyError(shape_id)
+        self._histories[shape_id] = TransformHistory(shape_data)
+        self._store(shape_id, self._histories[shape_id].current)
+        for stack in (self._undo_stack, self._redo_stack):
+            actions = [tuple(i for i in action if i != shape_id) for action in stack]
+            stack[:] = [action for action in actions if action]
+
+    def _store(self, shape_id, shape):
+        self._shapes[shape_id] = shape
+        self.index.update(shape_id, shape.bounds())
+
+    def remove(self, shape_id):
+        """Menghapus bentuk (dan seleksinya) dari scene."""
+        del self._shapes[shape_id]
+        del self._histories[shape_id]
+        self._selection.pop(shape_id, None)
+        self.index.remove(shape_id)
+
+    def clear(self):
+        """Menghapus semua bentuk beserta riwayat undo/redo."""
+        self._shapes.clear()
+        self._histories.clear()
+        self._selection.clear()
+        self.index.clear()
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+
+    def history(self, shape_id):
+        """TransformHistory milik bentuk tertentu."""
+        return self._histories[shape_id]
+
+    # --- Seleksi ---
+
+    @property
+    def selection(self):
+        """ID bentuk terpilih dengan urutan pemilihan."""
+        return list(self._selection)
+
+    def select(self, shape_ids, extend=False):
+        """
+        Memilih bentuk.
+
+        Parameters:
+        -----------
+        shape_ids : iterable of int
+            ID bentuk yang dipilih (ID yang tidak ada diabaikan)
+        extend : bool
+            Jika True, ditambahkan ke seleksi yang ada; jika False, menggantinya
+
+        Returns:
+        --------
+        list : Seleksi setelah perubahan
+        """
+        if not extend:
+            self._selection.clear()
+        for shape_id in shape_ids:
+            if shape_id in self._shapes:
+                self._selection[shape_id] = None
+        return self.selection
+
+    def select_all(self):
+        """Memilih semua bentuk."""
+        return self.select(self._shapes)
+
+    def clear_selection(self):
+        """Mengosongkan seleksi."""
+        self._selection.clear()
+
+    # --- Query spasial ---
+
+    def shape_at(self, x, y):
+        """
+        Bentuk paling atas yang memuat titik (x, y).
+
+        Kandidat diambil dari spatial index (bounding box), lalu diuji
+        dengan Shape.contains_point dari yang paling atas.
+
+        Returns:
+        --------
+        int : ID bentuk, atau None jika tidak ada
+        """
+        for shape_id in sorted(self.index.query_point(x, y), reverse=True):
+            if self._shapes[shape_id].contains_point(x, y):
+                return shape_id
+        return None
+
+    def query_rect(self, rect, contained=False):
+        """
+        Bentuk yang berada pada persegi panjang.
+
+        Parameters:
+        -----------
+        rect : tuple
+            (xmin, ymin, xmax, ymax)
+        contained : bool
+            Jika True, hanya bentuk yang bounding box-nya seluruhnya di dalam rect;
+            jika False, semua bentuk yang bounding box-nya beririsan
+
+        Returns:
+        --------
+        list : ID bentuk, urut dari bawah ke atas
+        """
+        xmin, ymin, xmax, ymax = rect
+        rect = (min(xmin, xmax), min(ymin, ymax), max(xmin, xmax), max(ymin, ymax))
+        shape_ids = self.index.query_rect(rect)
+        if contained:
+            shape_ids = [i for i in shape_ids if self._inside(self.index.bounds(i), rect)]
+        return sorted(shape_ids)
+
+    @staticmethod
+    def _inside(bounds, rect):
+        return (rect[0] <= bounds[0] and bounds[2] <= rect[2]
+                and rect[1] <= bounds[1] and bounds[3] <= rect[3])
+
+    def visible(self, viewport):
+        """
+        ID bentuk yang terlihat pada viewport (culling).
+
+        Parameters:
+        -----------
+        viewport : tuple
+            (xmin, ymin, xmax, ymax), misalnya dari ax.get_xlim()/get_ylim()
+        """
+        return self.query_rect(viewport)
+
+    def select_point(self, x, y, extend=False):
+        """Memilih bentuk paling atas di titik (x, y); seleksi dikosongkan jika tidak ada."""
+        shape_id = self.shape_at(x, y)
+        return self.select([] if shape_id is None else [shape_id], extend)
+
+    def select_rect(self, rect, contained=False, extend=False):
+        """Memilih semua bentuk pada persegi panjang (lihat query_rect)."""
+        return self.select(self.query_rect(rect, contained), extend)
+
+    # --- Transformasi ---
+
+    def selection_centroid(self):
+        """
+        Titik pusat seleksi: rata-rata centroid bentuk terpilih.
+
+        Untuk satu bentuk sama dengan Shape.centroid(), sehingga
+        transformasi satu bentuk tetap berputar/berskala di pusatnya.
+        """
+        if not self._selection:
+            return None
+        centroids = np.array([self._shapes[i].centroid() for i in self._selection])
+        return tuple(centroids.mean(axis=0).tolist())
+
+    def transform_selected(self, matrix, name='affine', params=None):
+        """
+        Menerapkan satu matriks affine homogen 3x3 ke semua bentuk terpilih.
+
+        Langkah dicatat di riwayat setiap bentuk sebagai satu aksi undo.
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks affine homogen 3x3
+        name : str
+            Nama langkah untuk riwayat ('scale', 'rotate', 'reflect', ...)
+        params : dict, optional
+            Parameter langkah untuk riwayat
+
+        Returns:
+        --------
+        dict : {shape_id: Shape baru} untuk bentuk yang berubah
+        """
+        changed = {}
+        for shape_id in self._selection:
+            history = self._histories[shape_id]
+            history.push(matrix, name, params)
+            changed[shape_id] = history.current
+            self._store(shape_id, changed[shape_id])
+
+        if changed:
+            self._undo_stack.append(tuple(changed))
+            self._redo_stack.clear()
+        return changed
+
+    # --- Undo/redo ---
+
+    @property
+    def can_undo(self):
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo_stack)
+
+    def _replay(self, source, target, step):
+        if not source:
+            return {}
+        action = source.pop()
+        target.append(action)
+
+        changed = {}
+        for shape_id in action:
+            # Bentuk yang sudah dihapus atau diganti dilewati
+            history = self._histories.get(shape_id)
+            if history is not None and step(history):
+                changed[shape_id] = history.current
+                self._store(shape_id, changed[shape_id])
+        return changed
+
+    def undo(self):
+        """
+        Membatalkan transformasi terakhir pada semua bentuk yang terkena.
+
+        Returns:
+        --------
+        dict : {shape_id: Shape} untuk bentuk yang berubah (kosong jika tidak ada)
+        """
+        return self._replay(self._undo_stack, self._redo_stack, TransformHistory.undo)
+
+    def redo(self):
+        """Mengulang transformasi yang terakhir dibatalkan (lihat undo)."""
+        return self._replay(self._redo_stack, self._undo_stack, TransformHistory.redo)
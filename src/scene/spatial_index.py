@@ -0,0 +1,167 @@
+"""
+Modul spatial index berbasis grid seragam.
+
+Bidang dibagi menjadi sel persegi berukuran cell_size. Setiap bentuk
+didaftarkan ke semua sel yang disentuh bounding box-nya, sehingga query
+titik atau persegi panjang hanya memeriksa bentuk di sel yang relevan,
+bukan seluruh scene:
+
+    query_point : O(1) sel + kandidat di sel tersebut
+    query_rect  : O(sel yang dicakup) + kandidat
+
+Bentuk yang sangat besar (mencakup lebih dari max_cells_per_item sel)
+disimpan di daftar terpisah dan selalu ikut diperiksa, agar satu bentuk
+raksasa tidak mengisi ribuan sel.
+"""
+
+import math
+
+
+def bounds_intersect(a, b):
+    """True jika dua bounding box (xmin, ymin, xmax, ymax) beririsan."""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def bounds_contain_point(bounds, x, y):
+    """True jika titik (x, y) berada di dalam bounding box."""
+    return bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+
+
+class SpatialIndex:
+    """
+    Grid seragam untuk query bounding box.
+
+    Parameters:
+    -----------
+    cell_size : float
+        Ukuran sisi sel grid (satuan koordinat data)
+    max_cells_per_item : int
+        Batas jumlah sel per item; item yang lebih besar disimpan terpisah
+
+    Example:
+    --------
+    >>> index = SpatialIndex(cell_size=2.0)
+    >>> index.insert(1, (0, 0, 1, 1))
+    >>> index.insert(2, (5, 5, 6, 6))
+    >>> index.query_point(0.5, 0.5)
+    [1]
+    >>> index.query_rect((4, 4, 10, 10))
+    [2]
+    """
+
+    def __init__(self, cell_size=2.0, max_cells_per_item=256):
+        if cell_size <= 0:
+            raise ValueError("cell_size harus lebih besar dari 0.")
+        self.cell_size = float(cell_size)
+        self.max_cells_per_item = max_cells_per_item
+        self._cells = {}
+        self._bounds = {}
+        self._item_cells = {}
+        self._oversized = set()
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, item_id):
+        return item_id in self._bounds
+
+    def bounds(self, item_id):
+        """Bounding box yang terdaftar untuk item."""
+        return self._bounds[item_id]
+
+    def _cell_range(self, bounds):
+        size = self.cell_size
+        return (math.floor(bounds[0] / size), math.floor(bounds[1] / size),
+                math.floor(bounds[2] / size), math.floor(bounds[3] / size))
+
+    def insert(self, item_id, bounds):
+        """
+        Mendaftarkan item dengan bounding box-nya.
+
+        Parameters:
+        -----------
+        item_id : hashable
+            ID item (misalnya ID bentuk di Scene)
+        bounds : tuple
+            (xmin, ymin, xmax, ymax)
+        """
+        if item_id in self._bounds:
+            self.remove(item_id)
+
+        bounds = tuple(float(v) for v in bounds)
+        self._bounds[item_id] = bounds
+
+        ix0, iy0, ix1, iy1 = self._cell_range(bounds)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > self.max_cells_per_item:
+            self._oversized.add(item_id)
+            return
+
+        cells = [(ix, iy) for ix in range(ix0, ix1 + 1) for iy in range(iy0, iy1 + 1)]
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(item_id)
+        self._item_cells[item_id] = cells
+
+    def remove(self, item_id):
+        """Menghapus item dari index (tidak error jika tidak ada)."""
+        if self._bounds.pop(item_id, None) is None:
+            return
+        self._oversized.discard(item_id)
+        for cell in self._item_cells.pop(item_id, ()):
+            members = self._cells[cell]
+            members.discard(item_id)
+            if not members:
+                del self._cells[cell]
+
+    def update(self, item_id, bounds):
+        """Memperbarui bounding box item (misalnya setelah transformasi)."""
+        self.insert(item_id, bounds)
+
+    def clear(self):
+        """Mengosongkan index."""
+        self._cells.clear()
+        self._bounds.clear()
+        self._item_cells.clear()
+        self._oversized.clear()
+
+    def query_point(self, x, y):
+        """
+        Item yang bounding box-nya memuat titik (x, y).
+
+        Returns:
+        --------
+        list : ID item (urutan tidak dijamin)
+        """
+        size = self.cell_size
+        candidates = self._cells.get((math.floor(x / size), math.floor(y / size)), ())
+        return [item_id for item_id in (*candidates, *self._oversized)
+                if bounds_contain_point(self._bounds[item_id], x, y)]
+
+    def query_rect(self, rect):
+        """
+        Item yang bounding box-nya beririsan dengan persegi panjang.
+
+        Parameters:
+        -----------
+        rect : tuple
+            (xmin, ymin, xmax, ymax), misalnya batas viewport
+
+        Returns:
+        --------
+        list : ID item (urutan tidak dijamin)
+        """
+        ix0, iy0, ix1, iy1 = self._cell_range(rect)
+
+        # Viewport jauh lebih besar dari isi grid: lebih murah memindai sel yang ada
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(self._cells):
+            cells = (members for (ix, iy), members in self._cells.items()
+                     if ix0 <= ix <= ix1 and iy0 <= iy <= iy1)
+        else:
+            cells = (self._cells[cell] for cell in
+                     ((ix, iy) for ix in range(ix0, ix1 + 1) for iy in range(iy0, iy1 + 1))
+                     if cell in self._cells)
+
+        candidates = set(self._oversized)
+        for members in cells:
+            candidates.update(members)
+        return [item_id for item_id in candidates
+                if bounds_intersect(self._bounds[item_id], rect)]
@@ -7,10 +7,29 @@ Tersedia bentuk:
 - Rectangle (Persegi Panjang)
 - Circle (Lingkaran)
 - Trapezoid (Trapesium)
+
+Semua fungsi draw_* mengembalikan objek Shape (lihat shape_array.py).
+Fungsi create_* membuat Shape yang sama tanpa input pengguna dan tanpa menggambar.
+save_shapes/load_shapes menyimpan dan membuka ShapeArray sebagai file biner
+yang dapat di-memmap (lihat storage.py). ShapeMetrics berisi luas, centroid
+luas, keliling, dan bounding box dari Shape.metrics() / ShapeArray.metrics()
+(lihat metrics.py). PolygonLOD berisi level penyederhanaan polygon padat
+dari Shape.lod() (lihat lod.py). union, intersection, difference, dan
+symmetric_difference menggabungkan bentuk menjadi Shape bertipe 'polygon'
+(lihat boolean.py).
+
+Matplotlib hanya diimpor di dalam fungsi draw_*, sehingga membuat dan
+mentransformasi bentuk tidak memuat pyplot maupun backend GUI.
 """
 
-from .square import draw_square
-from .triangle import draw_triangle
-from .rectangle import draw_rectangle
-from .circle import draw_circle
-from .trapezoid import draw_trapezoid
+from .square import draw_square, create_square
+from .triangle import draw_triangle, create_triangle
+from .rectangle import draw_rectangle, create_rectangle
+from .circle import draw_circle, create_circle
+from .trapezoid import draw_trapezoid, create_trapezoid
+from .shape_array import Shape, ShapeArray
+from .metrics import ShapeMetrics
+from .lod import PolygonLOD
+from .boolean import (boolean_operation, union, intersection, difference,
+                      symmetric_difference)
+from .storage import save_shapes, load_shapes
@@ -0,0 +1,964 @@
+"""
+Modul operasi boolean polygon: union, intersection, difference, dan xor.
+
+Setiap operand adalah "region": kumpulan ring dengan ring luar
+berorientasi berlawanan jarum jam (CCW) dan lubang searah jarum jam (CW),
+sehingga interior selalu berada di kiri setiap edge. Lingkaran diubah
+menjadi polygon (tessellation) sebelum diproses.
+
+Overlay dua region dikerjakan dalam beberapa pass NumPy:
+
+1. Sweep sumbu X: edge kedua region diurutkan berdasarkan xmin, lalu
+   pasangan edge yang rentang X-nya bertumpuk dicari dengan searchsorted
+   (sweep-and-prune) dan disaring dengan rentang Y. Jika edge panjang
+   membuat sweep ini menghasilkan terlalu banyak pasangan, kotak edge
+   dicari dengan segment tree dua sumbu (_box_pairs). Hanya pasangan ini
+   yang diuji titik potongnya secara vektor (termasuk edge kolinear yang
+   bertumpuk).
+   Polygon bebas yang menyentuh/memotong dirinya sendiri lebih dulu
+   dipecah menjadi loop sederhana (_simple_loops).
+2. Setiap edge dipecah di semua titik potongnya. Titik yang berdekatan
+   (di bawah SNAP_RELATIVE × ukuran bentuk) disatukan menjadi satu ID.
+3. Setiap sub-edge diklasifikasikan dalam/luar region lain dengan uji
+   paritas sinar vertikal dari titik tengahnya. Pasangan edge yang
+   diuji dicari lewat kolom sumbu X, atau dihitung dengan segment tree
+   slab X jika kolomnya terlalu penuh (_crossings_above). Sub-edge
+   yang berimpit dengan sub-edge region lain ditandai searah/berlawanan.
+4. Sub-edge dipilih sesuai operasi (aturan Martinez–Rueda–Feito), lalu
+   disambung menjadi ring. Di titik dengan beberapa edge keluar dipilih
+   belokan paling kiri, sehingga bentuk yang hanya bersentuhan di satu
+   titik menjadi ring terpisah.
+
+Untuk polygon dengan edge pendek seperti lingkaran ter-tessellate sweep
+sumbu X menghasilkan mendekati n + k pasangan (n edge, k titik potong).
+Edge panjang yang membentang di sebagian besar rentang X (misalnya dua
+sisir yang saling menyisip) membuat jumlah itu tumbuh hingga O(n²);
+selama jumlahnya melebihi SWEEP_PAIR_FACTOR × n dipakai segment tree,
+sehingga pencarian kandidat O(n log² n + k) dan klasifikasi
+O(n log² n) berapa pun panjang edge-nya.
+
+Hasil dikembalikan sebagai list Shape bertipe 'polygon' (satu per
+komponen) sehingga dapat ditransformasi dan dirender seperti bentuk
+lain. Lubang disambungkan ke ring luarnya dengan jembatan (keyhole)
+berlebar nol.
+"""
+
+import numpy as np
+
+from .metrics import polygon_area
+from .shape_array import Shape
+from .tessellation import DEFAULT_CIRCLE_SEGMENTS
+
+
+BOOLEAN_OPERATIONS = ('union', 'intersection', 'difference', 'xor')
+
+# Tipe bentuk yang kelilingnya pasti tidak memotong/menyentuh dirinya sendiri
+SIMPLE_SHAPE_TYPES = ('square', 'rectangle', 'triangle', 'circle')
+
+# Toleransi titik sama, relatif terhadap ukuran bounding box gabungan
+SNAP_RELATIVE = 1e-9
+
+# Batas jumlah pasangan kandidat yang diproses sekaligus (membatasi memori)
+MAX_PAIRS_PER_CHUNK = 1 << 22
+
+# Sweep sumbu X (dan kolom X uji titik) dipakai selama jumlah pasangan yang
+# dihasilkannya paling banyak kelipatan ini dari jumlah edge + query;
+# selebihnya dipakai segment tree (lihat _box_pairs, _crossings_above)
+SWEEP_PAIR_FACTOR = 16
+
+
+def _as_region(shape, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """
+    Mengubah Shape, dict, list Shape (hasil operasi), atau array (N, 2)
+    menjadi list ring float64 dengan interior di kiri.
+
+    Ring tunggal dari sebuah bentuk diorientasikan CCW. Ring dari list
+    hasil operasi dipakai apa adanya karena keyhole sudah berorientasi benar.
+    Polygon bebas ('polygon' atau array) boleh menyentuh atau memotong
+    dirinya sendiri; interiornya ditentukan dengan aturan even-odd
+    (lihat _simple_loops).
+    """
+    if isinstance(shape, (list, tuple)) and shape and isinstance(shape[0], (Shape, dict)):
+        return [ring for item in shape for ring in _as_region(item, segments)]
+    if isinstance(shape, dict) or isinstance(shape, Shape):
+        shape = Shape.from_dict(shape)
+        points = shape.outline(segments) if shape.type == 'circle' else shape.vertices
+        # Bentuk bawaan (dan hasil transformasi affine-nya) selalu sederhana
+        simple = shape.type in SIMPLE_SHAPE_TYPES
+    else:
+        points, simple = shape, False
+    ring = _clean_ring(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+    if len(ring) < 3:
+        return []
+    if not simple:
+        loops = [ring for loop in _simple_loops(ring) for ring in _oriented(loop)]
+        if len(loops) != 1:
+            return _reduce([[loop] for loop in loops], 'xor') if loops else []
+        ring = loops[0]
+    return _oriented(ring)
+
+
+def _oriented(ring):
+    """Ring CCW dalam list (kosong jika luasnya nol)."""
+    area = polygon_area(ring)
+    if area == 0:
+        return []
+    return [ring if area > 0 else ring[::-1].copy()]
+
+
+def _clean_ring(ring):
+    """Membuang vertex berulang berturut-turut (termasuk penutup ring)."""
+    if len(ring) == 0:
+        return ring
+    keep = np.any(ring != np.roll(ring, -1, axis=0), axis=1)
+    return ring[keep]
+
+
+def _simple_loops(ring):
+    """
+    Memecah ring yang menyentuh atau memotong dirinya sendiri menjadi loop sederhana.
+
+    Edge dipecah di semua titik potong antar edge ring itu sendiri, lalu
+    urutan vertex ditelusuri: setiap kali sebuah vertex muncul lagi, loop
+    di antara kedua kemunculannya dipotong. Paritas sinar terhadap ring
+    sama dengan jumlah paritas terhadap semua loop, sehingga region
+    even-odd ring = xor semua loop. Ini mencakup vertex pinch (dua lobus
+    atau lubang yang bersentuhan di satu titik), figure-eight, dan ring
+    keyhole.
+
+    Returns:
+    --------
+    list of numpy.ndarray : [ring] jika ring sudah sederhana; loop dengan
+                            kurang dari tiga vertex dibuang
+    """
+    count = len(ring)
+    start, end = ring, np.roll(ring, -1, axis=0)
+    snap = (float(np.ptp(ring, axis=0).max()) or 1.0) * SNAP_RELATIVE
+
+    hits = []
+    for i, j in _candidate_pairs(start, end, start, end):
+        pair = i < j
+        ea, t, eb, u, point = _intersections(start, end, start, end, i[pair], j[pair], snap)
+        # Vertex bersama dua edge berurutan bukan titik potong
+        next_edge = (eb == ea + 1) & (t == 1) & (u == 0)
+        wrap = (ea == 0) & (eb == count - 1) & (t == 0) & (u == 1)
+        real = ~(next_edge | wrap)
+        hits.append((np.concatenate((ea[real], eb[real])), np.concatenate((t[real], u[real])),
+                     np.concatenate((point[real], point[real]))))
+    if not any(len(edge) for edge, _, _ in hits):
+        return [ring]
+
+    edge, param, point = (np.concatenate(parts) for parts in zip(*hits))
+    _, sub_from, sub_to = _split_edges(start, end, edge, param, point)
+    ids, coords = _snap_ids(np.concatenate((sub_from, sub_to)), snap)
+    frm, to = ids[:len(sub_from)], ids[len(sub_from):]
+    sequence = frm[frm != to].tolist()
+
+    # Telusuri vertex; kemunculan ulang menutup loop di atas stack
+    stack, position, loops = [], {}, []
+    for vertex in sequence:
+        if vertex in position:
+            first = position[vertex]
+            loops.append(stack[first:])
+            for removed in stack[first + 1:]:
+                del position[removed]
+            del stack[first + 1:]
+        else:
+            position[vertex] = len(stack)
+            stack.append(vertex)
+    loops.append(stack)
+    return [coords[loop] for loop in loops if len(loop) >= 3]
+
+
+def _edges(rings):
+    """Edge semua ring sebagai (start (E, 2), end (E, 2))."""
+    if not rings:
+        empty = np.empty((0, 2))
+        return empty, empty
+    start = np.concatenate(rings)
+    end = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+    return start, end
+
+
+def _range_pairs(lo, hi):
+    """
+    Memecah pasangan (baris, kolom) untuk semua baris i dan kolom lo[i]..hi[i]-1
+    menjadi beberapa chunk (generator).
+    """
+    counts = hi - lo
+    ends = np.cumsum(counts)
+    row = 0
+    while row < len(lo):
+        base = ends[row] - counts[row]
+        stop = max(int(np.searchsorted(ends, base + MAX_PAIRS_PER_CHUNK, 'right')), row + 1)
+        rows = np.repeat(np.arange(row, stop), counts[row:stop])
+        first = ends[row:stop] - counts[row:stop] - base
+        cols = np.arange(len(rows)) - np.repeat(first, counts[row:stop]) + np.repeat(lo[row:stop], counts[row:stop])
+        if len(rows):
+            yield rows, cols
+        row = stop
+
+
+def _candidate_pairs(a_start, a_end, b_start, b_end):
+    """
+    Pasangan (edge A, edge B) yang rentang X dan Y-nya bertumpuk (generator).
+
+    Sweep sumbu X: pasangan bertumpuk jika xmin B berada di [xmin A, xmax A],
+    atau xmin A berada di (xmin B, xmax B]. Kedua kasus tidak pernah
+    menghasilkan pasangan yang sama. Jumlah pasangan bertumpuk-X diketahui
+    dari searchsorted sebelum pasangan dibuat; jika edge panjang membuatnya
+    melebihi SWEEP_PAIR_FACTOR kali jumlah edge, pasangan dicari dengan
+    _box_pairs yang tidak bergantung pada tumpukan satu sumbu saja.
+    """
+    a_xmin, a_xmax = np.minimum(a_start[:, 0], a_end[:, 0]), np.maximum(a_start[:, 0], a_end[:, 0])
+    b_xmin, b_xmax = np.minimum(b_start[:, 0], b_end[:, 0]), np.maximum(b_start[:, 0], b_end[:, 0])
+    a_ymin, a_ymax = np.minimum(a_start[:, 1], a_end[:, 1]), np.maximum(a_start[:, 1], a_end[:, 1])
+    b_ymin, b_ymax = np.minimum(b_start[:, 1], b_end[:, 1]), np.maximum(b_start[:, 1], b_end[:, 1])
+
+    a_order, b_order = np.argsort(a_xmin, kind='stable'), np.argsort(b_xmin, kind='stable')
+    a_sorted, b_sorted = a_xmin[a_order], b_xmin[b_order]
+
+    sweeps = (
+        (np.searchsorted(b_sorted, a_xmin, 'left'), np.searchsorted(b_sorted, a_xmax, 'right'), False),
+        (np.searchsorted(a_sorted, b_xmin, 'right'), np.searchsorted(a_sorted, b_xmax, 'right'), True),
+    )
+    swept = sum(int((hi - lo).sum()) for lo, hi, _ in sweeps)
+    if swept > SWEEP_PAIR_FACTOR * (len(a_xmin) + len(b_xmin)):
+        yield from _box_pairs(np.column_stack((a_xmin, a_ymin, a_xmax, a_ymax)),
+                              np.column_stack((b_xmin, b_ymin, b_xmax, b_ymax)))
+        return
+    for lo, hi, swapped in sweeps:
+        for rows, cols in _range_pairs(lo, hi):
+            if swapped:
+                i, j = a_order[cols], rows
+            else:
+                i, j = rows, b_order[cols]
+            overlap = (a_ymin[i] <= b_ymax[j]) & (b_ymin[j] <= a_ymax[i])
+            yield i[overlap], j[overlap]
+
+
+def _tree_size(count):
+    """Jumlah daun segment tree: pangkat dua terkecil >= count."""
+    return 1 << int(max(count, 1) - 1).bit_length()
+
+
+def _canonical_nodes(lo, hi, size):
+    """
+    Node kanonik segment tree (heap: daun size..2·size-1) yang tepat menutup
+    daun lo..hi (inklusif) setiap baris; paling banyak 2·log2(size) node.
+
+    Returns:
+    --------
+    tuple : (baris, node), rentang kosong (lo > hi) tidak menghasilkan node
+    """
+    rows = np.flatnonzero(lo <= hi)
+    lo, hi = lo[rows] + size, hi[rows] + size + 1
+    found_rows, found_nodes = [], []
+    while len(rows):
+        take = (lo & 1) == 1
+        found_rows.append(rows[take]), found_nodes.append(lo[take])
+        lo = lo + take
+        take = (hi & 1) == 1
+        hi = hi - take
+        found_rows.append(rows[take]), found_nodes.append(hi[take])
+        lo, hi = lo >> 1, hi >> 1
+        keep = lo < hi
+        rows, lo, hi = rows[keep], lo[keep], hi[keep]
+    if not found_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(found_rows), np.concatenate(found_nodes)
+
+
+def _ancestors(leaf, size):
+    """Semua node dari daun sampai akar untuk setiap baris: (baris, node)."""
+    levels = size.bit_length()
+    rows = np.repeat(np.arange(len(leaf)), levels)
+    nodes = ((leaf[:, None] + size) >> np.arange(levels)).ravel()
+    return rows, nodes
+
+
+def _tree_query(items, item_keys, queries, key_lo, key_hi, key_count):
+    """
+    Pasangan (query, item) yang berbagi node dan key item di [key_lo, key_hi] query.
+
+    items dan queries berupa (baris, node). Entri item diurutkan dengan
+    kunci node · key_count + key, sehingga setiap (query, node) menjadi
+    satu rentang hasil searchsorted (generator).
+    """
+    item_rows, item_nodes = items
+    query_rows, query_nodes = queries
+    composite = item_nodes * key_count + item_keys[item_rows]
+    order = np.argsort(composite, kind='stable')
+    composite = composite[order]
+    lo = np.searchsorted(composite, query_nodes * key_count + key_lo[query_rows], 'left')
+    hi = np.searchsorted(composite, query_nodes * key_count + key_hi[query_rows], 'right')
+    for rows, cols in _range_pairs(lo, np.maximum(hi, lo)):
+        yield query_rows[rows], item_rows[order[cols]]
+
+
+def _box_pairs(a_box, b_box):
+    """
+    Pasangan (i, j) dengan bounding box a_box[i] dan b_box[j] beririsan (generator).
+
+    Koordinat diganti peringkatnya. Irisan X berarti xmin B di
+    [xmin A, xmax A] atau xmin A di (xmin B, xmax B]; irisan Y dipecah
+    dengan cara yang sama. Keempat kombinasinya saling lepas (setiap
+    pasangan dihasilkan tepat sekali) dan masing-masing adalah query
+    segment tree atas peringkat Y dengan rentang peringkat X per node:
+
+    - pojok kiri bawah B di dalam kotak A, atau sebaliknya (titik di
+      persegi panjang: titik di semua leluhur daunnya, query di node kanonik)
+    - interval Y B memuat ymin A dengan xmin B di rentang X A, atau
+      sebaliknya (interval di node kanonik, query di semua leluhur daunnya)
+
+    Biayanya O(n log² n + k) untuk n kotak dan k pasangan, berapa pun
+    panjang edge-nya.
+    """
+    xs = np.unique(np.concatenate((a_box[:, 0], a_box[:, 2], b_box[:, 0], b_box[:, 2])))
+    ys = np.unique(np.concatenate((a_box[:, 1], a_box[:, 3], b_box[:, 1], b_box[:, 3])))
+    ax0, ax1 = np.searchsorted(xs, a_box[:, 0]), np.searchsorted(xs, a_box[:, 2])
+    ay0, ay1 = np.searchsorted(ys, a_box[:, 1]), np.searchsorted(ys, a_box[:, 3])
+    bx0, bx1 = np.searchsorted(xs, b_box[:, 0]), np.searchsorted(xs, b_box[:, 2])
+    by0, by1 = np.searchsorted(ys, b_box[:, 1]), np.searchsorted(ys, b_box[:, 3])
+    size, keys = _tree_size(len(ys)), len(xs)
+
+    # xmin B di [xmin A, xmax A]: (ymin B di [ymin A, ymax A]) atau (ymin A di (ymin B, ymax B])
+    yield from _tree_query(_ancestors(by0, size), bx0, _canonical_nodes(ay0, ay1, size),
+                           ax0, ax1, keys)
+    yield from _tree_query(_canonical_nodes(by0 + 1, by1, size), bx0, _ancestors(ay0, size),
+                           ax0, ax1, keys)
+    # xmin A di (xmin B, xmax B]: query dari sisi B, pasangan dibalik
+    for j, i in _tree_query(_canonical_nodes(ay0, ay1, size), ax0, _ancestors(by0, size),
+                            bx0 + 1, bx1, keys):
+        yield i, j
+    for j, i in _tree_query(_ancestors(ay0, size), ax0, _canonical_nodes(by0 + 1, by1, size),
+                            bx0 + 1, bx1, keys):
+        yield i, j
+
+
+def _intersections(a_start, a_end, b_start, b_end, i, j, snap):
+    """
+    Titik potong pasangan edge (i dari A, j dari B).
+
+    Titik yang berjarak kurang dari snap dari ujung edge dianggap tepat
+    di ujung tersebut (memakai koordinat vertex aslinya).
+
+    Returns:
+    --------
+    tuple : (edge A, parameter t di A, edge B, parameter u di B, titik (K, 2));
+            edge kolinear yang bertumpuk menghasilkan titik ujung bagian
+            yang bertumpuk
+    """
+    p, r = a_start[i], a_end[i] - a_start[i]
+    q, s = b_start[j], b_end[j] - b_start[j]
+    qp = q - p
+    denom = r[:, 0] * s[:, 1] - r[:, 1] * s[:, 0]
+    r_len2 = np.einsum('ij,ij->i', r, r)
+    s_len2 = np.einsum('ij,ij->i', s, s)
+    r_len, s_len = np.sqrt(r_len2), np.sqrt(s_len2)
+    # Sejajar: sinus sudut antar edge praktis nol
+    parallel = np.abs(denom) <= 1e-12 * r_len * s_len
+
+    out_a, out_t, out_b, out_u, out_p = [], [], [], [], []
+
+    # Edge tidak sejajar: satu titik potong
+    k = np.flatnonzero(~parallel)
+    t = (qp[k, 0] * s[k, 1] - qp[k, 1] * s[k, 0]) / denom[k]
+    u = (qp[k, 0] * r[k, 1] - qp[k, 1] * r[k, 0]) / denom[k]
+    tol_t, tol_u = snap / r_len[k], snap / s_len[k]
+    hit = (t >= -tol_t) & (t <= 1 + tol_t) & (u >= -tol_u) & (u <= 1 + tol_u)
+    k, t, u = k[hit], np.clip(t[hit], 0, 1), np.clip(u[hit], 0, 1)
+    tol_t, tol_u = tol_t[hit], tol_u[hit]
+    point = p[k] + t[:, None] * r[k]
+    # Titik potong di ujung edge memakai koordinat vertex aslinya
+    for param, tol, first, last in ((t, tol_t, p[k], a_end[i[k]]), (u, tol_u, q[k], b_end[j[k]])):
+        at_start, at_end = param <= tol, param >= 1 - tol
+        point[at_start] = first[at_start]
+        point[at_end] = last[at_end]
+        param[at_start] = 0.0
+        param[at_end] = 1.0
+    out_a.append(i[k]), out_t.append(t), out_b.append(j[k]), out_u.append(u), out_p.append(point)
+
+    # Edge sejajar dan kolinear: ujung edge yang satu di dalam edge yang lain
+    k = np.flatnonzero(parallel)
+    # Jarak titik awal B ke garis A
+    distance = np.abs(qp[k, 0] * r[k, 1] - qp[k, 1] * r[k, 0]) / r_len[k]
+    k = k[distance <= snap]
+    for endpoint_of_b in (True, False):
+        for offset in (0.0, 1.0):
+            if endpoint_of_b:
+                point = q[k] + offset * s[k]
+                t = np.einsum('ij,ij->i', point - p[k], r[k]) / r_len2[k]
+                tol = snap / r_len[k]
+                inside = (t > tol) & (t < 1 - tol)
+                u = np.full(inside.sum(), offset)
+                t = t[inside]
+            else:
+                point = p[k] + offset * r[k]
+                u = np.einsum('ij,ij->i', point - q[k], s[k]) / s_len2[k]
+                tol = snap / s_len[k]
+                inside = (u > tol) & (u < 1 - tol)
+                t = np.full(inside.sum(), offset)
+                u = u[inside]
+            out_a.append(i[k[inside]]), out_t.append(t), out_b.append(j[k[inside]])
+            out_u.append(u), out_p.append(point[inside])
+
+    return (np.concatenate(out_a), np.concatenate(out_t), np.concatenate(out_b),
+            np.concatenate(out_u), np.concatenate(out_p))
+
+
+def _collinear_pairs(a_start, a_end, b_start, b_end, i, j, snap):
+    """Pasangan (edge A i, edge B j) yang sejajar dan segaris (lihat _intersections)."""
+    r, s = a_end[i] - a_start[i], b_end[j] - b_start[j]
+    qp = b_start[j] - a_start[i]
+    r_len, s_len = np.hypot(*r.T), np.hypot(*s.T)
+    denom = r[:, 0] * s[:, 1] - r[:, 1] * s[:, 0]
+    distance = np.abs(qp[:, 0] * r[:, 1] - qp[:, 1] * r[:, 0]) / r_len
+    keep = (np.abs(denom) <= 1e-12 * r_len * s_len) & (distance <= snap)
+    return i[keep], j[keep]
+
+
+def _collinear_splits(start, end, target, source, splits, snap):
+    """
+    Titik pecah edge source[k] yang berada di dalam edge segaris target[k].
+
+    splits adalah (edge, parameter, titik) edge sumber, terurut menurut edge.
+    """
+    split_edge, _, split_point = splits
+    lo = np.searchsorted(split_edge, source, 'left')
+    hi = np.searchsorted(split_edge, source, 'right')
+    found = []
+    for rows, cols in _range_pairs(lo, hi):
+        edge, point = target[rows], split_point[cols]
+        p, r = start[edge], end[edge] - start[edge]
+        r_len2 = np.einsum('ij,ij->i', r, r)
+        t = np.einsum('ij,ij->i', point - p, r) / r_len2
+        tol = snap / np.sqrt(r_len2)
+        inside = (t > tol) & (t < 1 - tol)
+        found.append((edge[inside], t[inside], point[inside]))
+    return found
+
+
+def _unique_splits(parts, snap):
+    """Menggabungkan (edge, parameter, titik) dan membuang titik ganda per edge, terurut menurut edge."""
+    edge, param, point = (np.concatenate(column) for column in zip(*parts))
+    keys = np.column_stack((edge, np.round(point / snap).astype(np.int64)))
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return edge[first], param[first], point[first]
+
+
+def _share_collinear_splits(a_edges, b_edges, pairs, a_splits, b_splits, snap):
+    """
+    Menyamakan titik pecah pasangan edge A-B yang segaris dan bertumpuk.
+
+    Vertex yang hanya menyentuh edge region-nya sendiri (T-junction,
+    misalnya dua loop _simple_loops yang bersentuhan di tengah edge) bukan
+    titik potong A-B, sehingga bagian yang berimpit bisa dipecah berbeda
+    di A dan B dan sub-edge-nya tidak dikenali sebagai berimpit. Titik
+    pecah disalin ke pasangan segarisnya bolak-balik sampai tidak ada titik
+    baru.
+
+    Returns:
+    --------
+    tuple : (titik pecah A, titik pecah B), masing-masing (edge, parameter, titik)
+    """
+    a_pair, b_pair = pairs
+    a_splits, b_splits = _unique_splits([a_splits], snap), _unique_splits([b_splits], snap)
+    while True:
+        count = len(a_splits[0]) + len(b_splits[0])
+        new_a = _collinear_splits(*a_edges, a_pair, b_pair, b_splits, snap)
+        new_b = _collinear_splits(*b_edges, b_pair, a_pair, a_splits, snap)
+        a_splits = _unique_splits([a_splits] + new_a, snap)
+        b_splits = _unique_splits([b_splits] + new_b, snap)
+        if len(a_splits[0]) + len(b_splits[0]) == count:
+            return a_splits, b_splits
+
+
+def _split_edges(start, end, edge, param, point):
+    """
+    Memecah edge di titik-titik potongnya.
+
+    Returns:
+    --------
+    tuple : (edge asal setiap sub-edge, titik awal (S, 2), titik akhir (S, 2))
+    """
+    count = len(start)
+    edge = np.concatenate((np.arange(count), np.arange(count), edge))
+    param = np.concatenate((np.zeros(count), np.ones(count), param))
+    point = np.concatenate((start, end, point))
+    order = np.lexsort((param, edge))
+    edge, point = edge[order], point[order]
+    same = edge[1:] == edge[:-1]
+    return edge[1:][same], point[:-1][same], point[1:][same]
+
+
+def _snap_ids(points, snap):
+    """ID titik setelah disatukan ke grid berukuran snap, dan koordinat wakilnya."""
+    keys = np.round(points / snap).astype(np.int64)
+    _, first, ids = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return ids.reshape(-1), points[first]
+
+
+def _column_index(px, xmin, xmax):
+    """
+    Kolom sumbu X untuk uji titik: edge setiap kolom dan rentangnya per query.
+
+    Setiap edge didaftarkan ke semua kolom yang dicakup rentang X-nya;
+    jumlah kolom dikurangi jika edge panjang membuat daftar terlalu besar.
+
+    Returns:
+    --------
+    tuple atau None : (edge per entri, lo, hi); entri lo[q]..hi[q]-1 adalah
+                      edge di kolom query q. None jika tidak ada query/edge
+    """
+    if len(px) == 0 or len(xmin) == 0:
+        return None
+    left, right = float(xmin.min()), float(xmax.max())
+    columns = max(len(xmin), 1)
+    while True:
+        width = (right - left) / columns or 1.0
+        first = np.clip(((xmin - left) / width).astype(np.int64), 0, columns - 1)
+        last = np.clip(((xmax - left) / width).astype(np.int64), 0, columns - 1)
+        spans = last - first + 1
+        if spans.sum() <= 16 * len(xmin) + columns or columns == 1:
+            break
+        columns = max(columns // 4, 1)
+
+    entry_edge = np.repeat(np.arange(len(xmin)), spans)
+    entry_column = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans) + np.repeat(first, spans)
+    order = np.argsort(entry_column, kind='stable')
+    entry_edge, entry_column = entry_edge[order], entry_column[order]
+
+    query_column = np.clip(np.floor((px - left) / width), -1, columns).astype(np.int64)
+    lo = np.searchsorted(entry_column, query_column, 'left')
+    hi = np.searchsorted(entry_column, query_column, 'right')
+    return entry_edge, lo, hi
+
+
+def _crossings_above(points, start, end):
+    """
+    Jumlah edge yang dilintasi sinar vertikal ke atas dari setiap titik.
+
+    Segment tree atas slab X (di antara koordinat X vertex yang berurutan):
+    setiap edge tidak vertikal disimpan di node kanonik rentang slab-nya.
+    Edge region tidak saling memotong, sehingga urutan Y edge dalam satu
+    node sama di seluruh slab node tersebut; edge diurutkan menurut Y di
+    tengah slab, lalu jumlah edge di atas titik dicari dengan binary search
+    di setiap node dari daun titik sampai akar. Biayanya O((n + m) log² n)
+    untuk n edge dan m titik, berapa pun panjang edge-nya.
+    """
+    crossings = np.zeros(len(points), dtype=np.int64)
+    sloped = start[:, 0] != end[:, 0]
+    x0, y0 = start[sloped, 0], start[sloped, 1]
+    x1, y1 = end[sloped, 0], end[sloped, 1]
+    xs = np.unique(np.concatenate((x0, x1)))
+    slabs = len(xs) - 1
+    if slabs < 1:
+        return crossings
+
+    def y_at(edge, x):
+        # Rumus yang sama dengan jalur kolom (points_inside)
+        return y0[edge] + (x - x0[edge]) * (y1[edge] - y0[edge]) / (x1[edge] - x0[edge])
+
+    size = _tree_size(slabs)
+    edges, nodes = _canonical_nodes(np.searchsorted(xs, np.minimum(x0, x1)),
+                                    np.searchsorted(xs, np.maximum(x0, x1)) - 1, size)
+    depth = np.floor(np.log2(nodes)).astype(np.int64)
+    span = size >> depth
+    first = (nodes - (1 << depth)) * span
+    order = np.lexsort((y_at(edges, (xs[first] + xs[first + span]) / 2), nodes))
+    edges, nodes = edges[order], nodes[order]
+
+    # Slab setengah terbuka [xs[r], xs[r + 1]), sama dengan aturan x0 <= px < x1
+    leaf = np.searchsorted(xs, points[:, 0], 'right') - 1
+    queried = np.flatnonzero((leaf >= 0) & (leaf < slabs))
+    rows, query_nodes = _ancestors(leaf[queried], size)
+    rows = queried[rows]
+    lo = np.searchsorted(nodes, query_nodes, 'left')
+    hi = np.searchsorted(nodes, query_nodes, 'right')
+    block_end = hi.copy()
+    # Binary search edge pertama (terurut Y) yang berada di atas titik
+    active = np.flatnonzero(lo < hi)
+    while len(active):
+        mid = (lo[active] + hi[active]) // 2
+        above = y_at(edges[mid], points[rows[active], 0]) > points[rows[active], 1]
+        hi[active[above]] = mid[above]
+        lo[active[~above]] = mid[~above] + 1
+        active = active[lo[active] < hi[active]]
+    crossings += np.bincount(rows, weights=block_end - lo, minlength=len(points)).astype(np.int64)
+    return crossings
+
+
+def points_inside(points, rings):
+    """
+    Uji titik di dalam region (aturan even-odd, lubang dihitung).
+
+    Parameters:
+    -----------
+    points : array_like
+        Titik (M, 2)
+    rings : list of numpy.ndarray
+        Ring region (lihat modul); edge ring boleh bersentuhan atau
+        berimpit, tetapi tidak saling memotong
+
+    Returns:
+    --------
+    numpy.ndarray : bool (M,)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    start, end = _edges(rings)
+    xmin, xmax = np.minimum(start[:, 0], end[:, 0]), np.maximum(start[:, 0], end[:, 0])
+    columns = _column_index(points[:, 0], xmin, xmax)
+    if columns is None:
+        return np.zeros(len(points), dtype=bool)
+    entry_edge, lo, hi = columns
+    if int((hi - lo).sum()) > SWEEP_PAIR_FACTOR * (len(points) + len(start)):
+        # Edge panjang memenuhi kolom: hitung lewat segment tree slab X
+        return _crossings_above(points, start, end) % 2 == 1
+
+    crossings = np.zeros(len(points), dtype=np.int64)
+    for rows, cols in _range_pairs(lo, hi):
+        edges = entry_edge[cols]
+        px, py = points[rows, 0], points[rows, 1]
+        x0, y0 = start[edges, 0], start[edges, 1]
+        x1, y1 = end[edges, 0], end[edges, 1]
+        # Sinar vertikal ke atas; edge dihitung jika melintasi x = px (setengah terbuka)
+        spans = (x0 <= px) != (x1 <= px)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            y_at = y0 + (px - x0) * (y1 - y0) / (x1 - x0)
+        above = spans & (y_at > py)
+        crossings += np.bincount(rows[above], minlength=len(points))
+    return crossings % 2 == 1
+
+
+def _drop_bridges(frm, to, count):
+    """Membuang pasangan edge u->v dan v->u (jembatan keyhole berlebar nol)."""
+    forward = frm.astype(np.int64) * count + to
+    backward = to.astype(np.int64) * count + frm
+    bridge = np.isin(forward, backward)
+    return frm[~bridge], to[~bridge]
+
+
+def _select_edges(sub, operation):
+    """
+    Memilih sub-edge hasil operasi (aturan Martinez–Rueda–Feito).
+
+    sub berisi array per sub-edge: 'a' (milik A), 'inside' (di dalam
+    region lain), 'shared' (0 = tidak berimpit, 1 = searah, -1 = berlawanan),
+    dan 'primary' (salinan A dari pasangan berimpit).
+
+    Returns:
+    --------
+    tuple : (mask dipilih, mask dibalik arahnya)
+    """
+    a, inside, shared, primary = sub['a'], sub['inside'], sub['shared'], sub['primary']
+    normal = shared == 0
+    if operation == 'union':
+        keep = (normal & ~inside) | ((shared == 1) & primary)
+        reverse = np.zeros_like(keep)
+    elif operation == 'intersection':
+        keep = (normal & inside) | ((shared == 1) & primary)
+        reverse = np.zeros_like(keep)
+    elif operation == 'difference':
+        keep = (normal & (a != inside)) | ((shared == -1) & primary)
+        reverse = normal & ~a & inside
+    else:
+        keep = normal
+        reverse = normal & inside
+    return keep, reverse & keep
+
+
+def _link_rings(frm, to, coords):
+    """
+    Menyambung edge berarah (ID titik) menjadi ring tertutup.
+
+    Di titik dengan lebih dari satu edge keluar, setiap edge masuk
+    dipasangkan dengan edge keluar yang belokannya paling kiri.
+    """
+    count = len(frm)
+    if count == 0:
+        return []
+    order = np.argsort(frm, kind='stable')
+    sorted_frm = frm[order]
+    lo = np.searchsorted(sorted_frm, to, 'left')
+    hi = np.searchsorted(sorted_frm, to, 'right')
+    degree = hi - lo
+    nxt = np.where(degree == 1, order[np.minimum(lo, count - 1)], -1)
+
+    # Titik bercabang: pasangkan edge masuk dengan edge keluar belokan paling kiri
+    branching = np.flatnonzero(degree > 1)
+    if len(branching):
+        taken = np.zeros(count, dtype=bool)
+        for e in branching[np.argsort(to[branching], kind='stable')].tolist():
+            incoming = coords[to[e]] - coords[frm[e]]
+            best, best_angle = -1, -np.inf
+            for candidate in order[lo[e]:hi[e]].tolist():
+                if taken[candidate]:
+                    continue
+                outgoing = coords[to[candidate]] - coords[frm[candidate]]
+                angle = np.arctan2(incoming[0] * outgoing[1] - incoming[1] * outgoing[0],
+                                   incoming[0] * outgoing[0] + incoming[1] * outgoing[1])
+                # Kembali lurus ke asal (putar balik) adalah pilihan terakhir
+                if angle <= -np.pi + 1e-12:
+                    angle = -np.inf
+                if angle > best_angle:
+                    best, best_angle = candidate, angle
+            if best < 0:
+                best = next((c for c in order[lo[e]:hi[e]].tolist() if not taken[c]), -1)
+            if best >= 0:
+                taken[best] = True
+            nxt[e] = best
+
+    rings = []
+    visited = np.zeros(count, dtype=bool)
+    nxt = nxt.tolist()
+    for e0 in range(count):
+        if visited[e0]:
+            continue
+        ring = []
+        e = e0
+        while e >= 0 and not visited[e]:
+            visited[e] = True
+            ring.append(e)
+            e = nxt[e]
+        if e == e0 and len(ring) >= 3:
+            rings.append(coords[frm[ring]])
+    return rings
+
+
+def _ring_areas(rings):
+    """Luas bertanda semua ring sekaligus (positif = CCW)."""
+    if not rings:
+        return np.empty(0)
+    start, end = _edges(rings)
+    cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+    sizes = np.array([len(ring) for ring in rings])
+    return np.add.reduceat(cross, np.cumsum(sizes) - sizes) / 2
+
+
+def _simplify_rings(rings, tolerance):
+    """Membuang vertex kolinear (sisa pemecahan edge) dari semua ring sekaligus."""
+    if not rings:
+        return []
+    points = np.concatenate(rings)
+    sizes = np.array([len(ring) for ring in rings])
+    while True:
+        offsets = np.cumsum(sizes) - sizes
+        ring_of = np.repeat(np.arange(len(sizes)), sizes)
+        local = np.arange(len(points)) - offsets[ring_of]
+        prev = offsets[ring_of] + (local - 1) % sizes[ring_of]
+        following = offsets[ring_of] + (local + 1) % sizes[ring_of]
+        d1, d2 = points - points[prev], points[following] - points
+        cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+        dot = np.einsum('ij,ij->i', d1, d2)
+        length = np.hypot(*d1.T) * np.hypot(*d2.T)
+        collinear = (np.abs(cross) <= tolerance * length) & (dot > 0) & (sizes[ring_of] > 3)
+        # Jangan membuang dua vertex bersebelahan sekaligus
+        collinear &= ~collinear[prev]
+        if not collinear.any():
+            break
+        points = points[~collinear]
+        sizes = np.bincount(ring_of[~collinear], minlength=len(sizes))
+    return [ring for ring in np.split(points, np.cumsum(sizes)[:-1]) if len(ring)]
+
+
+def _disjoint_result(rings_a, rings_b, operation):
+    """Hasil operasi untuk region yang tidak bertumpuk sama sekali."""
+    if operation == 'intersection':
+        return []
+    if operation == 'difference':
+        return list(rings_a)
+    return list(rings_a) + list(rings_b)
+
+
+def _overlay(rings_a, rings_b, operation):
+    """Operasi boolean dua region; mengembalikan ring hasil (interior di kiri)."""
+    if not rings_a or not rings_b:
+        return _disjoint_result(rings_a, rings_b, operation)
+
+    a_start, a_end = _edges(rings_a)
+    b_start, b_end = _edges(rings_b)
+    size = float(np.ptp(np.concatenate((a_start, b_start)), axis=0).max()) or 1.0
+    snap = size * SNAP_RELATIVE
+
+    # Bounding box tidak bertumpuk: tidak ada titik potong
+    a_box = np.concatenate((a_start.min(axis=0), a_start.max(axis=0)))
+    b_box = np.concatenate((b_start.min(axis=0), b_start.max(axis=0)))
+    if a_box[2] < b_box[0] or b_box[2] < a_box[0] or a_box[3] < b_box[1] or b_box[3] < a_box[1]:
+        return _disjoint_result(rings_a, rings_b, operation)
+
+    # 1. Titik potong semua pasangan kandidat dari sweep sumbu X
+    split_a, split_b, collinear = [], [], []
+    for i, j in _candidate_pairs(a_start, a_end, b_start, b_end):
+        ea, t, eb, u, point = _intersections(a_start, a_end, b_start, b_end, i, j, snap)
+        split_a.append((ea, t, point))
+        split_b.append((eb, u, point))
+        collinear.append(_collinear_pairs(a_start, a_end, b_start, b_end, i, j, snap))
+
+    def gather(splits):
+        if not splits:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty((0, 2))
+        return tuple(np.concatenate(parts) for parts in zip(*splits))
+
+    # 2. Pecah edge (edge segaris dipecah di titik yang sama), lalu satukan
+    #    titik yang berimpit
+    a_splits, b_splits = gather(split_a), gather(split_b)
+    pairs = [np.concatenate(parts) for parts in zip(*collinear)] if collinear else []
+    if pairs and len(pairs[0]):
+        a_splits, b_splits = _share_collinear_splits((a_start, a_end), (b_start, b_end), pairs,
+                                                     a_splits, b_splits, snap)
+    a_edge, a_from, a_to = _split_edges(a_start, a_end, *a_splits)
+    b_edge, b_from, b_to = _split_edges(b_start, b_end, *b_splits)
+    ids, coords = _snap_ids(np.concatenate((a_from, b_from, a_to, b_to)), snap)
+    total = len(a_from) + len(b_from)
+    frm, to = ids[:total], ids[total:]
+    valid = frm != to
+    is_a = np.arange(total) < len(a_from)
+    frm, to, is_a = frm[valid], to[valid], is_a[valid]
+
+    # 3. Klasifikasi: titik tengah sub-edge di dalam region lain?
+    mid = (coords[frm] + coords[to]) / 2
+    inside = np.empty(len(frm), dtype=bool)
+    inside[is_a] = points_inside(mid[is_a], rings_b)
+    inside[~is_a] = points_inside(mid[~is_a], rings_a)
+
+    # Sub-edge A dan B yang berimpit (ID ujung sama)
+    shared = np.zeros(len(frm), dtype=np.int8)
+    low, high = np.minimum(frm, to), np.maximum(frm, to)
+    keys = low * len(coords) + high
+    a_idx, b_idx = np.flatnonzero(is_a), np.flatnonzero(~is_a)
+    _, in_a, in_b = np.intersect1d(keys[a_idx], keys[b_idx], return_indices=True)
+    match_a, match_b = a_idx[in_a], b_idx[in_b]
+    direction = np.where(frm[match_a] == frm[match_b], 1, -1).astype(np.int8)
+    shared[match_a] = direction
+    shared[match_b] = direction
+    primary = is_a.copy()
+
+    # 4. Pilih sub-edge, balik arah bila perlu, lalu sambung menjadi ring
+    keep, reverse = _select_edges({'a': is_a, 'inside': inside, 'shared': shared,
+                                   'primary': primary}, operation)
+    out_from, out_to = _drop_bridges(np.where(reverse, to, frm)[keep],
+                                     np.where(reverse, frm, to)[keep], len(coords))
+    rings = [ring for ring in _simplify_rings(_link_rings(out_from, out_to, coords), 1e-12)
+             if len(ring) >= 3]
+    areas = _ring_areas(rings)
+    return [ring for ring, area in zip(rings, areas.tolist()) if abs(area) > snap * snap]
+
+
+def _bridge_holes(outer, holes):
+    """
+    Menyambung lubang ke ring luar dengan jembatan berlebar nol (keyhole).
+
+    Lubang diproses dari x maksimum terbesar. Dari vertex paling kanan
+    lubang, sinar horizontal ke kanan mengenai edge ring saat ini yang
+    terdekat; segmen tersebut tidak memotong edge lain sehingga menjadi
+    jembatan yang valid.
+    """
+    ring = outer
+    for hole in sorted(holes, key=lambda h: -h[:, 0].max()):
+        m = int(np.argmax(hole[:, 0]))
+        mx, my = hole[m]
+        start, end = ring, np.roll(ring, -1, axis=0)
+        spans = (start[:, 1] > my) != (end[:, 1] > my)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_at = start[:, 0] + (my - start[:, 1]) * (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1])
+        candidates = np.flatnonzero(spans & (x_at >= mx))
+        if len(candidates) == 0:
+            continue
+        k = int(candidates[np.argmin(x_at[candidates])])
+        bridge = np.array([[x_at[k], my]])
+        hole_loop = np.concatenate((hole[m:], hole[:m + 1]))
+        ring = np.concatenate((ring[:k + 1], bridge, hole_loop, bridge, ring[k + 1:]))
+    return ring
+
+
+def region_to_shapes(rings):
+    """
+    Mengubah ring hasil operasi menjadi list Shape 'polygon'.
+
+    Setiap ring luar (CCW) menjadi satu Shape; lubang (CW) disambungkan ke
+    ring luar terkecil yang memuatnya.
+    """
+    areas = _ring_areas(rings)
+    outers = [ring for ring, area in zip(rings, areas.tolist()) if area > 0]
+    holes = [ring for ring, area in zip(rings, areas.tolist()) if area <= 0]
+    areas = areas[areas > 0]
+    owned = [[] for _ in outers]
+    boxes = [np.concatenate((ring.min(axis=0), ring.max(axis=0))) for ring in outers] if holes else []
+    for hole in holes:
+        low, high = hole.min(axis=0), hole.max(axis=0)
+        # Vertex lubang bisa menyentuh ring luar: pakai suara mayoritas
+        containing = [k for k, ring in enumerate(outers)
+                      if np.all(boxes[k][:2] <= low) and np.all(high <= boxes[k][2:])
+                      and points_inside(hole, [ring]).mean() > 0.5]
+        if containing:
+            owned[min(containing, key=lambda k: areas[k])].append(hole)
+    return [Shape('polygon', _bridge_holes(ring, owned[k]) if owned[k] else ring)
+            for k, ring in enumerate(outers)]
+
+
+def _reduce(regions, operation):
+    """Menggabungkan banyak region secara berpasangan (pohon seimbang)."""
+    while len(regions) > 1:
+        merged = [_overlay(regions[k], regions[k + 1], operation)
+                  for k in range(0, len(regions) - 1, 2)]
+        if len(regions) % 2:
+            merged.append(regions[-1])
+        regions = merged
+    return regions[0] if regions else []
+
+
+def boolean_operation(a, b, operation, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """
+    Operasi boolean dua bentuk.
+
+    Parameters:
+    -----------
+    a, b : Shape, dict, list of Shape, atau array_like (N, 2)
+        Operand; list Shape (misalnya hasil operasi sebelumnya) dianggap
+        satu region
+    operation : str
+        Salah satu BOOLEAN_OPERATIONS
+    segments : int
+        Jumlah segmen untuk tessellation lingkaran
+
+    Returns:
+    --------
+    list of Shape : Komponen hasil bertipe 'polygon' (kosong jika hasilnya kosong)
+
+    Example:
+    --------
+    >>> hasil = boolean_operation(create_square(4, 0, 0), create_circle(4, 4, 2), 'difference')
+    >>> [shape.metrics().area for shape in hasil]
+    """
+    if operation not in BOOLEAN_OPERATIONS:
+        raise ValueError(f"Operasi '{operation}' tidak dikenali. Pilih salah satu dari "
+                         f"{', '.join(BOOLEAN_OPERATIONS)}.")
+    return region_to_shapes(_overlay(_as_region(a, segments), _as_region(b, segments), operation))
+
+
+def union(*shapes, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """Gabungan (union) dua bentuk atau lebih; lihat boolean_operation."""
+    return region_to_shapes(_reduce([_as_region(s, segments) for s in shapes], 'union'))
+
+
+def intersection(*shapes, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """Irisan (intersection) dua bentuk atau lebih; lihat boolean_operation."""
+    regions = [_as_region(s, segments) for s in shapes]
+    result = regions[0] if regions else []
+    for region in regions[1:]:
+        result = _overlay(result, region, 'intersection')
+        if not result:
+            break
+    return region_to_shapes(result)
+
+
+def difference(shape, *others, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """Selisih bentuk pertama dikurangi gabungan bentuk lainnya; lihat boolean_operation."""
+    subtract = _reduce([_as_region(s, segments) for s in others], 'union')
+    return region_to_shapes(_overlay(_as_region(shape, segments), subtract, 'difference'))
+
+
+def symmetric_difference(*shapes, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """Selisih simetris (xor) dua bentuk atau lebih; lihat boolean_operation."""
+    return region_to_shapes(_reduce([_as_region(s, segments) for s in shapes], 'xor'))
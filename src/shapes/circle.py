@@ -2,11 +2,34 @@
 Modul untuk menggambar lingkaran (circle).
 
 Lingkaran didefinisikan oleh titik pusat dan radius.
+Keliling polygon hanya dibuat saat dibutuhkan (lihat tessellation.py).
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import numpy as np
+from .shape_array import Shape
+
+
+def create_circle(center_x, center_y, radius):
+    """
+    Membuat lingkaran tanpa input pengguna dan tanpa menggambar.
+    
+    Parameters:
+    -----------
+    center_x : float
+        Koordinat X pusat lingkaran
+    center_y : float
+        Koordinat Y pusat lingkaran
+    radius : float
+        Radius lingkaran (harus positif)
+        
+    Returns:
+    --------
+    Shape : Bentuk berisi tipe, pusat, dan radius lingkaran
+    """
+    if radius <= 0:
+        raise ValueError("Radius harus bernilai positif.")
+
+    # Lingkaran disimpan analitik; vertices dihitung saat dibutuhkan
+    return Shape('circle', [], center=(center_x, center_y), radius=radius)
 
 
 def draw_circle(ax):
@@ -20,7 +43,7 @@ def draw_circle(ax):
         
     Returns:
     --------
-    dict : Dictionary berisi tipe, pusat, dan radius lingkaran
+    Shape : Bentuk berisi tipe, pusat, dan radius lingkaran
            atau None jika input tidak valid
            
     Example:
@@ -42,6 +65,7 @@ def draw_circle(ax):
         return None
 
     # Membuat patch lingkaran
+    from matplotlib.patches import Circle
     circle = Circle((center_x, center_y), radius, edgecolor='red', 
                     facecolor='lightyellow', alpha=0.5)
 
@@ -53,15 +77,4 @@ def draw_circle(ax):
 
     print(f"Lingkaran berhasil digambar dengan pusat ({center_x}, {center_y}) dan radius {radius}.")
 
-    # Menghitung titik-titik pada lingkaran untuk transformasi
-    theta = np.linspace(0, 2 * np.pi, 100)
-    x_points = center_x + radius * np.cos(theta)
-    y_points = center_y + radius * np.sin(theta)
-    vertices = list(zip(x_points, y_points))
-
-    return {
-        'type': 'circle',
-        'center': (center_x, center_y),
-        'radius': radius,
-        'vertices': vertices  # Untuk keperluan transformasi
-    }
+    return create_circle(center_x, center_y, radius)
@@ -0,0 +1,204 @@
+"""
+Modul level-of-detail (LOD) untuk polygon dengan banyak vertices.
+
+Saat seluruh scene terlihat, polygon dengan ribuan vertices hanya
+menempati beberapa piksel. Polygon disederhanakan dengan algoritma
+Douglas–Peucker, dihitung sekali untuk semua toleransi:
+
+- Dekomposisi Douglas–Peucker lengkap dijalankan secara vektor: pada
+  setiap iterasi semua segmen aktif dipecah sekaligus di titik terjauh
+  dari chord-nya (satu pass NumPy per tingkat rekursi).
+- Setiap vertex menyimpan "importance" = min(jarak saat dipilih,
+  importance induknya). Hasil Douglas–Peucker dengan toleransi ε adalah
+  tepat semua vertex dengan importance > ε, karena titik pecah setiap
+  segmen tidak bergantung pada ε.
+- Beberapa level (toleransi berkelipatan 2 dari ukuran bentuk) disimpan
+  sebagai array indeks; renderer memilih level dari skala piksel per
+  satuan axes.
+
+Visvalingam–Whyatt tidak dipakai karena urutan penghapusannya berurutan
+(heap) dan tidak dapat divektorkan seperti dekomposisi di atas.
+
+Karena level berupa indeks, LOD tetap berlaku setelah transformasi
+similaritas (rotasi, translasi, skala seragam, cermin): importance cukup
+dikalikan faktor skalanya.
+"""
+
+import numpy as np
+
+
+# Polygon dengan vertices sebanyak ini atau kurang tidak disederhanakan
+LOD_MIN_VERTICES = 64
+
+# Jumlah vertices minimum setiap level (agar polygon tetap punya luas)
+LOD_MIN_KEPT = 3
+
+# Jumlah level maksimum (toleransi ukuran/2, ukuran/4, ..., ukuran/4096)
+LOD_MAX_LEVELS = 12
+
+
+def douglas_peucker_importance(vertices, min_tolerance=0.0):
+    """
+    Importance setiap vertex polygon tertutup menurut Douglas–Peucker.
+
+    Polygon diperlakukan sebagai polyline v0, v1, ..., v(N-1), v0. Jarak
+    ke chord yang panjangnya nol (v0 ke v0) adalah jarak ke titik v0.
+
+    Parameters:
+    -----------
+    vertices : array_like
+        Vertices polygon (N, 2)
+    min_tolerance : float
+        Segmen yang jarak terjauhnya <= min_tolerance tidak dipecah lagi;
+        titik interiornya mendapat importance 0. Hasil tetap tepat untuk
+        setiap toleransi >= min_tolerance, dan jauh lebih cepat untuk
+        polygon yang sangat rapat.
+
+    Returns:
+    --------
+    numpy.ndarray : Importance float64 (N,); v0 bernilai inf
+
+    Example:
+    --------
+    >>> importance = douglas_peucker_importance(vertices)
+    >>> simplified = vertices[importance > 0.01]    # Sama dengan DP(ε=0.01)
+    """
+    points = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    count = len(points)
+    importance = np.zeros(count + 1)
+    importance[0] = importance[count] = np.inf
+    if count < 3:
+        return np.full(count, np.inf)
+    xs = np.append(points[:, 0], points[0, 0])
+    ys = np.append(points[:, 1], points[0, 1])
+
+    starts = np.array([0])
+    stops = np.array([count])
+    inherited = np.array([np.inf])
+    while len(starts):
+        # Semua titik interior dari semua segmen aktif dalam satu array
+        lengths = stops - starts - 1
+        segment = np.repeat(np.arange(len(starts)), lengths)
+        first = np.cumsum(lengths) - lengths
+        index = starts[segment] + 1 + np.arange(len(segment)) - first[segment]
+
+        # Jarak ke garis chord sebagai |x·u + y·v + w| dengan (u, v) normal satuan
+        ax, ay = xs[starts], ys[starts]
+        dx, dy = xs[stops] - ax, ys[stops] - ay
+        length = np.hypot(dx, dy)
+        degenerate = length == 0
+        length[degenerate] = 1.0
+        u, v = -dy / length, dx / length
+        w = -(ax * u + ay * v)
+        px, py = xs[index], ys[index]
+        distance = np.abs(px * u[segment] + py * v[segment] + w[segment])
+        if degenerate.any():
+            # Chord nol (v0 ke v0): jarak ke titik v0
+            point = degenerate[segment]
+            distance[point] = np.hypot(px[point] - ax[segment[point]], py[point] - ay[segment[point]])
+
+        # Titik terjauh per segmen (yang pertama jika ada beberapa);
+        # titik interior setiap segmen berurutan di dalam array
+        farthest = np.maximum.reduceat(distance, first)
+        candidates = np.flatnonzero(distance == farthest[segment])
+        candidates = candidates[np.r_[True, np.diff(segment[candidates]) != 0]]
+        split = index[candidates]
+        value = np.minimum(distance[candidates], inherited)
+        importance[split] = value
+
+        # Segmen dengan titik terjauh <= min_tolerance berhenti dipecah
+        starts, stops = np.concatenate((starts, split)), np.concatenate((split, stops))
+        inherited = np.concatenate((value, value))
+        keep = (stops - starts > 1) & (inherited > min_tolerance)
+        starts, stops, inherited = starts[keep], stops[keep], inherited[keep]
+
+    return importance[:count]
+
+
+def keep_indices(importance, tolerance, min_kept=LOD_MIN_KEPT):
+    """
+    Indeks vertices yang dipertahankan untuk toleransi tertentu (urut).
+
+    Jika kurang dari min_kept, diambil min_kept vertices terpenting.
+    """
+    kept = np.flatnonzero(importance > tolerance)
+    if len(kept) < min(min_kept, len(importance)):
+        kept = np.sort(np.argsort(-importance, kind='stable')[:min_kept])
+    return kept
+
+
+class PolygonLOD:
+    """
+    Level-level penyederhanaan satu polygon sebagai array indeks vertices.
+
+    Parameters:
+    -----------
+    importance : numpy.ndarray
+        Importance setiap vertex (lihat douglas_peucker_importance)
+    size : float
+        Ukuran bentuk (diagonal bounding box) untuk toleransi level
+        terkasar; level berikutnya separuh toleransi sebelumnya sampai
+        semua vertices dipertahankan
+
+    Example:
+    --------
+    >>> lod = PolygonLOD.from_vertices(vertices)
+    >>> outline = vertices[lod.select(0.25 / pixels_per_unit)]
+    """
+
+    __slots__ = ('importance', 'tolerances', 'levels')
+
+    def __init__(self, importance, size):
+        self.importance = np.asarray(importance, dtype=np.float64)
+        self.tolerances = []
+        self.levels = []
+        tolerance = float(size) / 2
+        for _ in range(LOD_MAX_LEVELS):
+            if tolerance <= 0:
+                break
+            kept = keep_indices(self.importance, tolerance)
+            if self.levels and len(kept) == len(self.levels[-1]):
+                self.tolerances[-1] = tolerance
+            else:
+                self.tolerances.append(tolerance)
+                self.levels.append(kept)
+            if len(kept) == len(self.importance):
+                break
+            tolerance /= 2
+
+    @classmethod
+    def from_vertices(cls, vertices):
+        """Membangun LOD dari vertices polygon (N, 2)."""
+        points = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        size = np.hypot(*np.ptp(points, axis=0)) if len(points) else 0.0
+        # Level terhalus: size / 2^LOD_MAX_LEVELS; detail di bawahnya tidak pernah dipilih
+        finest = size / 2 ** LOD_MAX_LEVELS
+        return cls(douglas_peucker_importance(points, finest), size)
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __repr__(self):
+        counts = [len(level) for level in self.levels]
+        return f"PolygonLOD({len(self.importance)} vertices, levels={counts})"
+
+    def select(self, tolerance):
+        """
+        Indeks vertices level paling kasar yang toleransinya <= tolerance.
+
+        Jika tolerance lebih kecil dari semua level, seluruh vertices
+        dikembalikan (slice, tanpa salinan indeks).
+        """
+        for level_tolerance, kept in zip(self.tolerances, self.levels):
+            if level_tolerance <= tolerance:
+                return kept
+        return slice(None)
+
+    def scaled(self, factor):
+        """LOD untuk bentuk yang diskalakan seragam dengan faktor |factor|."""
+        factor = abs(float(factor))
+        lod = PolygonLOD.__new__(PolygonLOD)
+        lod.importance = self.importance * factor
+        lod.tolerances = [tolerance * factor for tolerance in self.tolerances]
+        lod.levels = self.levels
+        return lod
@@ -0,0 +1,257 @@
+"""
+Modul metrik geometri bentuk: luas bertanda, centroid luas, keliling, bounding box.
+
+Polygon dihitung dengan rumus shoelace secara vektor:
+
+    A  = 1/2 · Σ (x_i · y_(i+1) - x_(i+1) · y_i)
+    Cx = 1/(6A) · Σ (x_i + x_(i+1)) · (x_i · y_(i+1) - x_(i+1) · y_i)
+
+Luas bertanda positif untuk vertices berlawanan arah jarum jam. Centroid
+adalah pusat massa daerah polygon (bukan rata-rata vertices); untuk
+polygon yang luasnya nol dipakai rata-rata vertices. Luas dianggap nol
+relatif terhadap suku shoelace-nya (DEGENERATE_RELATIVE), bukan dengan
+toleransi absolut, sehingga polygon yang sangat kecil tetap benar.
+
+Lingkaran/elips dihitung analitik dari center, radius, dan matriks
+akumulasi L: luas π·r²·det(L), keliling dengan aproksimasi Ramanujan
+dari sumbu-sumbu elips (nilai singular r·L), tepat untuk lingkaran.
+
+Di bawah transformasi affine M = [L | t], metrik dapat diperbarui tanpa
+membaca vertices (ShapeMetrics.transformed):
+- luas dikalikan det(L), centroid dipetakan M (affine mempertahankan
+  pusat massa);
+- bounding box dipetakan langsung jika L hanya menskalakan/mencerminkan
+  sumbu atau menukar sumbu (rotasi kelipatan 90°);
+- keliling dikalikan s jika L similaritas (rotasi/cermin dengan skala s).
+Selain itu bagian yang tidak analitik dihitung ulang dari vertices baru.
+"""
+
+import numpy as np
+
+
+# Luas dianggap nol jika |Σ cross| <= DEGENERATE_RELATIVE · Σ |cross|
+# (sisa pembatalan float64, misalnya polygon kolinear)
+DEGENERATE_RELATIVE = 1e-9
+
+
+class ShapeMetrics:
+    """
+    Metrik satu bentuk (nilai skalar) atau satu ShapeArray (array per bentuk).
+
+    Attributes:
+    -----------
+    area : float atau numpy.ndarray (n,)
+        Luas bertanda (positif jika vertices berlawanan arah jarum jam)
+    centroid : tuple atau numpy.ndarray (n, 2)
+        Centroid luas
+    perimeter : float atau numpy.ndarray (n,)
+        Keliling
+    bounds : tuple atau numpy.ndarray (n, 4)
+        Bounding box (xmin, ymin, xmax, ymax)
+    """
+
+    __slots__ = ('area', 'centroid', 'perimeter', 'bounds')
+
+    def __init__(self, area, centroid, perimeter, bounds):
+        self.area = area
+        self.centroid = centroid
+        self.perimeter = perimeter
+        self.bounds = bounds
+
+    def __repr__(self):
+        return (f"ShapeMetrics(area={self.area!r}, centroid={self.centroid!r}, "
+                f"perimeter={self.perimeter!r}, bounds={self.bounds!r})")
+
+    def transformed(self, matrix, vertices=None):
+        """
+        Metrik bentuk setelah transformasi affine homogen 3x3 (untuk satu bentuk).
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks affine homogen 3x3
+        vertices : numpy.ndarray, optional
+            Vertices hasil transformasi; dipakai untuk bounding box atau
+            keliling yang tidak dapat diperbarui analitik
+
+        Returns:
+        --------
+        ShapeMetrics : Metrik baru, atau None jika vertices dibutuhkan
+                       tetapi tidak diberikan
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        linear, translation = matrix[:2, :2], matrix[:2, 2]
+        area = self.area * float(np.linalg.det(linear))
+        centroid = tuple((linear @ self.centroid + translation).tolist())
+
+        if (linear[0, 1] == 0 and linear[1, 0] == 0) or (linear[0, 0] == 0 and linear[1, 1] == 0):
+            # Sumbu tetap sejajar sumbu: pojok bounding box dipetakan langsung
+            xmin, ymin, xmax, ymax = self.bounds
+            corners = np.array([[xmin, ymin], [xmax, ymax]]) @ linear.T + translation
+            bounds = tuple(np.concatenate((corners.min(axis=0), corners.max(axis=0))).tolist())
+        elif vertices is not None:
+            bounds = polygon_bounds(vertices)
+        else:
+            return None
+
+        scale = similarity_scale(linear)
+        if scale is not None:
+            perimeter = self.perimeter * scale
+        elif vertices is not None:
+            perimeter = polygon_perimeter(vertices)
+        else:
+            return None
+
+        return ShapeMetrics(area, centroid, perimeter, bounds)
+
+
+def similarity_scale(linear):
+    """
+    Faktor skala s jika matriks linear 2x2 adalah similaritas (s × rotasi/cermin).
+
+    Returns:
+    --------
+    float atau None : s, atau None jika L bukan similaritas
+    """
+    gram = linear.T @ linear
+    # Toleransi relatif terhadap skala matriks (L yang sangat kecil tetap dibedakan)
+    tolerance = 1e-12 * float(np.abs(gram).max())
+    if abs(gram[0, 1]) <= tolerance and abs(gram[0, 0] - gram[1, 1]) <= tolerance:
+        return float(np.sqrt(gram[0, 0]))
+    return None
+
+
+def _cross_terms(vertices):
+    xs, ys = vertices[:, 0], vertices[:, 1]
+    xn, yn = np.roll(xs, -1), np.roll(ys, -1)
+    return xs, ys, xn, yn, xs * yn - xn * ys
+
+
+def polygon_area(vertices):
+    """Luas bertanda polygon (N, 2) dengan rumus shoelace."""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(vertices) < 3:
+        return 0.0
+    return float(_cross_terms(vertices)[4].sum() / 2)
+
+
+def polygon_centroid(vertices):
+    """Centroid luas polygon (N, 2); rata-rata vertices jika luasnya nol."""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(vertices) == 0:
+        return (0.0, 0.0)
+    xs, ys, xn, yn, cross = _cross_terms(vertices)
+    area = cross.sum() / 2
+    if len(vertices) < 3 or abs(area) <= DEGENERATE_RELATIVE * np.abs(cross).sum() / 2:
+        return tuple(vertices.mean(axis=0).tolist())
+    return (float(((xs + xn) * cross).sum() / (6 * area)),
+            float(((ys + yn) * cross).sum() / (6 * area)))
+
+
+def polygon_perimeter(vertices):
+    """Keliling polygon tertutup (N, 2)."""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(vertices) < 2:
+        return 0.0
+    return float(np.hypot(*(np.roll(vertices, -1, axis=0) - vertices).T).sum())
+
+
+def polygon_bounds(vertices):
+    """Bounding box (xmin, ymin, xmax, ymax) vertices (N, 2)."""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(vertices) == 0:
+        return (0.0, 0.0, 0.0, 0.0)
+    return tuple(np.concatenate((vertices.min(axis=0), vertices.max(axis=0))).tolist())
+
+
+def polygon_metrics(vertices):
+    """Semua metrik polygon (N, 2) dalam satu ShapeMetrics."""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    return ShapeMetrics(polygon_area(vertices), polygon_centroid(vertices),
+                        polygon_perimeter(vertices), polygon_bounds(vertices))
+
+
+def ellipse_perimeter(a, b):
+    """Keliling elips dengan sumbu semi a dan b (aproksimasi Ramanujan II)."""
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    total = a + b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        h = np.where(total > 0, ((a - b) / total) ** 2, 0.0)
+    return np.pi * total * (1 + 3 * h / (10 + np.sqrt(4 - 3 * h)))
+
+
+def ellipse_metrics(center, radius, matrix=None):
+    """
+    Metrik analitik lingkaran/elips.
+
+    Parameters:
+    -----------
+    center : tuple
+        Pusat lingkaran asli
+    radius : float
+        Radius lingkaran asli
+    matrix : numpy.ndarray, optional
+        Matriks affine akumulasi 3x3
+
+    Returns:
+    --------
+    ShapeMetrics
+    """
+    linear = np.eye(2) if matrix is None else np.asarray(matrix, dtype=np.float64)[:2, :2]
+    center = np.asarray(center, dtype=np.float64)
+    if matrix is not None:
+        center = linear @ center + matrix[:2, 2]
+    axes = radius * np.linalg.svd(linear, compute_uv=False)
+    half = radius * np.sqrt((linear ** 2).sum(axis=1))
+    return ShapeMetrics(float(np.pi * radius ** 2 * np.linalg.det(linear)),
+                        tuple(center.tolist()),
+                        float(ellipse_perimeter(axes[0], axes[1])),
+                        tuple(np.concatenate((center - half, center + half)).tolist()))
+
+
+def segment_metrics(vertices, offsets):
+    """
+    Metrik banyak polygon dalam satu buffer (vertices[offsets[i]:offsets[i + 1]]).
+
+    Semua suku shoelace dihitung sekali untuk seluruh buffer, lalu
+    dijumlahkan per polygon dengan np.add.reduceat.
+
+    Returns:
+    --------
+    ShapeMetrics : area (n,), centroid (n, 2), perimeter (n,), bounds (n, 4)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    counts = np.diff(offsets)
+    count = len(counts)
+    area = np.zeros(count)
+    centroid = np.zeros((count, 2))
+    perimeter = np.zeros(count)
+    bounds = np.zeros((count, 4))
+
+    filled = np.flatnonzero(counts > 0)
+    if len(filled) == 0:
+        return ShapeMetrics(area, centroid, perimeter, bounds)
+
+    # Vertex berikutnya dalam polygon yang sama (vertex terakhir kembali ke awal)
+    following = np.arange(1, len(vertices) + 1)
+    following[offsets[filled + 1] - 1] = offsets[filled]
+    xs, ys = vertices[:, 0], vertices[:, 1]
+    xn, yn = xs[following], ys[following]
+    cross = xs * yn - xn * ys
+
+    starts = offsets[filled]
+    area[filled] = np.add.reduceat(cross, starts) / 2
+    perimeter[filled] = np.add.reduceat(np.hypot(xn - xs, yn - ys), starts)
+    moments = np.add.reduceat(np.column_stack(((xs + xn) * cross, (ys + yn) * cross)), starts)
+    means = np.add.reduceat(vertices, starts) / counts[filled, None]
+    bounds[filled, :2] = np.minimum.reduceat(vertices, starts)
+    bounds[filled, 2:] = np.maximum.reduceat(vertices, starts)
+
+    magnitude = np.add.reduceat(np.abs(cross), starts) / 2
+    degenerate = (np.abs(area[filled]) <= DEGENERATE_RELATIVE * magnitude) | (counts[filled] < 3)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centroid[filled] = np.where(degenerate[:, None], means,
+                                    moments / (6 * area[filled, None]))
+    area[filled[counts[filled] < 3]] = 0.0
+    return ShapeMetrics(area, centroid, perimeter, bounds)
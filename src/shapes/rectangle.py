@@ -5,7 +5,38 @@ Persegi panjang adalah segi empat dengan sudut 90 derajat,
 dimana panjang dan lebar dapat berbeda.
 """
 
-import matplotlib.pyplot as plt
+from .shape_array import Shape
+
+
+def create_rectangle(width, height, x_start, y_start):
+    """
+    Membuat persegi panjang tanpa input pengguna dan tanpa menggambar.
+    
+    Parameters:
+    -----------
+    width : float
+        Lebar persegi panjang
+    height : float
+        Tinggi persegi panjang
+    x_start : float
+        Koordinat X pojok kiri bawah
+    y_start : float
+        Koordinat Y pojok kiri bawah
+        
+    Returns:
+    --------
+    Shape : Bentuk berisi tipe dan vertices persegi panjang
+    """
+    # Menghitung vertices persegi panjang
+    vertices = [
+        (x_start, y_start),                      # Kiri bawah
+        (x_start + width, y_start),              # Kanan bawah
+        (x_start + width, y_start + height),     # Kanan atas
+        (x_start, y_start + height)              # Kiri atas
+    ]
+
+    return Shape('rectangle', vertices, width=width, height=height,
+                 start_point=(x_start, y_start))
 
 
 def draw_rectangle(ax):
@@ -19,7 +50,7 @@ def draw_rectangle(ax):
         
     Returns:
     --------
-    dict : Dictionary berisi tipe dan vertices persegi panjang
+    Shape : Bentuk berisi tipe dan vertices persegi panjang
            atau None jika input tidak valid
            
     Example:
@@ -37,16 +68,11 @@ def draw_rectangle(ax):
         print("Input tidak valid. Harap masukkan angka.")
         return None
 
-    # Menghitung vertices persegi panjang
-    vertices = [
-        (x_start, y_start),                      # Kiri bawah
-        (x_start + width, y_start),              # Kanan bawah
-        (x_start + width, y_start + height),     # Kanan atas
-        (x_start, y_start + height)              # Kiri atas
-    ]
+    shape = create_rectangle(width, height, x_start, y_start)
 
     # Membuat polygon patch
-    rectangle = plt.Polygon(vertices, closed=True, edgecolor='purple', 
+    import matplotlib.pyplot as plt
+    rectangle = plt.Polygon(shape.vertices, closed=True, edgecolor='purple', 
                             facecolor='lavender', alpha=0.5)
 
     # Menambahkan patch ke axes
@@ -59,10 +85,4 @@ def draw_rectangle(ax):
 
     print(f"Persegi panjang berhasil digambar dengan ukuran {width}x{height} pada ({x_start}, {y_start}).")
 
-    return {
-        'type': 'rectangle',
-        'vertices': vertices,
-        'width': width,
-        'height': height,
-        'start_point': (x_start, y_start)
-    }
+    return shape
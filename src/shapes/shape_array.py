@@ -0,0 +1,629 @@
+"""
+Modul representasi bentuk yang ringkas berbasis array NumPy.
+
+- Shape      : satu bentuk, vertices disimpan dalam satu buffer float64
+               (N, 2) yang kontigu, metadata disimpan sebagai field bertipe.
+- ShapeArray : banyak bentuk dalam satu buffer vertices bersama dan array
+               offsets, sehingga setiap vertex hanya memakan 16 byte.
+
+Shape tetap mendukung akses gaya dictionary (shape['vertices'],
+shape.get('radius'), shape.copy()) agar kompatibel dengan kode lama
+yang memakai shape_data berupa dict.
+
+Lingkaran disimpan secara analitik: pusat dan radius asli ditambah matriks
+affine akumulasi. Setelah penskalaan tidak seragam lingkaran menjadi elips,
+dan keliling polygon hanya dibuat saat dibutuhkan (lihat tessellation.py).
+"""
+
+import numpy as np
+
+from .lod import LOD_MIN_VERTICES, PolygonLOD
+from .metrics import (ellipse_metrics, ellipse_perimeter, polygon_metrics, segment_metrics,
+                      similarity_scale)
+from .tessellation import DEFAULT_CIRCLE_SEGMENTS, circle_outline
+
+
+# Kode tipe bentuk untuk penyimpanan ringkas (uint8). 'polygon' adalah
+# polygon bebas, misalnya hasil operasi boolean (lihat boolean.py)
+SHAPE_TYPES = ('square', 'triangle', 'rectangle', 'circle', 'trapezoid', 'polygon')
+
+# Arti kolom `params` pada ShapeArray untuk setiap tipe bentuk
+PARAM_FIELDS = {
+    'square': ('side',),
+    'triangle': (),
+    'rectangle': ('width', 'height'),
+    'circle': ('radius',),
+    'trapezoid': ('bottom_width', 'top_width', 'height'),
+    'polygon': (),
+}
+
+# Field metadata yang disimpan Shape selain tipe dan vertices
+METADATA_FIELDS = ('center', 'radius', 'side', 'width', 'height',
+                   'bottom_width', 'top_width', 'start_point')
+
+
+def as_vertex_buffer(vertices):
+    """
+    Mengubah vertices menjadi buffer float64 (N, 2) yang kontigu.
+
+    Tidak melakukan salinan jika input sudah berupa array yang sesuai.
+    """
+    return np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 2)
+
+
+def _as_point(point):
+    if point is None:
+        return None
+    x, y = point
+    return (float(x), float(y))
+
+
+def _as_float(value):
+    return None if value is None else float(value)
+
+
+class Shape:
+    """
+    Satu bentuk geometris dengan vertices dalam buffer float64 kontigu.
+
+    Parameters:
+    -----------
+    shape_type : str
+        Tipe bentuk ('square', 'triangle', 'rectangle', 'circle', 'trapezoid',
+        atau 'polygon')
+    vertices : array_like
+        Koordinat vertices berbentuk (N, 2)
+    **metadata :
+        Field opsional: center, radius, side, width, height,
+        bottom_width, top_width, start_point, matrix
+
+    Note:
+    -----
+    Untuk lingkaran, vertices tidak disimpan. Keliling dihitung dari
+    center, radius, dan matrix (transformasi affine 3x3 akumulasi)
+    dengan DEFAULT_CIRCLE_SEGMENTS segmen, atau dengan outline(segments).
+
+    metrics() (luas, centroid luas, keliling, bounding box) dan lod()
+    (level penyederhanaan Douglas–Peucker) di-cache dan dihapus saat
+    vertices atau field diubah lewat shape.vertices = ... atau
+    shape[...] = ...; transformed() memperbaruinya jika memungkinkan.
+
+    Example:
+    --------
+    >>> shape = Shape('square', [(0, 0), (2, 0), (2, 2), (0, 2)],
+    ...               side=2, start_point=(0, 0))
+    >>> shape['vertices'].shape
+    (4, 2)
+    >>> shape.get('side')
+    2.0
+    """
+
+    __slots__ = ('type', '_vertices', 'matrix', '_metrics', '_lod') + METADATA_FIELDS
+
+    def __init__(self, shape_type, vertices, center=None, radius=None, side=None,
+                 width=None, height=None, bottom_width=None, top_width=None,
+                 start_point=None, matrix=None):
+        self.type = shape_type
+        if shape_type == 'circle':
+            # Keliling lingkaran selalu dihitung ulang dari bentuk analitiknya
+            self._vertices = None
+        else:
+            self._vertices = as_vertex_buffer(vertices)
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=np.float64).reshape(3, 3)
+        self.center = _as_point(center)
+        self.radius = _as_float(radius)
+        self.side = _as_float(side)
+        self.width = _as_float(width)
+        self.height = _as_float(height)
+        self.bottom_width = _as_float(bottom_width)
+        self.top_width = _as_float(top_width)
+        self.start_point = _as_point(start_point)
+        self._metrics = None
+        self._lod = None
+
+    @property
+    def vertices(self):
+        """Buffer vertices float64 (N, 2)."""
+        if self._vertices is None:
+            self._vertices = self.outline(DEFAULT_CIRCLE_SEGMENTS)
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, value):
+        if self.type == 'circle':
+            raise AttributeError("Vertices lingkaran dihitung dari center, radius, dan matrix. "
+                                 "Gunakan transformed() untuk mentransformasi lingkaran.")
+        self._vertices = as_vertex_buffer(value)
+        self._metrics = None
+        self._lod = None
+
+    def __repr__(self):
+        if self.type == 'circle':
+            return f"Shape(type='circle', center={self.center}, radius={self.radius})"
+        return f"Shape(type={self.type!r}, n_vertices={len(self._vertices)})"
+
+    def outline(self, segments=DEFAULT_CIRCLE_SEGMENTS):
+        """
+        Keliling bentuk sebagai array (N, 2).
+
+        Untuk lingkaran, keliling dibuat dengan jumlah segmen tertentu
+        (tabel cos/sin di-cache per jumlah segmen). Untuk polygon,
+        mengembalikan vertices apa adanya.
+        """
+        if self.type == 'circle':
+            return circle_outline(self.center, self.radius, self.matrix, segments)
+        return self._vertices
+
+    def centroid(self):
+        """
+        Titik pusat default untuk transformasi.
+
+        Untuk polygon: rata-rata vertices (sama seperti scale_vertices).
+        Untuk lingkaran: pusat setelah transformasi matrix.
+        """
+        if self.type == 'circle':
+            center = np.asarray(self.center, dtype=float)
+            if self.matrix is not None:
+                center = self.matrix[:2, :2] @ center + self.matrix[:2, 2]
+            return tuple(center.tolist())
+        if len(self._vertices) == 0:
+            return (0.0, 0.0)
+        return tuple(self._vertices.mean(axis=0).tolist())
+
+    def metrics(self):
+        """
+        Luas bertanda, centroid luas, keliling, dan bounding box (lihat metrics.py).
+
+        Dihitung sekali lalu di-cache. Untuk lingkaran/elips dihitung
+        analitik dari center, radius, dan matrix, tanpa tessellation.
+
+        Returns:
+        --------
+        ShapeMetrics
+        """
+        if self._metrics is None:
+            if self.type == 'circle':
+                self._metrics = ellipse_metrics(self.center, self.radius, self.matrix)
+            else:
+                self._metrics = polygon_metrics(self._vertices)
+        return self._metrics
+
+    def lod(self):
+        """
+        Level-of-detail polygon (lihat lod.py), dibangun sekali lalu di-cache.
+
+        Returns:
+        --------
+        PolygonLOD atau None : None untuk lingkaran dan polygon dengan
+                               LOD_MIN_VERTICES vertices atau kurang
+        """
+        if self.type == 'circle' or len(self._vertices) <= LOD_MIN_VERTICES:
+            return None
+        if self._lod is None:
+            self._lod = PolygonLOD.from_vertices(self._vertices)
+        return self._lod
+
+    def simplified(self, tolerance):
+        """
+        Vertices yang disederhanakan untuk toleransi (koordinat data) tertentu.
+
+        Memakai level LOD paling kasar yang penyimpangannya tidak melebihi
+        tolerance; polygon kecil dan lingkaran dikembalikan apa adanya.
+        """
+        lod = self.lod()
+        if lod is None:
+            return self.outline()
+        return self._vertices[lod.select(tolerance)]
+
+    def bounds(self):
+        """
+        Bounding box sejajar sumbu (xmin, ymin, xmax, ymax).
+
+        Untuk lingkaran/elips dihitung analitik: setengah lebar pada tiap
+        sumbu adalah norma baris matriks r · L, tanpa tessellation.
+        """
+        return self.metrics().bounds
+
+    def contains_point(self, x, y):
+        """
+        Memeriksa apakah titik (x, y) berada di dalam bentuk.
+
+        Polygon memakai aturan even-odd (ray casting) secara vektor.
+        Lingkaran/elips: titik dipetakan balik dengan invers matrix lalu
+        dibandingkan dengan radius asli.
+        """
+        if self.type == 'circle':
+            point = np.array([x, y], dtype=float)
+            if self.matrix is not None:
+                point = np.linalg.solve(self.matrix[:2, :2], point - self.matrix[:2, 2])
+            return bool(np.hypot(*(point - self.center)) <= self.radius)
+
+        vertices = self._vertices
+        if len(vertices) < 3:
+            return False
+        xs, ys = vertices[:, 0], vertices[:, 1]
+        xn, yn = np.roll(xs, -1), np.roll(ys, -1)
+        crosses = (ys > y) != (yn > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_at_y = xs + (y - ys) * (xn - xs) / (yn - ys)
+        return bool(np.count_nonzero(crosses & (x < x_at_y)) % 2)
+
+    def transformed(self, matrix):
+        """
+        Menghasilkan bentuk baru hasil transformasi affine homogen 3x3.
+
+        Polygon: vertices dikalikan dengan matriks (satu operasi NumPy).
+        Lingkaran: matriks dikomposisikan ke matrix akumulasi sehingga
+        bentuk tetap analitik (menjadi elips setelah penskalaan tidak seragam).
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks affine homogen 3x3
+
+        Returns:
+        --------
+        Shape : Bentuk baru; bentuk asal tidak berubah
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        new_shape = self.copy()
+
+        if self.type == 'circle':
+            new_shape.matrix = matrix if self.matrix is None else matrix @ self.matrix
+            new_shape._vertices = None
+            new_shape._metrics = None
+        else:
+            new_shape._vertices = self._vertices @ matrix[:2, :2].T + matrix[:2, 2]
+            if self._metrics is not None:
+                new_shape._metrics = self._metrics.transformed(matrix, new_shape._vertices)
+            if self._lod is not None:
+                # Indeks level tetap berlaku untuk similaritas; jarak ikut diskalakan
+                scale = similarity_scale(matrix[:2, :2])
+                new_shape._lod = None if scale is None else self._lod.scaled(scale)
+
+        return new_shape
+
+    # --- Kompatibilitas dengan shape_data berbentuk dict ---
+
+    def keys(self):
+        """Nama field yang terisi, seperti dict.keys()."""
+        return ['type', 'vertices'] + [f for f in METADATA_FIELDS + ('matrix',)
+                                       if getattr(self, f) is not None]
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __getitem__(self, key):
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in ('type', 'vertices', 'matrix') + METADATA_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+        self._metrics = None
+        self._lod = None
+
+    def get(self, key, default=None):
+        """Mengambil field seperti dict.get()."""
+        if key in self.keys():
+            return getattr(self, key)
+        return default
+
+    def copy(self):
+        """
+        Salinan dangkal: buffer vertices dibagi pakai, bukan disalin.
+
+        Transformasi selalu menghasilkan buffer baru, sehingga berbagi
+        buffer di sini aman dan tidak memakan memori tambahan.
+        """
+        new_shape = Shape.__new__(Shape)
+        new_shape.type = self.type
+        new_shape._vertices = self._vertices
+        new_shape.matrix = self.matrix
+        new_shape._metrics = self._metrics
+        new_shape._lod = self._lod
+        for field in METADATA_FIELDS:
+            setattr(new_shape, field, getattr(self, field))
+        return new_shape
+
+    def to_dict(self):
+        """Mengubah bentuk menjadi dict dengan vertices list of tuples."""
+        data = {'type': self.type,
+                'vertices': [tuple(v) for v in self.vertices.tolist()]}
+        for field in METADATA_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.matrix is not None:
+            data['matrix'] = self.matrix.tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, shape_data):
+        """Membuat Shape dari shape_data berbentuk dict (atau Shape lain)."""
+        if isinstance(shape_data, cls):
+            return shape_data
+        metadata = {f: shape_data[f] for f in METADATA_FIELDS + ('matrix',) if f in shape_data}
+        return cls(shape_data['type'], shape_data.get('vertices', []), **metadata)
+
+
+class ShapeArray:
+    """
+    Kumpulan banyak bentuk dalam satu buffer vertices bersama.
+
+    Vertices bentuk ke-i berada pada vertices[offsets[i]:offsets[i + 1]].
+    Buffer vertices bertipe float64, atau float32 jika diberikan float32
+    (misalnya dari file float32 yang dibuka dengan np.memmap; lihat storage.py).
+    Array yang sudah bertipe sesuai dan kontigu dipakai tanpa salinan.
+    Metadata disimpan per kolom:
+    - type_codes : uint8 (n,), indeks ke SHAPE_TYPES
+    - anchors    : float64 (n, 2), start_point untuk polygon, center untuk lingkaran
+    - params     : float64 (n, 3), arti kolom mengikuti PARAM_FIELDS (NaN jika kosong)
+    - transforms : float64 (n, 6), matriks affine akumulasi lingkaran
+                   (a, b, tx, c, d, ty), NaN jika tidak ada
+
+    Example:
+    --------
+    >>> shapes = ShapeArray.from_shapes([square, circle])
+    >>> len(shapes), shapes.vertices.shape
+    (2, (104, 2))
+    >>> np.shares_memory(shapes[0].vertices, shapes.vertices)  # view, tanpa salinan
+    True
+    """
+
+    __slots__ = ('vertices', 'offsets', 'type_codes', 'anchors', 'params', 'transforms')
+
+    def __init__(self, vertices, offsets, type_codes, anchors=None, params=None,
+                 transforms=None):
+        vertices = np.asarray(vertices)
+        if vertices.dtype == np.float32:
+            self.vertices = np.ascontiguousarray(vertices).reshape(-1, 2)
+        else:
+            self.vertices = as_vertex_buffer(vertices)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.type_codes = np.asarray(type_codes, dtype=np.uint8)
+
+        count = len(self.type_codes)
+        if len(self.offsets) != count + 1:
+            raise ValueError("offsets harus berisi len(type_codes) + 1 elemen.")
+        if self.offsets[-1] != len(self.vertices):
+            raise ValueError("offsets terakhir harus sama dengan jumlah vertices.")
+
+        if anchors is None:
+            anchors = np.full((count, 2), np.nan)
+        if params is None:
+            params = np.full((count, 3), np.nan)
+        if transforms is None:
+            transforms = np.full((count, 6), np.nan)
+        self.anchors = np.asarray(anchors, dtype=np.float64).reshape(count, 2)
+        self.params = np.asarray(params, dtype=np.float64).reshape(count, 3)
+        self.transforms = np.asarray(transforms, dtype=np.float64).reshape(count, 6)
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """
+        Menggabungkan banyak Shape (atau dict shape_data) menjadi satu ShapeArray.
+
+        Parameters:
+        -----------
+        shapes : iterable
+            Kumpulan Shape atau dict shape_data
+
+        Returns:
+        --------
+        ShapeArray : Kumpulan bentuk dengan satu buffer vertices
+        """
+        shapes = [Shape.from_dict(s) for s in shapes]
+        count = len(shapes)
+
+        counts = np.fromiter((len(s.vertices) for s in shapes), dtype=np.int64, count=count)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        vertices = np.empty((offsets[-1], 2), dtype=np.float64)
+        type_codes = np.empty(count, dtype=np.uint8)
+        anchors = np.full((count, 2), np.nan)
+        params = np.full((count, 3), np.nan)
+        transforms = np.full((count, 6), np.nan)
+
+        for i, shape in enumerate(shapes):
+            vertices[offsets[i]:offsets[i + 1]] = shape.vertices
+            type_codes[i] = SHAPE_TYPES.index(shape.type)
+            anchor = shape.center if shape.type == 'circle' else shape.start_point
+            if anchor is not None:
+                anchors[i] = anchor
+            for column, field in enumerate(PARAM_FIELDS[shape.type]):
+                value = getattr(shape, field)
+                if value is not None:
+                    params[i, column] = value
+            if shape.matrix is not None:
+                transforms[i] = shape.matrix[:2].ravel()
+
+        return cls(vertices, offsets, type_codes, anchors, params, transforms)
+
+    def __len__(self):
+        return len(self.type_codes)
+
+    def __repr__(self):
+        return f"ShapeArray({len(self)} shapes, {len(self.vertices)} vertices)"
+
+    @property
+    def vertex_counts(self):
+        """Jumlah vertices setiap bentuk, array int64 (n,)."""
+        return np.diff(self.offsets)
+
+    @property
+    def types(self):
+        """Nama tipe setiap bentuk sebagai list of str."""
+        return [SHAPE_TYPES[code] for code in self.type_codes.tolist()]
+
+    @property
+    def nbytes(self):
+        """Total memori buffer (vertices, offsets, dan metadata) dalam byte."""
+        return (self.vertices.nbytes + self.offsets.nbytes + self.type_codes.nbytes
+                + self.anchors.nbytes + self.params.nbytes + self.transforms.nbytes)
+
+    def shape_vertices(self, index):
+        """View (tanpa salinan) ke vertices bentuk ke-index."""
+        return self.vertices[self.offsets[index]:self.offsets[index + 1]]
+
+    def vertex_rows(self, indices):
+        """Indeks baris buffer vertices milik bentuk-bentuk tertentu, berurutan per bentuk."""
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        counts = self.offsets[indices + 1] - self.offsets[indices]
+        starts = np.repeat(self.offsets[indices] - (np.cumsum(counts) - counts), counts)
+        return starts + np.arange(counts.sum())
+
+    def circle_affines(self, indices):
+        """
+        Matriks affine akumulasi bentuk tertentu (identitas jika tidak ada).
+
+        Returns:
+        --------
+        tuple : (linear (n, 2, 2), translasi (n, 2))
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        matrices = np.broadcast_to(np.eye(3)[:2], (len(indices), 2, 3)).copy()
+        stored = self.transforms[indices]
+        known = ~np.isnan(stored).any(axis=1)
+        matrices[known] = stored[known].reshape(-1, 2, 3)
+        return matrices[:, :, :2], matrices[:, :, 2]
+
+    def bounds(self, indices=None):
+        """
+        Bounding box (xmin, ymin, xmax, ymax) bentuk tertentu tanpa menghitung metrik lain.
+
+        Parameters:
+        -----------
+        indices : array of int, optional
+            Indeks bentuk; None berarti semua bentuk
+
+        Returns:
+        --------
+        numpy.ndarray : Array (n, 4)
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        bounds = np.zeros((len(indices), 4))
+        is_circle = self.type_codes[indices] == SHAPE_TYPES.index('circle')
+        counts = self.offsets[indices + 1] - self.offsets[indices]
+        filled = np.flatnonzero(~is_circle & (counts > 0))
+        if len(filled):
+            points = self.vertices[self.vertex_rows(indices[filled])]
+            starts = np.cumsum(counts[filled]) - counts[filled]
+            bounds[filled, :2] = np.minimum.reduceat(points, starts)
+            bounds[filled, 2:] = np.maximum.reduceat(points, starts)
+
+        circles = np.flatnonzero(is_circle)
+        if len(circles):
+            linear, translation = self.circle_affines(indices[circles])
+            centers = np.einsum('nij,nj->ni', linear, self.anchors[indices[circles]]) + translation
+            half = self.params[indices[circles], 0][:, None] * np.sqrt((linear ** 2).sum(axis=2))
+            bounds[circles] = np.column_stack((centers - half, centers + half))
+        return bounds
+
+    def metrics(self):
+        """
+        Metrik semua bentuk sekaligus (lihat metrics.segment_metrics).
+
+        Polygon dihitung dari buffer vertices bersama dengan np.add.reduceat;
+        lingkaran/elips dihitung analitik dari anchors, params, dan transforms.
+
+        Returns:
+        --------
+        ShapeMetrics : area (n,), centroid (n, 2), perimeter (n,), bounds (n, 4)
+        """
+        metrics = segment_metrics(self.vertices, self.offsets)
+        circles = np.flatnonzero(self.type_codes == SHAPE_TYPES.index('circle'))
+        if len(circles) == 0:
+            return metrics
+
+        radius = self.params[circles, 0]
+        linear, translation = self.circle_affines(circles)
+
+        centers = np.einsum('nij,nj->ni', linear, self.anchors[circles]) + translation
+        axes = radius[:, None] * np.linalg.svd(linear, compute_uv=False)
+        half = radius[:, None] * np.sqrt((linear ** 2).sum(axis=2))
+        metrics.area[circles] = np.pi * radius ** 2 * np.linalg.det(linear)
+        metrics.centroid[circles] = centers
+        metrics.perimeter[circles] = ellipse_perimeter(axes[:, 0], axes[:, 1])
+        metrics.bounds[circles] = np.column_stack((centers - half, centers + half))
+        return metrics
+
+    def split(self):
+        """List view vertices per bentuk, siap diberikan ke PolyCollection."""
+        return np.split(self.vertices, self.offsets[1:-1])
+
+    def transform(self, matrix, chunk_size=1 << 20, indices=None):
+        """
+        Menerapkan matriks homogen 3x3 ke semua bentuk secara in-place.
+
+        Vertices diproses per chunk sehingga memori sementara tetap kecil,
+        termasuk untuk buffer np.memmap yang jauh lebih besar dari RAM.
+        Untuk lingkaran, matriks juga dikomposisikan ke `transforms`
+        (sama seperti Shape.transformed).
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks affine homogen 3x3
+        chunk_size : int
+            Jumlah vertices per chunk
+        indices : array of int, optional
+            Hanya bentuk-bentuk ini yang ditransformasi (default: semua)
+
+        Returns:
+        --------
+        ShapeArray : Objek ini sendiri
+        """
+        matrix = np.asarray(matrix, dtype=np.float64).reshape(3, 3)
+        linear_t = matrix[:2, :2].T.astype(self.vertices.dtype)
+        translation = matrix[:2, 2].astype(self.vertices.dtype)
+        if indices is None:
+            for start in range(0, len(self.vertices), chunk_size):
+                chunk = self.vertices[start:start + chunk_size]
+                chunk[:] = chunk @ linear_t
+                chunk += translation
+            circles = np.flatnonzero(self.type_codes == SHAPE_TYPES.index('circle'))
+        else:
+            indices = np.unique(np.asarray(indices, dtype=np.int64))
+            rows = self.vertex_rows(indices)
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                self.vertices[chunk] = self.vertices[chunk] @ linear_t + translation
+            circles = indices[self.type_codes[indices] == SHAPE_TYPES.index('circle')]
+
+        if len(circles):
+            current = np.broadcast_to(np.eye(3), (len(circles), 3, 3)).copy()
+            current[:, :2, :2], current[:, :2, 2] = self.circle_affines(circles)
+            self.transforms[circles] = (matrix @ current)[:, :2].reshape(-1, 6)
+        return self
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        shape_type = SHAPE_TYPES[self.type_codes[index]]
+        metadata = {}
+        anchor = self.anchors[index]
+        if not np.isnan(anchor).any():
+            key = 'center' if shape_type == 'circle' else 'start_point'
+            metadata[key] = tuple(anchor.tolist())
+        for column, field in enumerate(PARAM_FIELDS[shape_type]):
+            value = self.params[index, column]
+            if not np.isnan(value):
+                metadata[field] = value
+        transform = self.transforms[index]
+        if not np.isnan(transform).any():
+            metadata['matrix'] = np.vstack((transform.reshape(2, 3), (0.0, 0.0, 1.0)))
+
+        return Shape(shape_type, self.shape_vertices(index), **metadata)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
@@ -5,7 +5,39 @@ Bujursangkar adalah segi empat dengan semua sisi sama panjang
 dan semua sudut 90 derajat.
 """
 
-import matplotlib.pyplot as plt
+from .shape_array import Shape
+
+
+def create_square(side, x_start, y_start):
+    """
+    Membuat bujursangkar tanpa input pengguna dan tanpa menggambar.
+    
+    Parameters:
+    -----------
+    side : float
+        Panjang sisi bujursangkar
+    x_start : float
+        Koordinat X pojok kiri bawah
+    y_start : float
+        Koordinat Y pojok kiri bawah
+        
+    Returns:
+    --------
+    Shape : Bentuk berisi tipe dan vertices bujursangkar
+    """
+    # Menghitung vertices bujursangkar
+    # (x_start, y_start) adalah pojok kiri bawah
+    # (x_start + side, y_start) adalah pojok kanan bawah
+    # (x_start + side, y_start + side) adalah pojok kanan atas  
+    # (x_start, y_start + side) adalah pojok kiri atas
+    vertices = [
+        (x_start, y_start),                    # Kiri bawah
+        (x_start + side, y_start),             # Kanan bawah
+        (x_start + side, y_start + side),      # Kanan atas
+        (x_start, y_start + side)              # Kiri atas
+    ]
+
+    return Shape('square', vertices, side=side, start_point=(x_start, y_start))
 
 
 def draw_square(ax):
@@ -19,7 +51,7 @@ def draw_square(ax):
         
     Returns:
     --------
-    dict : Dictionary berisi tipe dan vertices bujursangkar
+    Shape : Bentuk berisi tipe dan vertices bujursangkar
            atau None jika input tidak valid
            
     Example:
@@ -36,20 +68,11 @@ def draw_square(ax):
         print("Input tidak valid. Harap masukkan angka.")
         return None
 
-    # Menghitung vertices bujursangkar
-    # (x_start, y_start) adalah pojok kiri bawah
-    # (x_start + side, y_start) adalah pojok kanan bawah
-    # (x_start + side, y_start + side) adalah pojok kanan atas  
-    # (x_start, y_start + side) adalah pojok kiri atas
-    vertices = [
-        (x_start, y_start),                    # Kiri bawah
-        (x_start + side, y_start),             # Kanan bawah
-        (x_start + side, y_start + side),      # Kanan atas
-        (x_start, y_start + side)              # Kiri atas
-    ]
+    shape = create_square(side, x_start, y_start)
 
     # Membuat polygon patch
-    square = plt.Polygon(vertices, closed=True, edgecolor='blue', 
+    import matplotlib.pyplot as plt
+    square = plt.Polygon(shape.vertices, closed=True, edgecolor='blue', 
                          facecolor='lightblue', alpha=0.5)
 
     # Menambahkan patch ke axes
@@ -62,9 +85,4 @@ def draw_square(ax):
 
     print(f"Bujursangkar berhasil digambar dengan sisi {side} pada ({x_start}, {y_start}).")
 
-    return {
-        'type': 'square',
-        'vertices': vertices,
-        'side': side,
-        'start_point': (x_start, y_start)
-    }
+    return shape
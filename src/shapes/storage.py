@@ -0,0 +1,196 @@
+"""
+Modul format file biner untuk menyimpan dan memuat ShapeArray.
+
+File berisi header berukuran tetap lalu array ShapeArray yang kontigu,
+masing-masing dimulai pada kelipatan 64 byte:
+
+    offset  isi
+    ------  -------------------------------------------------------------
+    0       header: magic b'GRAF2DSA', versi (uint16), ukuran float
+            vertices (uint8: 4 atau 8), jumlah bentuk n (uint64),
+            jumlah vertices V (uint64)
+    64      offsets     int64   (n + 1,)
+    ...     type_codes  uint8   (n,)
+    ...     anchors     float64 (n, 2)   start_point / center lingkaran
+    ...     params      float64 (n, 3)   side, width, height, radius, ...
+    ...     transforms  float64 (n, 6)   matriks affine lingkaran
+    ...     vertices    float64 atau float32 (V, 2)
+
+Semua angka little-endian. Posisi setiap array dihitung dari n, V, dan
+ukuran float saja, sehingga load_shapes cukup membaca header lalu
+membuka setiap array dengan np.memmap: file berukuran beberapa GB
+terbuka seketika, dan halaman data baru dibaca dari disk saat diakses.
+
+Metadata lingkaran (center, radius, matriks) selalu float64, sehingga
+lingkaran tetap tepat meskipun vertices disimpan sebagai float32.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from .shape_array import ShapeArray
+
+
+FILE_MAGIC = b'GRAF2DSA'
+FORMAT_VERSION = 1
+
+# magic, versi, ukuran float vertices, cadangan, jumlah bentuk, jumlah vertices
+HEADER = struct.Struct('<8sHBx4xQQ')
+
+# Setiap array dimulai pada kelipatan ALIGNMENT byte
+ALIGNMENT = 64
+
+# Jumlah vertices per chunk saat menulis vertices
+WRITE_CHUNK_SIZE = 1 << 20
+
+VERTEX_DTYPES = {4: np.dtype('<f4'), 8: np.dtype('<f8')}
+
+
+def _align(position):
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def file_layout(count, vertex_count, vertex_dtype=np.float64):
+    """
+    Menghitung posisi setiap array di dalam file.
+
+    Parameters:
+    -----------
+    count : int
+        Jumlah bentuk
+    vertex_count : int
+        Jumlah vertices
+    vertex_dtype : numpy dtype
+        float64 atau float32
+
+    Returns:
+    --------
+    tuple : (list of (nama, dtype, shape, offset), ukuran_file)
+    """
+    sections = [
+        ('offsets', np.dtype('<i8'), (count + 1,)),
+        ('type_codes', np.dtype('u1'), (count,)),
+        ('anchors', np.dtype('<f8'), (count, 2)),
+        ('params', np.dtype('<f8'), (count, 3)),
+        ('transforms', np.dtype('<f8'), (count, 6)),
+        ('vertices', np.dtype(vertex_dtype).newbyteorder('<'), (vertex_count, 2)),
+    ]
+    layout = []
+    position = _align(HEADER.size)
+    for name, dtype, shape in sections:
+        layout.append((name, dtype, shape, position))
+        position = _align(position + dtype.itemsize * int(np.prod(shape)))
+    return layout, position
+
+
+def save_shapes(path, shapes, dtype=np.float64):
+    """
+    Menyimpan bentuk ke file biner.
+
+    Parameters:
+    -----------
+    path : str
+        Path file output
+    shapes : ShapeArray atau iterable of Shape
+        Bentuk yang disimpan (semua tipe di modul shapes)
+    dtype : numpy dtype
+        Tipe vertices di file: float64 (default) atau float32 (separuh ukuran)
+
+    Returns:
+    --------
+    int : Ukuran file dalam byte
+    """
+    dtype = np.dtype(dtype)
+    if dtype.itemsize not in VERTEX_DTYPES or dtype.kind != 'f':
+        raise ValueError("Tipe vertices harus float32 atau float64.")
+    if not isinstance(shapes, ShapeArray):
+        shapes = ShapeArray.from_shapes(shapes)
+
+    layout, size = file_layout(len(shapes), len(shapes.vertices), dtype)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(FILE_MAGIC, FORMAT_VERSION, dtype.itemsize,
+                            len(shapes), len(shapes.vertices)))
+        for name, section_dtype, _, offset in layout:
+            f.seek(offset)
+            array = getattr(shapes, name)
+            # Ditulis per chunk agar buffer besar (misalnya memmap) tidak disalin sekaligus
+            for start in range(0, len(array), WRITE_CHUNK_SIZE):
+                chunk = array[start:start + WRITE_CHUNK_SIZE]
+                np.ascontiguousarray(chunk, dtype=section_dtype).tofile(f)
+        f.truncate(size)
+
+    return size
+
+
+def read_header(path):
+    """
+    Membaca dan memeriksa header file bentuk.
+
+    Returns:
+    --------
+    tuple : (jumlah_bentuk, jumlah_vertices, dtype_vertices)
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"File {path} terlalu pendek untuk berisi header bentuk.")
+
+    magic, version, itemsize, count, vertex_count = HEADER.unpack(data)
+    if magic != FILE_MAGIC:
+        raise ValueError(f"File {path} bukan file bentuk (magic {magic!r}).")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versi format {version} tidak didukung (harus {FORMAT_VERSION}).")
+    if itemsize not in VERTEX_DTYPES:
+        raise ValueError(f"Ukuran float vertices {itemsize} tidak valid.")
+    return count, vertex_count, VERTEX_DTYPES[itemsize]
+
+
+def load_shapes(path, mode='r'):
+    """
+    Membuka file bentuk tanpa membaca isinya ke RAM.
+
+    Parameters:
+    -----------
+    path : str
+        Path file
+    mode : str
+        Mode np.memmap:
+        - 'r'  : hanya baca (default)
+        - 'r+' : perubahan (misalnya ShapeArray.transform) ditulis ke file
+        - 'c'  : copy-on-write, perubahan hanya di memori
+
+    Returns:
+    --------
+    ShapeArray : Bentuk dengan semua array berupa view ke file
+
+    Example:
+    --------
+    >>> shapes = load_shapes('scene.shapes', mode='r+')
+    >>> shapes.transform(to_homogeneous(get_rotation_matrix(90)))   # Ditulis per chunk
+    >>> shapes[0]                                                    # Shape biasa
+    """
+    if mode not in ('r', 'r+', 'c'):
+        raise ValueError("Mode harus 'r', 'r+', atau 'c'.")
+
+    count, vertex_count, vertex_dtype = read_header(path)
+    layout, size = file_layout(count, vertex_count, vertex_dtype)
+    if os.path.getsize(path) < size:
+        raise ValueError(f"File {path} terpotong: {os.path.getsize(path)} dari {size} byte.")
+
+    arrays = {}
+    for name, dtype, shape, offset in layout:
+        if np.prod(shape) == 0:
+            # mmap tidak menerima panjang 0
+            arrays[name] = np.empty(shape, dtype)
+        else:
+            arrays[name] = np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+    shapes = ShapeArray(arrays['vertices'], arrays['offsets'], arrays['type_codes'],
+                        arrays['anchors'], arrays['params'], arrays['transforms'])
+    # Hanya ujung offsets yang diperiksa agar file besar tidak dibaca seluruhnya
+    if shapes.offsets[0] != 0:
+        raise ValueError(f"File {path} berisi offsets yang tidak valid.")
+    return shapes
@@ -0,0 +1,105 @@
+"""
+Modul tessellation lingkaran adaptif.
+
+Lingkaran disimpan secara analitik (pusat, radius, dan matriks affine
+akumulasi), lalu diubah menjadi polygon hanya saat dirender. Jumlah segmen
+ditentukan dari ukuran lingkaran di layar (piksel) agar lingkaran kecil
+tidak membuang titik dan lingkaran besar tidak terlihat bersegi.
+
+Tabel cos/sin untuk setiap jumlah segmen di-cache sehingga tessellation
+berikutnya hanya berupa satu transformasi affine.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+# Jumlah segmen default jika ukuran di layar tidak diketahui
+DEFAULT_CIRCLE_SEGMENTS = 100
+
+# Batas jumlah segmen
+MIN_CIRCLE_SEGMENTS = 8
+MAX_CIRCLE_SEGMENTS = 4096
+
+# Penyimpangan maksimum tepi polygon dari lingkaran sebenarnya (piksel)
+DEFAULT_TOLERANCE_PX = 0.25
+
+
+@lru_cache(maxsize=64)
+def unit_circle(segments):
+    """
+    Titik-titik lingkaran satuan dengan jumlah segmen tertentu (di-cache).
+
+    Parameters:
+    -----------
+    segments : int
+        Jumlah segmen (titik) pada keliling
+
+    Returns:
+    --------
+    numpy.ndarray : Array read-only (segments, 2) berisi (cos θ, sin θ)
+    """
+    theta = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    points = np.column_stack((np.cos(theta), np.sin(theta)))
+    points.flags.writeable = False
+    return points
+
+
+def segments_for_radius(radius_px, tolerance_px=DEFAULT_TOLERANCE_PX):
+    """
+    Menghitung jumlah segmen agar sagitta (jarak tepi polygon ke busur)
+    tidak melebihi toleransi piksel.
+
+    Rumus:
+        sagitta = r * (1 - cos(π / n))  <=  toleransi
+        n >= π / acos(1 - toleransi / r)
+
+    Parameters:
+    -----------
+    radius_px : float
+        Radius terbesar lingkaran/elips di layar dalam piksel
+    tolerance_px : float
+        Toleransi penyimpangan dalam piksel
+
+    Returns:
+    --------
+    int : Jumlah segmen antara MIN_CIRCLE_SEGMENTS dan MAX_CIRCLE_SEGMENTS
+    """
+    if not np.isfinite(radius_px) or radius_px <= tolerance_px:
+        return MIN_CIRCLE_SEGMENTS
+
+    segments = int(np.ceil(np.pi / np.arccos(1 - tolerance_px / radius_px)))
+    # Kelipatan 4 agar titik ekstrem di keempat sumbu selalu ada
+    segments = (segments + 3) // 4 * 4
+    return max(MIN_CIRCLE_SEGMENTS, min(MAX_CIRCLE_SEGMENTS, segments))
+
+
+def circle_outline(center, radius, matrix=None, segments=DEFAULT_CIRCLE_SEGMENTS):
+    """
+    Menghasilkan polygon keliling lingkaran (atau elips jika matrix tidak seragam).
+
+    Parameters:
+    -----------
+    center : tuple
+        Pusat lingkaran asli (sebelum transformasi)
+    radius : float
+        Radius lingkaran asli
+    matrix : array_like, optional
+        Matriks affine homogen 3x3 akumulasi. Jika None, identitas
+    segments : int
+        Jumlah segmen
+
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (segments, 2)
+    """
+    linear = radius * np.eye(2)
+    offset = np.asarray(center, dtype=float)
+
+    if matrix is not None:
+        matrix = np.asarray(matrix, dtype=float)
+        linear = matrix[:2, :2] @ linear
+        offset = matrix[:2, :2] @ offset + matrix[:2, 2]
+
+    return unit_circle(segments) @ linear.T + offset
@@ -5,7 +5,44 @@ Trapesium adalah segi empat dengan sepasang sisi sejajar
 (sisi atas dan sisi bawah).
 """
 
-import matplotlib.pyplot as plt
+from .shape_array import Shape
+
+
+def create_trapezoid(bottom_width, top_width, height, x_start, y_start):
+    """
+    Membuat trapesium sama kaki tanpa input pengguna dan tanpa menggambar.
+    
+    Parameters:
+    -----------
+    bottom_width : float
+        Lebar sisi bawah
+    top_width : float
+        Lebar sisi atas
+    height : float
+        Tinggi trapesium
+    x_start : float
+        Koordinat X pojok kiri bawah
+    y_start : float
+        Koordinat Y pojok kiri bawah
+        
+    Returns:
+    --------
+    Shape : Bentuk berisi tipe dan vertices trapesium
+    """
+    # Menghitung offset untuk sisi atas agar simetris
+    offset = (bottom_width - top_width) / 2
+
+    # Menghitung vertices trapesium
+    vertices = [
+        (x_start, y_start),                                    # Kiri bawah
+        (x_start + bottom_width, y_start),                     # Kanan bawah
+        (x_start + bottom_width - offset, y_start + height),   # Kanan atas
+        (x_start + offset, y_start + height)                   # Kiri atas
+    ]
+
+    return Shape('trapezoid', vertices, bottom_width=bottom_width,
+                 top_width=top_width, height=height,
+                 start_point=(x_start, y_start))
 
 
 def draw_trapezoid(ax):
@@ -19,7 +56,7 @@ def draw_trapezoid(ax):
         
     Returns:
     --------
-    dict : Dictionary berisi tipe dan vertices trapesium
+    Shape : Bentuk berisi tipe dan vertices trapesium
            atau None jika input tidak valid
            
     Example:
@@ -38,19 +75,11 @@ def draw_trapezoid(ax):
         print("Input tidak valid. Harap masukkan angka.")
         return None
 
-    # Menghitung offset untuk sisi atas agar simetris
-    offset = (bottom_width - top_width) / 2
-
-    # Menghitung vertices trapesium
-    vertices = [
-        (x_start, y_start),                                    # Kiri bawah
-        (x_start + bottom_width, y_start),                     # Kanan bawah
-        (x_start + bottom_width - offset, y_start + height),   # Kanan atas
-        (x_start + offset, y_start + height)                   # Kiri atas
-    ]
+    shape = create_trapezoid(bottom_width, top_width, height, x_start, y_start)
 
     # Membuat polygon patch
-    trapezoid = plt.Polygon(vertices, closed=True, edgecolor='orange', 
+    import matplotlib.pyplot as plt
+    trapezoid = plt.Polygon(shape.vertices, closed=True, edgecolor='orange', 
                             facecolor='moccasin', alpha=0.5)
 
     # Menambahkan patch ke axes
@@ -63,11 +92,4 @@ def draw_trapezoid(ax):
 
     print(f"Trapesium berhasil digambar dengan sisi bawah {bottom_width}, sisi atas {top_width}, tinggi {height}.")
 
-    return {
-        'type': 'trapezoid',
-        'vertices': vertices,
-        'bottom_width': bottom_width,
-        'top_width': top_width,
-        'height': height,
-        'start_point': (x_start, y_start)
-    }
+    return shape
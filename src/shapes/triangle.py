@@ -4,7 +4,26 @@ Modul untuk menggambar segitiga (triangle).
 Segitiga dapat digambar dengan menentukan tiga titik vertices.
 """
 
-import matplotlib.pyplot as plt
+from .shape_array import Shape
+
+
+def create_triangle(vertices):
+    """
+    Membuat segitiga dari tiga titik tanpa input pengguna dan tanpa menggambar.
+    
+    Parameters:
+    -----------
+    vertices : list of tuples
+        Tiga koordinat titik [(x1, y1), (x2, y2), (x3, y3)]
+        
+    Returns:
+    --------
+    Shape : Bentuk berisi tipe dan vertices segitiga
+    """
+    shape = Shape('triangle', vertices)
+    if len(shape.vertices) != 3:
+        raise ValueError("Segitiga harus memiliki tepat tiga titik.")
+    return shape
 
 
 def draw_triangle(ax):
@@ -18,7 +37,7 @@ def draw_triangle(ax):
         
     Returns:
     --------
-    dict : Dictionary berisi tipe dan vertices segitiga
+    Shape : Bentuk berisi tipe dan vertices segitiga
            atau None jika input tidak valid
            
     Example:
@@ -40,14 +59,15 @@ def draw_triangle(ax):
         return None
 
     # Vertices segitiga
-    vertices = [
+    shape = create_triangle([
         (x1, y1),  # Titik 1
         (x2, y2),  # Titik 2
         (x3, y3)   # Titik 3
-    ]
+    ])
 
     # Membuat polygon patch
-    triangle = plt.Polygon(vertices, closed=True, edgecolor='green', 
+    import matplotlib.pyplot as plt
+    triangle = plt.Polygon(shape.vertices, closed=True, edgecolor='green', 
                            facecolor='lightgreen', alpha=0.5)
 
     # Menambahkan patch ke axes
@@ -60,7 +80,4 @@ def draw_triangle(ax):
 
     print(f"Segitiga berhasil digambar dengan vertices: ({x1},{y1}), ({x2},{y2}), ({x3},{y3}).")
 
-    return {
-        'type': 'triangle',
-        'vertices': vertices
-    }
+    return shape
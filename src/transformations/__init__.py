@@ -5,8 +5,37 @@ Tersedia transformasi:
 - Scaling (Penskalaan)
 - Reflection (Pencerminan)
 - Rotation (Rotasi)
+- TransformPipeline (rantai transformasi affine yang dievaluasi malas)
+- TransformHistory (undo/redo berbasis matriks kumulatif)
+- ParallelTransformer (transformasi multi-proses lewat shared memory)
+- StreamingPipeline (transformasi file vertices per chunk, memori tetap)
+
+ParallelTransformer dan SharedVertexBuffer dimuat saat pertama kali
+diakses: modul parallel mengimpor multiprocessing dan shared_memory
+yang tidak dibutuhkan oleh pemakai transformations lainnya.
 """
 
 from .scaling import apply_scaling
 from .reflection import apply_reflection
 from .rotation import apply_rotation
+from .pipeline import TransformPipeline
+from .history import TransformHistory
+from .streaming import StreamingPipeline
+
+_LAZY_ATTRIBUTES = {
+    'ParallelTransformer': 'parallel',
+    'SharedVertexBuffer': 'parallel',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
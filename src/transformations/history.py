@@ -0,0 +1,159 @@
+"""
+Modul riwayat transformasi (undo/redo) berbasis matriks.
+
+Riwayat tidak menyimpan salinan vertices per langkah. Setiap langkah
+hanya berupa catatan kecil (nama, parameter, matriks homogen 3x3), dan
+matriks kumulatif setiap kedalaman disimpan di samping referensi ke
+geometri asal:
+
+    state_k = geometri_asal × (T_k · T_(k-1) · ... · T_1)
+
+Sehingga:
+- keadaan pada kedalaman mana pun dibangun ulang dengan satu perkalian
+  matriks terhadap geometri asal
+- 1000 langkah undo hanya memakan sekitar 1000 × 2 × 72 byte, bukan
+  1000 salinan vertices
+- rotasi berulang tidak menumpuk galat pembulatan pada vertices, karena
+  vertices selalu dihitung dari geometri asal (galat hanya ada pada
+  matriks 3x3 kumulatif)
+
+Bentuk pada posisi saat ini baru dibangun saat `current` diakses, sehingga
+menambah banyak langkah sekaligus tidak menyentuh vertices sama sekali.
+"""
+
+import numpy as np
+
+from shapes.shape_array import Shape
+
+
+class TransformHistory:
+    """
+    Riwayat undo/redo untuk satu bentuk.
+
+    Parameters:
+    -----------
+    base_shape : Shape atau dict
+        Geometri asal; disimpan sebagai referensi, tidak disalin
+
+    Example:
+    --------
+    >>> history = TransformHistory(create_square(2, 0, 0))
+    >>> history.push(to_homogeneous(get_rotation_matrix(45), (1, 1)), 'rotate', {'angle': 45})
+    >>> history.push(to_homogeneous(get_scaling_matrix(2, 2), (1, 1)), 'scale')
+    >>> history.undo()        # Kembali ke keadaan setelah rotasi
+    True
+    >>> history.current       # Bentuk dibangun dengan satu perkalian matriks
+    """
+
+    def __init__(self, base_shape):
+        self.base = Shape.from_dict(base_shape)
+        # Indeks 0 adalah keadaan asal (identitas)
+        self._records = [('original', {}, np.eye(3))]
+        self._cumulative = [np.eye(3)]
+        self._position = 0
+        self._current = None
+
+    def __len__(self):
+        """Jumlah langkah yang tersimpan (tidak termasuk keadaan asal)."""
+        return len(self._records) - 1
+
+    @property
+    def position(self):
+        """Kedalaman keadaan saat ini (0 = geometri asal)."""
+        return self._position
+
+    @property
+    def can_undo(self):
+        return self._position > 0
+
+    @property
+    def can_redo(self):
+        return self._position < len(self._records) - 1
+
+    @property
+    def matrix(self):
+        """Matriks kumulatif keadaan saat ini (3x3)."""
+        return self._cumulative[self._position]
+
+    @property
+    def steps(self):
+        """Daftar (nama, parameter) langkah yang aktif, dari yang paling awal."""
+        return [(name, params) for name, params, _ in self._records[1:self._position + 1]]
+
+    @property
+    def current(self):
+        """Bentuk pada keadaan saat ini (dibangun sekali per posisi)."""
+        if self._current is None:
+            # Keadaan asal memakai geometri asal langsung, tanpa salinan
+            if self._position == 0:
+                self._current = self.base
+            else:
+                self._current = self.base.transformed(self._cumulative[self._position])
+        return self._current
+
+    def centroid(self):
+        """
+        Centroid keadaan saat ini tanpa membangun vertices.
+
+        Centroid (rata-rata vertices atau pusat lingkaran) ikut
+        tertransformasi affine, sehingga cukup M × centroid asal.
+        """
+        x, y = self.base.centroid()
+        return tuple((self.matrix @ (x, y, 1.0))[:2].tolist())
+
+    def push(self, matrix, name='affine', params=None):
+        """
+        Menambahkan satu langkah transformasi.
+
+        Langkah yang sudah di-undo (cabang redo) dibuang.
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks affine homogen 3x3 langkah ini
+        name : str
+            Nama langkah (misalnya 'scale', 'rotate', 'reflect')
+        params : dict, optional
+            Parameter langkah, untuk ditampilkan
+        """
+        matrix = np.asarray(matrix, dtype=np.float64).reshape(3, 3)
+
+        del self._records[self._position + 1:]
+        del self._cumulative[self._position + 1:]
+
+        self._records.append((name, dict(params or {}), matrix))
+        self._cumulative.append(matrix @ self._cumulative[self._position])
+        self.goto(self._position + 1)
+
+    def undo(self):
+        """Mundur satu langkah. Mengembalikan False jika sudah di keadaan asal."""
+        if not self.can_undo:
+            return False
+        self.goto(self._position - 1)
+        return True
+
+    def redo(self):
+        """Maju satu langkah. Mengembalikan False jika tidak ada langkah untuk diulang."""
+        if not self.can_redo:
+            return False
+        self.goto(self._position + 1)
+        return True
+
+    def goto(self, position):
+        """
+        Pindah ke kedalaman tertentu.
+
+        Bentuknya dibangun ulang dengan satu perkalian matriks saat
+        `current` diakses berikutnya.
+
+        Parameters:
+        -----------
+        position : int
+            Kedalaman (0 = geometri asal, len(history) = langkah terakhir)
+        """
+        if not 0 <= position < len(self._records):
+            raise IndexError(f"Posisi riwayat {position} di luar rentang 0-{len(self)}.")
+
+        if position != self._position:
+            self._position = position
+            self._current = None
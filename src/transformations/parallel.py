@@ -0,0 +1,280 @@
+"""
+Modul transformasi paralel untuk dataset vertices yang sangat besar.
+
+Kernel NumPy (rotate_vertices_array, scale_vertices_array, ...) hanya
+memakai satu core. Untuk puluhan juta vertices, buffer (N, 2) ditempatkan
+di multiprocessing.shared_memory lalu dibagi menjadi potongan (chunk)
+yang dikerjakan ProcessPoolExecutor. Worker hanya menerima nama blok
+shared memory, rentang baris, dan matriks homogen 3x3 (beberapa ratus
+byte per tugas, bukan list vertices yang di-pickle), lalu menulis
+hasilnya langsung ke blok output:
+
+    out[a:b] = vertices[a:b] · L^T + t
+
+Data yang sudah berada di SharedVertexBuffer diproses tanpa salinan sama
+sekali. Array biasa disalin sekali ke shared memory dan sekali kembali.
+
+Ukuran chunk dapat diatur: chunk kecil membagi beban lebih rata antar
+worker, chunk besar mengurangi overhead per tugas. Dataset yang muat
+dalam satu chunk langsung dihitung di proses utama.
+
+Worker membuka blok shared memory hanya selama satu tugas lalu
+menutupnya lagi, sehingga blok yang sudah di-unlink proses utama tidak
+tetap ter-mapping di worker yang masih hidup.
+"""
+
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .pipeline import apply_affine, to_homogeneous
+from .scaling import get_scaling_matrix
+from .rotation import get_rotation_matrix
+from .reflection import get_reflection_matrix
+
+
+# Jumlah vertices per tugas worker (2^20 vertices float64 = 16 MB)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class SharedVertexBuffer:
+    """
+    Array vertices (N, 2) yang disimpan di shared memory.
+
+    Parameters:
+    -----------
+    count : int
+        Jumlah vertices
+    dtype : numpy dtype
+        float64 (default) atau float32
+    name : str, optional
+        Nama blok yang sudah ada; jika None, blok baru dibuat dan
+        dihapus (unlink) saat close()
+
+    Example:
+    --------
+    >>> with SharedVertexBuffer.from_array(vertices) as buffer:
+    ...     transformer.rotate(buffer, 30)      # In-place, tanpa salinan
+    ...     result = buffer.array.copy()
+    """
+
+    def __init__(self, count, dtype=np.float64, name=None):
+        self.dtype = np.dtype(dtype)
+        self.count = int(count)
+        self._owner = name is None
+        size = max(self.count * 2 * self.dtype.itemsize, 1)
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        self.array = np.ndarray((self.count, 2), self.dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def from_array(cls, vertices, dtype=None):
+        """Membuat buffer baru berisi salinan vertices (N, 2)."""
+        vertices = np.asarray(vertices).reshape(-1, 2)
+        buffer = cls(len(vertices), dtype or (vertices.dtype if vertices.dtype.kind == 'f'
+                                               else np.float64))
+        buffer.array[:] = vertices
+        return buffer
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"SharedVertexBuffer({self.count} vertices, {self.dtype}, name={self.name!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def name(self):
+        """Nama blok shared memory."""
+        return self._shm.name
+
+    @property
+    def spec(self):
+        """Deskripsi kecil yang dikirim ke worker: (nama, jumlah, dtype)."""
+        return (self.name, self.count, self.dtype.str)
+
+    def close(self):
+        """Melepas mapping; blok dihapus jika dibuat oleh objek ini."""
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+def _with_attached(task, specs, *args):
+    """
+    Menjalankan task(*arrays, *args) dengan blok shared memory yang dibuka sementara.
+
+    Setiap blok dibuka lagi per tugas (shm_open + mmap, murah dibanding
+    satu chunk) dan ditutup setelah task selesai. Nama yang sama dibuka
+    sekali: transformasi in-place memakai blok yang sama sebagai sumber
+    dan tujuan, dan hanya pada satu mapping NumPy dapat mendeteksi
+    tumpang tindih keduanya.
+    """
+    blocks = {}
+    try:
+        for name, _, _ in specs:
+            if name not in blocks:
+                blocks[name] = shared_memory.SharedMemory(name=name)
+        return task(*[np.ndarray((count, 2), np.dtype(dtype), buffer=blocks[name].buf)
+                      for name, count, dtype in specs], *args)
+    finally:
+        for shm in blocks.values():
+            try:
+                shm.close()
+            except BufferError:
+                # View masih dirujuk traceback pengecualian dari task;
+                # mapping dilepas saat view tersebut dibebaskan
+                pass
+
+
+def _transform_rows(source, target, start, stop, matrix):
+    out = target[start:stop]
+    np.matmul(source[start:stop], matrix[:2, :2].T.astype(out.dtype), out=out)
+    out += matrix[:2, 2].astype(out.dtype)
+    return stop - start
+
+
+def _sum_rows(source, start, stop):
+    return source[start:stop].sum(axis=0, dtype=np.float64)
+
+
+def _transform_chunk(start, stop, source, target, matrix):
+    """Tugas worker: target[start:stop] = source[start:stop] · L^T + t."""
+    return _with_attached(_transform_rows, (source, target), start, stop, matrix)
+
+
+def _sum_chunk(start, stop, source):
+    """Tugas worker: jumlah koordinat satu chunk (untuk centroid)."""
+    return _with_attached(_sum_rows, (source,), start, stop)
+
+
+class ParallelTransformer:
+    """
+    Menerapkan transformasi affine ke buffer vertices besar dengan banyak proses.
+
+    Input berupa SharedVertexBuffer diubah in-place (atau ditulis ke `out`),
+    sedangkan array biasa tidak pernah diubah dan hasilnya dikembalikan
+    sebagai numpy.ndarray baru.
+
+    Parameters:
+    -----------
+    workers : int, optional
+        Jumlah proses worker (default: os.cpu_count())
+    chunk_size : int
+        Jumlah vertices per tugas worker
+
+    Example:
+    --------
+    >>> with ParallelTransformer(workers=8) as transformer:
+    ...     rotated = transformer.rotate(vertices, 45, center=(0, 0))
+    ...     with SharedVertexBuffer.from_array(vertices) as buffer:
+    ...         transformer.scale(buffer, 2, 2)     # Tanpa salinan, in-place
+    """
+
+    def __init__(self, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus bernilai positif.")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = int(chunk_size)
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def executor(self):
+        """ProcessPoolExecutor, dibuat saat pertama kali dibutuhkan lalu dipakai ulang."""
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self):
+        """Menghentikan semua worker."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def chunks(self, count):
+        """Daftar rentang (start, stop) untuk `count` vertices."""
+        return [(start, min(start + self.chunk_size, count))
+                for start in range(0, count, self.chunk_size)]
+
+    def _run(self, task, *args, count):
+        futures = [self.executor.submit(task, start, stop, *args)
+                   for start, stop in self.chunks(count)]
+        return [future.result() for future in futures]
+
+    def apply(self, vertices, matrix, out=None):
+        """
+        Menerapkan matriks homogen 3x3 ke semua vertices.
+
+        Parameters:
+        -----------
+        vertices : SharedVertexBuffer atau array_like
+            Buffer shared memory (diproses in-place jika out None)
+            atau array (N, 2) biasa (tidak diubah)
+        matrix : array_like
+            Matriks homogen 3x3
+        out : SharedVertexBuffer, optional
+            Buffer tujuan dengan jumlah vertices yang sama
+
+        Returns:
+        --------
+        numpy.ndarray : Array (N, 2) hasil transformasi. Untuk input
+                        SharedVertexBuffer berupa view ke buffer tujuan.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64).reshape(3, 3)
+
+        if not isinstance(vertices, SharedVertexBuffer):
+            points = np.asarray(vertices, dtype=float).reshape(-1, 2)
+            if len(points) <= self.chunk_size:
+                return apply_affine(points, matrix)
+            with SharedVertexBuffer.from_array(points) as buffer:
+                return self.apply(buffer, matrix).copy()
+
+        target = vertices if out is None else out
+        if len(target) != len(vertices):
+            raise ValueError("Buffer output harus memiliki jumlah vertices yang sama.")
+
+        if len(vertices) <= self.chunk_size:
+            target.array[:] = apply_affine(vertices.array, matrix)
+        else:
+            self._run(_transform_chunk, vertices.spec, target.spec, matrix, count=len(vertices))
+        return target.array
+
+    def centroid(self, vertices):
+        """Rata-rata vertices, dijumlahkan per chunk oleh worker."""
+        if not isinstance(vertices, SharedVertexBuffer):
+            return np.asarray(vertices, dtype=float).reshape(-1, 2).mean(axis=0)
+        if len(vertices) <= self.chunk_size:
+            return vertices.array.mean(axis=0, dtype=np.float64)
+        return sum(self._run(_sum_chunk, vertices.spec, count=len(vertices))) / len(vertices)
+
+    def scale(self, vertices, sx, sy, center=None, out=None):
+        """Penskalaan; pusat default adalah centroid seperti scale_vertices_array."""
+        if center is None:
+            center = self.centroid(vertices)
+        return self.apply(vertices, to_homogeneous(get_scaling_matrix(sx, sy), center), out)
+
+    def rotate(self, vertices, angle_degrees, center=None, out=None):
+        """Rotasi; pusat default adalah centroid seperti rotate_vertices_array."""
+        if center is None:
+            center = self.centroid(vertices)
+        return self.apply(vertices, to_homogeneous(get_rotation_matrix(angle_degrees), center), out)
+
+    def reflect(self, vertices, axis='x', out=None):
+        """Pencerminan terhadap sumbu/garis melalui origin seperti reflect_vertices_array."""
+        return self.apply(vertices, to_homogeneous(get_reflection_matrix(axis)), out)
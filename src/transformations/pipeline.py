@@ -0,0 +1,213 @@
+"""
+Modul untuk pipeline transformasi affine yang dievaluasi secara malas (lazy).
+
+Setiap langkah (penskalaan, rotasi, pencerminan, translasi) disimpan
+sebagai matriks homogen 3x3 di sekitar titik pusatnya, lalu dikalikan
+menjadi satu matriks gabungan. Vertices baru disentuh satu kali saat
+benar-benar dibutuhkan (render atau ekspor).
+
+Koordinat homogen:
+    | x' |   | a  b  tx |   | x |
+    | y' | = | c  d  ty | × | y |
+    | 1  |   | 0  0  1  |   | 1 |
+"""
+
+import numpy as np
+
+from .scaling import get_scaling_matrix
+from .rotation import get_rotation_matrix
+from .reflection import get_reflection_matrix
+
+
+def get_translation_matrix(tx, ty):
+    """
+    Menghasilkan matriks translasi homogen 3x3.
+
+    Parameters:
+    -----------
+    tx : float
+        Pergeseran sumbu X
+    ty : float
+        Pergeseran sumbu Y
+
+    Returns:
+    --------
+    numpy.ndarray : Matriks translasi 3x3
+
+    Note:
+    -----
+    Matriks translasi:
+    | 1  0  tx |
+    | 0  1  ty |
+    | 0  0  1  |
+    """
+    return np.array([
+        [1.0, 0.0, tx],
+        [0.0, 1.0, ty],
+        [0.0, 0.0, 1.0]
+    ])
+
+
+def to_homogeneous(matrix, center=None):
+    """
+    Mengubah matriks linear 2x2 menjadi matriks homogen 3x3.
+
+    Parameters:
+    -----------
+    matrix : array_like
+        Matriks linear 2x2 (misalnya dari get_rotation_matrix)
+    center : tuple, optional
+        Titik pusat transformasi. Jika None, menggunakan origin
+
+    Returns:
+    --------
+    numpy.ndarray : Matriks homogen 3x3, setara dengan
+                    T(center) × M × T(-center)
+    """
+    linear = np.asarray(matrix, dtype=float)
+    homogeneous = np.eye(3)
+    homogeneous[:2, :2] = linear
+
+    if center is not None:
+        center = np.asarray(center, dtype=float)
+        homogeneous[:2, 2] = center - linear @ center
+
+    return homogeneous
+
+
+def apply_affine(vertices, matrix):
+    """
+    Menerapkan matriks homogen 3x3 pada array vertices.
+
+    Parameters:
+    -----------
+    vertices : array_like
+        Array koordinat vertices berbentuk (N, 2)
+    matrix : array_like
+        Matriks homogen 3x3
+
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (N, 2) hasil transformasi
+    """
+    points = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    matrix = np.asarray(matrix, dtype=float)
+
+    return points @ matrix[:2, :2].T + matrix[:2, 2]
+
+
+class TransformPipeline:
+    """
+    Rantai transformasi affine yang digabung menjadi satu matriks.
+
+    Parameters:
+    -----------
+    vertices : array_like
+        Vertices asli berbentuk (N, 2). Vertices ini tidak pernah diubah.
+
+    Example:
+    --------
+    >>> pipeline = TransformPipeline([(0, 0), (2, 0), (2, 2), (0, 2)])
+    >>> pipeline.scale(2, 2).rotate(45).reflect('x').translate(1, 0)
+    >>> vertices = pipeline.vertices  # Satu perkalian matriks
+    """
+
+    def __init__(self, vertices):
+        self._base = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        if len(self._base) > 0:
+            self._base_centroid = self._base.mean(axis=0)
+        else:
+            self._base_centroid = np.zeros(2)
+        self._matrix = np.eye(3)
+        self._steps = []
+        self._vertices = None
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __repr__(self):
+        steps = ', '.join(name for name, _ in self._steps)
+        return f"TransformPipeline({len(self._base)} vertices, [{steps}])"
+
+    @property
+    def base_vertices(self):
+        """Vertices asli sebelum transformasi (read-only)."""
+        view = self._base.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def matrix(self):
+        """Matriks homogen 3x3 gabungan dari semua langkah."""
+        return self._matrix.copy()
+
+    @property
+    def steps(self):
+        """Daftar langkah berupa tuple (nama, parameter)."""
+        return list(self._steps)
+
+    @property
+    def centroid(self):
+        """
+        Centroid vertices saat ini, dihitung tanpa menyentuh vertices.
+
+        Transformasi affine mempertahankan rata-rata titik, sehingga
+        centroid baru = M × centroid asli.
+        """
+        return tuple(apply_affine(self._base_centroid, self._matrix)[0].tolist())
+
+    @property
+    def vertices(self):
+        """Array vertices (N, 2) hasil seluruh rantai, dihitung sekali lalu di-cache."""
+        if self._vertices is None:
+            self._vertices = apply_affine(self._base, self._matrix)
+        return self._vertices
+
+    def to_list(self):
+        """Mengembalikan vertices hasil transformasi sebagai list of tuples."""
+        return [tuple(v) for v in self.vertices.tolist()]
+
+    def then(self, matrix, name='matrix', params=None):
+        """
+        Menambahkan matriks homogen 3x3 sembarang ke akhir rantai.
+
+        Parameters:
+        -----------
+        matrix : array_like
+            Matriks homogen 3x3
+        name : str
+            Nama langkah untuk keperluan inspeksi
+        params : dict, optional
+            Parameter langkah untuk keperluan inspeksi
+
+        Returns:
+        --------
+        TransformPipeline : Objek ini sendiri agar bisa dirangkai
+        """
+        self._matrix = np.asarray(matrix, dtype=float) @ self._matrix
+        self._steps.append((name, params or {}))
+        self._vertices = None
+        return self
+
+    def scale(self, sx, sy, center=None):
+        """Menambahkan penskalaan; pusat default adalah centroid saat ini."""
+        if center is None:
+            center = self.centroid
+        matrix = to_homogeneous(get_scaling_matrix(sx, sy), center)
+        return self.then(matrix, 'scale', {'sx': sx, 'sy': sy, 'center': center})
+
+    def rotate(self, angle_degrees, center=None):
+        """Menambahkan rotasi; pusat default adalah centroid saat ini."""
+        if center is None:
+            center = self.centroid
+        matrix = to_homogeneous(get_rotation_matrix(angle_degrees), center)
+        return self.then(matrix, 'rotate', {'angle_degrees': angle_degrees, 'center': center})
+
+    def reflect(self, axis='x', center=None):
+        """Menambahkan pencerminan; pusat default adalah origin seperti reflect_vertices."""
+        matrix = to_homogeneous(get_reflection_matrix(axis), center)
+        return self.then(matrix, 'reflect', {'axis': axis, 'center': center})
+
+    def translate(self, tx, ty):
+        """Menambahkan translasi sebesar (tx, ty)."""
+        return self.then(get_translation_matrix(tx, ty), 'translate', {'tx': tx, 'ty': ty})
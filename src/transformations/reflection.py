@@ -11,9 +11,48 @@ Jenis pencerminan:
 4. Terhadap garis y = x: x' = y, y' = x
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+from shapes.shape_array import Shape
+from utils.plotting import plot_shape_on_ax
+
+
+# Faktor pengali (x, y) untuk setiap sumbu pencerminan selain y = x
+REFLECTION_SIGNS = {
+    'x': (1.0, -1.0),
+    'y': (-1.0, 1.0),
+    'origin': (-1.0, -1.0),
+}
+
+
+def reflect_vertices_array(vertices, axis='x'):
+    """
+    Menerapkan pencerminan pada array vertices dalam satu operasi NumPy.
+    
+    Parameters:
+    -----------
+    vertices : array_like
+        Array koordinat vertices berbentuk (N, 2)
+    axis : str
+        Sumbu pencerminan: 'x', 'y', 'origin', atau 'y=x'
+        
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (N, 2) yang sudah dicerminkan
+    """
+    points = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    
+    if axis == 'y=x':
+        # Cermin terhadap garis y = x: tukar kolom x dan y
+        return points[:, ::-1].copy()
+    
+    signs = REFLECTION_SIGNS.get(axis)
+    if signs is None:
+        print(f"Sumbu '{axis}' tidak dikenali. Menggunakan sumbu X.")
+        signs = REFLECTION_SIGNS['x']
+    
+    return points * np.array(signs)
+
 
 def reflect_vertices(vertices, axis='x'):
     """
@@ -35,51 +74,20 @@ def reflect_vertices(vertices, axis='x'):
     >>> vertices = [(1, 1), (2, 1), (2, 2), (1, 2)]
     >>> reflected = reflect_vertices(vertices, 'x')
     >>> print(reflected)
-    [(1, -1), (2, -1), (2, -2), (1, -2)]
+    [(1.0, -1.0), (2.0, -1.0), (2.0, -2.0), (1.0, -2.0)]
     """
-    reflected_vertices = []
-    
-    for x, y in vertices:
-        if axis == 'x':
-            # Cermin terhadap sumbu X
-            x_new, y_new = x, -y
-        elif axis == 'y':
-            # Cermin terhadap sumbu Y
-            x_new, y_new = -x, y
-        elif axis == 'origin':
-            # Cermin terhadap origin
-            x_new, y_new = -x, -y
-        elif axis == 'y=x':
-            # Cermin terhadap garis y = x
-            x_new, y_new = y, x
-        else:
-            print(f"Sumbu '{axis}' tidak dikenali. Menggunakan sumbu X.")
-            x_new, y_new = x, -y
-            
-        reflected_vertices.append((x_new, y_new))
-    
-    return reflected_vertices
-
-
-def apply_reflection(ax, shape_data=None):
+    reflected = reflect_vertices_array(vertices, axis)
+    return [tuple(v) for v in reflected.tolist()]
+
+
+def read_reflection_axis():
     """
-    Meminta input jenis pencerminan dari pengguna dan menerapkannya.
+    Meminta input jenis pencerminan dari pengguna.
     
-    Parameters:
-    -----------
-    ax : Axes
-        Objek axes Matplotlib
-    shape_data : dict, optional
-        Data bentuk yang akan dicerminkan
-        
     Returns:
     --------
-    dict : Data bentuk yang sudah dicerminkan, atau None jika gagal
+    str : Sumbu pencerminan ('x', 'y', 'origin', 'y=x'), atau None jika gagal
     """
-    if shape_data is None:
-        print("Tidak ada bentuk yang dipilih untuk pencerminan.")
-        return None
-    
     print("\nPilih jenis pencerminan:")
     print("1. Terhadap sumbu X")
     print("2. Terhadap sumbu Y")
@@ -99,30 +107,50 @@ def apply_reflection(ax, shape_data=None):
         '4': 'y=x'
     }
     
-    axis = axis_map.get(choice, 'x')
+    return axis_map.get(choice, 'x')
+
+
+def apply_reflection(ax, shape_data=None, redraw=True):
+    """
+    Meminta input jenis pencerminan dari pengguna dan menerapkannya.
+    
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    shape_data : dict, optional
+        Data bentuk yang akan dicerminkan
+    redraw : bool
+        Jika False, axes tidak diubah; pemanggil yang merender hasilnya
+        (misalnya lewat ShapeRenderer)
+        
+    Returns:
+    --------
+    Shape : Data bentuk yang sudah dicerminkan, atau None jika gagal
+    """
+    # Import lokal: pipeline.py mengimpor modul ini (circular import)
+    from .pipeline import to_homogeneous
+    
+    if shape_data is None:
+        print("Tidak ada bentuk yang dipilih untuk pencerminan.")
+        return None
+    
+    axis = read_reflection_axis()
+    if axis is None:
+        return None
     
-    vertices = shape_data.get('vertices', [])
-    if len(vertices) == 0:
+    shape = Shape.from_dict(shape_data)
+    if len(shape.vertices) == 0:
         print("Bentuk tidak memiliki vertices.")
         return None
     
-    # Terapkan pencerminan
-    reflected_vertices = reflect_vertices(vertices, axis)
+    # Terapkan pencerminan sebagai matriks homogen terhadap origin
+    matrix = to_homogeneous(get_reflection_matrix(axis))
+    new_shape_data = shape.transformed(matrix)
     
     # Bersihkan axes dan gambar ulang
-    for p in ax.patches:
-        p.remove()
-    for txt in ax.texts:
-        txt.remove()
-    
-    # Gambar bentuk yang sudah dicerminkan
-    polygon = plt.Polygon(reflected_vertices, closed=True, edgecolor='blue', 
-                          facecolor='lightblue', alpha=0.5)
-    ax.add_patch(polygon)
-    
-    # Update shape_data
-    new_shape_data = shape_data.copy()
-    new_shape_data['vertices'] = reflected_vertices
+    if redraw:
+        plot_shape_on_ax(ax, new_shape_data, clear_previous=True)
     
     print(f"Pencerminan berhasil diterapkan terhadap sumbu {axis}.")
     
@@ -11,9 +11,47 @@ dimana θ adalah sudut rotasi dalam radian.
 Sudut positif = rotasi berlawanan arah jarum jam (counter-clockwise).
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+from shapes.shape_array import Shape
+from utils.plotting import plot_shape_on_ax
+
+
+def rotate_vertices_array(vertices, angle_degrees, center=None):
+    """
+    Menerapkan rotasi pada array vertices dalam satu operasi NumPy.
+    
+    Parameters:
+    -----------
+    vertices : array_like
+        Array koordinat vertices berbentuk (N, 2)
+    angle_degrees : float
+        Sudut rotasi dalam derajat (positif = counter-clockwise)
+    center : tuple, optional
+        Titik pusat rotasi. Jika None, menggunakan centroid
+        
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (N, 2) yang sudah dirotasi
+    
+    Note:
+    -----
+    R * (p - c) + c disederhanakan menjadi p * R^T + (c - c * R^T),
+    sehingga seluruh vertices diproses dengan satu perkalian matriks.
+    """
+    points = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        return points.copy()
+    
+    if center is None:
+        # Hitung centroid sebagai pusat default
+        center = points.mean(axis=0)
+    
+    center = np.asarray(center, dtype=float)
+    rotation_t = get_rotation_matrix(angle_degrees).T
+    
+    return points @ rotation_t + (center - center @ rotation_t)
+
 
 def rotate_vertices(vertices, angle_degrees, center=None):
     """
@@ -38,40 +76,26 @@ def rotate_vertices(vertices, angle_degrees, center=None):
     >>> rotated = rotate_vertices(vertices, 90)
     >>> # Hasil: rotasi 90 derajat counter-clockwise
     """
-    # Konversi ke radian
-    angle_rad = np.radians(angle_degrees)
-    
-    if center is None:
-        # Hitung centroid sebagai pusat default
-        cx = sum(v[0] for v in vertices) / len(vertices)
-        cy = sum(v[1] for v in vertices) / len(vertices)
-        center = (cx, cy)
-    
-    cx, cy = center
-    cos_a = np.cos(angle_rad)
-    sin_a = np.sin(angle_rad)
-    
-    rotated_vertices = []
-    
-    for x, y in vertices:
-        # Translasi ke origin (pusat rotasi)
-        x_translated = x - cx
-        y_translated = y - cy
-        
-        # Terapkan rotasi
-        x_rotated = x_translated * cos_a - y_translated * sin_a
-        y_rotated = x_translated * sin_a + y_translated * cos_a
-        
-        # Translasi kembali
-        x_new = x_rotated + cx
-        y_new = y_rotated + cy
-        
-        rotated_vertices.append((x_new, y_new))
+    rotated = rotate_vertices_array(vertices, angle_degrees, center)
+    return [tuple(v) for v in rotated.tolist()]
+
+
+def read_rotation_angle():
+    """
+    Meminta input sudut rotasi dari pengguna.
     
-    return rotated_vertices
+    Returns:
+    --------
+    float : Sudut dalam derajat, atau None jika input tidak valid
+    """
+    try:
+        return float(input("Masukkan sudut rotasi (dalam derajat, positif = CCW): "))
+    except ValueError:
+        print("Input tidak valid. Harap masukkan angka.")
+        return None
 
 
-def apply_rotation(ax, shape_data=None):
+def apply_rotation(ax, shape_data=None, redraw=True):
     """
     Meminta input sudut rotasi dari pengguna dan menerapkan rotasi.
     
@@ -81,43 +105,37 @@ def apply_rotation(ax, shape_data=None):
         Objek axes Matplotlib
     shape_data : dict, optional
         Data bentuk yang akan dirotasi
+    redraw : bool
+        Jika False, axes tidak diubah; pemanggil yang merender hasilnya
+        (misalnya lewat ShapeRenderer)
         
     Returns:
     --------
-    dict : Data bentuk yang sudah dirotasi, atau None jika gagal
+    Shape : Data bentuk yang sudah dirotasi, atau None jika gagal
     """
+    # Import lokal: pipeline.py mengimpor modul ini (circular import)
+    from .pipeline import to_homogeneous
+    
     if shape_data is None:
         print("Tidak ada bentuk yang dipilih untuk rotasi.")
         return None
     
-    try:
-        angle = float(input("Masukkan sudut rotasi (dalam derajat, positif = CCW): "))
-    except ValueError:
-        print("Input tidak valid. Harap masukkan angka.")
+    angle = read_rotation_angle()
+    if angle is None:
         return None
     
-    vertices = shape_data.get('vertices', [])
-    if len(vertices) == 0:
+    shape = Shape.from_dict(shape_data)
+    if len(shape.vertices) == 0:
         print("Bentuk tidak memiliki vertices.")
         return None
     
-    # Terapkan rotasi
-    rotated_vertices = rotate_vertices(vertices, angle)
+    # Terapkan rotasi sebagai matriks homogen di sekitar centroid
+    matrix = to_homogeneous(get_rotation_matrix(angle), shape.centroid())
+    new_shape_data = shape.transformed(matrix)
     
     # Bersihkan axes dan gambar ulang
-    for p in ax.patches:
-        p.remove()
-    for txt in ax.texts:
-        txt.remove()
-    
-    # Gambar bentuk yang sudah dirotasi
-    polygon = plt.Polygon(rotated_vertices, closed=True, edgecolor='blue', 
-                          facecolor='lightblue', alpha=0.5)
-    ax.add_patch(polygon)
-    
-    # Update shape_data
-    new_shape_data = shape_data.copy()
-    new_shape_data['vertices'] = rotated_vertices
+    if redraw:
+        plot_shape_on_ax(ax, new_shape_data, clear_previous=True)
     
     print(f"Rotasi berhasil diterapkan dengan sudut {angle} derajat.")
     
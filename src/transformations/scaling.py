@@ -11,9 +11,49 @@ Rumus penskalaan:
 dimana sx dan sy adalah faktor skala untuk sumbu X dan Y.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+from shapes.shape_array import Shape
+from utils.plotting import plot_shape_on_ax
+
+
+def scale_vertices_array(vertices, sx, sy, center=None):
+    """
+    Menerapkan penskalaan pada array vertices dalam satu operasi NumPy.
+    
+    Parameters:
+    -----------
+    vertices : array_like
+        Array koordinat vertices berbentuk (N, 2)
+    sx : float
+        Faktor skala sumbu X
+    sy : float
+        Faktor skala sumbu Y
+    center : tuple, optional
+        Titik pusat penskalaan. Jika None, menggunakan centroid
+        
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (N, 2) yang sudah diskalakan
+    
+    Note:
+    -----
+    (x - cx) * sx + cx disederhanakan menjadi x * sx + (cx - cx * sx),
+    sehingga offset hanya dihitung sekali untuk seluruh vertices.
+    """
+    points = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        return points.copy()
+    
+    if center is None:
+        # Hitung centroid sebagai pusat default
+        center = points.mean(axis=0)
+    
+    center = np.asarray(center, dtype=float)
+    factors = np.array([sx, sy], dtype=float)
+    
+    return points * factors + (center - center * factors)
+
 
 def scale_vertices(vertices, sx, sy, center=None):
     """
@@ -28,7 +68,7 @@ def scale_vertices(vertices, sx, sy, center=None):
     sy : float
         Faktor skala sumbu Y
     center : tuple, optional
-        Titik pusat penskalaan. Jika None, menggunakan (0, 0)
+        Titik pusat penskalaan. Jika None, menggunakan centroid
         
     Returns:
     --------
@@ -37,38 +77,32 @@ def scale_vertices(vertices, sx, sy, center=None):
     Example:
     --------
     >>> vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
-    >>> scaled = scale_vertices(vertices, 2, 2)
+    >>> scaled = scale_vertices(vertices, 2, 2, center=(0, 0))
     >>> print(scaled)
-    [(0, 0), (2, 0), (2, 2), (0, 2)]
+    [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
     """
-    if center is None:
-        # Hitung centroid sebagai pusat default
-        cx = sum(v[0] for v in vertices) / len(vertices)
-        cy = sum(v[1] for v in vertices) / len(vertices)
-        center = (cx, cy)
-    
-    cx, cy = center
-    scaled_vertices = []
-    
-    for x, y in vertices:
-        # Translasi ke origin
-        x_translated = x - cx
-        y_translated = y - cy
-        
-        # Terapkan penskalaan
-        x_scaled = x_translated * sx
-        y_scaled = y_translated * sy
-        
-        # Translasi kembali
-        x_new = x_scaled + cx
-        y_new = y_scaled + cy
-        
-        scaled_vertices.append((x_new, y_new))
+    scaled = scale_vertices_array(vertices, sx, sy, center)
+    return [tuple(v) for v in scaled.tolist()]
+
+
+def read_scaling_factors():
+    """
+    Meminta input faktor skala dari pengguna.
     
-    return scaled_vertices
+    Returns:
+    --------
+    tuple : (sx, sy), atau None jika input tidak valid
+    """
+    try:
+        sx = float(input("Masukkan faktor skala X: "))
+        sy = float(input("Masukkan faktor skala Y: "))
+    except ValueError:
+        print("Input tidak valid. Harap masukkan angka.")
+        return None
+    return sx, sy
 
 
-def apply_scaling(ax, shape_data=None):
+def apply_scaling(ax, shape_data=None, redraw=True):
     """
     Meminta input faktor skala dari pengguna dan menerapkan penskalaan.
     
@@ -78,44 +112,39 @@ def apply_scaling(ax, shape_data=None):
         Objek axes Matplotlib
     shape_data : dict, optional
         Data bentuk yang akan diskalakan
+    redraw : bool
+        Jika False, axes tidak diubah; pemanggil yang merender hasilnya
+        (misalnya lewat ShapeRenderer)
         
     Returns:
     --------
-    dict : Data bentuk yang sudah diskalakan, atau None jika gagal
+    Shape : Data bentuk yang sudah diskalakan, atau None jika gagal
     """
+    # Import lokal: pipeline.py mengimpor modul ini (circular import)
+    from .pipeline import to_homogeneous
+    
     if shape_data is None:
         print("Tidak ada bentuk yang dipilih untuk penskalaan.")
         return None
     
-    try:
-        sx = float(input("Masukkan faktor skala X: "))
-        sy = float(input("Masukkan faktor skala Y: "))
-    except ValueError:
-        print("Input tidak valid. Harap masukkan angka.")
+    factors = read_scaling_factors()
+    if factors is None:
         return None
+    sx, sy = factors
     
-    vertices = shape_data.get('vertices', [])
-    if len(vertices) == 0:
+    shape = Shape.from_dict(shape_data)
+    if len(shape.vertices) == 0:
         print("Bentuk tidak memiliki vertices.")
         return None
     
-    # Terapkan penskalaan
-    scaled_vertices = scale_vertices(vertices, sx, sy)
+    # Terapkan penskalaan sebagai matriks homogen di sekitar centroid.
+    # Lingkaran tetap analitik (menjadi elips jika sx != sy).
+    matrix = to_homogeneous(get_scaling_matrix(sx, sy), shape.centroid())
+    new_shape_data = shape.transformed(matrix)
     
     # Bersihkan axes dan gambar ulang
-    for p in ax.patches:
-        p.remove()
-    for txt in ax.texts:
-        txt.remove()
-    
-    # Gambar bentuk yang sudah diskalakan
-    polygon = plt.Polygon(scaled_vertices, closed=True, edgecolor='blue', 
-                          facecolor='lightblue', alpha=0.5)
-    ax.add_patch(polygon)
-    
-    # Update shape_data
-    new_shape_data = shape_data.copy()
-    new_shape_data['vertices'] = scaled_vertices
+    if redraw:
+        plot_shape_on_ax(ax, new_shape_data, clear_previous=True)
     
     print(f"Penskalaan berhasil diterapkan dengan faktor ({sx}, {sy}).")
     
@@ -0,0 +1,271 @@
+"""
+Modul pipeline transformasi streaming untuk vertices yang lebih besar dari RAM.
+
+Vertices dibaca per chunk berukuran tetap (generator), ditransformasi
+dengan satu matriks gabungan, lalu langsung ditulis ke output. Memori
+yang dipakai hanya sebanding dengan ukuran chunk, berapa pun ukuran file.
+
+Format yang didukung (ditentukan dari ekstensi file):
+- .csv  : satu vertex per baris "x,y"; baris header boleh ada
+- lainnya : biner mentah float64 (atau float32) little-endian x0 y0 x1 y1 ...
+
+Penskalaan dan rotasi tanpa pusat memakai centroid seperti
+scale_vertices_array/rotate_vertices_array. Centroid dihitung dengan satu
+pass awal yang hanya menjumlahkan koordinat. Karena transformasi affine
+mempertahankan rata-rata titik, satu pass cukup untuk seluruh rantai:
+centroid sebelum langkah ke-k = M_(k-1) × centroid asal.
+"""
+
+import itertools
+import os
+
+import numpy as np
+
+from .pipeline import apply_affine, get_translation_matrix, to_homogeneous
+from .scaling import get_scaling_matrix
+from .rotation import get_rotation_matrix
+from .reflection import get_reflection_matrix
+
+
+# Jumlah vertices per chunk (2^18 vertices float64 = 4 MB)
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+def vertex_format(path):
+    """Format file dari ekstensinya: 'csv' atau 'binary'."""
+    return 'csv' if path.lower().endswith('.csv') else 'binary'
+
+
+def _is_header(line):
+    try:
+        float(line.split(',')[0])
+        return False
+    except ValueError:
+        return True
+
+
+def read_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Membaca file CSV "x,y" per chunk.
+
+    Yields:
+    -------
+    numpy.ndarray : Array float64 (k, 2), k <= chunk_size
+    """
+    with open(path, encoding='utf-8') as f:
+        first = f.readline()
+        lines = iter(f) if not first or _is_header(first) else itertools.chain([first], f)
+        while True:
+            rows = [line for line in itertools.islice(lines, chunk_size) if line.strip()]
+            if not rows:
+                return
+            yield np.loadtxt(rows, delimiter=',', ndmin=2, usecols=(0, 1))
+
+
+def read_binary_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+    """
+    Membaca file biner mentah (x, y berurutan) per chunk.
+
+    Yields:
+    -------
+    numpy.ndarray : Array float64 (k, 2), k <= chunk_size
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    with open(path, 'rb') as f:
+        while True:
+            values = np.fromfile(f, dtype=dtype, count=2 * chunk_size)
+            if len(values) == 0:
+                return
+            if len(values) % 2:
+                raise ValueError(f"File {path} berisi jumlah koordinat ganjil.")
+            yield values.astype(np.float64).reshape(-1, 2)
+
+
+def read_vertex_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+    """Membaca file vertices per chunk sesuai formatnya (lihat vertex_format)."""
+    if vertex_format(path) == 'csv':
+        return read_csv_chunks(path, chunk_size)
+    return read_binary_chunks(path, chunk_size, dtype)
+
+
+def write_vertex_chunks(chunks, path, dtype=np.float64):
+    """
+    Menulis chunk vertices ke file satu per satu.
+
+    Parameters:
+    -----------
+    chunks : iterable of numpy.ndarray
+        Chunk vertices (k, 2)
+    path : str
+        File output; format mengikuti ekstensi (lihat vertex_format)
+    dtype : numpy dtype
+        Tipe float untuk output biner
+
+    Returns:
+    --------
+    int : Jumlah vertices yang ditulis
+    """
+    count = 0
+    if vertex_format(path) == 'csv':
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('x,y\n')
+            for chunk in chunks:
+                np.savetxt(f, chunk, fmt='%.17g', delimiter=',')
+                count += len(chunk)
+    else:
+        dtype = np.dtype(dtype).newbyteorder('<')
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                np.ascontiguousarray(chunk, dtype=dtype).tofile(f)
+                count += len(chunk)
+    return count
+
+
+def stream_centroid(chunks):
+    """
+    Centroid (rata-rata vertices) dari chunk, tanpa menyimpan vertices.
+
+    Returns:
+    --------
+    tuple : (x, y), atau (0.0, 0.0) jika tidak ada vertices
+    """
+    total = np.zeros(2)
+    count = 0
+    for chunk in chunks:
+        total += chunk.sum(axis=0)
+        count += len(chunk)
+    if count == 0:
+        return (0.0, 0.0)
+    return tuple((total / count).tolist())
+
+
+def transform_chunks(chunks, matrix):
+    """Menerapkan matriks homogen 3x3 ke setiap chunk (generator)."""
+    for chunk in chunks:
+        yield apply_affine(chunk, matrix)
+
+
+class StreamingPipeline:
+    """
+    Rantai transformasi yang diterapkan ke file vertices per chunk.
+
+    Parameters:
+    -----------
+    path : str
+        File vertices input (.csv atau biner mentah)
+    chunk_size : int
+        Jumlah vertices per chunk
+    dtype : numpy dtype
+        Tipe float file input biner
+
+    Example:
+    --------
+    >>> pipeline = StreamingPipeline('titik.bin', chunk_size=1 << 20)
+    >>> pipeline.scale(2, 2).rotate(45).reflect('x')
+    >>> pipeline.run('hasil.csv')      # Pass centroid + pass transformasi
+    """
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus bernilai positif.")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File {path} tidak ditemukan.")
+        self.path = path
+        self.chunk_size = int(chunk_size)
+        self.dtype = dtype
+        self._steps = []
+        self._centroid = None
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __repr__(self):
+        steps = ', '.join(name for name, _ in self._steps)
+        return f"StreamingPipeline({self.path!r}, [{steps}])"
+
+    @property
+    def steps(self):
+        """Daftar langkah berupa tuple (nama, parameter)."""
+        return list(self._steps)
+
+    def read_chunks(self):
+        """Generator chunk vertices input (tanpa transformasi)."""
+        return read_vertex_chunks(self.path, self.chunk_size, self.dtype)
+
+    def centroid(self):
+        """Centroid vertices input; dihitung sekali dengan satu pass baca."""
+        if self._centroid is None:
+            self._centroid = stream_centroid(self.read_chunks())
+        return self._centroid
+
+    @property
+    def needs_centroid(self):
+        """True jika ada langkah yang memakai centroid sebagai pusat."""
+        return any(name in ('scale', 'rotate') and params.get('center') is None
+                   for name, params in self._steps)
+
+    def scale(self, sx, sy, center=None):
+        """Menambahkan penskalaan; pusat default adalah centroid saat ini."""
+        self._steps.append(('scale', {'sx': sx, 'sy': sy, 'center': center}))
+        return self
+
+    def rotate(self, angle, center=None):
+        """Menambahkan rotasi; pusat default adalah centroid saat ini."""
+        self._steps.append(('rotate', {'angle': angle, 'center': center}))
+        return self
+
+    def reflect(self, axis='x'):
+        """Menambahkan pencerminan terhadap sumbu/garis melalui origin."""
+        self._steps.append(('reflect', {'axis': axis}))
+        return self
+
+    def translate(self, tx, ty):
+        """Menambahkan translasi sebesar (tx, ty)."""
+        self._steps.append(('translate', {'tx': tx, 'ty': ty}))
+        return self
+
+    def matrix(self):
+        """
+        Matriks homogen 3x3 gabungan seluruh rantai.
+
+        Pass centroid hanya dijalankan jika ada langkah yang membutuhkannya.
+        """
+        base = np.append(self.centroid(), 1.0) if self.needs_centroid else None
+        matrix = np.eye(3)
+        for name, params in self._steps:
+            center = params.get('center')
+            if center is None and base is not None:
+                center = (matrix @ base)[:2]
+            if name == 'scale':
+                step = to_homogeneous(get_scaling_matrix(params['sx'], params['sy']), center)
+            elif name == 'rotate':
+                step = to_homogeneous(get_rotation_matrix(params['angle']), center)
+            elif name == 'reflect':
+                step = to_homogeneous(get_reflection_matrix(params['axis']))
+            else:
+                step = get_translation_matrix(params['tx'], params['ty'])
+            matrix = step @ matrix
+        return matrix
+
+    def chunks(self):
+        """Generator chunk vertices hasil transformasi."""
+        return transform_chunks(self.read_chunks(), self.matrix())
+
+    def run(self, output_path, dtype=np.float64):
+        """
+        Menjalankan pipeline dan menulis hasilnya per chunk.
+
+        Parameters:
+        -----------
+        output_path : str
+            File output (.csv atau biner mentah); tidak boleh sama dengan input
+        dtype : numpy dtype
+            Tipe float untuk output biner
+
+        Returns:
+        --------
+        int : Jumlah vertices yang ditulis
+        """
+        if os.path.abspath(output_path) == os.path.abspath(self.path):
+            raise ValueError("File output harus berbeda dari file input.")
+        return write_vertex_chunks(self.chunks(), output_path, dtype)
@@ -0,0 +1,333 @@
+"""
+Modul animasi transisi transformasi dengan frame yang dihitung di muka.
+
+Parameter transformasi (faktor skala, sudut rotasi, matriks pencerminan)
+diinterpolasi dari identitas ke nilai akhirnya menjadi tumpukan matriks
+homogen (F, 3, 3). Semua frame untuk seluruh vertices kemudian dihitung
+dalam satu operasi NumPy:
+
+    frames[f, v] = L_f · vertices[v] + t_f        (einsum, hasil (F, V, 2))
+
+Saat diputar, setiap kelompok polygon (jumlah vertices sama) digambar
+oleh satu PathCollection. Path Matplotlib dibuat sekali sebagai view ke
+buffer (n, k + 1, 2); setiap frame hanya menyalin frames[f] ke buffer
+tersebut dengan satu fancy indexing, tanpa membuat objek Python per bentuk.
+
+Pemutaran interaktif memakai FuncAnimation dengan blitting. Frame dipilih
+berdasarkan waktu yang telah berlalu, sehingga jika rasterisasi satu frame
+lebih lambat dari 1/fps, frame dilewati dan durasi animasi tetap. Ekspor
+tanpa GUI menggambar latar sekali lalu menyimpan frame sebagai GIF
+(Pillow) atau urutan PNG.
+
+Matplotlib baru dimuat saat TransformAnimation dibuat, sehingga
+interpolasi matriks dan konstanta modul ini dapat diimpor tanpa GUI.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from shapes.shape_array import SHAPE_TYPES, ShapeArray
+from transformations.scaling import get_scaling_matrix
+from transformations.reflection import get_reflection_matrix
+
+from .plotting import shape_style
+
+
+# Jumlah frame dan kecepatan default animasi transisi
+DEFAULT_FRAMES = 30
+DEFAULT_FPS = 60
+
+# Fungsi easing: memetakan waktu 0..1 ke kemajuan 0..1
+EASINGS = {
+    'linear': lambda t: t,
+    'smooth': lambda t: t * t * (3 - 2 * t),
+}
+
+
+def interpolated_matrices(op, params, center=None, frames=DEFAULT_FRAMES, easing='smooth'):
+    """
+    Tumpukan matriks homogen dari identitas sampai transformasi penuh.
+
+    - scale   : faktor (1, 1) -> (sx, sy)
+    - rotate  : sudut 0 -> angle
+    - reflect : interpolasi linear I -> R (bentuk "terlipat" melewati sumbu)
+
+    Parameters:
+    -----------
+    op : str
+        'scale', 'rotate', atau 'reflect'
+    params : dict
+        {'sx', 'sy'}, {'angle'}, atau {'axis'}
+    center : tuple, optional
+        Titik pusat transformasi; None berarti origin
+    frames : int
+        Jumlah frame (frame pertama = keadaan awal, terakhir = keadaan akhir)
+    easing : str
+        Nama fungsi di EASINGS
+
+    Returns:
+    --------
+    numpy.ndarray : Array (frames, 3, 3)
+    """
+    if frames < 2:
+        raise ValueError("Animasi membutuhkan minimal 2 frame.")
+    t = EASINGS[easing](np.linspace(0.0, 1.0, frames))[:, None, None]
+
+    identity = np.eye(2)
+    if op == 'scale':
+        target = get_scaling_matrix(params['sx'], params['sy'])
+        linear = identity + t * (target - identity)
+    elif op == 'rotate':
+        angles = np.radians(params['angle']) * t[:, 0, 0]
+        cos, sin = np.cos(angles), np.sin(angles)
+        linear = np.stack((np.stack((cos, -sin), -1), np.stack((sin, cos), -1)), -2)
+    elif op == 'reflect':
+        target = get_reflection_matrix(params.get('axis', 'x'))
+        linear = identity + t * (target - identity)
+    else:
+        raise ValueError(f"Operasi '{op}' tidak dapat dianimasikan.")
+
+    matrices = np.zeros((frames, 3, 3))
+    matrices[:, :2, :2] = linear
+    matrices[:, 2, 2] = 1.0
+    if center is not None:
+        # T(c) · L · T(-c): translasi = c - L·c
+        center = np.asarray(center, dtype=float)
+        matrices[:, :2, 2] = center - linear @ center
+    return matrices
+
+
+def transform_frames(vertices, matrices, dtype=np.float64):
+    """
+    Menghitung semua frame untuk semua vertices dalam satu operasi.
+
+    Parameters:
+    -----------
+    vertices : array_like
+        Vertices (V, 2), misalnya ShapeArray.vertices
+    matrices : array_like
+        Matriks homogen (F, 3, 3)
+    dtype : numpy dtype
+        Tipe hasil; float32 menghemat separuh memori untuk scene besar
+
+    Returns:
+    --------
+    numpy.ndarray : Array (F, V, 2)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    matrices = np.asarray(matrices, dtype=np.float64)
+    frames = np.einsum('fij,vj->fvi', matrices[:, :2, :2], vertices)
+    frames += matrices[:, None, :2, 2]
+    return frames.astype(dtype, copy=False)
+
+
+class TransformAnimation:
+    """
+    Animasi sekumpulan bentuk mengikuti tumpukan matriks transformasi.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    shapes : ShapeArray atau iterable of Shape
+        Bentuk pada keadaan awal (lingkaran memakai keliling default)
+    matrices : array_like
+        Matriks homogen (F, 3, 3), misalnya dari interpolated_matrices
+    linewidth : float
+        Tebal tepi. Pada Agg, menggambar tepi memakan sekitar separuh waktu
+        rasterisasi; 0 mempercepat scene dengan ribuan bentuk
+
+    Example:
+    --------
+    >>> matrices = interpolated_matrices('rotate', {'angle': 90}, center=(0, 0))
+    >>> animation = TransformAnimation(ax, shapes, matrices)
+    >>> animation.play(fps=60)              # Jendela interaktif
+    >>> animation.save('rotasi.gif')        # Tanpa GUI
+    """
+
+    def __init__(self, ax, shapes, matrices, linewidth=1.0):
+        if not isinstance(shapes, ShapeArray):
+            shapes = ShapeArray.from_shapes(shapes)
+
+        self.ax = ax
+        self.shapes = shapes
+        self.linewidth = linewidth
+        self.frames = transform_frames(shapes.vertices, matrices)
+        self.collections = []
+        self._groups = []
+        self._index = 0
+
+        counts = shapes.vertex_counts
+        for vertex_count in np.unique(counts[counts > 0]):
+            indices = np.flatnonzero(counts == vertex_count)
+            self._add_group(indices, int(vertex_count))
+
+        self.draw_frame(0)
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def finished(self):
+        """True setelah frame terakhir digambar."""
+        return self._index == len(self) - 1
+
+    def _add_group(self, indices, vertex_count):
+        from matplotlib.collections import PathCollection
+        from matplotlib.colors import to_rgba
+        from matplotlib.path import Path
+
+        # Buffer polygon tertutup (n, k + 1, 2); setiap Path adalah view ke satu barisnya
+        rows = self.shapes.offsets[indices][:, None] + np.arange(vertex_count)
+        buffer = np.zeros((len(indices), vertex_count + 1, 2))
+        template = Path(buffer[0], closed=True)
+        paths = [Path(polygon, template.codes) for polygon in buffer]
+
+        facecolors, edgecolors = [], []
+        for code in self.shapes.type_codes[indices].tolist():
+            style = shape_style(SHAPE_TYPES[code])
+            facecolors.append(to_rgba(style['facecolor'], style['alpha']))
+            edgecolors.append(to_rgba(style['edgecolor'], style['alpha']))
+
+        collection = PathCollection(paths, animated=True, facecolors=facecolors,
+                                    edgecolors=edgecolors, linewidths=self.linewidth,
+                                    transform=self.ax.transData)
+        self.ax.add_collection(collection, autolim=False)
+
+        self.collections.append(collection)
+        self._groups.append((rows, buffer))
+
+    def draw_frame(self, index):
+        """
+        Memperbarui collection ke frame tertentu.
+
+        Returns:
+        --------
+        list : Collection yang berubah (untuk blitting)
+        """
+        self._index = index
+        frame = self.frames[index]
+        for collection, (rows, buffer) in zip(self.collections, self._groups):
+            np.take(frame, rows, axis=0, out=buffer[:, :-1])
+            buffer[:, -1] = buffer[:, 0]
+            collection.stale = True
+        return self.collections
+
+    def play(self, fps=DEFAULT_FPS, static_artists=()):
+        """
+        Memutar animasi dengan FuncAnimation dan blitting.
+
+        Parameters:
+        -----------
+        fps : float
+            Frame per detik
+        static_artists : sequence of Artist
+            Artist animated=True lain yang harus tetap terlihat selama
+            animasi (misalnya bentuk yang tidak ikut bergerak pada ShapeRenderer)
+
+        Returns:
+        --------
+        FuncAnimation : Objek animasi; simpan referensinya selama diputar
+        """
+        from matplotlib.animation import FuncAnimation
+
+        static_artists = list(static_artists)
+        last = len(self) - 1
+
+        def frame_indices():
+            # Indeks mengikuti jam dinding: frame yang terlambat dilewati
+            start = time.perf_counter()
+            index = 0
+            while index < last:
+                yield index
+                index = max(index + 1, min(last, int((time.perf_counter() - start) * fps)))
+            yield last
+
+        def update(index):
+            return static_artists + self.draw_frame(index)
+
+        return FuncAnimation(self.ax.figure, update, frames=frame_indices,
+                             interval=1000 / fps, blit=True, repeat=False,
+                             cache_frame_data=False)
+
+    def render_frames(self):
+        """
+        Menggambar setiap frame tanpa GUI dan menghasilkan buffer RGBA.
+
+        Latar (grid, sumbu, bentuk statis) digambar sekali; setiap frame
+        hanya memulihkan latar lalu menggambar collection animasi.
+
+        Yields:
+        -------
+        numpy.ndarray : Gambar RGBA (H, W, 4) uint8, valid sampai frame berikutnya
+        """
+        canvas = self.ax.figure.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(self.ax.figure.bbox)
+
+        for index in range(len(self)):
+            canvas.restore_region(background)
+            for collection in self.draw_frame(index):
+                self.ax.draw_artist(collection)
+            yield np.asarray(canvas.buffer_rgba())
+
+    def save(self, path, fps=30):
+        """Menyimpan animasi sebagai GIF atau urutan PNG (lihat save_frames)."""
+        return save_frames(self.render_frames(), path, fps)
+
+    def remove(self):
+        """Melepas collection animasi dari axes."""
+        for collection in self.collections:
+            collection.remove()
+        self.collections = []
+        self._groups = []
+
+
+def save_frames(frames, path, fps=30):
+    """
+    Menyimpan urutan frame RGBA.
+
+    - path berakhiran .gif : satu file GIF animasi (Pillow), berulang terus.
+                             Semua frame memakai palet frame pertama tanpa
+                             dithering dan tanpa optimasi per frame; ini
+                             sekitar 10x lebih cepat dari kuantisasi per frame
+    - selain itu           : direktori berisi frame_0000.png, frame_0001.png, ...
+
+    Parameters:
+    -----------
+    frames : iterable of numpy.ndarray
+        Gambar RGBA (H, W, 4) uint8
+    path : str
+        File .gif atau direktori output
+    fps : float
+        Frame per detik (durasi tiap frame GIF)
+
+    Returns:
+    --------
+    int : Jumlah frame yang disimpan
+    """
+    from PIL import Image
+
+    if path.lower().endswith('.gif'):
+        images = []
+        for frame in frames:
+            image = Image.fromarray(frame).convert('RGB')
+            if images:
+                image = image.quantize(palette=images[0], dither=Image.Dither.NONE)
+            else:
+                image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+            images.append(image)
+        if not images:
+            return 0
+        images[0].save(path, save_all=True, append_images=images[1:],
+                       duration=round(1000 / fps), loop=0, optimize=False)
+        return len(images)
+
+    os.makedirs(path, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, start=1):
+        Image.fromarray(frame).save(os.path.join(path, f'frame_{count - 1:04d}.png'),
+                                    compress_level=1)
+    return count
@@ -0,0 +1,460 @@
+"""
+Modul mode batch (headless) yang dijalankan dari file skrip.
+
+File skrip berupa JSON berisi daftar operasi yang dijalankan berurutan,
+sama seperti pilihan menu pada aplikasi interaktif:
+
+    {
+        "operations": [
+            {"op": "draw", "shape": "square", "side": 4, "x_start": 0, "y_start": 0},
+            {"op": "scale", "sx": 2, "sy": 1.5},
+            {"op": "rotate", "angle": 45},
+            {"op": "reflect", "axis": "y"}
+        ]
+    }
+
+Operasi yang tersedia:
+- draw    : shape = square | triangle | rectangle | circle | trapezoid,
+            parameter sama dengan fungsi create_* di modul shapes
+- scale   : sx, sy, center (opsional)
+- rotate  : angle, center (opsional)
+- reflect : axis ('x', 'y', 'origin', 'y=x')
+- undo    : membatalkan transformasi terakhir
+- redo    : mengulang transformasi yang terakhir dibatalkan
+- clear   : menghapus bentuk saat ini
+
+Rendering memakai backend Agg tanpa jendela GUI dan tanpa plt.pause().
+Latar statis (grid, sumbu, judul) dirender sekali, lalu setiap skrip hanya
+menggambar bentuknya di atas salinan latar tersebut.
+
+Jika diminta, transisi semua transformasi skrip juga diekspor sebagai
+animasi (GIF atau urutan PNG, lihat utils.animation).
+"""
+
+import json
+import os
+import time
+
+from shapes import (create_square, create_triangle, create_rectangle,
+                    create_circle, create_trapezoid)
+from transformations.scaling import get_scaling_matrix
+from transformations.rotation import get_rotation_matrix
+from transformations.reflection import get_reflection_matrix
+from transformations.pipeline import to_homogeneous
+from transformations.history import TransformHistory
+
+from .plotting import init_cartesian_plot, plot_shape_on_ax
+from .profiling import PROFILER
+
+
+# Pemetaan nama bentuk ke fungsi pembuatnya
+SHAPE_BUILDERS = {
+    'square': create_square,
+    'triangle': create_triangle,
+    'rectangle': create_rectangle,
+    'circle': create_circle,
+    'trapezoid': create_trapezoid,
+}
+
+
+def load_script(path):
+    """
+    Membaca file skrip JSON.
+
+    Parameters:
+    -----------
+    path : str
+        Path file skrip
+
+    Returns:
+    --------
+    list : Daftar operasi (dict)
+    """
+    with open(path, encoding='utf-8') as f:
+        script = json.load(f)
+
+    if isinstance(script, dict):
+        script = script.get('operations', [])
+    if not isinstance(script, list):
+        raise ValueError("Skrip harus berupa list operasi atau dict dengan kunci 'operations'.")
+    for index, operation in enumerate(script):
+        _check_operation(operation, index)
+
+    return script
+
+
+def _check_operation(operation, index=None):
+    """Memastikan operasi berupa dict, selain itu ValueError."""
+    if not isinstance(operation, dict):
+        where = '' if index is None else f" ke-{index + 1}"
+        raise ValueError(f"Operasi{where} harus berupa objek JSON, bukan {operation!r}.")
+
+
+# Operasi yang berupa transformasi affine terhadap bentuk saat ini
+TRANSFORM_OPS = ('scale', 'rotate', 'reflect')
+
+
+def operation_matrix(operation, shape_data):
+    """
+    Menyusun matriks homogen 3x3 untuk operasi scale/rotate/reflect.
+
+    Parameters:
+    -----------
+    operation : dict
+        Operasi dengan kunci 'op' dan parameternya
+    shape_data : Shape atau TransformHistory
+        Bentuk saat ini; centroid()-nya menjadi pusat default
+
+    Returns:
+    --------
+    numpy.ndarray : Matriks affine homogen 3x3
+    """
+    op = operation.get('op')
+    center = operation.get('center')
+    if center is None:
+        center = shape_data.centroid()
+
+    if op == 'scale':
+        return to_homogeneous(get_scaling_matrix(operation['sx'], operation['sy']), center)
+    if op == 'rotate':
+        return to_homogeneous(get_rotation_matrix(operation['angle']), center)
+    return to_homogeneous(get_reflection_matrix(operation.get('axis', 'x')))
+
+
+def run_operation(operation, shape_data):
+    """
+    Menjalankan satu operasi skrip terhadap bentuk saat ini.
+
+    Parameters:
+    -----------
+    operation : dict
+        Operasi dengan kunci 'op' dan parameternya
+    shape_data : Shape atau None
+        Bentuk saat ini
+
+    Returns:
+    --------
+    Shape : Bentuk setelah operasi (None setelah 'clear')
+    """
+    _check_operation(operation)
+    params = dict(operation)
+    op = params.pop('op', None)
+
+    if op == 'draw':
+        shape_type = params.pop('shape', None)
+        builder = SHAPE_BUILDERS.get(shape_type)
+        if builder is None:
+            raise ValueError(f"Bentuk '{shape_type}' tidak dikenali.")
+        return builder(**params)
+
+    if op == 'clear':
+        return None
+
+    if op not in TRANSFORM_OPS:
+        raise ValueError(f"Operasi '{op}' tidak dikenali.")
+    if shape_data is None:
+        raise ValueError(f"Operasi '{op}' membutuhkan bentuk. Gunakan 'draw' terlebih dahulu.")
+
+    return shape_data.transformed(operation_matrix(operation, shape_data))
+
+
+def run_operations(operations, timings=None):
+    """
+    Menjalankan daftar operasi secara berurutan.
+
+    Transformasi dicatat di TransformHistory, sehingga setiap keadaan
+    dihitung dari geometri asal dengan satu matriks kumulatif dan
+    operasi 'undo'/'redo' tidak perlu menyalin vertices.
+
+    Parameters:
+    -----------
+    operations : list of dict
+        Daftar operasi skrip
+    timings : dict, optional
+        Akumulator waktu {nama_operasi: [total_detik, jumlah]}
+
+    Returns:
+    --------
+    Shape : Bentuk terakhir, atau None jika tidak ada
+    """
+    history = None
+
+    for index, operation in enumerate(operations):
+        start = time.perf_counter()
+        _check_operation(operation, index)
+        op = operation.get('op')
+
+        if op in TRANSFORM_OPS + ('undo', 'redo') and history is None:
+            raise ValueError(f"Operasi '{op}' membutuhkan bentuk. Gunakan 'draw' terlebih dahulu.")
+
+        if op in TRANSFORM_OPS:
+            params = {k: v for k, v in operation.items() if k != 'op'}
+            history.push(operation_matrix(operation, history), op, params)
+        elif op == 'undo':
+            history.undo()
+        elif op == 'redo':
+            history.redo()
+        else:
+            shape_data = run_operation(operation, None)
+            history = None if shape_data is None else TransformHistory(shape_data)
+
+        if timings is not None:
+            _record(timings, op, time.perf_counter() - start)
+
+    return None if history is None else history.current
+
+
+def script_animation(operations, frames):
+    """
+    Menyusun matriks animasi untuk semua transformasi dalam skrip.
+
+    Setiap transformasi dianimasikan dari keadaan sebelumnya:
+    frame = interpolasi_k · kumulatif_(k-1), sehingga semua frame dihitung
+    dari geometri asal bentuk terakhir yang digambar. Undo/redo melompat
+    langsung ke keadaan barunya (satu frame).
+
+    Parameters:
+    -----------
+    operations : list of dict
+        Daftar operasi skrip
+    frames : int
+        Jumlah frame per transformasi
+
+    Returns:
+    --------
+    tuple : (Shape asal, numpy.ndarray (F, 3, 3)), atau (None, None)
+            jika skrip tidak menghasilkan bentuk
+    """
+    import numpy as np
+    from .animation import interpolated_matrices
+
+    history = None
+    stacks = []
+    for operation in operations:
+        op = operation.get('op')
+        if op in TRANSFORM_OPS + ('undo', 'redo') and history is None:
+            raise ValueError(f"Operasi '{op}' membutuhkan bentuk. Gunakan 'draw' terlebih dahulu.")
+
+        if op in TRANSFORM_OPS:
+            params = {k: v for k, v in operation.items() if k != 'op'}
+            center = None
+            if op != 'reflect':
+                center = params.get('center') or history.centroid()
+            steps = interpolated_matrices(op, params, center, frames)
+            stacks.append(steps @ history.matrix)
+            history.push(operation_matrix(operation, history), op, params)
+        elif op in ('undo', 'redo'):
+            if getattr(history, op)():
+                stacks.append(history.matrix[None])
+        else:
+            shape_data = run_operation(operation, None)
+            history = None if shape_data is None else TransformHistory(shape_data)
+            stacks = []
+
+    if history is None:
+        return None, None
+    if not stacks:
+        stacks.append(np.stack((history.matrix, history.matrix)))
+    return history.base, np.concatenate(stacks)
+
+
+def streaming_pipeline(path, operations, chunk_size=None):
+    """
+    Menyusun StreamingPipeline dari operasi transformasi skrip.
+
+    Hanya scale, rotate, dan reflect yang didukung; input adalah file
+    vertices, bukan bentuk, sehingga 'draw', 'clear', dan undo/redo ditolak.
+
+    Parameters:
+    -----------
+    path : str
+        File vertices input (.csv atau biner mentah)
+    operations : list of dict
+        Daftar operasi skrip
+    chunk_size : int, optional
+        Jumlah vertices per chunk (default: DEFAULT_CHUNK_SIZE)
+
+    Returns:
+    --------
+    StreamingPipeline : Pipeline yang siap dijalankan
+    """
+    from transformations.streaming import DEFAULT_CHUNK_SIZE, StreamingPipeline
+
+    pipeline = StreamingPipeline(path, chunk_size or DEFAULT_CHUNK_SIZE)
+    for operation in operations:
+        op = operation.get('op')
+        if op == 'scale':
+            pipeline.scale(operation['sx'], operation['sy'], operation.get('center'))
+        elif op == 'rotate':
+            pipeline.rotate(operation['angle'], operation.get('center'))
+        elif op == 'reflect':
+            pipeline.reflect(operation.get('axis', 'x'))
+        else:
+            raise ValueError(f"Operasi '{op}' tidak didukung pada mode streaming.")
+    return pipeline
+
+
+def _record(timings, name, seconds):
+    entry = timings.setdefault(name, [0.0, 0])
+    entry[0] += seconds
+    entry[1] += 1
+    PROFILER.add_stage(name, seconds)
+
+
+def output_path_for(script_path, out, multiple, extension='.png'):
+    """
+    Menentukan path output untuk sebuah skrip.
+
+    - Jika `out` mengandung '{name}', diganti dengan nama skrip tanpa ekstensi.
+    - Jika ada banyak skrip, `out` dianggap sebagai direktori
+      (nama file = nama skrip + extension).
+    - Selain itu, `out` dipakai apa adanya.
+    """
+    name = os.path.splitext(os.path.basename(script_path))[0]
+    if '{name}' in out:
+        return out.format(name=name)
+    if multiple:
+        return os.path.join(out, name + extension)
+    return out
+
+
+def save_canvas_png(canvas, path):
+    """
+    Menyimpan isi buffer RGBA canvas Agg ke file PNG tanpa menggambar ulang figure.
+
+    Kompresi level 1 dipakai karena waktu encode PNG lebih penting
+    daripada ukuran file pada mode batch.
+    """
+    import numpy as np
+    from PIL import Image
+
+    Image.fromarray(np.asarray(canvas.buffer_rgba())).save(path, compress_level=1)
+
+
+def run_batch(script_paths, out='frame.png', dpi=100, animate=None, frames=30, fps=30):
+    """
+    Menjalankan banyak file skrip dan menyimpan hasil render masing-masing.
+
+    Figure dan axes dibuat sekali lalu dipakai ulang untuk semua skrip.
+    Latar statis dirender sekali; setiap skrip hanya memulihkan latar
+    tersebut dan menggambar bentuknya dengan ax.draw_artist().
+
+    Parameters:
+    -----------
+    script_paths : list of str
+        Daftar path file skrip
+    out : str
+        Path output (lihat output_path_for)
+    dpi : int
+        Resolusi gambar output (ukuran gambar = 8 inci x dpi)
+    animate : str, optional
+        Path animasi transisi: file .gif, direktori frame PNG, atau pola
+        dengan '{name}'. Untuk banyak skrip tanpa '{name}': direktori
+        berisi <nama_skrip>.gif
+    frames : int
+        Jumlah frame per transformasi pada animasi
+    fps : float
+        Frame per detik animasi
+
+    Returns:
+    --------
+    tuple : (timings, failures) dimana timings adalah
+            {nama_operasi: [total_detik, jumlah]} dan failures adalah
+            list (path_skrip, pesan_error)
+    """
+    with PROFILER.stage('setup'):
+        import matplotlib.pyplot as plt
+
+        plt.switch_backend('Agg')
+        fig, ax = init_cartesian_plot(
+            figsize=(8, 8),
+            xlim=(-10, 10),
+            ylim=(-10, 10),
+            title='Interactive Drawing and Transformation Application'
+        )
+        fig.set_dpi(dpi)
+        canvas = fig.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+    multiple = len(script_paths) > 1
+    if multiple and '{name}' not in out:
+        os.makedirs(out, exist_ok=True)
+    if animate and multiple and '{name}' not in animate:
+        os.makedirs(animate, exist_ok=True)
+
+    timings = {}
+    failures = []
+
+    for script_path in script_paths:
+        try:
+            start = time.perf_counter()
+            operations = load_script(script_path)
+            _record(timings, 'load', time.perf_counter() - start)
+
+            shape_data = run_operations(operations, timings)
+
+            start = time.perf_counter()
+            canvas.restore_region(background)
+            patch = plot_shape_on_ax(ax, shape_data, clear_previous=True)
+            if patch is not None:
+                ax.draw_artist(patch)
+            _record(timings, 'render', time.perf_counter() - start)
+
+            start = time.perf_counter()
+            save_canvas_png(canvas, output_path_for(script_path, out, multiple))
+            _record(timings, 'save', time.perf_counter() - start)
+
+            if animate:
+                start = time.perf_counter()
+                if patch is not None:
+                    patch.remove()
+                export_animation(ax, operations, frames, fps,
+                                 output_path_for(script_path, animate, multiple, '.gif'))
+                canvas.restore_region(background)
+                _record(timings, 'animate', time.perf_counter() - start)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            failures.append((script_path, str(e)))
+
+    plt.close(fig)
+    return timings, failures
+
+
+def export_animation(ax, operations, frames, fps, path):
+    """
+    Mengekspor animasi transisi transformasi skrip tanpa GUI.
+
+    Returns:
+    --------
+    int : Jumlah frame yang disimpan (0 jika skrip tidak menghasilkan bentuk)
+    """
+    from .animation import TransformAnimation
+
+    base, matrices = script_animation(operations, frames)
+    if base is None:
+        return 0
+    animation = TransformAnimation(ax, [base], matrices)
+    try:
+        return animation.save(path, fps)
+    finally:
+        animation.remove()
+
+
+def format_timing_report(timings):
+    """
+    Menyusun laporan waktu per operasi dalam bentuk tabel teks.
+
+    Parameters:
+    -----------
+    timings : dict
+        {nama_operasi: [total_detik, jumlah]}
+
+    Returns:
+    --------
+    str : Tabel laporan waktu
+    """
+    lines = [f"{'Operasi':<10} {'Jumlah':>8} {'Total (ms)':>12} {'Rata-rata (ms)':>15}",
+             "-" * 48]
+    for name, (total, count) in sorted(timings.items(), key=lambda item: -item[1][0]):
+        lines.append(f"{name:<10} {count:>8} {total * 1000:>12.2f} {total * 1000 / count:>15.3f}")
+    return "\n".join(lines)
@@ -0,0 +1,124 @@
+"""
+Modul clipping polygon terhadap viewport sebelum rendering.
+
+Saat memperbesar (zoom) bentuk raksasa, sebagian besar vertices berada
+jauh di luar viewport tetapi tetap dikirim ke Matplotlib. Di sini setiap
+bentuk diperiksa terlebih dahulu dengan bounding box-nya (di-cache oleh
+Shape.metrics):
+
+- trivial reject : bounding box tidak beririsan dengan viewport, tidak
+                   ada vertex yang dikirim
+- trivial accept : bounding box seluruhnya di dalam viewport, vertices
+                   dipakai apa adanya (tanpa salinan)
+- selain itu     : polygon dipotong dengan algoritma Sutherland–Hodgman
+                   terhadap keempat sisi persegi panjang viewport
+
+Setiap sisi clip diproses dengan satu pass NumPy atas semua edge:
+vertex di dalam dipertahankan, dan titik potong ditambahkan untuk edge
+yang melintasi sisi. Polygon konkaf dapat menghasilkan edge berimpit di
+sepanjang sisi clip; karena itu viewport diperlebar dengan margin
+(CLIP_MARGIN) sehingga edge buatan tersebut berada di luar area yang
+terlihat dan tetap dipotong oleh Matplotlib seperti biasa.
+"""
+
+import numpy as np
+
+
+# Margin clip di setiap sisi, sebagai fraksi lebar/tinggi viewport
+CLIP_MARGIN = 0.05
+
+
+def axes_clip_rect(ax, margin=CLIP_MARGIN):
+    """
+    Persegi panjang clip (xmin, ymin, xmax, ymax) dari batas axes saat ini.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    margin : float
+        Pelebaran di setiap sisi sebagai fraksi ukuran viewport
+    """
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    xmin, xmax = min(x0, x1), max(x0, x1)
+    ymin, ymax = min(y0, y1), max(y0, y1)
+    dx, dy = (xmax - xmin) * margin, (ymax - ymin) * margin
+    return (xmin - dx, ymin - dy, xmax + dx, ymax + dy)
+
+
+def bounds_inside(bounds, rect):
+    """True jika bounding box seluruhnya berada di dalam rect."""
+    return rect[0] <= bounds[0] and rect[1] <= bounds[1] and bounds[2] <= rect[2] and bounds[3] <= rect[3]
+
+
+def _clip_side(points, axis, value, keep_above):
+    """Satu langkah Sutherland–Hodgman terhadap garis koordinat[axis] = value."""
+    coords = points[:, axis]
+    inside = coords >= value if keep_above else coords <= value
+    following = np.roll(points, -1, axis=0)
+    crossing = inside != np.roll(inside, -1)
+    if not crossing.any():
+        return points if inside.all() else points[:0]
+
+    # Titik potong edge i -> i+1 (hanya dipakai untuk edge yang melintas)
+    start, stop = points[crossing], following[crossing]
+    t = (value - start[:, axis]) / (stop[:, axis] - start[:, axis])
+    intersections = np.empty_like(points)
+    intersections[crossing] = start + t[:, None] * (stop - start)
+    intersections[crossing, axis] = value
+
+    # Per edge: vertex awal (jika di dalam) lalu titik potong (jika melintas)
+    pairs = np.stack((points, intersections), axis=1)
+    return pairs[np.column_stack((inside, crossing))]
+
+
+def clip_polygon(vertices, rect):
+    """
+    Memotong polygon dengan persegi panjang (Sutherland–Hodgman).
+
+    Parameters:
+    -----------
+    vertices : array_like
+        Vertices polygon (N, 2)
+    rect : tuple
+        (xmin, ymin, xmax, ymax)
+
+    Returns:
+    --------
+    numpy.ndarray : Vertices hasil (M, 2); kosong jika polygon di luar rect
+    """
+    points = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    xmin, ymin, xmax, ymax = rect
+    for axis, value, keep_above in ((0, xmin, True), (0, xmax, False),
+                                    (1, ymin, True), (1, ymax, False)):
+        if len(points) == 0:
+            break
+        points = _clip_side(points, axis, value, keep_above)
+    return points
+
+
+def clip_shape_outline(shape, rect, outline):
+    """
+    Keliling bentuk yang sudah dipotong ke rect, dengan trivial accept/reject.
+
+    Parameters:
+    -----------
+    shape : Shape
+        Bentuk (bounding box diambil dari Shape.bounds(), di-cache)
+    rect : tuple
+        (xmin, ymin, xmax, ymax)
+    outline : callable
+        Fungsi tanpa argumen yang menghasilkan keliling (N, 2); hanya
+        dipanggil jika bentuk tidak ditolak, sehingga lingkaran di luar
+        viewport tidak perlu di-tessellate
+
+    Returns:
+    --------
+    numpy.ndarray : Keliling (N, 2); kosong jika bentuk tidak terlihat
+    """
+    bounds = shape.bounds()
+    if bounds[2] < rect[0] or bounds[0] > rect[2] or bounds[3] < rect[1] or bounds[1] > rect[3]:
+        return np.empty((0, 2))
+    if bounds_inside(bounds, rect):
+        return outline()
+    return clip_polygon(outline(), rect)
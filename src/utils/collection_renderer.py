@@ -0,0 +1,474 @@
+"""
+Modul renderer berbasis collection untuk scene dengan ribuan bentuk.
+
+Setiap plt.Polygon membawa overhead per-artist (transformasi, properti,
+pemanggilan draw) yang membengkak setelah beberapa ratus patch.
+CollectionRenderer menggambar semua polygon dengan PolyCollection dan
+semua lingkaran/elips dengan satu EllipseCollection, dengan warna per
+bentuk disimpan dalam array RGBA.
+
+Polygon dikelompokkan berdasarkan jumlah vertices (segitiga = 3, segi
+empat = 4, ...). Setiap kelompok diambil dari buffer vertices ShapeArray
+sebagai satu array (n, k, 2) sehingga PolyCollection dapat memakai jalur
+cepatnya tanpa membangun Path satu per satu. Lingkaran dikirim sebagai
+parameter elips (pusat, sumbu, sudut) tanpa tessellation.
+
+SceneCollectionRenderer membungkus CollectionRenderer dengan antarmuka
+ShapeRenderer (update/highlight/refresh per ID scene), sehingga aplikasi
+interaktif dapat memakainya untuk scene besar (lihat --renderer pada main.py).
+"""
+
+import numpy as np
+from matplotlib.collections import EllipseCollection, PolyCollection
+from matplotlib.colors import to_rgba, to_rgba_array
+
+from shapes.shape_array import SHAPE_TYPES, Shape, ShapeArray
+
+from .plotting import CIRCLE_STYLE, POLYGON_STYLE, SELECTED_STYLE, shape_style
+
+
+CIRCLE_CODE = SHAPE_TYPES.index('circle')
+
+
+def _style_rgba(style):
+    """Mengubah gaya (edgecolor, facecolor, alpha) menjadi pasangan RGBA."""
+    return (to_rgba(style['facecolor'], style['alpha']),
+            to_rgba(style['edgecolor'], style['alpha']))
+
+
+def gather_polygons(shapes, indices, vertex_count):
+    """
+    Mengambil vertices beberapa polygon dengan jumlah vertices sama sebagai array 3D.
+
+    Parameters:
+    -----------
+    shapes : ShapeArray
+        Kumpulan bentuk
+    indices : numpy.ndarray
+        Indeks polygon (semuanya memiliki vertex_count vertices)
+    vertex_count : int
+        Jumlah vertices setiap polygon
+
+    Returns:
+    --------
+    numpy.ndarray : Array (n, vertex_count, 2)
+    """
+    rows = shapes.offsets[indices][:, None] + np.arange(vertex_count)
+    return shapes.vertices[rows]
+
+
+def circle_ellipse_params(shapes, indices):
+    """
+    Menghitung parameter elips untuk lingkaran pada ShapeArray secara vektor.
+
+    Parameters:
+    -----------
+    shapes : ShapeArray
+        Kumpulan bentuk
+    indices : numpy.ndarray
+        Indeks lingkaran di dalam shapes
+
+    Returns:
+    --------
+    tuple : (offsets (n, 2), widths (n,), heights (n,), angles_deg (n,))
+    """
+    centers = shapes.anchors[indices]
+    radii = shapes.params[indices, 0]
+
+    transforms = shapes.transforms[indices]
+    has_transform = ~np.isnan(transforms).any(axis=1)
+
+    # Matriks linear (n, 2, 2) dan translasi (n, 2); identitas jika tidak ada transformasi
+    linear = np.broadcast_to(np.eye(2), (len(indices), 2, 2)).copy()
+    translation = np.zeros((len(indices), 2))
+    affine = transforms[has_transform].reshape(-1, 2, 3)
+    linear[has_transform] = affine[:, :, :2]
+    translation[has_transform] = affine[:, :, 2]
+
+    offsets = np.einsum('nij,nj->ni', linear, centers) + translation
+
+    # Lingkaran satuan × (r · L) menghasilkan elips dengan sumbu = nilai
+    # singular dan arah sumbu utama = vektor singular kiri pertama
+    u, s, _ = np.linalg.svd(linear * radii[:, None, None])
+    angles = np.degrees(np.arctan2(u[:, 1, 0], u[:, 0, 0]))
+
+    return offsets, 2 * s[:, 0], 2 * s[:, 1], angles
+
+
+class CollectionRenderer:
+    """
+    Renderer berbasis collection untuk seluruh scene.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    animated : bool
+        True jika collection akan digambar lewat blitting
+
+    Example:
+    --------
+    >>> renderer = CollectionRenderer(ax)
+    >>> renderer.set_shapes(ShapeArray.from_shapes(shapes))
+    >>> renderer.set_facecolors([0, 5, 9], 'salmon')
+    >>> fig.canvas.draw()
+    """
+
+    def __init__(self, ax, animated=False):
+        self.ax = ax
+        self.animated = animated
+        self.shapes = None
+
+        # Satu kelompok per collection: indeks bentuk, collection, dan warnanya
+        self.group_indices = []
+        self.collections = []
+        self.facecolors = []
+        self.edgecolors = []
+        self.linewidths = []
+
+        # Posisi setiap bentuk: kelompok ke berapa dan urutan ke berapa di dalamnya
+        self.group_of = np.empty(0, dtype=np.int64)
+        self.position_of = np.empty(0, dtype=np.int64)
+
+    def __len__(self):
+        return 0 if self.shapes is None else len(self.shapes)
+
+    @property
+    def artists(self):
+        """Collection yang dikelola renderer ini (untuk blitting)."""
+        return list(self.collections)
+
+    def set_shapes(self, shapes):
+        """
+        Mengganti seluruh isi scene.
+
+        Parameters:
+        -----------
+        shapes : ShapeArray atau iterable of Shape
+            Bentuk yang akan dirender; dikonversi ke ShapeArray bila perlu
+        """
+        if not isinstance(shapes, ShapeArray):
+            shapes = ShapeArray.from_shapes(shapes)
+
+        self.remove()
+        self.shapes = shapes
+
+        is_circle = shapes.type_codes == CIRCLE_CODE
+        counts = shapes.vertex_counts
+        polygon_indices = np.flatnonzero(~is_circle)
+
+        self.group_of = np.empty(len(shapes), dtype=np.int64)
+        self.position_of = np.empty(len(shapes), dtype=np.int64)
+
+        polygon_face, polygon_edge = _style_rgba(POLYGON_STYLE)
+        for vertex_count in np.unique(counts[polygon_indices]):
+            indices = polygon_indices[counts[polygon_indices] == vertex_count]
+            collection = PolyCollection([], closed=True, animated=self.animated, linewidths=1.0)
+            self._add_group(indices, collection, polygon_face, polygon_edge)
+
+        circle_indices = np.flatnonzero(is_circle)
+        if len(circle_indices) > 0:
+            collection = EllipseCollection([], [], [], units='xy', offsets=np.empty((0, 2)),
+                                           offset_transform=self.ax.transData,
+                                           animated=self.animated, linewidths=1.0)
+            circle_face, circle_edge = _style_rgba(CIRCLE_STYLE)
+            self._add_group(circle_indices, collection, circle_face, circle_edge)
+
+        self.update_geometry()
+
+    def _add_group(self, indices, collection, facecolor, edgecolor):
+        group = len(self.collections)
+        self.group_of[indices] = group
+        self.position_of[indices] = np.arange(len(indices))
+
+        self.group_indices.append(indices)
+        self.collections.append(collection)
+        self.facecolors.append(np.tile(facecolor, (len(indices), 1)))
+        self.edgecolors.append(np.tile(edgecolor, (len(indices), 1)))
+        self.linewidths.append(np.ones(len(indices)))
+
+        collection.set_facecolors(self.facecolors[group])
+        collection.set_edgecolors(self.edgecolors[group])
+        collection.set_linewidths(self.linewidths[group])
+        self.ax.add_collection(collection, autolim=False)
+
+    def update_geometry(self):
+        """
+        Menyinkronkan collection dengan buffer ShapeArray.
+
+        Panggil setelah vertices, anchors, params, atau transforms pada
+        ShapeArray diubah in-place.
+        """
+        for indices, collection in zip(self.group_indices, self.collections):
+            if isinstance(collection, EllipseCollection):
+                offsets, widths, heights, angles = circle_ellipse_params(self.shapes, indices)
+                collection.set_offsets(offsets)
+                collection.set_widths(widths)
+                collection.set_heights(heights)
+                collection.set_angles(angles)
+            else:
+                vertex_count = self.shapes.vertex_counts[indices[0]]
+                collection.set_verts(gather_polygons(self.shapes, indices, vertex_count))
+            collection.stale = True
+
+    def _set_values(self, values_per_group, setter, indices, values):
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        groups = self.group_of[indices]
+        positions = self.position_of[indices]
+
+        for group in np.unique(groups):
+            mask = groups == group
+            values_per_group[group][positions[mask]] = values[mask] if len(values) > 1 else values[0]
+            getattr(self.collections[group], setter)(values_per_group[group])
+
+    def _set_colors(self, colors_per_group, setter, indices, color):
+        self._set_values(colors_per_group, setter, indices, to_rgba_array(color))
+
+    def set_facecolors(self, indices, color):
+        """
+        Mengubah warna isi bentuk tertentu.
+
+        Parameters:
+        -----------
+        indices : int atau array of int
+            Indeks bentuk pada ShapeArray
+        color : warna Matplotlib, atau array RGBA (len(indices), 4)
+        """
+        self._set_colors(self.facecolors, 'set_facecolors', indices, color)
+
+    def set_edgecolors(self, indices, color):
+        """Mengubah warna tepi bentuk tertentu (lihat set_facecolors)."""
+        self._set_colors(self.edgecolors, 'set_edgecolors', indices, color)
+
+    def set_linewidths(self, indices, width):
+        """Mengubah tebal tepi bentuk tertentu (float atau array (len(indices),))."""
+        self._set_values(self.linewidths, 'set_linewidths', indices,
+                         np.atleast_1d(np.asarray(width, dtype=float)))
+
+    def remove(self):
+        """Melepas semua collection dari axes."""
+        for collection in self.collections:
+            collection.remove()
+        self.group_indices = []
+        self.collections = []
+        self.facecolors = []
+        self.edgecolors = []
+        self.linewidths = []
+
+
+class SceneCollectionRenderer:
+    """
+    Renderer scene berbasis collection dengan antarmuka ShapeRenderer.
+
+    Bentuk dikumpulkan ke satu ShapeArray yang digambar oleh
+    CollectionRenderer. Pembaruan bentuk yang tipe dan jumlah vertices-nya
+    tetap ditulis in-place ke buffer; bentuk baru atau yang dihapus membuat
+    ShapeArray disusun ulang satu kali pada refresh berikutnya. Collection
+    digambar lewat blitting di atas latar statis seperti ShapeRenderer.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    scene : Scene, optional
+        Tidak dipakai (collection tidak perlu culling per bentuk); diterima
+        agar dapat menggantikan ShapeRenderer
+
+    Example:
+    --------
+    >>> renderer = SceneCollectionRenderer(ax)
+    >>> renderer.update(1, shape)
+    >>> renderer.highlight([1])
+    >>> renderer.refresh()
+    """
+
+    def __init__(self, ax, scene=None):
+        self.ax = ax
+        self.scene = scene
+        self.figure = ax.figure
+        self.canvas = ax.figure.canvas
+        self.collection = CollectionRenderer(ax, animated=True)
+        self._shapes = {}
+        self._rows = {}
+        self._highlighted = set()
+        self._hidden = set()
+        self._rebuild = False
+        self._background = None
+        self._needs_full_draw = True
+        self._dirty = True
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def supports_blit(self):
+        """True jika backend canvas mendukung blitting."""
+        return getattr(self.canvas, 'supports_blit', False)
+
+    @property
+    def dirty(self):
+        """True jika ada perubahan yang belum ditampilkan (lihat ShapeRenderer.dirty)."""
+        return self._dirty or self._needs_full_draw
+
+    @property
+    def artists(self):
+        """Collection yang menggambar scene."""
+        return self.collection.artists
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def update(self, shape_id, shape_data):
+        """
+        Menambahkan bentuk baru atau memperbarui bentuk yang sudah ada.
+
+        Parameters:
+        -----------
+        shape_id : hashable
+            ID bentuk
+        shape_data : Shape atau dict
+            Data bentuk
+        """
+        shape = Shape.from_dict(shape_data)
+        self._shapes[shape_id] = shape
+        self._dirty = True
+
+        row = self._rows.get(shape_id)
+        if self._rebuild or row is None:
+            self._rebuild = True
+            return
+
+        shapes = self.collection.shapes
+        single = ShapeArray.from_shapes([shape])
+        if (single.type_codes[0] != shapes.type_codes[row]
+                or len(single.vertices) != shapes.vertex_counts[row]):
+            self._rebuild = True
+            return
+        shapes.vertices[shapes.offsets[row]:shapes.offsets[row + 1]] = single.vertices
+        shapes.anchors[row] = single.anchors[0]
+        shapes.params[row] = single.params[0]
+        shapes.transforms[row] = single.transforms[0]
+
+    def remove(self, shape_id):
+        """Menghapus bentuk tertentu."""
+        if self._shapes.pop(shape_id, None) is not None:
+            self._highlighted.discard(shape_id)
+            self._hidden.discard(shape_id)
+            self._rebuild = True
+            self._dirty = True
+
+    def clear(self):
+        """Menghapus semua bentuk."""
+        for shape_id in list(self._shapes):
+            self.remove(shape_id)
+
+    def highlight(self, shape_ids):
+        """Menandai bentuk terpilih dengan tepi tebal (lihat ShapeRenderer.highlight)."""
+        shape_ids = set(shape_ids) & set(self._shapes)
+        if shape_ids != self._highlighted:
+            changed = shape_ids ^ self._highlighted
+            self._highlighted = shape_ids
+            self._restyle(changed)
+            self._dirty = True
+
+    def set_hidden(self, shape_ids):
+        """
+        Menyembunyikan bentuk tertentu, misalnya selama animasi transisi.
+
+        Parameters:
+        -----------
+        shape_ids : iterable
+            ID bentuk yang disembunyikan; kosong untuk menampilkan semuanya
+
+        Returns:
+        --------
+        list : Artist yang tetap digambar (untuk blitting animasi)
+        """
+        shape_ids = set(shape_ids) & set(self._shapes)
+        changed = shape_ids ^ self._hidden
+        self._hidden = shape_ids
+        self._restyle(changed)
+        if changed:
+            self._dirty = True
+        self._sync()
+        return self.artists
+
+    def _restyle(self, shape_ids):
+        """Menerapkan gaya (normal, terpilih, tersembunyi) ke bentuk tertentu."""
+        shape_ids = [shape_id for shape_id in shape_ids if shape_id in self._rows]
+        if self._rebuild or not shape_ids:
+            return
+        rows = np.array([self._rows[shape_id] for shape_id in shape_ids], dtype=np.int64)
+        faces, edges, widths = [], [], []
+        for shape_id in shape_ids:
+            style = shape_style(self._shapes[shape_id].type)
+            face, edge = _style_rgba(style)
+            width = 1.0
+            if shape_id in self._highlighted:
+                edge = to_rgba(SELECTED_STYLE['edgecolor'], style['alpha'])
+                width = SELECTED_STYLE['linewidth']
+            if shape_id in self._hidden:
+                face = edge = (0.0, 0.0, 0.0, 0.0)
+            faces.append(face)
+            edges.append(edge)
+            widths.append(width)
+        self.collection.set_facecolors(rows, faces)
+        self.collection.set_edgecolors(rows, edges)
+        self.collection.set_linewidths(rows, widths)
+
+    def _sync(self):
+        """Menyusun ulang ShapeArray bila perlu, atau menyalin buffer ke collection."""
+        if not self._rebuild:
+            if self._shapes:
+                self.collection.update_geometry()
+            return
+        self._rebuild = False
+        self._rows = {shape_id: row for row, shape_id in enumerate(self._shapes)}
+        if self._shapes:
+            self.collection.set_shapes(ShapeArray.from_shapes(self._shapes.values()))
+            self._restyle(self._highlighted | self._hidden)
+        else:
+            self.collection.remove()
+
+    def remove_untracked_artists(self):
+        """Menghapus patch dan teks sementara dari fungsi draw_* (lihat ShapeRenderer)."""
+        untracked = [p for p in self.ax.patches if not p.get_animated()] + list(self.ax.texts)
+        for artist in untracked:
+            artist.remove()
+        if untracked:
+            self.invalidate()
+        return len(untracked)
+
+    def invalidate(self):
+        """Menandai bahwa latar statis berubah dan perlu full draw berikutnya."""
+        self._needs_full_draw = True
+
+    def refresh(self):
+        """Menampilkan perubahan: blit collection, atau full draw bila latar berubah."""
+        self._sync()
+        if self._needs_full_draw or self._background is None or not self.supports_blit:
+            self.canvas.draw()
+            self._dirty = False
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+        self._dirty = False
+
+    def _draw_artists(self):
+        for collection in self.collection.collections:
+            self.ax.draw_artist(collection)
+
+    def _on_draw(self, event):
+        """Dipanggil setelah setiap full draw: simpan latar lalu gambar collection."""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._sync()
+        if self.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._needs_full_draw = False
+        self._dirty = False
+        self._draw_artists()
+
+    def disconnect(self):
+        """Melepas callback draw_event dari canvas."""
+        self.canvas.mpl_disconnect(self._draw_cid)
@@ -0,0 +1,166 @@
+"""
+Modul event loop non-blocking untuk aplikasi interaktif.
+
+Sebelumnya menu memanggil input() secara langsung: selama prompt
+menunggu, event loop GUI tidak berjalan sehingga jendela membeku (tidak
+bisa di-pan, di-zoom, atau di-resize).
+
+Di sini input dipisahkan dari rendering:
+
+- CommandReader membaca baris dari stdin di thread tersendiri dan
+  memasukkannya ke antrian.
+- EventLoop menggantikan builtins.input selama aplikasi berjalan. Saat
+  prompt menunggu baris berikutnya, event loop GUI terus dipompa
+  (canvas.start_event_loop) dalam interval pendek, sehingga jendela
+  tetap responsif dan baris yang masuk diproses paling lambat satu
+  interval kemudian.
+
+Canvas tanpa event loop GUI (misalnya backend Agg) tidak dipompa sama
+sekali: prompt langsung menunggu antrian tanpa memakai CPU.
+
+Semua prompt yang sudah ada (menu, draw_*, read_*_factors) otomatis ikut
+non-blocking tanpa perubahan karena memanggil input() biasa. Rendering
+tidak dipompa secara berkala: Matplotlib sendiri menjadwalkan draw untuk
+pan/zoom, dan aplikasi hanya me-refresh saat renderer kotor (lihat
+ShapeRenderer.dirty).
+"""
+
+import builtins
+import queue
+import sys
+import threading
+
+from .profiling import PROFILER
+
+
+# Lama satu putaran event loop GUI saat menunggu input (detik)
+PUMP_INTERVAL = 1 / 60
+
+
+class CommandReader:
+    """
+    Pembaca baris stdin di thread daemon.
+
+    Parameters:
+    -----------
+    stream : file, optional
+        Sumber baris (default: sys.stdin)
+
+    Attributes:
+    -----------
+    lines : queue.Queue
+        Baris tanpa akhiran newline; None menandakan EOF
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdin
+        self.lines = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """Memulai thread pembaca (sekali saja)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='command-reader', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for line in iter(self.stream.readline, ''):
+                self.lines.put(line.rstrip('\r\n'))
+        except (OSError, ValueError):
+            pass
+        self.lines.put(None)
+
+
+class EventLoop:
+    """
+    Menggantikan input() dengan versi yang memompa event loop GUI saat menunggu.
+
+    Parameters:
+    -----------
+    canvas : FigureCanvas
+        Canvas figure yang event loop-nya dipompa
+    reader : CommandReader, optional
+        Sumber baris perintah (default: stdin)
+    interval : float
+        Lama satu putaran event loop GUI (detik)
+
+    Example:
+    --------
+    >>> with EventLoop(fig.canvas):
+    ...     choice = input("Pilih opsi: ")   # Jendela tetap responsif
+    """
+
+    def __init__(self, canvas, reader=None, interval=PUMP_INTERVAL):
+        from matplotlib.backend_bases import FigureCanvasBase
+
+        self.canvas = canvas
+        self.reader = reader if reader is not None else CommandReader()
+        self.interval = interval
+        # Implementasi dasar start_event_loop hanya sleep: tidak ada GUI untuk dipompa
+        self.has_gui = type(canvas).start_event_loop is not FigureCanvasBase.start_event_loop
+        self.closed = False
+        self._previous_input = None
+        self._close_cid = canvas.mpl_connect('close_event', self._on_close)
+
+    def install(self):
+        """Memulai pembaca dan memasang input() non-blocking."""
+        self.reader.start()
+        if self._previous_input is None:
+            self._previous_input = builtins.input
+            builtins.input = self.input
+        return self
+
+    def uninstall(self):
+        """Mengembalikan input() semula dan melepas callback canvas."""
+        if self._previous_input is not None:
+            builtins.input = self._previous_input
+            self._previous_input = None
+        self.canvas.mpl_disconnect(self._close_cid)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+        return False
+
+    def _on_close(self, event):
+        self.closed = True
+
+    def input(self, prompt=''):
+        """
+        Pengganti input(): mencetak prompt lalu menunggu baris dari pembaca.
+
+        Raises:
+        -------
+        EOFError : Jika stdin sudah habis
+        """
+        if prompt:
+            sys.stdout.write(str(prompt))
+            sys.stdout.flush()
+        with PROFILER.stage('input'):
+            line = self.wait_line()
+        if line is None:
+            # Pembaca sudah berhenti: EOF berikutnya juga langsung dikembalikan
+            self.reader.lines.put(None)
+            raise EOFError
+        return line
+
+    def wait_line(self):
+        """Menunggu baris berikutnya sambil memompa event loop GUI."""
+        lines = self.reader.lines
+        while True:
+            try:
+                return lines.get_nowait()
+            except queue.Empty:
+                pass
+            if self.closed or not self.has_gui:
+                # Jendela ditutup atau tanpa GUI: cukup tunggu stdin
+                return lines.get()
+            self.pump()
+
+    def pump(self):
+        """Menjalankan event loop GUI selama satu interval."""
+        self.canvas.start_event_loop(self.interval)
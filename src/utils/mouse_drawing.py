@@ -0,0 +1,265 @@
+"""
+Modul menggambar bentuk dengan mouse dan pratinjau rubber-band.
+
+Selain lewat input koordinat (draw_*), bentuk dapat digambar langsung
+di jendela:
+
+- square, rectangle, circle, trapezoid : tekan lalu seret (drag); bentuk
+  mengikuti kursor dan dibuat saat tombol dilepas
+- triangle                             : klik tiga kali untuk tiga titiknya
+
+Selama menggambar, hanya artist pratinjau yang digambar ulang dengan
+blitting: isi axes (latar dan semua bentuk) disalin sekali saat mulai
+menggambar, lalu setiap gerakan mouse hanya memulihkan salinan itu,
+menggambar pratinjau, dan mem-blit area axes. Biayanya tidak bergantung
+pada jumlah bentuk di scene.
+
+Bentuk yang selesai dibuat dengan fungsi create_* yang sama seperti
+input keyboard, lalu diserahkan ke callback (misalnya untuk ditambahkan
+ke Scene dan ShapeRenderer). Event mouse hanya diproses selama event
+loop GUI berjalan (lihat event_loop.py).
+"""
+
+import numpy as np
+from matplotlib.patches import Polygon
+
+from shapes import (create_square, create_triangle, create_rectangle,
+                    create_circle, create_trapezoid)
+
+from .plotting import shape_outline_for_axes, shape_style
+
+
+# Bentuk yang dibuat dengan drag dan dengan klik per titik
+DRAG_SHAPES = ('square', 'rectangle', 'circle', 'trapezoid')
+CLICK_SHAPES = ('triangle',)
+
+# Perbandingan sisi atas terhadap sisi bawah trapesium hasil drag
+TRAPEZOID_TOP_RATIO = 0.6
+
+# Drag yang lebih pendek dari ini (piksel) dianggap klik dan diabaikan
+MIN_DRAG_PX = 3
+
+# Gaya tepi pratinjau
+PREVIEW_STYLE = {'fill': False, 'linestyle': '--', 'linewidth': 1.5}
+
+
+def shape_from_drag(shape_type, start, end):
+    """
+    Membuat bentuk dari titik awal dan akhir drag.
+
+    - square    : sisi = max(|dx|, |dy|), tumbuh ke arah kursor
+    - rectangle : persegi panjang dengan dua pojok berlawanan start dan end
+    - circle    : pusat di start, radius = jarak ke end
+    - trapezoid : trapesium sama kaki di dalam kotak start-end, sisi atas
+                  TRAPEZOID_TOP_RATIO kali sisi bawah
+
+    Parameters:
+    -----------
+    shape_type : str
+        Salah satu DRAG_SHAPES
+    start, end : tuple
+        Titik (x, y) dalam koordinat data
+
+    Returns:
+    --------
+    Shape : Bentuk baru, atau None jika ukurannya nol
+    """
+    (x0, y0), (x1, y1) = start, end
+    dx, dy = x1 - x0, y1 - y0
+    width, height = abs(dx), abs(dy)
+    left, bottom = min(x0, x1), min(y0, y1)
+
+    if shape_type == 'square':
+        side = max(width, height)
+        if side == 0:
+            return None
+        return create_square(side, x0 if dx >= 0 else x0 - side, y0 if dy >= 0 else y0 - side)
+    if shape_type == 'circle':
+        radius = float(np.hypot(dx, dy))
+        return create_circle(x0, y0, radius) if radius > 0 else None
+    if width == 0 or height == 0:
+        return None
+    if shape_type == 'rectangle':
+        return create_rectangle(width, height, left, bottom)
+    if shape_type == 'trapezoid':
+        return create_trapezoid(width, width * TRAPEZOID_TOP_RATIO, height, left, bottom)
+    raise ValueError(f"Bentuk '{shape_type}' tidak dapat dibuat dengan drag.")
+
+
+class MouseDrawingTool:
+    """
+    Alat menggambar satu jenis bentuk dengan mouse pada axes.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    shape_type : str
+        Salah satu DRAG_SHAPES atau CLICK_SHAPES
+    on_shape : callable
+        Dipanggil sebagai on_shape(shape) untuk setiap bentuk yang selesai
+    renderer : ShapeRenderer, optional
+        Jika diberikan, perubahan yang belum ditampilkan di-refresh dulu
+        sebelum isi axes disalin sebagai latar pratinjau
+
+    Example:
+    --------
+    >>> tool = MouseDrawingTool(ax, 'circle', lambda shape: scene.add(shape))
+    >>> # ... drag di jendela ...
+    >>> tool.disconnect()
+
+    Note:
+    -----
+    Escape membatalkan bentuk yang sedang digambar. Klik diabaikan saat
+    mode pan/zoom toolbar aktif.
+    """
+
+    def __init__(self, ax, shape_type, on_shape, renderer=None):
+        if shape_type not in DRAG_SHAPES + CLICK_SHAPES:
+            raise ValueError(f"Bentuk '{shape_type}' tidak dikenali.")
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.shape_type = shape_type
+        self.on_shape = on_shape
+        self.renderer = renderer
+        self.points = []
+        self._start_px = None
+        self._cursor = None
+        self._background = None
+        self._preview = None
+        self._cids = [
+            self.canvas.mpl_connect('button_press_event', self._on_press),
+            self.canvas.mpl_connect('motion_notify_event', self._on_motion),
+            self.canvas.mpl_connect('button_release_event', self._on_release),
+            self.canvas.mpl_connect('key_press_event', self._on_key),
+            self.canvas.mpl_connect('draw_event', self._on_draw),
+        ]
+
+    @property
+    def active(self):
+        """True jika sebuah bentuk sedang digambar."""
+        return bool(self.points)
+
+    def disconnect(self):
+        """Membatalkan bentuk yang sedang digambar dan melepas semua callback."""
+        self.cancel()
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+        # Pratinjau bisa sudah terlepas dari axes (misalnya oleh clear_all_shapes)
+        if self._preview is not None and self._preview.axes is not None:
+            self._preview.remove()
+        self._preview = None
+
+    def cancel(self):
+        """Membatalkan bentuk yang sedang digambar."""
+        if not self.points:
+            return
+        self.points = []
+        self._cursor = None
+        self._hide_preview()
+
+    def _accepts(self, event):
+        if event.inaxes is not self.ax or event.button != 1:
+            return False
+        toolbar = getattr(self.canvas, 'toolbar', None)
+        return not (toolbar is not None and getattr(toolbar, 'mode', ''))
+
+    def _on_press(self, event):
+        if not self._accepts(event):
+            return
+        point = (event.xdata, event.ydata)
+        if not self.points:
+            self._begin()
+            self._start_px = (event.x, event.y)
+        self.points.append(point)
+        self._cursor = point
+        if self.shape_type in CLICK_SHAPES and len(self.points) == 3:
+            self._finish(create_triangle(self.points))
+        else:
+            self._update_preview()
+
+    def _on_motion(self, event):
+        if not self.points or event.inaxes is not self.ax:
+            return
+        self._cursor = (event.xdata, event.ydata)
+        self._update_preview()
+
+    def _on_release(self, event):
+        if self.shape_type not in DRAG_SHAPES or not self.points or event.button != 1:
+            return
+        if event.inaxes is self.ax:
+            self._cursor = (event.xdata, event.ydata)
+        if np.hypot(event.x - self._start_px[0], event.y - self._start_px[1]) < MIN_DRAG_PX:
+            # Klik tanpa drag: tidak ada bentuk
+            self.cancel()
+            return
+        self._finish(shape_from_drag(self.shape_type, self.points[0], self._cursor))
+
+    def _on_key(self, event):
+        if event.key == 'escape':
+            self.cancel()
+
+    def _on_draw(self, event):
+        # Full draw (zoom, pan, resize): salinan latar tidak berlaku lagi.
+        # Callback ini terhubung setelah milik renderer, sehingga bentuk
+        # scene sudah tergambar saat latar disalin ulang.
+        if self.points:
+            self._background = self._copy_axes()
+            self._update_preview()
+
+    def _copy_axes(self):
+        if not getattr(self.canvas, 'supports_blit', False):
+            return None
+        return self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _begin(self):
+        """Menyalin isi axes saat ini sebagai latar pratinjau."""
+        if self.renderer is not None and self.renderer.dirty:
+            self.renderer.refresh()
+        if self._preview is None:
+            # animated=True: pratinjau tidak ikut full draw maupun salinan latar
+            self._preview = Polygon(np.zeros((1, 2)), closed=True, animated=True,
+                                    edgecolor=shape_style(self.shape_type)['edgecolor'],
+                                    **PREVIEW_STYLE)
+        if self._preview.axes is None:
+            # Baru dibuat, atau dilepas dari axes sejak bentuk sebelumnya
+            self.ax.add_patch(self._preview)
+        self._background = self._copy_axes()
+
+    def _preview_vertices(self):
+        if self.shape_type in CLICK_SHAPES:
+            return np.array(self.points + [self._cursor], dtype=float)
+        shape = shape_from_drag(self.shape_type, self.points[0], self._cursor)
+        if shape is None:
+            return np.array([self.points[0]], dtype=float)
+        return shape_outline_for_axes(self.ax, shape, clip=False)
+
+    def _update_preview(self):
+        """Memulihkan latar, menggambar pratinjau, lalu mem-blit area axes."""
+        self._preview.set_xy(self._preview_vertices())
+        self._preview.set_visible(True)
+        self._blit(draw_preview=True)
+
+    def _hide_preview(self):
+        if self._preview is not None:
+            self._preview.set_visible(False)
+            self._blit(draw_preview=False)
+
+    def _blit(self, draw_preview):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if draw_preview:
+            self.ax.draw_artist(self._preview)
+        self.canvas.blit(self.ax.bbox)
+
+    def _finish(self, shape):
+        """Menghapus pratinjau lalu menyerahkan bentuk ke callback."""
+        self.points = []
+        self._cursor = None
+        self._hide_preview()
+        self._background = None
+        if shape is not None:
+            self.on_shape(shape)
@@ -5,11 +5,34 @@ Modul ini menyediakan fungsi-fungsi untuk:
 - Menginisialisasi lingkungan plotting Matplotlib
 - Setup sistem koordinat Kartesius
 - Helper untuk menggambar bentuk pada axes
+
+pyplot diimpor di dalam fungsi yang benar-benar membuat figure atau patch,
+sehingga mengimpor modul ini (misalnya lewat transformations) tidak memuat
+Matplotlib dan tidak memilih backend.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+from shapes.metrics import polygon_bounds
+from shapes.shape_array import Shape
+from shapes.tessellation import DEFAULT_TOLERANCE_PX, segments_for_radius
+
+from .clipping import axes_clip_rect, clip_shape_outline
+from .profiling import PROFILER
+
+
+# Gaya patch untuk setiap tipe bentuk saat dirender ulang
+POLYGON_STYLE = {'edgecolor': 'blue', 'facecolor': 'lightblue', 'alpha': 0.5}
+CIRCLE_STYLE = {'edgecolor': 'red', 'facecolor': 'lightyellow', 'alpha': 0.5}
+
+# Tepi bentuk yang sedang dipilih
+SELECTED_STYLE = {'edgecolor': 'black', 'linewidth': 2.5}
+
+
+def shape_style(shape_type):
+    """Mengembalikan gaya patch (edgecolor, facecolor, alpha) untuk tipe bentuk."""
+    return CIRCLE_STYLE if shape_type == 'circle' else POLYGON_STYLE
+
 
 def init_cartesian_plot(figsize=(8, 8), xlim=(-10, 10), ylim=(-10, 10), title="Cartesian Coordinate System"):
     """
@@ -38,6 +61,8 @@ def init_cartesian_plot(figsize=(8, 8), xlim=(-10, 10), ylim=(-10, 10), title="C
     >>> fig, ax = init_cartesian_plot()
     >>> plt.show()
     """
+    import matplotlib.pyplot as plt
+    
     # Membuat figure dan axes
     fig, ax = plt.subplots(figsize=figsize)
     
@@ -71,12 +96,13 @@ def plot_shape_on_ax(ax, shape_data, clear_previous=True):
     -----------
     ax : Axes
         Objek axes Matplotlib
-    shape_data : dict
-        Dictionary berisi informasi bentuk:
+    shape_data : Shape atau dict
+        Bentuk (lihat shapes.shape_array.Shape) berisi informasi:
         - 'type': tipe bentuk ('square', 'triangle', 'rectangle', 'circle', 'trapezoid')
         - 'vertices': list koordinat vertices (untuk polygon)
         - 'center': koordinat pusat (untuk lingkaran)
         - 'radius': radius (untuk lingkaran)
+        - 'matrix': matriks affine akumulasi (untuk lingkaran, opsional)
     clear_previous : bool
         Apakah menghapus bentuk sebelumnya
         
@@ -94,27 +120,115 @@ def plot_shape_on_ax(ax, shape_data, clear_previous=True):
     
     if shape_data is None:
         return None
+    
+    # Lingkaran/elips: keliling dibuat sesuai ukurannya di layar.
+    # Polygon (square, triangle, rectangle, trapezoid): vertices apa adanya.
+    outline = shape_outline_for_axes(ax, shape_data)
+    if len(outline) > 0:
+        from matplotlib.patches import Polygon
+        patch = Polygon(outline, closed=True, **shape_style(shape_data.get('type')))
+        ax.add_patch(patch)
+        PROFILER.count('artists_created')
+        PROFILER.count('vertices_rendered', len(outline))
+        return patch
+    
+    return None
+
+
+def shape_outline_for_axes(ax, shape_data, clip=True):
+    """
+    Keliling bentuk yang siap dirender pada axes tertentu.
+    
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    shape_data : Shape atau dict
+        Data bentuk
+    clip : bool
+        Memotong keliling ke viewport axes (lihat clipping.py), sehingga
+        vertices di luar area yang terlihat tidak dikirim ke Matplotlib
         
-    shape_type = shape_data.get('type')
-    
-    if shape_type == 'circle':
-        # Untuk lingkaran
-        from matplotlib.patches import Circle
-        center = shape_data['center']
-        radius = shape_data['radius']
-        circle = Circle(center, radius, edgecolor='red', facecolor='lightyellow', alpha=0.5)
-        ax.add_patch(circle)
-        return circle
+    Returns:
+    --------
+    numpy.ndarray : Array vertices (N, 2); untuk lingkaran jumlah segmen
+                    disesuaikan dengan ukurannya di layar, dan polygon
+                    padat disederhanakan sesuai skala layar (lihat lod.py).
+                    Kosong jika bentuk berada di luar viewport.
+    """
+    shape = Shape.from_dict(shape_data)
+    if shape.type == 'circle':
+        outline = lambda: shape.outline(circle_segments_for_axes(ax, shape))
     else:
-        # Untuk polygon (square, triangle, rectangle, trapezoid)
-        vertices = shape_data.get('vertices', [])
-        if len(vertices) > 0:
-            polygon = plt.Polygon(vertices, closed=True, edgecolor='blue', 
-                                  facecolor='lightblue', alpha=0.5)
-            ax.add_patch(polygon)
-            return polygon
+        outline = lambda: shape.simplified(lod_tolerance_for_axes(ax))
+    if not clip:
+        return outline()
+    return clip_shape_outline(shape, axes_clip_rect(ax), outline)
+
+
+def data_to_pixel_matrix(ax):
+    """
+    Matriks linear 2x2 yang memetakan vektor koordinat data ke piksel layar.
     
-    return None
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+        
+    Returns:
+    --------
+    numpy.ndarray : Matriks 2x2 (kolom = vektor satuan X dan Y dalam piksel)
+    """
+    origin, unit_x, unit_y = ax.transData.transform([(0, 0), (1, 0), (0, 1)])
+    return np.column_stack((unit_x - origin, unit_y - origin))
+
+
+def circle_segments_for_axes(ax, shape, tolerance_px=DEFAULT_TOLERANCE_PX):
+    """
+    Menentukan jumlah segmen keliling lingkaran/elips dari ukurannya di layar.
+    
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    shape : Shape
+        Bentuk lingkaran (center, radius, matrix)
+    tolerance_px : float
+        Penyimpangan maksimum tepi polygon dari busur dalam piksel
+        
+    Returns:
+    --------
+    int : Jumlah segmen
+    """
+    linear = data_to_pixel_matrix(ax) * shape.radius
+    if shape.matrix is not None:
+        linear = linear @ shape.matrix[:2, :2]
+    
+    # Norma-2 = nilai singular terbesar = radius terpanjang elips di layar
+    radius_px = np.linalg.norm(linear, 2)
+    return segments_for_radius(radius_px, tolerance_px)
+
+
+def lod_tolerance_for_axes(ax, tolerance_px=DEFAULT_TOLERANCE_PX):
+    """
+    Toleransi penyederhanaan polygon (koordinat data) untuk skala axes saat ini.
+    
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    tolerance_px : float
+        Penyimpangan maksimum keliling di layar dalam piksel
+        
+    Returns:
+    --------
+    float : tolerance_px dibagi piksel per satuan data (arah terbesar)
+    """
+    # Norma-2 = pembesaran terbesar dari satuan data ke piksel
+    pixels_per_unit = np.linalg.norm(data_to_pixel_matrix(ax), 2)
+    if not np.isfinite(pixels_per_unit) or pixels_per_unit <= 0:
+        return 0.0
+    return tolerance_px / pixels_per_unit
 
 
 def adjust_plot_limits(ax, vertices, padding=2):
@@ -125,19 +239,15 @@ def adjust_plot_limits(ax, vertices, padding=2):
     -----------
     ax : Axes
         Objek axes Matplotlib
-    vertices : list
-        List koordinat vertices
+    vertices : list atau numpy.ndarray
+        Koordinat vertices (N, 2)
     padding : float
         Padding tambahan di sekitar bentuk
     """
     if len(vertices) == 0:
         return
         
-    x_coords = [v[0] for v in vertices]
-    y_coords = [v[1] for v in vertices]
-    
-    x_min, x_max = min(x_coords), max(x_coords)
-    y_min, y_max = min(y_coords), max(y_coords)
+    x_min, y_min, x_max, y_max = polygon_bounds(vertices)
     
     ax.set_xlim(x_min - padding, x_max + padding)
     ax.set_ylim(y_min - padding, y_max + padding)
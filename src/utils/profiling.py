@@ -0,0 +1,316 @@
+"""
+Modul profiling bawaan untuk setiap aksi menu.
+
+Profiler mencatat, per aksi (misalnya 'draw_square' atau 'rotate'):
+
+- waktu setiap tahap (input, pembuatan bentuk, transformasi vertices,
+  pembuatan/pembaruan artist, draw ke layar, animasi). Tahap boleh
+  bersarang; yang dicatat adalah waktu milik tahap itu sendiri (tanpa
+  tahap di dalamnya), sehingga jumlah semua tahap ditambah 'lainnya'
+  sama dengan total waktu aksi.
+- counter seperti jumlah vertices yang diproses dan artist yang dibuat
+- puncak alokasi memori selama aksi (tracemalloc, opsional)
+
+Laporan ditulis ke JSON atau CSV (dari ekstensi file), dan profil
+cProfile lengkap dapat disimpan untuk dibuka dengan pstats/snakeviz.
+
+Profiler diaktifkan lewat `main.py --profile laporan.json` atau variabel
+lingkungan GRAFIKA_PROFILE=laporan.json. Saat tidak aktif, stage()
+mengembalikan context manager kosong yang sama dan count() langsung
+kembali, sehingga instrumentasi di jalur panas hampir tanpa biaya.
+
+Modul ini hanya memakai pustaka standar.
+"""
+
+import builtins
+import contextlib
+import csv
+import json
+import os
+import time
+import tracemalloc
+
+
+# Variabel lingkungan berisi path laporan (mengaktifkan profiler)
+PROFILE_ENV = 'GRAFIKA_PROFILE'
+
+# Nama tahap untuk waktu aksi yang tidak tercakup tahap mana pun
+OTHER_STAGE = 'lainnya'
+
+# Context manager kosong yang dipakai ulang saat profiler tidak aktif
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class ActionStats:
+    """Statistik terkumpul untuk satu nama aksi."""
+
+    __slots__ = ('count', 'total', 'stages', 'counters', 'peak_memory')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.stages = {}
+        self.counters = {}
+        self.peak_memory = 0
+
+    def to_dict(self):
+        """Ringkasan dalam satuan ms dan KB."""
+        staged = sum(total for total, _ in self.stages.values())
+        stages = {name: {'count': count, 'total_ms': total * 1000,
+                         'mean_ms': total * 1000 / count}
+                  for name, (total, count) in self.stages.items()}
+        stages[OTHER_STAGE] = {'count': self.count,
+                               'total_ms': max(self.total - staged, 0.0) * 1000,
+                               'mean_ms': max(self.total - staged, 0.0) * 1000 / self.count}
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total * 1000 / self.count,
+            'peak_memory_kb': self.peak_memory / 1024,
+            'stages': stages,
+            'counters': dict(self.counters),
+        }
+
+
+class _Stage:
+    """Context manager satu tahap; mencatat waktu tanpa tahap bersarang."""
+
+    __slots__ = ('profiler', 'stats', 'name', 'start', 'children')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.stats = profiler._action
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0.0
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        if profiler._stack and profiler._stack[-1] is self:
+            profiler._stack.pop()
+            if profiler._stack:
+                profiler._stack[-1].children += elapsed
+        entry = self.stats.stages.setdefault(self.name, [0.0, 0])
+        entry[0] += elapsed - self.children
+        entry[1] += 1
+        return False
+
+
+class Profiler:
+    """
+    Pengumpul waktu tahap, counter, dan puncak memori per aksi.
+
+    Parameters:
+    -----------
+    enabled : bool
+        Jika False, semua pemanggilan hampir tanpa biaya
+
+    Example:
+    --------
+    >>> profiler = Profiler()
+    >>> profiler.start(memory=True)
+    >>> profiler.begin_action('rotate')
+    >>> with profiler.stage('transform'):
+    ...     changed = scene.transform_selected(matrix)
+    >>> profiler.count('vertices', 1024)
+    >>> profiler.end_action()
+    >>> profiler.stop()
+    >>> profiler.write_report('laporan.json')
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.actions = {}
+        self.memory = False
+        self._action = None
+        self._action_start = 0.0
+        self._memory_base = 0
+        self._stack = []
+        self._cprofile = None
+        self._input = None
+
+    def start(self, memory=True, cprofile=False):
+        """
+        Mengaktifkan profiler.
+
+        Parameters:
+        -----------
+        memory : bool
+            Mencatat puncak alokasi per aksi dengan tracemalloc
+            (memperlambat alokasi selama profiling)
+        cprofile : bool
+            Menjalankan cProfile untuk seluruh sesi (lihat dump_cprofile)
+        """
+        self.enabled = True
+        self.memory = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        # Waktu input pengguna dicatat sebagai tahap 'input' di aksi aktif
+        if self._input is None:
+            self._input = builtins.input
+            builtins.input = self._timed_input
+
+    def stop(self):
+        """Menutup aksi yang masih terbuka lalu menonaktifkan profiler."""
+        if self._action is not None:
+            self.end_action()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        if self._input is not None:
+            builtins.input = self._input
+            self._input = None
+        self.enabled = False
+
+    def _timed_input(self, *args, **kwargs):
+        with self.stage('input'):
+            return self._input(*args, **kwargs)
+
+    def begin_action(self, name):
+        """Memulai aksi baru (aksi sebelumnya yang masih terbuka ditutup)."""
+        if not self.enabled:
+            return
+        if self._action is not None:
+            self.end_action()
+        self._action = self.actions.setdefault(name, ActionStats())
+        if self.memory:
+            tracemalloc.reset_peak()
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        self._action_start = time.perf_counter()
+
+    def end_action(self):
+        """Menutup aksi aktif dan menambahkan waktu serta puncak memorinya."""
+        action = self._action
+        if action is None:
+            return
+        action.total += time.perf_counter() - self._action_start
+        action.count += 1
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1] - self._memory_base
+            action.peak_memory = max(action.peak_memory, peak)
+        self._action = None
+        self._stack.clear()
+
+    @contextlib.contextmanager
+    def action(self, name):
+        """Context manager untuk begin_action/end_action."""
+        self.begin_action(name)
+        try:
+            yield
+        finally:
+            self.end_action()
+
+    def stage(self, name):
+        """
+        Context manager yang mencatat waktu satu tahap pada aksi aktif.
+
+        Tanpa aksi aktif (atau saat profiler tidak aktif), tidak ada yang dicatat.
+        """
+        if self._action is None:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def add_stage(self, name, seconds):
+        """Menambahkan waktu tahap yang sudah diukur pemanggil (misalnya mode batch)."""
+        action = self._action
+        if action is not None:
+            entry = action.stages.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def count(self, name, amount=1):
+        """Menambahkan amount ke counter name pada aksi aktif."""
+        action = self._action
+        if action is not None:
+            action.counters[name] = action.counters.get(name, 0) + amount
+
+    def report(self):
+        """
+        Ringkasan semua aksi.
+
+        Returns:
+        --------
+        dict : {nama_aksi: {'count', 'total_ms', 'mean_ms', 'peak_memory_kb',
+                'stages': {nama_tahap: {'count', 'total_ms', 'mean_ms'}},
+                'counters': {nama: nilai}}}
+        """
+        return {name: stats.to_dict() for name, stats in self.actions.items() if stats.count}
+
+    def write_report(self, path):
+        """
+        Menyimpan laporan ke file .csv (satu baris per tahap/counter) atau JSON.
+
+        Returns:
+        --------
+        dict : Laporan yang ditulis (lihat report)
+        """
+        report = self.report()
+        if os.path.splitext(path)[1].lower() == '.csv':
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['action', 'kind', 'name', 'count', 'total_ms', 'mean_ms', 'value'])
+                for name, entry in report.items():
+                    writer.writerow([name, 'action', name, entry['count'], f"{entry['total_ms']:.3f}",
+                                     f"{entry['mean_ms']:.3f}", ''])
+                    for stage, stats in entry['stages'].items():
+                        writer.writerow([name, 'stage', stage, stats['count'],
+                                         f"{stats['total_ms']:.3f}", f"{stats['mean_ms']:.3f}", ''])
+                    for counter, value in entry['counters'].items():
+                        writer.writerow([name, 'counter', counter, '', '', '', value])
+                    if self.memory:
+                        writer.writerow([name, 'memory', 'peak_kb', '', '', '',
+                                         f"{entry['peak_memory_kb']:.1f}"])
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        return report
+
+    def dump_cprofile(self, path):
+        """Menyimpan statistik cProfile (jika dijalankan) ke file .prof."""
+        if self._cprofile is None:
+            return False
+        self._cprofile.dump_stats(path)
+        return True
+
+
+def format_profile_report(report):
+    """
+    Menyusun laporan profiler sebagai tabel teks (aksi lalu tahapnya).
+
+    Parameters:
+    -----------
+    report : dict
+        Hasil Profiler.report()
+
+    Returns:
+    --------
+    str : Tabel laporan
+    """
+    lines = [f"{'Aksi / tahap':<24} {'Jumlah':>8} {'Total (ms)':>12} {'Rata-rata (ms)':>15}",
+             "-" * 62]
+    for name, entry in sorted(report.items(), key=lambda item: -item[1]['total_ms']):
+        lines.append(f"{name:<24} {entry['count']:>8} {entry['total_ms']:>12.2f} "
+                     f"{entry['mean_ms']:>15.3f}")
+        for stage, stats in sorted(entry['stages'].items(), key=lambda item: -item[1]['total_ms']):
+            lines.append(f"  {stage:<22} {stats['count']:>8} {stats['total_ms']:>12.2f} "
+                         f"{stats['mean_ms']:>15.3f}")
+        extras = [f"{counter}={value}" for counter, value in entry['counters'].items()]
+        if entry['peak_memory_kb']:
+            extras.append(f"puncak memori={entry['peak_memory_kb']:.1f} KB")
+        if extras:
+            lines.append("  " + ", ".join(extras))
+    return "\n".join(lines)
+
+
+# Profiler global yang dipakai oleh aplikasi dan renderer
+PROFILER = Profiler()
@@ -0,0 +1,283 @@
+"""
+Modul renderer dengan artist yang dipakai ulang dan blitting.
+
+Alih-alih menghapus semua patch lalu membuat plt.Polygon baru setiap kali
+bentuk berubah, ShapeRenderer menyimpan satu artist per bentuk dan
+memperbarui koordinatnya secara in-place (set_xy). Latar statis (grid,
+sumbu, judul) disimpan sebagai bitmap setelah setiap full draw, sehingga
+pembaruan berikutnya hanya:
+
+    1. memulihkan bitmap latar (restore_region)
+    2. menggambar artist bentuk (ax.draw_artist)
+    3. menyalin area axes ke layar (blit)
+
+tanpa menggambar ulang tick, label, dan grid. Renderer mencatat apakah
+ada perubahan sejak refresh terakhir (dirty), sehingga loop aplikasi
+hanya merender saat memang ada yang berubah.
+
+Jika diberikan Scene, hanya artist bentuk yang bounding box-nya terlihat
+di viewport yang digambar (culling lewat spatial index scene).
+
+Keliling setiap artist dipotong ke viewport sebelum dikirim ke Matplotlib
+(lihat clipping.py). Setelah zoom atau pan, hanya bentuk yang sebelumnya
+terpotong atau kini tidak lagi seluruhnya terlihat yang dipotong ulang.
+Polygon padat memakai level-of-detail sesuai skala layar (lihat lod.py)
+dan levelnya dipilih ulang setiap kali viewport berubah.
+"""
+
+from matplotlib.patches import Polygon
+
+from shapes.shape_array import Shape
+
+from .clipping import axes_clip_rect, bounds_inside
+from .plotting import SELECTED_STYLE, shape_outline_for_axes, shape_style
+from .profiling import PROFILER
+
+
+class ShapeRenderer:
+    """
+    Renderer yang menyimpan satu artist per bentuk dan memperbaruinya in-place.
+
+    Parameters:
+    -----------
+    ax : Axes
+        Objek axes Matplotlib
+    scene : Scene, optional
+        Scene dengan ID bentuk yang sama; dipakai untuk culling viewport
+
+    Example:
+    --------
+    >>> renderer = ShapeRenderer(ax)
+    >>> renderer.update('bentuk-1', shape)
+    >>> renderer.refresh()          # Blit, tanpa menggambar ulang grid/sumbu
+    """
+
+    def __init__(self, ax, scene=None):
+        self.ax = ax
+        self.scene = scene
+        self.figure = ax.figure
+        self.canvas = ax.figure.canvas
+        self._shapes = {}
+        self._artists = {}
+        self._highlighted = set()
+        self._clipped = set()
+        self._clip_rect = None
+        self._background = None
+        self._needs_full_draw = True
+        self._dirty = True
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def supports_blit(self):
+        """True jika backend mendukung copy_from_bbox/restore_region."""
+        return getattr(self.canvas, 'supports_blit', False)
+
+    @property
+    def dirty(self):
+        """True jika ada perubahan yang belum ditampilkan (lihat refresh)."""
+        return self._dirty or self._needs_full_draw
+
+    @property
+    def artists(self):
+        """Dictionary {shape_id: artist} untuk semua bentuk yang dirender."""
+        return dict(self._artists)
+
+    def __len__(self):
+        return len(self._artists)
+
+    def update(self, shape_id, shape_data):
+        """
+        Menambahkan bentuk baru atau memperbarui artist bentuk yang sudah ada.
+
+        Parameters:
+        -----------
+        shape_id : hashable
+            ID bentuk
+        shape_data : Shape atau dict
+            Data bentuk terbaru
+
+        Returns:
+        --------
+        Polygon : Artist milik bentuk tersebut
+        """
+        outline = self._outline(shape_id, shape_data)
+        artist = self._artists.get(shape_id)
+        previous = self._shapes.get(shape_id)
+
+        if artist is None or previous is None or previous.get('type') != shape_data.get('type'):
+            if artist is not None:
+                artist.remove()
+            # animated=True: artist tidak ikut digambar pada full draw,
+            # sehingga tidak masuk ke bitmap latar
+            artist = Polygon(outline, closed=True, animated=True,
+                             **shape_style(shape_data.get('type')))
+            self.ax.add_patch(artist)
+            self._artists[shape_id] = artist
+            PROFILER.count('artists_created')
+            if shape_id in self._highlighted:
+                artist.set(**SELECTED_STYLE)
+        else:
+            artist.set_xy(outline)
+            PROFILER.count('artists_updated')
+
+        PROFILER.count('vertices_rendered', len(outline))
+        self._shapes[shape_id] = shape_data
+        self._dirty = True
+        return artist
+
+    def _outline(self, shape_id, shape_data):
+        """Keliling yang dipotong ke viewport; mencatat bentuk yang terpotong."""
+        self._clip_rect = axes_clip_rect(self.ax)
+        if bounds_inside(Shape.from_dict(shape_data).bounds(), self._clip_rect):
+            self._clipped.discard(shape_id)
+        else:
+            self._clipped.add(shape_id)
+        return shape_outline_for_axes(self.ax, shape_data)
+
+    def _needs_outline(self, shape_id, shape_data, rect):
+        """True jika keliling bentuk harus dihitung ulang untuk rect baru."""
+        shape = Shape.from_dict(shape_data)
+        return (shape_id in self._clipped or shape.lod() is not None
+                or not bounds_inside(shape.bounds(), rect))
+
+    def remove(self, shape_id):
+        """Menghapus artist bentuk tertentu."""
+        artist = self._artists.pop(shape_id, None)
+        self._shapes.pop(shape_id, None)
+        self._highlighted.discard(shape_id)
+        self._clipped.discard(shape_id)
+        if artist is not None:
+            artist.remove()
+            self._dirty = True
+
+    def clear(self):
+        """Menghapus semua artist bentuk."""
+        for shape_id in list(self._artists):
+            self.remove(shape_id)
+
+    def highlight(self, shape_ids):
+        """
+        Menandai bentuk terpilih dengan tepi tebal; bentuk lain kembali ke gaya normal.
+
+        Parameters:
+        -----------
+        shape_ids : iterable
+            ID bentuk yang disorot (misalnya Scene.selection)
+        """
+        shape_ids = set(shape_ids)
+        if shape_ids & set(self._artists) != self._highlighted:
+            self._dirty = True
+        for shape_id in self._highlighted - shape_ids:
+            if shape_id in self._artists:
+                style = shape_style(self._shapes[shape_id].get('type'))
+                self._artists[shape_id].set(edgecolor=style['edgecolor'], linewidth=1.0)
+        for shape_id in shape_ids - self._highlighted:
+            if shape_id in self._artists:
+                self._artists[shape_id].set(**SELECTED_STYLE)
+        self._highlighted = shape_ids & set(self._artists)
+
+    def set_hidden(self, shape_ids):
+        """
+        Menyembunyikan artist bentuk tertentu, misalnya selama animasi transisi.
+
+        Parameters:
+        -----------
+        shape_ids : iterable
+            ID bentuk yang disembunyikan; kosong untuk menampilkan semuanya
+
+        Returns:
+        --------
+        list : Artist bentuk lain yang tetap digambar (untuk blitting animasi)
+        """
+        shape_ids = set(shape_ids)
+        static = []
+        for shape_id, artist in self._artists.items():
+            hidden = shape_id in shape_ids
+            if artist.get_visible() == hidden:
+                artist.set_visible(not hidden)
+                self._dirty = True
+            if not hidden:
+                static.append(artist)
+        return static
+
+    def remove_untracked_artists(self):
+        """
+        Menghapus patch dan teks di axes yang bukan milik renderer.
+
+        Fungsi draw_* menambahkan patch dan label sendiri; setelah bentuknya
+        diserahkan ke renderer, artist sementara itu dibuang di sini. Patch
+        animated (misalnya pratinjau MouseDrawingTool) dikelola pemiliknya
+        dan tidak ikut dihapus.
+
+        Returns:
+        --------
+        int : Jumlah artist yang dihapus
+        """
+        owned = set(map(id, self._artists.values()))
+        untracked = [p for p in self.ax.patches
+                     if id(p) not in owned and not p.get_animated()] + list(self.ax.texts)
+        for artist in untracked:
+            artist.remove()
+        if untracked:
+            self.invalidate()
+        return len(untracked)
+
+    def invalidate(self):
+        """Menandai bahwa latar statis berubah dan perlu full draw berikutnya."""
+        self._needs_full_draw = True
+
+    def refresh(self):
+        """
+        Menampilkan perubahan ke layar.
+
+        Jika latar valid dan backend mendukung blitting, hanya artist bentuk
+        yang digambar ulang. Jika tidak, dilakukan full draw satu kali yang
+        sekaligus menyimpan latar baru.
+        """
+        if self._needs_full_draw or self._background is None or not self.supports_blit:
+            self.canvas.draw()
+            self._dirty = False
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+        self._dirty = False
+
+    def visible_ids(self):
+        """ID bentuk yang perlu digambar pada viewport saat ini."""
+        if self.scene is None:
+            return list(self._artists)
+        (xmin, xmax), (ymin, ymax) = self.ax.get_xlim(), self.ax.get_ylim()
+        return [shape_id for shape_id in self.scene.visible((xmin, ymin, xmax, ymax))
+                if shape_id in self._artists]
+
+    def _draw_artists(self):
+        for shape_id in self.visible_ids():
+            self.ax.draw_artist(self._artists[shape_id])
+
+    def _on_draw(self, event):
+        """Dipanggil setelah setiap full draw (termasuk zoom, pan, dan resize)."""
+        if event is not None and event.canvas is not self.canvas:
+            return
+
+        # Skala layar mungkin berubah: hitung ulang tessellation lingkaran.
+        # Viewport mungkin berubah: potong ulang bentuk yang sebelumnya
+        # terpotong atau kini keluar dari viewport, dan pilih ulang level
+        # LOD polygon padat.
+        rect = axes_clip_rect(self.ax)
+        view_changed = rect != self._clip_rect
+        for shape_id, shape_data in self._shapes.items():
+            if shape_data.get('type') == 'circle' or (view_changed and self._needs_outline(
+                    shape_id, shape_data, rect)):
+                self._artists[shape_id].set_xy(self._outline(shape_id, shape_data))
+
+        if self.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._needs_full_draw = False
+        self._dirty = False
+        self._draw_artists()
+
+    def disconnect(self):
+        """Melepas callback draw_event dari canvas."""
+        self.canvas.mpl_disconnect(self._draw_cid)
@@ -0,0 +1,238 @@
+"""
+Modul rendering ber-tile untuk kanvas yang sangat besar (poster 16k x 16k).
+
+Satu framebuffer RGBA 16384 x 16384 saja sudah 1 GB, dan Matplotlib
+membutuhkan beberapa kali lipatnya. Di sini kanvas dibagi menjadi tile
+berukuran tetap:
+
+1. Bounding box semua bentuk dihitung sekali dan diubah ke piksel.
+2. Setiap tile hanya menerima bentuk yang bounding box-nya beririsan
+   dengan tile tersebut.
+3. Tile dirender dengan Rasterizer(window=...) di pool proses atau
+   thread, lalu disambung per baris tile (band) dan langsung ditulis ke
+   PNG (PNGStreamWriter).
+
+Semua pembulatan piksel dilakukan di koordinat kanvas penuh, sehingga
+hasil sambungan identik bit per bit dengan satu Rasterizer utuh.
+Memori puncak sebanding dengan satu band (tile_size baris x lebar
+kanvas) ditambah tile yang sedang dikerjakan, berapa pun tinggi kanvas.
+"""
+
+import os
+from collections import deque
+
+import numpy as np
+
+from shapes.shape_array import Shape
+
+from .raster import PNGStreamWriter, Rasterizer
+
+
+# Sisi tile dalam piksel (1024 x 1024 RGBA = 4 MB)
+DEFAULT_TILE_SIZE = 1024
+
+# Margin piksel di sekitar bounding box: piksel outline dan pembulatan radius lingkaran
+TILE_MARGIN = 2
+
+
+def tile_grid(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Membagi kanvas menjadi tile, urut baris demi baris.
+
+    Returns:
+    --------
+    list of tuple : (col0, row0, lebar, tinggi) setiap tile
+    """
+    return [(col0, row0, min(tile_size, width - col0), min(tile_size, height - row0))
+            for row0 in range(0, height, tile_size)
+            for col0 in range(0, width, tile_size)]
+
+
+def shape_bounds(shapes):
+    """Bounding box semua bentuk sebagai array (n, 4): xmin, ymin, xmax, ymax."""
+    bounds = [Shape.from_dict(shape).bounds() for shape in shapes]
+    return np.array(bounds, dtype=np.float64).reshape(-1, 4)
+
+
+def _render_tile(canvas, window, shapes, grid):
+    """Tugas worker: merender satu tile dan mengembalikan buffernya."""
+    width, height, xlim, ylim, background = canvas
+    raster = Rasterizer(width, height, xlim, ylim, background, window=window)
+    if grid:
+        raster.draw_grid()
+    raster.draw_shapes(shapes)
+    return raster.buffer
+
+
+class TiledRenderer:
+    """
+    Merender bentuk ke kanvas besar per tile dengan banyak proses/thread.
+
+    Parameters:
+    -----------
+    width, height : int
+        Ukuran kanvas dalam piksel
+    xlim, ylim : tuple
+        Rentang koordinat data yang dipetakan ke seluruh kanvas
+    background : str atau tuple
+        Warna latar
+    tile_size : int
+        Sisi tile dalam piksel
+    workers : int, optional
+        Jumlah worker (default: os.cpu_count())
+    pool : str
+        'process' (default) atau 'thread'. Thread menghindari pickle
+        bentuk dan tile, tetapi hanya paralel selama NumPy melepas GIL.
+
+    Example:
+    --------
+    >>> with TiledRenderer(16384, 16384, tile_size=1024, workers=8) as renderer:
+    ...     renderer.render(daftar_bentuk, 'poster.png', grid=True)
+    """
+
+    def __init__(self, width, height, xlim=(-10, 10), ylim=(-10, 10), background='white',
+                 tile_size=DEFAULT_TILE_SIZE, workers=None, pool='process'):
+        if tile_size < 1:
+            raise ValueError("tile_size harus bernilai positif.")
+        if pool not in ('process', 'thread'):
+            raise ValueError("pool harus 'process' atau 'thread'.")
+        self.width = int(width)
+        self.height = int(height)
+        self.xlim = tuple(xlim)
+        self.ylim = tuple(ylim)
+        self.background = background
+        self.tile_size = int(tile_size)
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = pool
+        self._executor = None
+        # Rasterizer tanpa piksel, hanya untuk pemetaan data -> piksel kanvas
+        self._mapping = Rasterizer(self.width, self.height, self.xlim, self.ylim,
+                                   background, window=(0, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def executor(self):
+        """Executor proses/thread, dibuat saat pertama kali dibutuhkan lalu dipakai ulang."""
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            executor_class = ProcessPoolExecutor if self.pool == 'process' else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.workers)
+        return self._executor
+
+    def close(self):
+        """Menghentikan semua worker."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def tiles(self):
+        """Daftar tile (col0, row0, lebar, tinggi) kanvas ini."""
+        return tile_grid(self.width, self.height, self.tile_size)
+
+    def pixel_bounds(self, shapes):
+        """
+        Bounding box piksel kanvas setiap bentuk, array (n, 4): col0, row0, col1, row1.
+
+        Sumbu y piksel mengarah ke bawah, jadi ymax data menjadi row0.
+        """
+        bounds = shape_bounds(shapes)
+        corners = np.column_stack((
+            self._mapping.to_pixels(bounds[:, [0, 3]]),
+            self._mapping.to_pixels(bounds[:, [2, 1]]),
+        ))
+        corners[:, :2] = np.floor(corners[:, :2]) - TILE_MARGIN
+        corners[:, 2:] = np.ceil(corners[:, 2:]) + TILE_MARGIN
+        return corners
+
+    def assign(self, shapes):
+        """
+        Indeks bentuk untuk setiap tile (urutan gambar dipertahankan).
+
+        Returns:
+        --------
+        list of numpy.ndarray : Satu array indeks per tile, sesuai tiles()
+        """
+        pixels = self.pixel_bounds(shapes)
+        return [np.flatnonzero((pixels[:, 0] < col0 + width) & (pixels[:, 2] >= col0)
+                               & (pixels[:, 1] < row0 + height) & (pixels[:, 3] >= row0))
+                for col0, row0, width, height in self.tiles()]
+
+    def render_tiles(self, shapes, grid=False):
+        """
+        Merender semua tile secara paralel (generator).
+
+        Tile dikirim ke worker berurutan dengan paling banyak
+        2 x workers tile (minimal satu band) yang belum diambil, sehingga
+        memori tetap terbatas untuk kanvas berapa pun ukurannya.
+
+        Yields:
+        -------
+        tuple : ((col0, row0, lebar, tinggi), buffer RGBA tile), urut baris demi baris
+        """
+        shapes = [Shape.from_dict(shape) for shape in shapes]
+        canvas = (self.width, self.height, self.xlim, self.ylim, self.background)
+        tiles = self.tiles()
+        assigned = self.assign(shapes)
+        per_band = -(-self.width // self.tile_size)
+        max_pending = max(2 * self.workers, per_band)
+
+        pending = deque()
+        for window, indices in zip(tiles, assigned):
+            tile_shapes = [shapes[i] for i in indices.tolist()]
+            pending.append((window, self.executor.submit(_render_tile, canvas, window,
+                                                         tile_shapes, grid)))
+            if len(pending) >= max_pending:
+                window, future = pending.popleft()
+                yield window, future.result()
+        while pending:
+            window, future = pending.popleft()
+            yield window, future.result()
+
+    def render(self, shapes, path=None, grid=False, compress_level=1):
+        """
+        Merender bentuk ke PNG per band, atau ke array jika path None.
+
+        Parameters:
+        -----------
+        shapes : iterable of Shape atau dict
+            Bentuk yang digambar (bentuk berikutnya di atas)
+        path : str atau file object, optional
+            Tujuan PNG; jika None, seluruh kanvas dikembalikan sebagai array
+            (H, W, 4) uint8 (hanya untuk kanvas yang muat di memori)
+        grid : bool
+            Menggambar grid dan sumbu seperti Rasterizer.draw_grid
+        compress_level : int
+            Level zlib PNG
+
+        Returns:
+        --------
+        numpy.ndarray atau None : Kanvas jika path None
+        """
+        if path is None:
+            canvas = np.empty((self.height, self.width, 4), dtype=np.uint8)
+            for (col0, row0, width, height), tile in self.render_tiles(shapes, grid):
+                canvas[row0:row0 + height, col0:col0 + width] = tile
+            return canvas
+
+        if hasattr(path, 'write'):
+            self._write_png(path, shapes, grid, compress_level)
+        else:
+            with open(path, 'wb') as f:
+                self._write_png(f, shapes, grid, compress_level)
+        return None
+
+    def _write_png(self, file, shapes, grid, compress_level):
+        writer = PNGStreamWriter(file, self.width, self.height, compress_level)
+        band = None
+        for (col0, row0, width, height), tile in self.render_tiles(shapes, grid):
+            if col0 == 0:
+                band = np.empty((height, self.width, 4), dtype=np.uint8)
+            band[:, col0:col0 + width] = tile
+            if col0 + width == self.width:
+                writer.write_rows(band)
+        writer.close()
@@ -0,0 +1,15 @@
+"""
+Konfigurasi pytest: modul di src/ diimpor dengan nama paketnya
+(shapes, transformations, scene, utils), sama seperti main.py.
+"""
+
+import os
+import sys
+
+import matplotlib
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+# Test tidak membuka jendela GUI
+matplotlib.use('Agg')
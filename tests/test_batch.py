@@ -0,0 +1,39 @@
+"""
+Test mode batch: validasi operasi skrip dan kegagalan per skrip.
+"""
+
+import json
+
+import pytest
+
+from utils.batch import load_script, run_batch, run_operation, run_operations
+
+
+def write_script(path, operations):
+    path.write_text(json.dumps({'operations': operations}), encoding='utf-8')
+    return str(path)
+
+
+DRAW = {'op': 'draw', 'shape': 'square', 'side': 2, 'x_start': 0, 'y_start': 0}
+
+
+@pytest.mark.parametrize('operation', ['rotate', 3, None, ['op', 'scale']])
+def test_non_dict_operation_rejected(tmp_path, operation):
+    path = write_script(tmp_path / 'bad.json', [DRAW, operation])
+    with pytest.raises(ValueError, match='ke-2'):
+        load_script(path)
+    with pytest.raises(ValueError):
+        run_operation(operation, None)
+    with pytest.raises(ValueError):
+        run_operations([DRAW, operation])
+
+
+def test_bad_script_does_not_abort_batch(tmp_path):
+    bad = write_script(tmp_path / 'bad.json', [DRAW, 'rotate'])
+    good = write_script(tmp_path / 'good.json', [DRAW, {'op': 'rotate', 'angle': 45}])
+
+    timings, failures = run_batch([bad, good], out=str(tmp_path / 'out'), dpi=20)
+
+    assert [path for path, _ in failures] == [bad]
+    assert (tmp_path / 'out' / 'good.png').exists()
+    assert not (tmp_path / 'out' / 'bad.png').exists()
@@ -0,0 +1,189 @@
+"""
+Test operasi boolean: identitas luas dan perbandingan dengan uji even-odd per titik grid.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import (create_circle, create_rectangle, create_square, create_triangle,
+                    boolean_operation, difference, intersection, symmetric_difference, union)
+from shapes import boolean
+from shapes.boolean import _box_pairs
+from shapes.metrics import polygon_area
+
+
+def area(shapes):
+    """Luas total hasil operasi (lubang keyhole sudah terhitung negatif oleh shoelace)."""
+    return sum(polygon_area(shape.vertices) for shape in shapes)
+
+
+def outline(operand):
+    """Ring operand sebagai list array (N, 2); list Shape menjadi beberapa ring."""
+    if isinstance(operand, list) and hasattr(operand[0], 'type'):
+        return [ring for item in operand for ring in outline(item)]
+    if hasattr(operand, 'type'):
+        return [operand.outline(256) if operand.type == 'circle' else operand.vertices]
+    return [np.asarray(operand, dtype=float)]
+
+
+def even_odd(points, rings):
+    """Uji even-odd brute force: jumlah edge yang dipotong sinar horizontal ke kiri."""
+    px, py = points[:, 0], points[:, 1]
+    inside = np.zeros(len(points), dtype=bool)
+    for ring in rings:
+        for (x0, y0), (x1, y1) in zip(ring, np.roll(ring, -1, axis=0)):
+            if y0 == y1:
+                continue
+            crosses = (min(y0, y1) <= py) & (py < max(y0, y1))
+            inside ^= crosses & (x0 + (py - y0) * (x1 - x0) / (y1 - y0) <= px)
+    return inside
+
+
+def sample_grid(*operands, size=300):
+    """Titik grid di sekitar semua operand, digeser agar tidak jatuh tepat di edge."""
+    points = np.concatenate([ring for operand in operands for ring in outline(operand)])
+    low, high = points.min(axis=0) - 0.5, points.max(axis=0) + 0.5
+    xs = np.linspace(low[0], high[0], size) + 1.234567e-4
+    ys = np.linspace(low[1], high[1], size) + 2.345678e-4
+    return np.stack(np.meshgrid(xs, ys), -1).reshape(-1, 2)
+
+
+# Segitiga, lubang, dan lobus yang hanya bersentuhan di satu vertex
+FIGURE_EIGHT = [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2), (1, 1)]
+CROSSED_EIGHT = [(0, 0), (2, 0), (1, 1), (0, 2), (2, 2), (1, 1)]
+HOLE_TOUCHING = [(0, 0), (4, 0), (4, 4), (2, 4), (1, 2), (2, 1), (3, 2), (2, 4), (0, 4)]
+BOWTIE = [(0, 0), (2, 2), (2, 0), (0, 2)]
+SPIKE = [(2, 2), (3, 2), (1, 2), (1, 4), (0, 2), (-1, 2), (0, 0), (2, 0)]
+
+PAIRS = {
+    'persegi_bertumpuk': (create_square(4, 0, 0), create_square(4, 2, 2)),
+    'persegi_lingkaran': (create_square(4, 0, 0), create_circle(4, 4, 2)),
+    'lingkaran_bertumpuk': (create_circle(0, 0, 3), create_circle(2, 1, 2)),
+    'bersentuhan_sisi': (create_square(2, 0, 0), create_square(2, 2, 0)),
+    'bersentuhan_vertex': (create_triangle([(0, 0), (2, 0), (1, 1)]),
+                           create_triangle([(1, 1), (2, 2), (0, 2)])),
+    'terpisah': (create_square(1, 0, 0), create_square(1, 5, 5)),
+    'di_dalam': (create_rectangle(6, 4, 0, 0), create_circle(3, 2, 1)),
+    'identik': (create_square(3, 1, 1), create_square(3, 1, 1)),
+    'figure_eight': (FIGURE_EIGHT, create_square(2, 1, 0)),
+    'figure_eight_silang': (CROSSED_EIGHT, create_square(2, 0.5, 0.5)),
+    'lubang_menyentuh_tepi': (HOLE_TOUCHING, create_circle(2, 2, 1.5)),
+    'pinch_dengan_pinch': (FIGURE_EIGHT, HOLE_TOUCHING),
+    'bowtie': (BOWTIE, create_rectangle(2, 1, 0, 0.5)),
+    'spike': (SPIKE, create_square(2, 0, 1)),
+}
+
+
+@pytest.mark.parametrize('name', sorted(PAIRS))
+def test_area_identities(name):
+    a, b = PAIRS[name]
+    area_a = area(union(a))
+    area_b = area(union(b))
+    area_union = area(union(a, b))
+    area_intersection = area(intersection(a, b))
+
+    assert area_union == pytest.approx(area_a + area_b - area_intersection, abs=1e-9)
+    assert area(difference(a, b)) == pytest.approx(area_a - area_intersection, abs=1e-9)
+    assert area(difference(b, a)) == pytest.approx(area_b - area_intersection, abs=1e-9)
+    assert area(symmetric_difference(a, b)) == pytest.approx(area_union - area_intersection,
+                                                              abs=1e-9)
+
+
+def comb(teeth, thick, shift=0.0, mirror=False):
+    """Sisir dengan gigi horizontal selebar 10; mirror=True menghadap ke kiri."""
+    vertices = [(-1, shift)]
+    for k in range(teeth):
+        y = shift + k
+        vertices += [(0, y), (10, y), (10, y + thick), (0, y + thick)]
+    vertices.append((-1, shift + teeth - 1 + thick))
+    vertices = np.array(vertices, dtype=float)
+    if mirror:
+        vertices[:, 0] = 10.5 - vertices[:, 0]
+        vertices = vertices[::-1].copy()
+    return vertices
+
+
+@pytest.mark.parametrize('name', sorted(PAIRS))
+@pytest.mark.parametrize('force_tree', [False, True])
+def test_matches_even_odd_reference(name, force_tree, monkeypatch):
+    if force_tree:
+        # Jalur segment tree (edge panjang) untuk kandidat dan klasifikasi
+        monkeypatch.setattr(boolean, 'SWEEP_PAIR_FACTOR', -1)
+    a, b = PAIRS[name]
+    points = sample_grid(a, b)
+    in_a, in_b = even_odd(points, outline(a)), even_odd(points, outline(b))
+    expected = {'union': in_a | in_b, 'intersection': in_a & in_b,
+                'difference': in_a & ~in_b, 'xor': in_a ^ in_b}
+    for operation, mask in expected.items():
+        result = boolean_operation(a, b, operation)
+        rings = [shape.vertices for shape in result]
+        got = even_odd(points, rings) if rings else np.zeros(len(points), dtype=bool)
+        # Lingkaran referensi lebih halus dari tessellation default: toleransi di tepinya
+        mismatch = (got != mask).mean()
+        assert mismatch < 0.01, f"{operation}: {mismatch:.4f}"
+
+
+@pytest.mark.parametrize('polygon, expected', [
+    (FIGURE_EIGHT, 2.0),
+    (CROSSED_EIGHT, 2.0),
+    (HOLE_TOUCHING, 13.0),
+    (BOWTIE, 2.0),
+    (SPIKE, 6.0),
+])
+def test_self_touching_union_is_never_empty(polygon, expected):
+    result = union(polygon)
+    assert result
+    assert area(result) == pytest.approx(expected)
+    assert area(union(polygon, polygon)) == pytest.approx(expected)
+
+
+def test_result_reused_as_operand():
+    a, b, c = create_square(4, 0, 0), create_square(4, 2, 2), create_circle(3, 3, 1)
+    merged = union(a, b)
+    assert area(merged) == pytest.approx(28.0)
+
+    holed = difference(merged, c)
+    assert area(holed) == pytest.approx(28.0 - area(union(c)))
+    # Region berlubang (keyhole) sebagai operand: mengisi kembali lubangnya
+    assert area(union(holed, c)) == pytest.approx(28.0)
+    assert area(intersection(holed, c)) == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize('thick', [0.4, 0.7])
+def test_interleaved_combs(thick):
+    # Hampir setiap edge membentang di seluruh rentang X: jalur segment tree
+    a, b = comb(60, thick), comb(60, thick, shift=0.5, mirror=True)
+    overlap = 119 * 9.5 * max(thick - 0.5, 0)
+    assert area(intersection(a, b)) == pytest.approx(overlap, abs=1e-9)
+    assert area(union(a, b)) == pytest.approx(area(union(a)) + area(union(b)) - overlap)
+
+    points = sample_grid(a, b, size=200)
+    in_a, in_b = even_odd(points, [a]), even_odd(points, [b])
+    for operation, mask in [('union', in_a | in_b), ('xor', in_a ^ in_b)]:
+        got = even_odd(points, [shape.vertices for shape in boolean_operation(a, b, operation)])
+        assert np.array_equal(got, mask), operation
+
+
+def test_box_pairs_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        # Koordinat bulat agar banyak kotak berbagi tepi/pojok
+        a = np.sort(rng.integers(0, 12, (40, 2, 2)), axis=1).reshape(40, 4)
+        b = np.sort(rng.integers(0, 12, (30, 2, 2)), axis=1).reshape(30, 4)
+        got = [(i, j) for rows, cols in _box_pairs(a.astype(float), b.astype(float))
+               for i, j in zip(rows.tolist(), cols.tolist())]
+        overlap = ((a[:, None, 0] <= b[None, :, 2]) & (b[None, :, 0] <= a[:, None, 2])
+                   & (a[:, None, 1] <= b[None, :, 3]) & (b[None, :, 1] <= a[:, None, 3]))
+        assert len(got) == len(set(got))
+        assert sorted(got) == sorted(zip(*np.nonzero(overlap)))
+
+
+def test_loops_touching_mid_edge():
+    # Loop segitiga B menyentuh edge bawah loop besarnya di (3, -1) (T-junction),
+    # dan edge itu berimpit searah dengan edge bawah A
+    a = [(6, 2), (5, 2), (5, 3), (2, 2), (2, 3), (-1, 3), (-1, 1), (1, 1), (0, -1), (4, -1), (2, 2)]
+    b = [(4, -1), (3, 0), (2, 0), (3, 1), (0, 0), (1, -2), (2, -4), (3, -1), (4, -2), (2, -1)]
+    area_a, area_b = area(union(a)), area(union(b))
+    area_intersection = area(intersection(a, b))
+    assert area(union(a, b)) == pytest.approx(area_a + area_b - area_intersection)
+    assert area(symmetric_difference(a, b)) == pytest.approx(area_a + area_b - 2 * area_intersection)
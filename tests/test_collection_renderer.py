@@ -0,0 +1,98 @@
+"""
+Test SceneCollectionRenderer: isi collection mengikuti bentuk scene.
+"""
+
+import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection
+import numpy as np
+import pytest
+
+from shapes import create_circle, create_rectangle, create_square, create_triangle
+from transformations.pipeline import to_homogeneous
+from transformations.rotation import get_rotation_matrix
+from utils.collection_renderer import CollectionRenderer, SceneCollectionRenderer
+from utils.plotting import SELECTED_STYLE
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def collection_state(renderer):
+    """Vertices polygon dan offset elips per collection, urut sesuai kelompok."""
+    state = []
+    for collection in renderer.collections:
+        if isinstance(collection, EllipseCollection):
+            state.append(np.column_stack([collection.get_offsets(), collection._widths]))
+        else:
+            state.append(np.concatenate([path.vertices for path in collection.get_paths()]))
+    return state
+
+
+def scene_shapes():
+    return {1: create_square(2, 0, 0), 2: create_circle(3, 3, 1),
+            3: create_triangle([(0, 0), (1, 0), (0, 1)]), 4: create_rectangle(2, 1, 5, 5)}
+
+
+def test_matches_collection_renderer(ax):
+    shapes = scene_shapes()
+    renderer = SceneCollectionRenderer(ax)
+    for shape_id, shape in shapes.items():
+        renderer.update(shape_id, shape)
+    renderer.refresh()
+
+    # Pembaruan in-place (tipe dan jumlah vertices sama) dan penghapusan
+    rotated = shapes[1].transformed(to_homogeneous(get_rotation_matrix(30), (1, 1)))
+    renderer.update(1, rotated)
+    renderer.refresh()
+    assert np.array_equal(renderer.collection.shapes.shape_vertices(0), rotated.vertices)
+    renderer.remove(3)
+    renderer.refresh()
+
+    reference = CollectionRenderer(ax)
+    reference.set_shapes([rotated, shapes[2], shapes[4]])
+    for got, expected in zip(collection_state(renderer.collection), collection_state(reference),
+                             strict=True):
+        np.testing.assert_allclose(got, expected)
+
+
+def test_dirty_after_invalidate(ax):
+    renderer = SceneCollectionRenderer(ax)
+    renderer.refresh()
+    assert not renderer.dirty
+
+    # Latar berubah tanpa perubahan bentuk (misalnya menu 9 pada scene kosong)
+    renderer.invalidate()
+    assert renderer.dirty
+    renderer.refresh()
+    assert not renderer.dirty
+
+    ax.add_patch(plt.Rectangle((0, 0), 1, 1))
+    assert renderer.remove_untracked_artists() == 1
+    assert renderer.dirty
+
+
+def test_highlight_and_hidden(ax):
+    renderer = SceneCollectionRenderer(ax)
+    for shape_id, shape in scene_shapes().items():
+        renderer.update(shape_id, shape)
+    renderer.highlight([2, 4])
+    renderer.refresh()
+
+    collection = renderer.collection
+
+    def slot(row):
+        return collection.group_of[row], collection.position_of[row]
+
+    # Baris ShapeArray mengikuti urutan penambahan: ID 1..4 -> baris 0..3
+    widths = [collection.linewidths[group][position] for group, position in map(slot, range(4))]
+    assert widths == [1.0, SELECTED_STYLE['linewidth'], 1.0, SELECTED_STYLE['linewidth']]
+
+    renderer.set_hidden([1])
+    group, position = slot(0)
+    assert collection.facecolors[group][position, 3] == 0
+    renderer.set_hidden(())
+    assert collection.facecolors[group][position, 3] > 0
@@ -0,0 +1,146 @@
+"""
+Test CollisionDetector: hasil inkremental sama dengan pemeriksaan ulang penuh,
+dan narrow phase sama dengan luas irisan dari shapes.boolean.
+"""
+
+import numpy as np
+import pytest
+
+from scene.collision import REBUILD_FRACTION, CollisionDetector, find_overlaps, narrow_phase
+from shapes import (ShapeArray, create_circle, create_rectangle, create_square,
+                    create_trapezoid, create_triangle, intersection)
+from shapes.metrics import polygon_area
+
+
+def random_scene(seed, count=120, extent=30.0, circles=True):
+    """Campuran bentuk konveks (dan lingkaran) dengan posisi dan ukuran acak."""
+    rng = np.random.default_rng(seed)
+    kinds = ['square', 'rectangle', 'triangle', 'trapezoid'] + (['circle'] if circles else [])
+    shapes = []
+    for kind in rng.choice(kinds, count).tolist():
+        x, y = rng.uniform(0, extent, 2)
+        size = rng.uniform(0.5, 4.0)
+        if kind == 'square':
+            shapes.append(create_square(size, x, y))
+        elif kind == 'rectangle':
+            shapes.append(create_rectangle(size, rng.uniform(0.5, 4.0), x, y))
+        elif kind == 'triangle':
+            shapes.append(create_triangle([(x, y), (x + size, y + rng.uniform(-1, 1)),
+                                           (x + rng.uniform(0, size), y + size)]))
+        elif kind == 'trapezoid':
+            shapes.append(create_trapezoid(size, size * rng.uniform(0.2, 1.0),
+                                           rng.uniform(0.5, 3.0), x, y))
+        else:
+            shapes.append(create_circle(x, y, size / 2))
+    return shapes
+
+
+def random_matrix(rng):
+    """Translasi, rotasi, atau skala tidak seragam (lingkaran menjadi elips) di sekitar titik acak."""
+    cx, cy = rng.uniform(0, 30, 2)
+    kind = rng.integers(3)
+    if kind == 0:
+        linear = np.eye(2)
+    elif kind == 1:
+        angle = rng.uniform(0, 2 * np.pi)
+        linear = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    else:
+        linear = np.diag(rng.uniform(0.6, 1.5, 2))
+    matrix = np.eye(3)
+    matrix[:2, :2] = linear
+    matrix[:2, 2] = np.array([cx, cy]) - linear @ (cx, cy) + rng.uniform(-3, 3, 2)
+    return matrix
+
+
+def partners_from_pairs(pairs, index):
+    found = np.concatenate((pairs[pairs[:, 0] == index, 1], pairs[pairs[:, 1] == index, 0]))
+    return np.sort(found)
+
+
+def assert_consistent(detector):
+    """Pasangan dan partners detektor sama dengan detektor baru atas salinan bentuknya."""
+    expected = find_overlaps(list(detector.shapes), detector.cell_size,
+                             detector.max_cells_per_item)
+    pairs = detector.pairs()
+    np.testing.assert_array_equal(pairs, expected)
+    for index in range(len(detector.shapes)):
+        np.testing.assert_array_equal(detector.partners(index), partners_from_pairs(pairs, index))
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('max_cells_per_item', [256, 2])
+def test_incremental_transform_matches_rebuild(seed, max_cells_per_item):
+    rng = np.random.default_rng(100 + seed)
+    detector = CollisionDetector(random_scene(seed), max_cells_per_item=max_cells_per_item)
+    count = len(detector.shapes)
+    # Cukup langkah agar grid dibangun ulang beberapa kali di tengah jalan
+    steps = int(3 * REBUILD_FRACTION * count) + 5
+    for _ in range(steps):
+        indices = rng.choice(count, rng.integers(1, 4), replace=False)
+        detector.transform(indices, random_matrix(rng))
+        assert_consistent(detector)
+
+    expected = detector.pairs()
+    np.testing.assert_array_equal(detector.rebuild().pairs(), expected)
+
+
+def test_update_after_direct_change():
+    rng = np.random.default_rng(7)
+    shapes = ShapeArray.from_shapes(random_scene(7))
+    detector = CollisionDetector(shapes)
+    for _ in range(10):
+        indices = rng.choice(len(shapes), 3, replace=False)
+        shapes.transform(random_matrix(rng), indices=indices)
+        detector.update(indices)
+        assert_consistent(detector)
+
+
+def test_moved_shape_finds_and_loses_partners():
+    shapes = [create_square(2, 0, 0), create_square(2, 10, 0), create_circle(20, 1, 1)]
+    detector = CollisionDetector(shapes, cell_size=2.0)
+    assert len(detector) == 0
+
+    move = np.eye(3)
+    move[0, 2] = 9.5
+    detector.transform(0, move)
+    np.testing.assert_array_equal(detector.pairs(), [[0, 1]])
+    np.testing.assert_array_equal(detector.partners(1), [0])
+
+    detector.transform(0, move)
+    np.testing.assert_array_equal(detector.pairs(), [[0, 2]])
+    np.testing.assert_array_equal(detector.partners(1), [])
+    np.testing.assert_array_equal(detector.colliding(), [0, 2])
+
+
+def boolean_overlap(a, b):
+    """Referensi: interior beririsan jika luas irisan (boolean) positif."""
+    return sum(polygon_area(shape.vertices) for shape in intersection(a, b)) > 1e-9
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_sat_matches_boolean_intersection(seed):
+    shapes = ShapeArray.from_shapes(random_scene(seed, count=40, extent=12.0, circles=False))
+    first, second = np.triu_indices(len(shapes), 1)
+    result = narrow_phase(shapes, first, second)
+    expected = [boolean_overlap(shapes[i], shapes[j])
+                for i, j in zip(first.tolist(), second.tolist())]
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize('a, b, expected', [
+    # Bersentuhan di sisi atau vertex saja: tidak bertumpuk
+    (create_square(2, 0, 0), create_square(2, 2, 0), False),
+    (create_square(2, 0, 0), create_square(2, 2, 2), False),
+    (create_triangle([(0, 0), (2, 0), (1, 1)]), create_triangle([(1, 1), (2, 2), (0, 2)]), False),
+    (create_square(2, 0, 0), create_square(2, 1.999, 0), True),
+    (create_rectangle(6, 4, 0, 0), create_square(1, 2, 2), True),
+    (create_square(2, 0, 0), create_circle(3, 1, 0.999), False),
+    (create_square(2, 0, 0), create_circle(3, 1, 1.001), True),
+    (create_square(2, 0, 0), create_circle(3, 3, 1.40), False),
+    (create_square(2, 0, 0), create_circle(3, 3, 1.42), True),
+])
+def test_narrow_phase_small_cases(a, b, expected):
+    shapes = ShapeArray.from_shapes([a, b])
+    assert bool(narrow_phase(shapes, [0], [1])[0]) == expected
+    if a.type != 'circle' and b.type != 'circle':
+        assert boolean_overlap(a, b) == expected
@@ -0,0 +1,139 @@
+"""
+Test metrik bentuk: centroid luas pada skala apa pun, versi batch, dan
+ShapeMetrics.transformed dibanding menghitung ulang dari vertices.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import Shape, create_circle
+from shapes.metrics import (polygon_centroid, polygon_metrics, segment_metrics,
+                            similarity_scale)
+
+
+QUAD = np.array([(0, 0), (1, 0), (1, 0.1), (0, 1)], dtype=float)
+# Centroid luas QUAD (dihitung dengan pecahan: A = 0.55)
+QUAD_CENTROID = np.array([0.4 / 1.1, 0.37 / 1.1])
+
+SCALES = [1e-8, 1e-4, 1.0, 1e4, 1e8]
+
+
+def random_polygon(seed, count=12):
+    """Polygon bintang acak (sederhana, tidak konveks) di sekitar titik acak."""
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, count))
+    radii = rng.uniform(0.3, 1.0, count)
+    return np.column_stack((np.cos(angles), np.sin(angles))) * radii[:, None] + rng.uniform(-3, 3, 2)
+
+
+def matrix(linear, translation=(0.0, 0.0)):
+    result = np.eye(3)
+    result[:2, :2] = linear
+    result[:2, 2] = translation
+    return result
+
+
+def rotation(degrees):
+    angle = np.radians(degrees)
+    return np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+
+
+MATRICES = {
+    'translasi': matrix(np.eye(2), (5, -2)),
+    'skala_sumbu': matrix(np.diag([2.0, 0.5]), (1, 1)),
+    'skala_kecil': matrix(np.diag([1e-5, 1e-5])),
+    'skala_kecil_tidak_seragam': matrix(np.diag([1e-5, 3e-5])),
+    'cermin': matrix(np.diag([-1.0, 1.0])),
+    'rotasi_90': matrix(rotation(90), (0.5, 0)),
+    'rotasi_30': matrix(rotation(30), (-1, 2)),
+    'geser': matrix(np.array([[1.0, 0.7], [0.0, 1.0]])),
+}
+
+
+@pytest.mark.parametrize('scale', SCALES)
+def test_centroid_scales_with_polygon(scale):
+    np.testing.assert_allclose(polygon_centroid(QUAD * scale), QUAD_CENTROID * scale, rtol=1e-12)
+    metrics = segment_metrics(QUAD * scale, [0, len(QUAD)])
+    np.testing.assert_allclose(metrics.centroid[0], QUAD_CENTROID * scale, rtol=1e-12)
+
+
+@pytest.mark.parametrize('offset', [0.0, 1e6])
+def test_degenerate_centroid_is_vertex_mean(offset):
+    line = np.array([(0, 0), (1, 1), (3, 3)], dtype=float) + offset
+    np.testing.assert_allclose(polygon_centroid(line), line.mean(axis=0))
+    metrics = segment_metrics(line, [0, 3])
+    np.testing.assert_allclose(metrics.centroid[0], line.mean(axis=0))
+
+
+def test_segment_metrics_matches_single_polygon():
+    polygons = [random_polygon(seed) * scale for seed, scale in enumerate(SCALES)]
+    offsets = np.cumsum([0] + [len(polygon) for polygon in polygons])
+    batch = segment_metrics(np.concatenate(polygons), offsets)
+    for k, polygon in enumerate(polygons):
+        single = polygon_metrics(polygon)
+        assert batch.area[k] == pytest.approx(single.area, rel=1e-12)
+        np.testing.assert_allclose(batch.centroid[k], single.centroid, rtol=1e-12)
+        assert batch.perimeter[k] == pytest.approx(single.perimeter, rel=1e-12)
+        np.testing.assert_allclose(batch.bounds[k], single.bounds, rtol=1e-12)
+
+
+def assert_metrics_close(got, expected, size):
+    assert got.area == pytest.approx(expected.area, rel=1e-9, abs=1e-12 * size ** 2)
+    np.testing.assert_allclose(got.centroid, expected.centroid, rtol=1e-9, atol=1e-12 * size)
+    assert got.perimeter == pytest.approx(expected.perimeter, rel=1e-9)
+    np.testing.assert_allclose(got.bounds, expected.bounds, rtol=1e-9, atol=1e-12 * size)
+
+
+@pytest.mark.parametrize('name', sorted(MATRICES))
+@pytest.mark.parametrize('scale', [1e-4, 1.0])
+def test_transformed_matches_recompute(name, scale):
+    vertices = random_polygon(3) * scale
+    # Translasi ikut diskalakan: shoelace ulang pada koordinat jauh kehilangan presisi
+    transform = MATRICES[name].copy()
+    transform[:2, 2] *= scale
+    moved = vertices @ transform[:2, :2].T + transform[:2, 2]
+    expected = polygon_metrics(moved)
+    size = float(np.ptp(moved, axis=0).max())
+
+    assert_metrics_close(polygon_metrics(vertices).transformed(transform, moved), expected, size)
+    # Shape memakai metrik yang sudah di-cache lalu memperbaruinya
+    shape = Shape('polygon', vertices)
+    shape.metrics()
+    assert_metrics_close(shape.transformed(transform).metrics(), expected, size)
+
+
+def test_transformed_without_vertices():
+    metrics = polygon_metrics(random_polygon(4))
+    # Rotasi sembarang butuh vertices baru untuk bounding box
+    assert metrics.transformed(MATRICES['rotasi_30']) is None
+    assert metrics.transformed(MATRICES['translasi']) is not None
+
+
+@pytest.mark.parametrize('name', sorted(MATRICES))
+def test_circle_metrics_after_transform(name):
+    transform = MATRICES[name]
+    circle = create_circle(1, 2, 0.5)
+    circle.metrics()
+    moved = circle.transformed(transform)
+    outline = moved.outline(4096)
+    expected = polygon_metrics(outline)
+    size = float(np.ptp(outline, axis=0).max())
+    got = moved.metrics()
+    assert got.area == pytest.approx(expected.area, rel=1e-5)
+    np.testing.assert_allclose(got.centroid, expected.centroid, rtol=1e-6, atol=1e-9 * size)
+    assert got.perimeter == pytest.approx(expected.perimeter, rel=1e-5)
+    np.testing.assert_allclose(got.bounds, expected.bounds, rtol=1e-5, atol=1e-5 * size)
+
+
+@pytest.mark.parametrize('linear, expected', [
+    (np.eye(2) * 1e-5, 1e-5),
+    (rotation(30) * 2.0, 2.0),
+    (np.diag([1e-5, 3e-5]), None),
+    (np.diag([2.0, 1.0]), None),
+])
+def test_similarity_scale(linear, expected):
+    result = similarity_scale(linear)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
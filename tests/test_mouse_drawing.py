@@ -0,0 +1,137 @@
+"""
+Test MouseDrawingTool dengan MouseEvent sintetis pada backend Agg.
+"""
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import KeyEvent, MouseEvent
+import numpy as np
+import pytest
+
+from main import clear_all_shapes
+from utils.collection_renderer import SceneCollectionRenderer
+from utils.mouse_drawing import MIN_DRAG_PX, MouseDrawingTool, shape_from_drag
+from utils.renderer import ShapeRenderer
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    ax.set_xlim(-10, 10)
+    ax.set_ylim(-10, 10)
+    fig.canvas.draw()
+    yield ax
+    plt.close(fig)
+
+
+def send(ax, name, point, button=1, pixels=False):
+    """Memproses event mouse di titik data (atau piksel) tertentu."""
+    x, y = point if pixels else ax.transData.transform(point)
+    MouseEvent(name, ax.figure.canvas, x, y, button=button)._process()
+
+
+def drag(ax, start, end):
+    send(ax, 'button_press_event', start)
+    send(ax, 'motion_notify_event', ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2))
+    send(ax, 'motion_notify_event', end)
+    send(ax, 'button_release_event', end)
+
+
+@pytest.mark.parametrize('shape_type, start, end, vertex, params', [
+    # Persegi tumbuh ke arah kursor (ke kiri bawah)
+    ('square', (0, 0), (-3, -1), (-3, -3), {'side': 3}),
+    ('rectangle', (0, 1), (-2, 4), (-2, 1), {'width': 2, 'height': 3}),
+    ('circle', (0, 0), (3, 4), None, {'radius': 5, 'center': (0, 0)}),
+    ('trapezoid', (0, 0), (5, 2), (0, 0), {'bottom_width': 5, 'top_width': 3, 'height': 2}),
+])
+def test_shape_from_drag(shape_type, start, end, vertex, params):
+    shape = shape_from_drag(shape_type, start, end)
+    assert shape.type == shape_type
+    for name, value in params.items():
+        assert np.allclose(getattr(shape, name), value)
+    if vertex is not None:
+        np.testing.assert_allclose(shape.vertices[0], vertex)
+
+
+def test_shape_from_drag_degenerate():
+    assert shape_from_drag('square', (1, 1), (1, 1)) is None
+    assert shape_from_drag('rectangle', (0, 0), (3, 0)) is None
+    with pytest.raises(ValueError):
+        shape_from_drag('triangle', (0, 0), (1, 1))
+
+
+def test_drag_creates_shape(ax):
+    shapes = []
+    tool = MouseDrawingTool(ax, 'rectangle', shapes.append)
+    drag(ax, (1, 1), (4, 3))
+    assert not tool.active
+    assert len(shapes) == 1
+    np.testing.assert_allclose(shapes[0].vertices.min(axis=0), (1, 1), atol=1e-9)
+    np.testing.assert_allclose(shapes[0].vertices.max(axis=0), (4, 3), atol=1e-9)
+    assert not tool._preview.get_visible()
+    tool.disconnect()
+
+
+def test_click_without_drag_is_ignored(ax):
+    shapes = []
+    tool = MouseDrawingTool(ax, 'square', shapes.append)
+    x, y = ax.transData.transform((0, 0))
+    send(ax, 'button_press_event', (x, y), pixels=True)
+    send(ax, 'button_release_event', (x + MIN_DRAG_PX - 1, y), pixels=True)
+    assert shapes == [] and not tool.active
+    tool.disconnect()
+
+
+def test_triangle_clicks_and_escape(ax):
+    shapes = []
+    tool = MouseDrawingTool(ax, 'triangle', shapes.append)
+    send(ax, 'button_press_event', (0, 0))
+    send(ax, 'button_press_event', (4, 0))
+    assert tool.active
+    KeyEvent('key_press_event', ax.figure.canvas, 'escape')._process()
+    assert not tool.active and shapes == []
+
+    for point in [(0, 0), (4, 0), (2, 3)]:
+        send(ax, 'button_press_event', point)
+        send(ax, 'button_release_event', point)
+    assert len(shapes) == 1
+    # Titik melewati konversi piksel -> data
+    np.testing.assert_allclose(shapes[0].vertices, [(0, 0), (4, 0), (2, 3)], atol=1e-9)
+    # Tombol selain kiri diabaikan
+    send(ax, 'button_press_event', (1, 1), button=3)
+    assert not tool.active
+    tool.disconnect()
+
+
+@pytest.mark.parametrize('renderer_class', [ShapeRenderer, SceneCollectionRenderer])
+def test_preview_survives_untracked_sweep(ax, renderer_class):
+    renderer = renderer_class(ax)
+    shapes = []
+    tool = MouseDrawingTool(ax, 'circle', shapes.append, renderer)
+    drag(ax, (0, 0), (2, 0))
+    # Keyboard draw 1-5: patch sementara dibuang, pratinjau tetap milik alat
+    ax.add_patch(plt.Rectangle((0, 0), 1, 1))
+    assert renderer.remove_untracked_artists() == 1
+    assert tool._preview in ax.patches
+    drag(ax, (0, 0), (0, 3))
+    assert len(shapes) == 2
+    tool.disconnect()
+    assert list(ax.patches) == []
+
+
+def test_disconnect_after_clear(ax):
+    shapes = []
+    tool = MouseDrawingTool(ax, 'square', shapes.append)
+    drag(ax, (0, 0), (2, 2))
+    # Menu 9 menghapus semua patch, termasuk pratinjau
+    clear_all_shapes(ax)
+    assert tool._preview.axes is None
+
+    # Menggambar lagi memasang ulang pratinjau
+    drag(ax, (1, 1), (3, 4))
+    assert len(shapes) == 2
+    assert tool._preview in ax.patches
+
+    clear_all_shapes(ax)
+    tool.disconnect()
+    tool.disconnect()
+    assert list(ax.patches) == []
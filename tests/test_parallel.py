@@ -0,0 +1,74 @@
+"""
+Test ParallelTransformer: hasil worker sama dengan apply_affine, dan worker
+tidak menyimpan mapping shared memory setelah tugas selesai.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from transformations.parallel import ParallelTransformer, SharedVertexBuffer
+from transformations.pipeline import apply_affine, to_homogeneous
+from transformations.rotation import get_rotation_matrix
+
+
+MATRIX = to_homogeneous(get_rotation_matrix(30), (1.5, -2.0))
+
+
+@pytest.fixture(scope='module')
+def transformer():
+    # chunk_size kecil memaksa jalur worker
+    with ParallelTransformer(workers=2, chunk_size=1000) as transformer:
+        yield transformer
+
+
+@pytest.fixture
+def vertices():
+    return np.random.default_rng(7).uniform(-100, 100, (10_500, 2))
+
+
+def test_array_matches_apply_affine(transformer, vertices):
+    original = vertices.copy()
+    result = transformer.apply(vertices, MATRIX)
+    np.testing.assert_array_equal(vertices, original)
+    np.testing.assert_allclose(result, apply_affine(vertices, MATRIX), rtol=0, atol=1e-12)
+
+
+def test_shared_buffer_in_place(transformer, vertices):
+    expected = apply_affine(vertices, MATRIX)
+    with SharedVertexBuffer.from_array(vertices) as buffer:
+        transformer.apply(buffer, MATRIX)
+        np.testing.assert_allclose(buffer.array, expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(transformer.centroid(buffer), expected.mean(axis=0))
+
+
+def mapped_blocks(names):
+    with open('/proc/self/maps') as f:
+        maps = f.read()
+    return [name for name in names if name.lstrip('/') in maps]
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/maps'), reason='butuh /proc/self/maps')
+def test_workers_release_blocks(transformer, vertices):
+    names = []
+    for _ in range(3):
+        with SharedVertexBuffer.from_array(vertices) as buffer:
+            names.append(buffer.name)
+            transformer.rotate(buffer, 45)
+
+    workers = [transformer.executor.submit(mapped_blocks, names) for _ in range(4)]
+    assert all(future.result() == [] for future in workers)
+
+
+def test_package_import_is_lazy():
+    code = ("import sys, transformations; "
+            "print('transformations.parallel' in sys.modules, "
+            "'multiprocessing.shared_memory' in sys.modules, "
+            "transformations.ParallelTransformer.__module__)")
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    output = subprocess.run([sys.executable, '-c', code], cwd=src, capture_output=True,
+                            text=True, check=True).stdout.split()
+    assert output == ['False', 'False', 'transformations.parallel']
@@ -0,0 +1,95 @@
+"""
+Test Rasterizer: isian scanline identik dengan uji even-odd per pusat piksel.
+"""
+
+import numpy as np
+import pytest
+
+from utils.raster import Rasterizer, scanline_spans
+
+
+SIZE = 64
+BLACK = (0, 0, 0, 255)
+
+
+def brute_force_mask(points, width, height):
+    """Uji even-odd per piksel: jumlah edge yang dipotong sinar ke kiri pusat piksel."""
+    cx, cy = np.meshgrid(np.arange(width) + 0.5, np.arange(height) + 0.5)
+    inside = np.zeros((height, width), dtype=bool)
+    for (x0, y0), (x1, y1) in zip(points, np.roll(points, -1, axis=0)):
+        if y0 == y1:
+            continue
+        crosses = (min(y0, y1) <= cy) & (cy < max(y0, y1))
+        inside ^= crosses & (x0 + (cy - y0) * (x1 - x0) / (y1 - y0) <= cx)
+    return inside
+
+
+def star(points=5, step=2, radius=8.0):
+    angles = 2 * np.pi * step * np.arange(points) / points
+    return np.column_stack((radius * np.sin(angles), radius * np.cos(angles)))
+
+
+POLYGONS = {
+    'konveks': np.array([(-6, -5), (7, -3), (5, 6), (-4, 7)], dtype=float),
+    'konkaf': np.array([(-8, -8), (8, -8), (8, 8), (0, -2), (-8, 8)], dtype=float),
+    # Pentagram: pusat berada di dalam dua kali, sehingga kosong (even-odd)
+    'pentagram': star(),
+    'bowtie': np.array([(-7, -7), (7, 7), (7, -7), (-7, 7)], dtype=float),
+    # Vertices tepat di tepi dan pusat piksel (1 piksel = 20/64 satuan)
+    'grid': np.array([(-5, -5), (0, -5), (0, 0), (5, 0), (5, 5), (-5, 5)], dtype=float)
+            * (20 / SIZE) * 4,
+    'tipis': np.array([(-9, 0), (9, 0.05), (9, 0.1)], dtype=float),
+    'keluar_kanvas': np.array([(-15, -3), (14, -12), (12, 16)], dtype=float),
+}
+
+
+def random_polygon(seed, count=40):
+    return np.random.default_rng(seed).uniform(-12, 12, (count, 2))
+
+
+@pytest.mark.parametrize('name', sorted(POLYGONS))
+def test_fill_matches_brute_force(name):
+    raster = Rasterizer(SIZE, SIZE)
+    raster.fill_polygon(POLYGONS[name], BLACK)
+    expected = brute_force_mask(raster.to_pixels(POLYGONS[name]), SIZE, SIZE)
+    np.testing.assert_array_equal(raster.buffer[..., 0] == 0, expected)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_random_self_intersecting(seed):
+    vertices = random_polygon(seed)
+    raster = Rasterizer(SIZE, SIZE)
+    raster.fill_polygon(vertices, BLACK)
+    expected = brute_force_mask(raster.to_pixels(vertices), SIZE, SIZE)
+    np.testing.assert_array_equal(raster.buffer[..., 0] == 0, expected)
+
+
+@pytest.mark.parametrize('window', [(0, 0, 32, 32), (17, 5, 30, 41), (40, 50, 24, 14)])
+def test_window_matches_full_frame(window):
+    vertices = random_polygon(99)
+    full = Rasterizer(SIZE, SIZE)
+    full.fill_polygon(vertices, BLACK)
+    part = Rasterizer(SIZE, SIZE, window=window)
+    part.fill_polygon(vertices, BLACK)
+
+    col0, row0, width, height = window
+    np.testing.assert_array_equal(part.buffer, full.buffer[row0:row0 + height, col0:col0 + width])
+
+
+def test_spans_are_sorted_and_paired():
+    points = Rasterizer(SIZE, SIZE).to_pixels(star(7, 3))
+    rows, starts, stops = scanline_spans(points, SIZE)
+    assert np.all(np.diff(rows) >= 0)
+    assert np.all(starts <= stops)
+
+
+def test_circle_is_symmetric():
+    raster = Rasterizer(SIZE + 1, SIZE + 1, xlim=(-10, 10), ylim=(-10, 10))
+    # Pusat piksel tengah: isian midpoint simetris terhadap kedua sumbu
+    center = raster.to_pixels([(0, 0)])[0]
+    assert np.all(np.floor(center) == SIZE // 2)
+    raster.draw_circle((0, 0), 6, BLACK, None)
+    mask = raster.buffer[..., 0] == 0
+    np.testing.assert_array_equal(mask, mask[::-1])
+    np.testing.assert_array_equal(mask, mask[:, ::-1])
+    np.testing.assert_array_equal(mask, mask.T)
@@ -0,0 +1,53 @@
+"""
+Test Scene: undo/redo aksi transformasi seleksi.
+"""
+
+import numpy as np
+
+from scene import Scene
+from shapes import create_square
+
+
+def translation(dx, dy):
+    matrix = np.eye(3)
+    matrix[:2, 2] = dx, dy
+    return matrix
+
+
+def test_undo_redo_selection():
+    scene = Scene()
+    a = scene.add(create_square(1, 0, 0))
+    b = scene.add(create_square(1, 5, 5))
+    scene.select([a, b])
+    scene.transform_selected(translation(1, 0))
+    scene.transform_selected(translation(0, 2))
+    np.testing.assert_allclose(scene[a].vertices[0], (1, 2))
+
+    assert set(scene.undo()) == {a, b}
+    np.testing.assert_allclose(scene[b].vertices[0], (6, 5))
+    scene.undo()
+    np.testing.assert_allclose(scene[b].vertices[0], (5, 5))
+    assert not scene.can_undo
+    scene.redo()
+    np.testing.assert_allclose(scene[a].vertices[0], (1, 0))
+
+
+def test_replace_drops_shape_from_old_actions():
+    scene = Scene()
+    a = scene.add(create_square(1, 0, 0))
+    b = scene.add(create_square(1, 5, 5))
+    scene.select([a, b])
+    scene.transform_selected(translation(1, 0))
+    scene.replace(a, create_square(1, 10, 10))
+    scene.transform_selected(translation(0, 3))
+
+    scene.undo()
+    scene.undo()
+    np.testing.assert_allclose(scene[a].vertices[0], (10, 10))
+    scene.remove(b)
+
+    # Aksi (1, 0) terjadi sebelum replace: bentuk a tidak boleh ikut di-redo
+    assert scene.redo() == {}
+    np.testing.assert_allclose(scene[a].vertices[0], (10, 10))
+    assert set(scene.redo()) == {a}
+    np.testing.assert_allclose(scene[a].vertices[0], (10, 13))
@@ -0,0 +1,111 @@
+"""
+Test format file bentuk: save_shapes lalu load_shapes menghasilkan bentuk yang sama.
+"""
+
+import numpy as np
+import pytest
+
+from shapes import (ShapeArray, create_circle, create_rectangle, create_square,
+                    create_trapezoid, create_triangle, load_shapes, save_shapes)
+from transformations.pipeline import to_homogeneous
+from transformations.rotation import get_rotation_matrix
+from transformations.scaling import get_scaling_matrix
+
+
+FIELDS = ('vertices', 'offsets', 'type_codes', 'anchors', 'params', 'transforms')
+
+
+@pytest.fixture
+def shapes():
+    ellipse = create_circle(1, -2, 1.5).transformed(to_homogeneous(get_scaling_matrix(2, 0.5)))
+    return ShapeArray.from_shapes([
+        create_square(2, 0, 0),
+        create_triangle([(0, 0), (4, 0), (1, 3)]),
+        create_rectangle(3, 1, -5, 2),
+        create_circle(3, 3, 1),
+        ellipse,
+        create_trapezoid(4, 2, 1.5, 1, 1),
+    ])
+
+
+def assert_same(loaded, expected):
+    for field in FIELDS:
+        np.testing.assert_array_equal(getattr(loaded, field), getattr(expected, field),
+                                      err_msg=field)
+
+
+def test_round_trip_float64(tmp_path, shapes):
+    path = str(tmp_path / 'scene.shapes')
+    size = save_shapes(path, shapes)
+    loaded = load_shapes(path)
+
+    assert size == (tmp_path / 'scene.shapes').stat().st_size
+    # View ke file yang dibuka read-only, bukan salinan di RAM
+    assert not loaded.vertices.flags.writeable
+    assert_same(loaded, shapes)
+    for original, restored in zip(shapes, loaded):
+        assert restored.type == original.type
+        np.testing.assert_array_equal(restored.vertices, original.vertices)
+
+
+def test_round_trip_list_of_shapes(tmp_path, shapes):
+    path = str(tmp_path / 'list.shapes')
+    save_shapes(path, list(shapes))
+    assert_same(load_shapes(path), shapes)
+
+
+def test_float32_vertices_keep_exact_metadata(tmp_path, shapes):
+    path = str(tmp_path / 'scene32.shapes')
+    save_shapes(path, shapes, dtype=np.float32)
+    loaded = load_shapes(path)
+
+    assert loaded.vertices.dtype == np.float32
+    np.testing.assert_array_equal(loaded.vertices, shapes.vertices.astype(np.float32))
+    for field in FIELDS[1:]:
+        np.testing.assert_array_equal(getattr(loaded, field), getattr(shapes, field))
+
+
+def test_read_write_mode_persists_transform(tmp_path, shapes):
+    path = str(tmp_path / 'scene.shapes')
+    save_shapes(path, shapes)
+    matrix = to_homogeneous(get_rotation_matrix(90), (1, 1))
+
+    stored = load_shapes(path, mode='r+')
+    stored.transform(matrix)
+    del stored
+
+    shapes.transform(matrix)
+    assert_same(load_shapes(path), shapes)
+
+
+def test_copy_on_write_leaves_file(tmp_path, shapes):
+    path = str(tmp_path / 'scene.shapes')
+    save_shapes(path, shapes)
+    copy = load_shapes(path, mode='c')
+    copy.transform(to_homogeneous(get_scaling_matrix(3, 3)))
+    assert_same(load_shapes(path), shapes)
+
+
+def test_empty(tmp_path):
+    path = str(tmp_path / 'empty.shapes')
+    save_shapes(path, [])
+    loaded = load_shapes(path)
+    assert len(loaded) == 0 and len(loaded.vertices) == 0
+
+
+def test_invalid_files(tmp_path, shapes):
+    path = tmp_path / 'scene.shapes'
+    save_shapes(str(path), shapes)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-8])
+    with pytest.raises(ValueError, match='terpotong'):
+        load_shapes(str(path))
+    path.write_bytes(b'NOTSHAPE' + data[8:])
+    with pytest.raises(ValueError, match='magic'):
+        load_shapes(str(path))
+    path.write_bytes(data[:10])
+    with pytest.raises(ValueError, match='terlalu pendek'):
+        load_shapes(str(path))
+    with pytest.raises(ValueError):
+        save_shapes(str(path), shapes, dtype=np.int32)
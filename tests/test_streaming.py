@@ -0,0 +1,61 @@
+"""
+Test StreamingPipeline: hasil per chunk sama dengan TransformPipeline di memori.
+"""
+
+import numpy as np
+import pytest
+
+from transformations import StreamingPipeline, TransformPipeline
+
+
+def build(pipeline):
+    # Rantai campuran: pusat centroid (default), pusat eksplisit, dan translasi
+    return (pipeline.scale(2, 0.5).rotate(30).reflect('y=x')
+            .translate(3, -1).rotate(-75, center=(1, 2)).scale(1.5, 1.5))
+
+
+@pytest.fixture
+def vertices():
+    return np.random.default_rng(3).normal(5, 20, (1001, 2))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 97, 1001, 5000])
+def test_binary_matches_transform_pipeline(tmp_path, vertices, chunk_size):
+    source, target = tmp_path / 'titik.bin', tmp_path / 'hasil.bin'
+    vertices.tofile(source)
+
+    pipeline = build(StreamingPipeline(str(source), chunk_size=chunk_size))
+    assert pipeline.run(str(target)) == len(vertices)
+
+    expected = build(TransformPipeline(vertices)).vertices
+    result = np.fromfile(target, dtype=np.float64).reshape(-1, 2)
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(pipeline.centroid(), vertices.mean(axis=0), rtol=1e-12)
+
+
+def test_csv_with_header(tmp_path, vertices):
+    source, target = tmp_path / 'titik.csv', tmp_path / 'hasil.csv'
+    np.savetxt(source, vertices, fmt='%.17g', delimiter=',', header='x,y', comments='')
+
+    build(StreamingPipeline(str(source), chunk_size=64)).run(str(target))
+
+    expected = build(TransformPipeline(vertices)).vertices
+    np.testing.assert_allclose(np.loadtxt(target, delimiter=',', skiprows=1, ndmin=2), expected,
+                               rtol=0, atol=1e-9)
+
+
+def test_float32_output(tmp_path, vertices):
+    source, target = tmp_path / 'titik.bin', tmp_path / 'hasil32.bin'
+    vertices.tofile(source)
+    build(StreamingPipeline(str(source), chunk_size=128)).run(str(target), dtype=np.float32)
+
+    expected = build(TransformPipeline(vertices)).vertices
+    result = np.fromfile(target, dtype=np.float32).reshape(-1, 2)
+    np.testing.assert_array_equal(result, expected.astype(np.float32))
+
+
+def test_output_must_differ_from_input(tmp_path, vertices):
+    source = tmp_path / 'titik.bin'
+    vertices.tofile(source)
+    with pytest.raises(ValueError):
+        StreamingPipeline(str(source)).rotate(10).run(str(source))
@@ -0,0 +1,68 @@
+"""
+Test TiledRenderer: kanvas hasil sambungan tile identik bit per bit dengan satu Rasterizer.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from shapes import create_circle, create_rectangle, create_square, create_triangle
+from transformations.pipeline import to_homogeneous
+from transformations.rotation import get_rotation_matrix
+from transformations.scaling import get_scaling_matrix
+from utils.raster import Rasterizer
+from utils.tiled import TiledRenderer, tile_grid
+
+
+WIDTH, HEIGHT = 150, 97
+LIMITS = {'xlim': (-10, 10), 'ylim': (-7, 6)}
+
+
+@pytest.fixture(scope='module')
+def shapes():
+    rng = np.random.default_rng(11)
+    result = []
+    for x, y in rng.uniform(-11, 11, (25, 2)):
+        size = rng.uniform(0.3, 4)
+        result.append(create_square(size, x, y))
+        result.append(create_circle(x, y, size / 2))
+        triangle = create_triangle(rng.uniform(-12, 12, (3, 2)).tolist())
+        result.append(triangle.transformed(to_homogeneous(get_rotation_matrix(rng.uniform(0, 360)))))
+    # Elips, bentuk yang melintasi semua tile, dan bentuk di luar kanvas
+    ellipse = create_circle(2, 1, 3).transformed(to_homogeneous(get_scaling_matrix(2, 0.6)))
+    return result + [ellipse, create_rectangle(30, 1, -15, -0.5), create_square(1, 40, 40)]
+
+
+def full_frame(shapes, grid):
+    raster = Rasterizer(WIDTH, HEIGHT, **LIMITS)
+    if grid:
+        raster.draw_grid()
+    raster.draw_shapes(shapes)
+    return raster.buffer
+
+
+@pytest.mark.parametrize('tile_size', [13, 33, 64, 512])
+@pytest.mark.parametrize('grid', [False, True])
+def test_tiles_match_full_frame(shapes, tile_size, grid):
+    with TiledRenderer(WIDTH, HEIGHT, tile_size=tile_size, workers=2, pool='thread',
+                       **LIMITS) as renderer:
+        canvas = renderer.render(shapes, grid=grid)
+    np.testing.assert_array_equal(canvas, full_frame(shapes, grid))
+
+
+def test_process_pool_png_matches_full_frame(shapes):
+    png = io.BytesIO()
+    with TiledRenderer(WIDTH, HEIGHT, tile_size=40, workers=2, pool='process',
+                       **LIMITS) as renderer:
+        renderer.render(shapes, png, grid=True)
+    decoded = np.asarray(Image.open(io.BytesIO(png.getvalue())).convert('RGBA'))
+    np.testing.assert_array_equal(decoded, full_frame(shapes, True))
+
+
+def test_tile_grid_covers_canvas():
+    covered = np.zeros((HEIGHT, WIDTH), dtype=np.int64)
+    for col0, row0, width, height in tile_grid(WIDTH, HEIGHT, 33):
+        covered[row0:row0 + height, col0:col0 + width] += 1
+    assert np.all(covered == 1)
@@ -0,0 +1,97 @@
+"""
+Kesetaraan kernel *_vertices_array dengan loop per vertex versi awal.
+
+Fungsi reference_* di bawah adalah salinan loop Python sebelum
+vektorisasi; hasil kernel NumPy harus sama sampai pembulatan float64.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from transformations.scaling import scale_vertices, scale_vertices_array
+from transformations.rotation import rotate_vertices, rotate_vertices_array
+from transformations.reflection import reflect_vertices, reflect_vertices_array
+
+
+TOLERANCE = 1e-12
+
+AXES = ('x', 'y', 'origin', 'y=x')
+
+
+def reference_scale(vertices, sx, sy, center=None):
+    if center is None:
+        center = (sum(v[0] for v in vertices) / len(vertices),
+                  sum(v[1] for v in vertices) / len(vertices))
+    cx, cy = center
+    return [((x - cx) * sx + cx, (y - cy) * sy + cy) for x, y in vertices]
+
+
+def reference_rotate(vertices, angle_degrees, center=None):
+    angle = math.radians(angle_degrees)
+    if center is None:
+        center = (sum(v[0] for v in vertices) / len(vertices),
+                  sum(v[1] for v in vertices) / len(vertices))
+    cx, cy = center
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    result = []
+    for x, y in vertices:
+        dx, dy = x - cx, y - cy
+        result.append((dx * cos_a - dy * sin_a + cx, dx * sin_a + dy * cos_a + cy))
+    return result
+
+
+def reference_reflect(vertices, axis='x'):
+    mapping = {
+        'x': lambda x, y: (x, -y),
+        'y': lambda x, y: (-x, y),
+        'origin': lambda x, y: (-x, -y),
+        'y=x': lambda x, y: (y, x),
+    }
+    return [mapping[axis](x, y) for x, y in vertices]
+
+
+@pytest.fixture(params=[1, 3, 1000])
+def vertices(request):
+    rng = np.random.default_rng(request.param)
+    return [tuple(p) for p in rng.uniform(-100, 100, size=(request.param, 2)).tolist()]
+
+
+@pytest.mark.parametrize('center', [None, (0.0, 0.0), (3.5, -2.25)])
+@pytest.mark.parametrize('sx, sy', [(2.0, 0.5), (-1.0, 3.0), (0.0, 1.0)])
+def test_scale_matches_loop(vertices, sx, sy, center):
+    expected = np.array(reference_scale(vertices, sx, sy, center))
+    np.testing.assert_allclose(scale_vertices_array(vertices, sx, sy, center), expected,
+                               rtol=0, atol=TOLERANCE * 100)
+    np.testing.assert_allclose(scale_vertices(vertices, sx, sy, center), expected,
+                               rtol=0, atol=TOLERANCE * 100)
+
+
+@pytest.mark.parametrize('center', [None, (0.0, 0.0), (3.5, -2.25)])
+@pytest.mark.parametrize('angle', [0, 30, 90, -135.5, 720])
+def test_rotate_matches_loop(vertices, angle, center):
+    expected = np.array(reference_rotate(vertices, angle, center))
+    np.testing.assert_allclose(rotate_vertices_array(vertices, angle, center), expected,
+                               rtol=0, atol=TOLERANCE * 100)
+    np.testing.assert_allclose(rotate_vertices(vertices, angle, center), expected,
+                               rtol=0, atol=TOLERANCE * 100)
+
+
+@pytest.mark.parametrize('axis', AXES)
+def test_reflect_matches_loop(vertices, axis):
+    expected = np.array(reference_reflect(vertices, axis))
+    np.testing.assert_array_equal(reflect_vertices_array(vertices, axis), expected)
+    np.testing.assert_array_equal(reflect_vertices(vertices, axis), expected)
+
+
+def test_list_api_returns_tuples():
+    result = rotate_vertices([(1, 0), (0, 0), (0, 1)], 90)
+    assert isinstance(result, list)
+    assert all(isinstance(vertex, tuple) and len(vertex) == 2 for vertex in result)
+
+
+def test_empty_input():
+    assert scale_vertices_array(np.empty((0, 2)), 2, 2).shape == (0, 2)
+    assert rotate_vertices_array(np.empty((0, 2)), 45).shape == (0, 2)
+    assert reflect_vertices_array(np.empty((0, 2)), 'x').shape == (0, 2)